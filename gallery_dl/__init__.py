@@ -7,7 +7,10 @@
 # published by the Free Software Foundation.
 
 import sys
+import queue
 import logging
+import threading
+import collections
 from . import version, config, option, output, extractor, job, util, exception
 
 __author__ = "Mike Fährmann"
@@ -72,6 +75,8 @@ def main():
             config.set((), "cookies", (browser, profile, keyring, container, domain))
         if args.options_pp:
             config.set((), "postprocessor-options", args.options_pp)
+        if args.stream:
+            config.set(("output",), "stream", True)
         for opts in args.options:
             config.set(*opts)
 
@@ -180,6 +185,28 @@ def main():
             )
             return 0
 
+        if args.archive_maintain:
+            from . import archive
+
+            path = config.interpolate(("extractor",), "archive")
+            if not path or not isinstance(path, str) or "{" in path:
+                log.error("Archive maintenance requires a single archive file")
+                return 1
+
+            prefixes = set()
+            for cls in extractor.extractors():
+                if cls.category:
+                    prefixes.add(cls.category)
+                if issubclass(cls, extractor.common.BaseExtractor):
+                    prefixes.update(instance[0] for instance in cls.instances)
+
+            return archive.maintain(
+                path,
+                args.archive_maintain,
+                prefixes,
+                args.jobtype is job.SimulationJob,
+            )
+
         if args.config:
             if args.config == "init":
                 return config.initialize()
@@ -359,6 +386,11 @@ def main():
                 common.CATEGORY_MAP = catmap
 
             # process input URLs
+            if (jobs := config.get((), "jobs", 1)) > 1:
+                retval = JobPool(jobtype, jobs, log).run(input_manager)
+                _log_connection_stats(log)
+                return retval
+
             retval = 0
             for url in input_manager:
                 try:
@@ -389,6 +421,7 @@ def main():
                     input_manager.error()
 
                 input_manager.next()
+            _log_connection_stats(log)
             return retval
         return 0
 
@@ -404,6 +437,14 @@ def main():
     return 1
 
 
+def _log_connection_stats(log):
+    from .extractor import common
+
+    opened, reused = common.connection_stats()
+    if opened:
+        log.debug("HTTP connections: %s opened, %s reused", opened, reused)
+
+
 class InputManager:
 
     def __init__(self):
@@ -548,25 +589,30 @@ class InputManager:
     def next(self):
         self._index += 1
 
-    def success(self):
-        if self._item:
-            self._rewrite()
+    def success(self, url=None, item=None):
+        if url is None:
+            item = self._item
+        if item:
+            self._rewrite(item)
 
-    def error(self):
+    def error(self, url=None, item=None):
+        if url is None:
+            url = self._url
+            item = self._item
         if self.err:
-            if self._item:
-                url, path, action, indicies = self._item
+            if item:
+                url, path, action, indicies = item
                 lines = self.files[path]
                 out = "".join(lines[i] for i in indicies)
                 if out and out[-1] == "\n":
                     out = out[:-1]
-                self._rewrite()
+                self._rewrite(item)
             else:
-                out = str(self._url)
+                out = str(url)
             self.err.info(out)
 
-    def _rewrite(self):
-        url, path, action, indicies = self._item
+    def _rewrite(self, item):
+        url, path, action, indicies = item
         lines = self.files[path]
         action(lines, indicies)
         try:
@@ -615,6 +661,125 @@ class InputManager:
         return url
 
 
+class JobPool:
+    """Run multiple top-level jobs concurrently
+
+    At most one job per extractor category runs at any time.
+    The output of each job is collected and written all at once
+    after it has finished.
+    """
+
+    def __init__(self, jobtype, size, log):
+        self.jobtype = jobtype
+        self.size = size
+        self.log = log
+        self.input = None
+        self.retval = 0
+        self.active = {}
+        self.deferred = collections.deque()
+        self.results = queue.Queue()
+
+    def run(self, input_manager):
+        self.input = input_manager
+        output.buffer_streams()
+        # progress indicators do not work with buffered output
+        config.set(("downloader",), "progress", None)
+
+        for url in input_manager:
+            item = input_manager._item
+
+            if isinstance(url, ExtendedUrl):
+                # URL-specific options modify the global configuration;
+                # run this job only while no other job is active
+                self.wait(0)
+                for opts in url.gconfig:
+                    config.set(*opts)
+                with config.apply(url.lconfig):
+                    self.submit(url, item)
+                    self.wait(0)
+            else:
+                self.submit(url, item)
+                self.wait(self.size * 2 - 1)
+
+            input_manager.next()
+
+        self.wait(0)
+        return self.retval
+
+    def submit(self, url, item, restart=False):
+        """Create a job for 'url' and schedule it"""
+        try:
+            if isinstance(url, ExtendedUrl):
+                jobinstance = self.jobtype(url.value)
+            else:
+                jobinstance = self.jobtype(url)
+        except exception.NoExtractorError:
+            self.log.error("Unsupported URL '%s'", url)
+            self.retval |= 64
+            self.input.error(url, item)
+            return
+
+        entry = (url, item, jobinstance.extractor.category, jobinstance)
+        if restart:
+            self.deferred.appendleft(entry)
+        else:
+            self.deferred.append(entry)
+        self.start()
+
+    def start(self):
+        """Start deferred jobs whose category is not active"""
+        active = self.active
+        deferred = self.deferred
+
+        for entry in tuple(deferred):
+            if len(active) >= self.size:
+                break
+            category = entry[2]
+            if category not in active:
+                deferred.remove(entry)
+                active[category] = entry
+                threading.Thread(
+                    target=self.run_job, args=(entry,), daemon=True
+                ).start()
+
+    def wait(self, limit):
+        """Wait until at most 'limit' jobs are active or deferred"""
+        while len(self.active) + len(self.deferred) > limit:
+            self.finish(*self.results.get())
+            self.start()
+
+    def finish(self, entry, result):
+        """Process the result of a finished job"""
+        url, item, category, _ = entry
+        del self.active[category]
+
+        if isinstance(result, BaseException):
+            if isinstance(result, exception.RestartExtraction):
+                self.log.debug("Restarting '%s'", url)
+                self.submit(url, item, True)
+            elif not isinstance(result, exception.ControlException):
+                raise result
+        elif result:
+            self.retval |= result
+            self.input.error(url, item)
+        else:
+            self.input.success(url, item)
+
+    def run_job(self, entry):
+        jobinstance = entry[3]
+        output.buffer_begin()
+        try:
+            self.log.debug(
+                "Starting %s for '%s'", jobinstance.__class__.__name__, entry[0]
+            )
+            result = jobinstance.run()
+        except BaseException as exc:
+            result = exc
+        finally:
+            output.buffer_end()
+        self.results.put((entry, result))
+
+
 class ExtendedUrl:
     """URL with attached config key-value pairs"""
 
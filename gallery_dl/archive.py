@@ -9,7 +9,12 @@
 """Download Archives"""
 
 import os
+import sys
+import time
+import hashlib
 import logging
+import threading
+import contextlib
 from . import util, formatter
 
 log = logging.getLogger("archive")
@@ -24,6 +29,8 @@ def connect(
     pragma=None,
     kwdict=None,
     cache_key=None,
+    batch_size=None,
+    batch_interval=None,
 ):
     keygen = formatter.parse(prefix + format).format_map
 
@@ -38,12 +45,27 @@ def connect(
             path = formatter.parse(path).format_map(kwdict)
         if mode == "memory":
             cls = DownloadArchiveMemory
+        elif mode == "batch":
+            cls = DownloadArchiveBatch
         else:
             cls = DownloadArchive
 
     if kwdict is not None and table:
         table = formatter.parse(table).format_map(kwdict)
 
+    if cls is DownloadArchiveBatch:
+        return cls(
+            path,
+            keygen,
+            table,
+            pragma,
+            cache_key,
+            prefix,
+            batch_size,
+            batch_interval,
+        )
+    if cls is DownloadArchive or cls is DownloadArchiveMemory:
+        return cls(path, keygen, table, pragma, cache_key, prefix)
     return cls(path, keygen, table, pragma, cache_key)
 
 
@@ -51,10 +73,17 @@ def sanitize(name):
     return f'''"{name.replace('"', '_')}"'''
 
 
+def digest(key):
+    """Return the compact form of archive ID 'key'"""
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
 class DownloadArchive:
     _sqlite3 = None
 
-    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
+    def __init__(
+        self, path, keygen, table=None, pragma=None, cache_key=None, prefix=None
+    ):
         if self._sqlite3 is None:
             DownloadArchive._sqlite3 = __import__("sqlite3")
 
@@ -67,11 +96,12 @@ class DownloadArchive:
 
         self.keygen = keygen
         self.connection = con
-        self.close = con.close
         self.cursor = cursor = con.cursor()
         self._cache_key = cache_key or "_archive_key"
+        self._prefetched = {}
 
         table = "archive" if table is None else sanitize(table)
+        self._table = table
         self._stmt_select = f"SELECT 1 " f"FROM {table} " f"WHERE entry=? " f"LIMIT 1"
         self._stmt_insert = f"INSERT OR IGNORE INTO {table} " f"(entry) VALUES (?)"
 
@@ -90,6 +120,21 @@ class DownloadArchive:
                 f"CREATE TABLE IF NOT EXISTS {table} " f"(entry TEXT PRIMARY KEY)"
             )
 
+        # tables rewritten by 'compact()' store hashed IDs
+        cursor.execute(f"PRAGMA table_info({table})")
+        self.compact = any(column[1] == "prefix" for column in cursor)
+        if self.compact:
+            keygen_text = self.keygen
+            self.keygen = lambda kwdict: digest(keygen_text(kwdict))
+
+            if prefix and "{" not in prefix:
+                pid = prefix_id(cursor, prefix)
+            else:
+                pid = "NULL"
+            self._stmt_insert = (
+                f"INSERT OR IGNORE INTO {table} (entry, prefix) VALUES (?, {pid})"
+            )
+
     def add(self, kwdict):
         """Add item described by 'kwdict' to archive"""
         key = kwdict.get(self._cache_key) or self.keygen(kwdict)
@@ -98,17 +143,59 @@ class DownloadArchive:
     def check(self, kwdict):
         """Return True if the item described by 'kwdict' exists in archive"""
         key = kwdict[self._cache_key] = self.keygen(kwdict)
-        self.cursor.execute(self._stmt_select, (key,))
-        return self.cursor.fetchone()
+        return self._select(key)
+
+    def prefetch(self, kwdicts):
+        """Look up the items described by 'kwdicts' with a single query
+
+        Results are used by the next 'check()' call for each item.
+        Return True if all items exist in archive.
+        """
+        keygen = self.keygen
+        keys = {keygen(kwdict) for kwdict in kwdicts}
+        return self._prefetch(keys) == len(keys)
 
     def finalize(self):
         pass
 
+    def close(self):
+        self.connection.close()
+
+    def _select(self, key):
+        if (result := self._prefetched.pop(key, None)) is not None:
+            return result
+        self.cursor.execute(self._stmt_select, (key,))
+        return self.cursor.fetchone()
+
+    def _prefetch(self, keys):
+        """Look up 'keys' and return the number of existing entries"""
+        self._prefetched = prefetched = dict.fromkeys(keys, False)
+        if not keys:
+            return 0
+
+        found = 0
+        keys = list(keys)
+        cursor = self.cursor
+        # stay below SQLITE_MAX_VARIABLE_NUMBER of older SQLite versions
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            cursor.execute(
+                f"SELECT entry FROM {self._table} "
+                f"WHERE entry IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for (entry,) in cursor:
+                prefetched[entry] = True
+                found += 1
+        return found
+
 
 class DownloadArchiveMemory(DownloadArchive):
 
-    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
-        DownloadArchive.__init__(self, path, keygen, table, pragma, cache_key)
+    def __init__(
+        self, path, keygen, table=None, pragma=None, cache_key=None, prefix=None
+    ):
+        DownloadArchive.__init__(self, path, keygen, table, pragma, cache_key, prefix)
         self.keys = set()
 
     def add(self, kwdict):
@@ -118,8 +205,13 @@ class DownloadArchiveMemory(DownloadArchive):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
         if key in self.keys:
             return True
-        self.cursor.execute(self._stmt_select, (key,))
-        return self.cursor.fetchone()
+        return self._select(key)
+
+    def prefetch(self, kwdicts):
+        keygen = self.keygen
+        keys = self.keys
+        pending = {key for kwdict in kwdicts if (key := keygen(kwdict)) not in keys}
+        return self._prefetch(pending) == len(pending)
 
     def finalize(self):
         if not self.keys:
@@ -140,6 +232,280 @@ class DownloadArchiveMemory(DownloadArchive):
                 cursor.executemany(stmt, ((key,) for key in self.keys))
 
 
+class DownloadArchiveBatch(DownloadArchive):
+    """Download archive with Bloom filter lookups and batched writes
+
+    All archive entries starting with 'prefix' get loaded into a
+    Bloom filter shared by all archive instances of this process,
+    which answers most negative 'check()' calls without any I/O.
+    After another process has written to the archive file,
+    these calls get answered by the database instead.
+
+    New entries are written in a single transaction
+    every 'size' entries or 'interval' seconds.
+    """
+
+    def __init__(
+        self,
+        path,
+        keygen,
+        table=None,
+        pragma=None,
+        cache_key=None,
+        prefix=None,
+        size=None,
+        interval=None,
+    ):
+        DownloadArchive.__init__(self, path, keygen, table, pragma, cache_key, prefix)
+        self.keys = set()
+        self.size = size or 1000
+        self.interval = 10.0 if interval is None else interval
+        self.timestamp = time.monotonic()
+
+        if self.compact or not prefix or "{" in prefix:
+            prefix = None
+
+        if path == ":memory:":
+            self.filter = self._load_filter(prefix)
+            self.watch = None
+        else:
+            fkey = (os.path.abspath(path), self._table, prefix)
+            with _filters_lock:
+                try:
+                    self.filter, self.watch = _filters[fkey]
+                except KeyError:
+                    # start watching before loading to not miss any changes
+                    self.watch = ArchiveWatch(path)
+                    self.filter = self._load_filter(prefix)
+                    _filters[fkey] = self.filter, self.watch
+
+    def add(self, kwdict):
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        if key not in self.keys:
+            self.keys.add(key)
+            self.filter.add(key)
+
+        if (
+            len(self.keys) >= self.size
+            or time.monotonic() - self.timestamp >= self.interval
+        ):
+            self.commit()
+
+    def check(self, kwdict):
+        key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if key not in self.filter and not self._modified():
+            return False
+        if key in self.keys:
+            return True
+        return self._select(key)
+
+    def prefetch(self, kwdicts):
+        keygen = self.keygen
+        keys = self.keys
+        if self._modified():
+            pending = {key for kwdict in kwdicts if (key := keygen(kwdict)) not in keys}
+            return self._prefetch(pending) == len(pending)
+
+        # items not in the Bloom filter are not in archive
+        bloom = self.filter
+        missing = False
+        pending = set()
+        for kwdict in kwdicts:
+            if (key := keygen(kwdict)) not in bloom:
+                missing = True
+            elif key not in keys:
+                pending.add(key)
+        return self._prefetch(pending) == len(pending) and not missing
+
+    def commit(self):
+        """Write all pending entries to the database"""
+        self.timestamp = time.monotonic()
+        if not (keys := self.keys):
+            return
+
+        cursor = self.cursor
+        if self.watch is None:
+            with self.connection:
+                try:
+                    cursor.execute("BEGIN")
+                except self._sqlite3.OperationalError:
+                    pass
+                cursor.executemany(self._stmt_insert, ((key,) for key in keys))
+        else:
+            with self.watch.commit(), self.connection:
+                try:
+                    # hold the write lock while checking for other changes
+                    cursor.execute("BEGIN IMMEDIATE")
+                except self._sqlite3.OperationalError:
+                    pass
+                self.watch.check()
+                cursor.executemany(self._stmt_insert, ((key,) for key in keys))
+        keys.clear()
+
+    def finalize(self):
+        self.commit()
+
+    def close(self):
+        try:
+            self.commit()
+        finally:
+            self.connection.close()
+
+    def _modified(self):
+        """Return True if another process modified the archive file"""
+        return self.watch is not None and self.watch.modified()
+
+    def _load_filter(self, prefix):
+        bloom = BloomFilter()
+        cursor = self.connection.cursor()
+
+        if prefix and (end := prefix_end(prefix)):
+            cursor.execute(
+                f"SELECT entry FROM {self._table} WHERE entry >= ? AND entry < ?",
+                (prefix, end),
+            )
+        else:
+            cursor.execute(f"SELECT entry FROM {self._table}")
+
+        add = bloom.add
+        for (entry,) in cursor:
+            add(entry)
+        cursor.close()
+
+        log.debug("Loaded %s archive entries into Bloom filter", bloom.count)
+        return bloom
+
+
+class ArchiveWatch:
+    """Detect changes to an archive file made by other processes
+
+    Uses 'PRAGMA data_version' of a separate connection,
+    checked at most once every 'interval' seconds.
+    Changes by archive instances of this process get registered
+    with 'commit()' and are not reported.
+    """
+
+    def __init__(self, path, interval=1.0):
+        self.connection = DownloadArchive._sqlite3.connect(
+            path, timeout=60, check_same_thread=False
+        )
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.timestamp = time.monotonic()
+        self.version = self._version()
+        self.stale = False
+
+    def modified(self):
+        """Return True if the file has been modified by another process"""
+        if not self.stale and time.monotonic() - self.timestamp >= self.interval:
+            with self.lock:
+                self.check()
+        return self.stale
+
+    def check(self):
+        self.timestamp = time.monotonic()
+        if self._version() != self.version:
+            log.debug("Archive file modified by another process")
+            self.stale = True
+
+    @contextlib.contextmanager
+    def commit(self):
+        """Register changes made inside this context as this process's own"""
+        with self.lock:
+            yield
+            self.version = self._version()
+
+    def _version(self):
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+
+class BloomFilter:
+    """Scalable Bloom filter for strings
+
+    Adds a new, twice as large filter whenever the current one
+    reaches its capacity.
+    """
+
+    def __init__(self, capacity=65536, error_rate=0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+        self.filled = 0
+        self.filters = []
+        self.lock = threading.Lock()
+        self._grow()
+
+    def add(self, key):
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32 & 0xFFFFFFFF) | 1
+
+        with self.lock:
+            data, bits, hashes, capacity = self.filters[-1]
+            if self.filled >= capacity:
+                data, bits, hashes, capacity = self._grow()
+            for i in range(hashes):
+                pos = (h1 + i * h2) % bits
+                data[pos >> 3] |= 1 << (pos & 7)
+            self.filled += 1
+            self.count += 1
+
+    def __contains__(self, key):
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32 & 0xFFFFFFFF) | 1
+
+        for data, bits, hashes, _ in self.filters:
+            for i in range(hashes):
+                pos = (h1 + i * h2) % bits
+                if not data[pos >> 3] & (1 << (pos & 7)):
+                    break
+            else:
+                return True
+        return False
+
+    def _grow(self):
+        import math
+
+        capacity = self.capacity << len(self.filters)
+        bits = int(-capacity * math.log(self.error_rate) / (math.log(2) ** 2))
+        hashes = max(1, round(bits / capacity * math.log(2)))
+
+        entry = (bytearray((bits + 7) >> 3), bits, hashes, capacity)
+        self.filters.append(entry)
+        self.filled = 0
+        return entry
+
+
+_filters = {}
+_filters_lock = threading.Lock()
+
+
+def prefix_id(cursor, prefix):
+    """Return the ID of 'prefix' in the 'archive_prefixes' table"""
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS archive_prefixes "
+        "(id INTEGER PRIMARY KEY, prefix TEXT UNIQUE NOT NULL)"
+    )
+    cursor.execute("SELECT id FROM archive_prefixes WHERE prefix=?", (prefix,))
+    if row := cursor.fetchone():
+        return row[0]
+    cursor.execute("INSERT INTO archive_prefixes (prefix) VALUES (?)", (prefix,))
+    return cursor.lastrowid
+
+
+def prefix_end(prefix):
+    """Return the smallest string greater than all strings starting with 'prefix'
+
+    Return None if there is no such string.
+    """
+    while prefix:
+        if (end := ord(prefix[-1]) + 1) <= 0x10FFFF:
+            return prefix[:-1] + chr(end)
+        prefix = prefix[:-1]
+    return None
+
+
 class DownloadArchivePostgresql:
     _psycopg = None
 
@@ -152,11 +518,13 @@ class DownloadArchivePostgresql:
         self.close = con.close
         self.keygen = keygen
         self._cache_key = cache_key or "_archive_key"
+        self._prefetched = {}
 
         table = "archive" if table is None else sanitize(table)
         self._stmt_select = (
             f"SELECT true " f"FROM {table} " f"WHERE entry=%s " f"LIMIT 1"
         )
+        self._stmt_select_many = f"SELECT entry FROM {table} WHERE entry = ANY(%s)"
         self._stmt_insert = (
             f"INSERT INTO {table} (entry) " f"VALUES (%s) " f"ON CONFLICT DO NOTHING"
         )
@@ -193,6 +561,19 @@ class DownloadArchivePostgresql:
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
+        return self._select(key)
+
+    def prefetch(self, kwdicts):
+        keygen = self.keygen
+        keys = {keygen(kwdict) for kwdict in kwdicts}
+        return self._prefetch(keys) == len(keys)
+
+    def finalize(self):
+        pass
+
+    def _select(self, key):
+        if (result := self._prefetched.pop(key, None)) is not None:
+            return result
         try:
             self.cursor.execute(self._stmt_select, (key,))
             return self.cursor.fetchone()
@@ -206,8 +587,26 @@ class DownloadArchivePostgresql:
             self.connection.rollback()
             return False
 
-    def finalize(self):
-        pass
+    def _prefetch(self, keys):
+        self._prefetched = {}
+        if not keys:
+            return 0
+
+        try:
+            self.cursor.execute(self._stmt_select_many, (list(keys),))
+            found = {entry for (entry,) in self.cursor}
+        except Exception as exc:
+            log.error(
+                "%s: %s when checking entries: %s",
+                self.connection,
+                exc.__class__.__name__,
+                exc,
+            )
+            self.connection.rollback()
+            return 0
+
+        self._prefetched = {key: key in found for key in keys}
+        return len(found)
 
 
 class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
@@ -223,18 +622,13 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
         if key in self.keys:
             return True
-        try:
-            self.cursor.execute(self._stmt_select, (key,))
-            return self.cursor.fetchone()
-        except Exception as exc:
-            log.error(
-                "%s: %s when checking entry: %s",
-                self.connection,
-                exc.__class__.__name__,
-                exc,
-            )
-            self.connection.rollback()
-            return False
+        return self._select(key)
+
+    def prefetch(self, kwdicts):
+        keygen = self.keygen
+        keys = self.keys
+        pending = {key for kwdict in kwdicts if (key := keygen(kwdict)) not in keys}
+        return self._prefetch(pending) == len(pending)
 
     def finalize(self):
         if not self.keys:
@@ -250,3 +644,253 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
                 exc,
             )
             self.connection.rollback()
+
+
+###############################################################################
+# Maintenance #################################################################
+
+
+def maintain(path, actions, prefixes=(), simulate=False):
+    """Run maintenance 'actions' on the SQLite archive at 'path'
+
+    Supported actions are
+    'shard', 'compact', 'optimize', and 'stats',
+    which always run in this order.
+    'prefixes' is a list of archive ID prefixes, usually all categories,
+    used to group IDs by their prefix.
+    With 'simulate', only report what 'shard' would do
+    and skip all other actions modifying the archive.
+    """
+    if isinstance(actions, str):
+        actions = actions.split(",")
+    actions = [action.strip().lower() for action in actions]
+    if unknown := set(actions).difference(("shard", "compact", "optimize", "stats")):
+        log.error("Unsupported archive maintenance action(s): %s", ", ".join(unknown))
+        return 2
+
+    path = util.expand_path(path)
+    if not os.path.isfile(path):
+        log.error("Unable to open archive '%s': No such file", path)
+        return 1
+
+    import sqlite3
+
+    con = sqlite3.connect(path)
+    con.isolation_level = None
+    con.create_function("digest", 1, digest, deterministic=True)
+    con.create_function("match", 1, _prefix_matcher(prefixes), deterministic=True)
+
+    try:
+        if "shard" in actions:
+            _shard(con, prefixes, simulate)
+        if "compact" in actions and not simulate:
+            _compact(con)
+        if "optimize" in actions and not simulate:
+            log.info("Optimizing '%s'", path)
+            con.execute("ANALYZE")
+            con.execute("VACUUM")
+        if "stats" in actions:
+            _stats(con, path)
+    except sqlite3.Error as exc:
+        log.error("%s: %s", exc.__class__.__name__, exc)
+        return 1
+    finally:
+        con.close()
+    return 0
+
+
+def _tables(con):
+    """Return a dict mapping archive table names to their 'compact' state"""
+    tables = {}
+    for (name,) in con.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+    ).fetchall():
+        columns = [
+            column[1] for column in con.execute(f"PRAGMA table_info({sanitize(name)})")
+        ]
+        if columns == ["entry"]:
+            tables[name] = False
+        elif columns == ["entry", "prefix"]:
+            tables[name] = True
+    return tables
+
+
+def _prefix_matcher(prefixes):
+    """Return a function returning the longest prefix of an archive ID"""
+    lengths = sorted({len(prefix) for prefix in prefixes if prefix}, reverse=True)
+    prefixes = set(prefixes)
+
+    def match(entry):
+        if isinstance(entry, str):
+            for length in lengths:
+                if entry[:length] in prefixes:
+                    return entry[:length]
+        return None
+
+    return match
+
+
+def _shard(con, prefixes, simulate=False):
+    """Move IDs from 'archive' into separate tables per prefix
+
+    The resulting layout is the same as when using
+    "archive-table": "{category}"
+
+    Each ID goes to the table of its longest matching prefix.
+    IDs only get removed from 'archive' after all of them
+    have been copied to their new tables.
+    """
+    tables = _tables(con)
+    if tables.get("archive") is not False:
+        log.warning("No 'archive' table with uncompacted IDs to shard")
+        return
+
+    plan = []
+    prefixes = set(filter(None, prefixes))
+    for prefix, count in con.execute(
+        "SELECT match(entry), COUNT(*) FROM archive "
+        "WHERE match(entry) IS NOT NULL GROUP BY 1 ORDER BY 1"
+    ).fetchall():
+        if (end := prefix_end(prefix)) is None:
+            continue
+        table = sanitize(prefix)
+        if tables.get(prefix):
+            log.warning("Unable to move '%s' IDs into table %s", prefix, table)
+            continue
+        if overlap := [p for p in prefixes if p != prefix and prefix.startswith(p)]:
+            overlap = f" (also matching '{', '.join(sorted(overlap))}')"
+        log.info(
+            "%s %s '%s' IDs into table %s%s",
+            "Would move" if simulate else "Moving",
+            count,
+            prefix,
+            table,
+            overlap or "",
+        )
+        plan.append((prefix, table, (prefix, end, prefix)))
+
+    if simulate or not plan:
+        return
+
+    moved = 0
+    select = "FROM archive WHERE entry >= ? AND entry < ? AND match(entry) = ?"
+    con.execute("BEGIN")
+    try:
+        for prefix, table, params in plan:
+            con.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                f"(entry TEXT PRIMARY KEY) WITHOUT ROWID"
+            )
+            con.execute(
+                f"INSERT OR IGNORE INTO {table} (entry) "
+                f"SELECT substr(entry, {len(prefix) + 1}) {select}",
+                params,
+            )
+
+        # keep 'archive' unchanged unless every ID has been copied
+        for prefix, table, params in plan:
+            (missing,) = con.execute(
+                f"SELECT COUNT(*) {select} AND substr(entry, {len(prefix) + 1}) "
+                f"NOT IN (SELECT entry FROM {table})",
+                params,
+            ).fetchone()
+            if missing:
+                import sqlite3
+
+                raise sqlite3.IntegrityError(
+                    f"{missing} '{prefix}' IDs missing from table {table}"
+                )
+
+        for prefix, table, params in plan:
+            moved += con.execute(f"DELETE {select}", params).rowcount
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    con.execute("COMMIT")
+
+    (remaining,) = con.execute("SELECT COUNT(*) FROM archive").fetchone()
+    log.info(
+        "Moved %s IDs into per-category tables, %s IDs remain in 'archive'",
+        moved,
+        remaining,
+    )
+    log.info("Set 'archive-table' to '{category}' to use these tables")
+
+
+def _compact(con):
+    """Replace IDs of all archive tables with their digest"""
+    tables = [name for name, compact in _tables(con).items() if not compact]
+    if not tables:
+        log.info("No archive tables to compact")
+        return
+
+    con.execute("BEGIN")
+    try:
+        cursor = con.cursor()
+        prefix_id(cursor, "")
+        for name in tables:
+            table = sanitize(name)
+            temp = sanitize(name + ".compact")
+            log.info("Compacting table %s", table)
+
+            con.execute(f"DROP TABLE IF EXISTS {temp}")
+            con.execute(
+                f"CREATE TABLE {temp} "
+                f"(entry BLOB PRIMARY KEY, prefix INTEGER) WITHOUT ROWID"
+            )
+            con.execute(
+                "INSERT OR IGNORE INTO archive_prefixes (prefix) "
+                f"SELECT DISTINCT match(entry) FROM {table} "
+                "WHERE match(entry) IS NOT NULL"
+            )
+            con.execute(
+                f"INSERT OR IGNORE INTO {temp} (entry, prefix) "
+                f"SELECT digest(entry), archive_prefixes.id FROM {table} "
+                f"LEFT JOIN archive_prefixes ON archive_prefixes.prefix = match(entry)"
+            )
+            con.execute(f"DROP TABLE {table}")
+            con.execute(f"ALTER TABLE {temp} RENAME TO {table}")
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    con.execute("COMMIT")
+
+
+def _stats(con, path):
+    """Write per-prefix entry counts and sizes of all archive tables"""
+    page_size = con.execute("PRAGMA page_size").fetchone()[0]
+    page_count = con.execute("PRAGMA page_count").fetchone()[0]
+    free_count = con.execute("PRAGMA freelist_count").fetchone()[0]
+
+    write = sys.stdout.write
+    write(
+        f"{path}\n"
+        f"Size    : {util.format_value(page_size * page_count)}B "
+        f"({page_count} pages, {free_count} free)\n"
+    )
+
+    for name, compact in _tables(con).items():
+        table = sanitize(name)
+        if compact:
+            rows = con.execute(
+                f"SELECT archive_prefixes.prefix, COUNT(*), SUM(length(entry)) "
+                f"FROM {table} LEFT JOIN archive_prefixes "
+                f"ON archive_prefixes.id = {table}.prefix "
+                f"GROUP BY 1 ORDER BY 2 DESC"
+            ).fetchall()
+        else:
+            rows = con.execute(
+                f"SELECT match(entry), COUNT(*), SUM(length(CAST(entry AS BLOB))) "
+                f"FROM {table} GROUP BY 1 ORDER BY 2 DESC"
+            ).fetchall()
+
+        total = sum(row[1] for row in rows)
+        write(
+            f"\nTable   : {name}{' (compact)' if compact else ''}\n"
+            f"Entries : {total}\n"
+        )
+        for prefix, count, size in rows:
+            write(
+                f"  {prefix or '-':<24} {count:>10} "
+                f"{util.format_value(size or 0):>8}B\n"
+            )
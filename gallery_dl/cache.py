@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-# Copyright 2016-2021 Mike Fährmann
+# Copyright 2016-2025 Mike Fährmann
 #
 # This program is free software; you can redistribute it and/or modify
 # it under the terms of the GNU General Public License version 2 as
@@ -10,18 +10,55 @@
 
 import sqlite3
 import pickle
+import json
 import time
 import os
 import functools
+import threading
+import contextlib
+import collections
 from . import config, util
 
 
+class LRUCache(collections.OrderedDict):
+    """Dict holding at most 'maxsize' entries
+
+    Evicts the least recently used entry when adding a new one.
+    Without an explicit 'maxsize', 'cache.memory-entries' gets read
+    when adding the first entry, since most caches get created
+    at import time before any config files are loaded.
+    """
+
+    def __init__(self, maxsize=None):
+        collections.OrderedDict.__init__(self)
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = collections.OrderedDict.__getitem__(self, key)
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            pass  # evicted by another thread
+        return value
+
+    def __setitem__(self, key, value):
+        collections.OrderedDict.__setitem__(self, key, value)
+        self.move_to_end(key)
+        if (maxsize := self.maxsize) is None:
+            maxsize = self.maxsize = config.get(("cache",), "memory-entries", 512)
+        if maxsize and len(self) > maxsize:
+            try:
+                self.popitem(False)
+            except KeyError:
+                pass
+
+
 class CacheDecorator:
     """Simplified in-memory cache"""
 
     def __init__(self, func, keyarg):
         self.func = func
-        self.cache = {}
+        self.cache = LRUCache()
         self.keyarg = keyarg
 
     def __get__(self, instance, cls):
@@ -53,32 +90,42 @@ class MemoryCacheDecorator(CacheDecorator):
         self.maxage = maxage
 
     def __call__(self, *args, **kwargs):
+        return self.lookup(args, kwargs)[0]
+
+    def lookup(self, args, kwargs=None, margin=0):
+        """Return (value, expires) for 'args'
+
+        Call 'func' when there is no cached value
+        that stays valid for at least another 'margin' seconds.
+        """
         key = "" if self.keyarg is None else args[self.keyarg]
         timestamp = int(time.time())
         try:
             value, expires = self.cache[key]
         except KeyError:
             expires = 0
-        if expires <= timestamp:
-            value = self.func(*args, **kwargs)
+        if expires <= timestamp + margin:
+            value = self.func(*args, **(kwargs or {}))
             expires = timestamp + self.maxage
             self.cache[key] = value, expires
-        return value
+        return value, expires
 
     def update(self, key, value):
-        self.cache[key] = value, int(time.time()) + self.maxage
+        """Store 'value' for 'key' and return its expiration timestamp"""
+        expires = int(time.time()) + self.maxage
+        self.cache[key] = value, expires
+        return expires
 
 
 class DatabaseCacheDecorator:
     """Database cache"""
 
     db = None
-    _init = True
 
     def __init__(self, func, keyarg, maxage):
         self.key = f"{func.__module__}.{func.__name__}"
         self.func = func
-        self.cache = {}
+        self.cache = LRUCache()
         self.keyarg = keyarg
         self.maxage = maxage
 
@@ -86,73 +133,194 @@ class DatabaseCacheDecorator:
         return functools.partial(self.__call__, obj)
 
     def __call__(self, *args, **kwargs):
+        return self.lookup(args, kwargs)[0]
+
+    def lookup(self, args, kwargs=None, margin=0):
+        """Return (value, expires) for 'args'
+
+        Call 'func' when neither the in-memory nor the database cache
+        has a value that stays valid for at least another 'margin' seconds.
+        """
         key = "" if self.keyarg is None else args[self.keyarg]
-        timestamp = int(time.time())
+        now = int(time.time())
+        timestamp = now + margin
 
         # in-memory cache lookup
         try:
-            value, expires = self.cache[key]
-            if expires > timestamp:
-                return value
+            result = self.cache[key]
+            if result[1] > timestamp:
+                return result
         except KeyError:
             pass
 
         # database lookup
         fullkey = f"{self.key}-{key}"
-        with self.database() as db:
-            cursor = db.cursor()
-            try:
-                cursor.execute("BEGIN EXCLUSIVE")
-            except sqlite3.OperationalError:
-                pass  # Silently swallow exception - workaround for Python 3.6
-            cursor.execute(
-                "SELECT value, expires FROM data WHERE key=? LIMIT 1",
-                (fullkey,),
-            )
-            result = cursor.fetchone()
-
-            if result and result[1] > timestamp:
-                value, expires = result
-                value = pickle.loads(value)
-            else:
-                value = self.func(*args, **kwargs)
-                expires = timestamp + self.maxage
-                cursor.execute(
-                    "INSERT OR REPLACE INTO data VALUES (?,?,?)",
-                    (fullkey, pickle.dumps(value), expires),
-                )
-
-        self.cache[key] = value, expires
-        return value
+        result = self.db.get(fullkey)
+
+        if not result or result[1] <= timestamp:
+            # lock the database to prevent other processes
+            # from calling 'func' at the same time
+            with self.db.lock():
+                result = self.db.get(fullkey)
+                if not result or result[1] <= timestamp:
+                    value = self.func(*args, **(kwargs or {}))
+                    expires = now + self.maxage
+                    self.db.set(fullkey, value, expires)
+                    result = value, expires
+
+        self.cache[key] = result
+        return result
 
     def update(self, key, value):
+        """Store 'value' for 'key' and return its expiration timestamp"""
         expires = int(time.time()) + self.maxage
         self.cache[key] = value, expires
-        with self.database() as db:
-            db.execute(
-                "INSERT OR REPLACE INTO data VALUES (?,?,?)",
-                (f"{self.key}-{key}", pickle.dumps(value), expires),
-            )
+        self.db.set(f"{self.key}-{key}", value, expires)
+        return expires
 
     def invalidate(self, key):
         try:
             del self.cache[key]
         except KeyError:
             pass
-        with self.database() as db:
-            db.execute(
-                "DELETE FROM data WHERE key=?",
-                (f"{self.key}-{key}",),
+        self.db.delete(f"{self.key}-{key}")
+
+
+class DatabaseBackend:
+    """SQLite3 database storing cache entries across processes
+
+    Its connection is shared between threads. Statements from other
+    threads wait until a transaction started by lock() has ended.
+
+    Expired entries get deleted when the database is first used
+    and every 'purge_interval' seconds while storing new entries.
+    """
+
+    purge_interval = 3600
+
+    def __init__(self, path, pragma=None, format=None):
+        self.connection = con = sqlite3.connect(
+            path, timeout=60, check_same_thread=False
+        )
+        con.isolation_level = None
+        self.json = format == "json"
+        self._init = True
+        self._lock = threading.RLock()
+        self._purged = 0.0
+
+        if pragma:
+            for stmt in pragma:
+                con.execute(f"PRAGMA {stmt}")
+
+    def get(self, key):
+        """Return (value, expires) for 'key' or None"""
+        with self._lock:
+            result = (
+                self.database()
+                .execute("SELECT value, expires FROM data WHERE key=? LIMIT 1", (key,))
+                .fetchone()
+            )
+        if result:
+            return self.loads(result[0]), result[1]
+        return None
+
+    def set(self, key, value, expires):
+        """Store 'value' for 'key' until timestamp 'expires'"""
+        value = self.dumps(value)
+        with self._lock:
+            self.database().execute(
+                "INSERT OR REPLACE INTO data VALUES (?,?,?)", (key, value, expires)
+            )
+            if time.monotonic() - self._purged >= self.purge_interval:
+                self._purge()
+
+    def delete(self, key):
+        """Delete the entry for 'key'"""
+        with self._lock:
+            self.database().execute("DELETE FROM data WHERE key=?", (key,))
+
+    def clear(self, prefix=None):
+        """Delete all entries with keys starting with 'prefix'
+
+        Return the number of deleted entries.
+        """
+        with self._lock:
+            cursor = self.connection.cursor()
+            if prefix is None:
+                cursor.execute("DELETE FROM data")
+            else:
+                cursor.execute(
+                    "DELETE FROM data WHERE key LIKE ? || '%'",
+                    (prefix,),
+                )
+            if rowcount := cursor.rowcount:
+                cursor.execute("VACUUM")
+        return rowcount
+
+    def purge(self, timestamp=None):
+        """Delete all expired entries"""
+        if timestamp is None:
+            timestamp = int(time.time())
+        with self._lock:
+            return (
+                self.database()
+                .execute("DELETE FROM data WHERE expires <= ?", (timestamp,))
+                .rowcount
             )
 
+    @contextlib.contextmanager
+    def lock(self):
+        """Hold an exclusive lock on the database"""
+        with self._lock:
+            con = self.database()
+            try:
+                con.execute("BEGIN EXCLUSIVE")
+            except sqlite3.OperationalError:
+                # already inside a transaction
+                yield
+                return
+
+            try:
+                yield
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+
     def database(self):
         if self._init:
-            self.db.execute(
+            self._init = False
+            self.connection.execute(
                 "CREATE TABLE IF NOT EXISTS data "
                 "(key TEXT PRIMARY KEY, value TEXT, expires INTEGER)"
             )
-            DatabaseCacheDecorator._init = False
-        return self.db
+            self._purge()
+        return self.connection
+
+    def _purge(self):
+        self._purged = time.monotonic()
+        try:
+            self.purge()
+        except sqlite3.OperationalError:
+            pass  # database locked or read-only
+
+    def dumps(self, value):
+        if self.json:
+            try:
+                data = json.dumps(value, separators=(",", ":"))
+            except (TypeError, ValueError):
+                pass
+            else:
+                # tuples, non-string dict keys, etc
+                # do not survive a JSON round trip unchanged
+                if json.loads(data) == value:
+                    return data
+        return pickle.dumps(value)
+
+    def loads(self, value):
+        if isinstance(value, str):
+            return json.loads(value)
+        return pickle.loads(value)
 
 
 def memcache(maxage=None, keyarg=None):
@@ -182,26 +350,12 @@ def clear(module):
     if not db:
         return None
 
-    rowcount = 0
-    cursor = db.cursor()
-
     try:
         if module == "ALL":
-            cursor.execute("DELETE FROM data")
-        else:
-            cursor.execute(
-                "DELETE FROM data "
-                "WHERE key LIKE 'gallery_dl.extractor.' || ? || '.%'",
-                (module.lower(),),
-            )
+            return db.clear()
+        return db.clear(f"gallery_dl.extractor.{module.lower()}.")
     except sqlite3.OperationalError:
-        pass  # database not initialized, cannot be modified, etc.
-    else:
-        rowcount = cursor.rowcount
-        db.commit()
-        if rowcount:
-            cursor.execute("VACUUM")
-    return rowcount
+        return 0  # database not initialized, cannot be modified, etc.
 
 
 def _path():
@@ -226,8 +380,10 @@ def _init():
         # restrict access permissions for new db files
         os.close(os.open(dbfile, os.O_CREAT | os.O_RDONLY, 0o600))
 
-        DatabaseCacheDecorator.db = sqlite3.connect(
-            dbfile, timeout=60, check_same_thread=False
+        DatabaseCacheDecorator.db = DatabaseBackend(
+            dbfile,
+            config.get(("cache",), "pragma"),
+            config.get(("cache",), "format"),
         )
     except (OSError, TypeError, sqlite3.OperationalError):
         global cache
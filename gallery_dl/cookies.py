@@ -19,9 +19,10 @@ import struct
 import subprocess
 import sys
 import tempfile
+import time
 from hashlib import pbkdf2_hmac
 from http.cookiejar import Cookie
-from . import aes, text, util
+from . import aes, cache, text, util
 
 
 SUPPORTED_BROWSERS_CHROMIUM = {
@@ -55,6 +56,39 @@ def load_cookies(browser_specification):
         raise ValueError(f"unknown browser '{browser_name}'")
 
 
+def load_cookies_cached(browser_specification, maxage=0):
+    """Load browser cookies and keep them in the cache database
+
+    Return cookies stored by a previous call with the same
+    'browser_specification' when they are less than 'maxage' seconds old.
+    """
+    db = cache.DatabaseCacheDecorator.db
+    if not db or not maxage or maxage <= 0:
+        return load_cookies(browser_specification)
+
+    spec = "|".join("" if v is None else str(v) for v in browser_specification)
+    key = f"{__name__}.load_cookies-{spec}"
+    now = int(time.time())
+
+    try:
+        result = db.get(key)
+    except Exception as exc:
+        logger.debug(
+            "Failed to read cached cookies (%s: %s)", exc.__class__.__name__, exc
+        )
+        result = None
+    if result and result[1] > now:
+        logger.debug("Using cookies cached until %s", result[1])
+        return result[0]
+
+    cookies = load_cookies(browser_specification)
+    try:
+        db.set(key, cookies, now + int(maxage))
+    except Exception as exc:
+        logger.debug("Failed to cache cookies (%s: %s)", exc.__class__.__name__, exc)
+    return cookies
+
+
 def load_cookies_firefox(browser_name, profile=None, container=None, domain=None):
     path, container_id = _firefox_cookies_database(browser_name, profile, container)
 
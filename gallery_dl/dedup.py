@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Content-addressed index of downloaded files"""
+
+import os
+import shutil
+import sqlite3
+import hashlib
+import logging
+import threading
+from . import util
+
+log = logging.getLogger("dedup")
+
+# number of bytes at the start of a file covered by its 'fast' hash
+FAST_SIZE = 65536
+
+
+def fast_hash(data):
+    """Return the 'fast' hash of the first FAST_SIZE bytes of a file"""
+    return hashlib.blake2b(data[:FAST_SIZE], digest_size=16).hexdigest()
+
+
+def file_hashes(path, algorithm, chunk_size=65536):
+    """Return the 'fast' and 'algorithm' hash digests of the file at 'path'
+
+    Only reads the first FAST_SIZE bytes when 'algorithm' is None.
+    """
+    with open(path, "rb") as fp:
+        head = fp.read(FAST_SIZE)
+        if algorithm is None:
+            return fast_hash(head), None
+
+        h = hashlib.new(algorithm, head)
+        while data := fp.read(chunk_size):
+            h.update(data)
+    return fast_hash(head), h.hexdigest()
+
+
+def link(src, dst, mode):
+    """Create a 'mode' link to file 'src' at 'dst', replacing 'dst'"""
+    tmp = dst + ".dedup"
+    if mode == "symlink":
+        os.symlink(os.path.abspath(src), tmp)
+    elif mode == "reflink":
+        reflink(src, tmp)
+    else:
+        os.link(src, tmp)
+    try:
+        os.replace(tmp, dst)
+    except OSError:
+        util.remove_file(tmp)
+        raise
+
+
+def reflink(src, dst):
+    """Create a copy-on-write copy of 'src' at 'dst'"""
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            # FICLONE
+            fcntl.ioctl(fdst.fileno(), 0x40049409, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            util.remove_file(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+class DedupIndex:
+    """SQLite3 database mapping file sizes and hashes to file paths"""
+
+    def __init__(self, path, pragma=None):
+        path = util.expand_path(path)
+        try:
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        except sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path))
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        con.isolation_level = None
+
+        self.path = path
+        self.connection = con
+        self.lock = threading.Lock()
+
+        if pragma:
+            for stmt in pragma:
+                con.execute(f"PRAGMA {stmt}")
+
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "size INTEGER NOT NULL, "
+            "strong TEXT NOT NULL, "
+            "fast TEXT NOT NULL, "
+            "path TEXT NOT NULL, "
+            "PRIMARY KEY (size, strong))"
+        )
+        con.execute("CREATE INDEX IF NOT EXISTS files_fast ON files (size, fast)")
+        con.execute("CREATE INDEX IF NOT EXISTS files_strong ON files (strong)")
+
+    def close(self):
+        self.connection.close()
+
+    def lookup(self, size, strong):
+        """Return the path of a file with 'size' and 'strong' hash or None"""
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT path FROM files WHERE size=? AND strong=? LIMIT 1",
+                (size, strong),
+            )
+            result = cursor.fetchone()
+        return result[0] if result else None
+
+    def candidates(self, size, fast):
+        """Return (strong, path) of all files with 'size' and 'fast' hash"""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT strong, path FROM files WHERE size=? AND fast=?",
+                (size, fast),
+            ).fetchall()
+
+    def lookup_digest(self, strong):
+        """Return (size, path) of a file with 'strong' hash or None"""
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT size, path FROM files WHERE strong=? LIMIT 1", (strong,)
+            )
+            return cursor.fetchone()
+
+    def add(self, size, fast, strong, path):
+        """Set 'path' as canonical file for 'size' and 'strong'"""
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?,?,?,?)",
+                (size, strong, fast, path),
+            )
+
+    def remove(self, size, strong):
+        """Remove the entry for 'size' and 'strong'"""
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM files WHERE size=? AND strong=?", (size, strong)
+            )
+
+    def find(self, size, strong):
+        """Return the path of an existing file with 'size' and 'strong'
+
+        Entries whose file got deleted or changed its size are removed.
+        """
+        path = self.lookup(size, strong)
+        if path is None:
+            return None
+        return self._validate(size, strong, path)
+
+    def find_digest(self, strong):
+        """Return the path of an existing file with 'strong' hash"""
+        result = self.lookup_digest(strong)
+        if result is None:
+            return None
+        return self._validate(result[0], strong, result[1])
+
+    def find_fast(self, size, fast):
+        """Return the path of an existing file with 'size' and 'fast' hash"""
+        for strong, path in self.candidates(size, fast):
+            if path := self._validate(size, strong, path):
+                return path
+        return None
+
+    def _validate(self, size, strong, path):
+        try:
+            if os.stat(path).st_size == size:
+                return path
+        except OSError:
+            pass
+        log.debug("Removing stale entry for '%s'", path)
+        self.remove(size, strong)
+        return None
+
+
+def connect(path, pragma=None):
+    """Return a shared DedupIndex for 'path'"""
+    path = util.expand_path(path)
+    with _lock:
+        index = _indices.get(path)
+        if index is None:
+            index = _indices[path] = DedupIndex(path, pragma)
+    return index
+
+
+_indices = {}
+_lock = threading.Lock()
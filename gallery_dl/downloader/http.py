@@ -8,11 +8,15 @@
 
 """Downloader module for http:// and https:// URLs"""
 
+import os
+import json
 import time
+import hashlib
+import threading
 import mimetypes
 from requests.exceptions import RequestException, ConnectionError, Timeout
 from .common import DownloaderBase
-from .. import text, util, output, exception
+from .. import text, util, output, exception, ratelimit, dedup
 from ssl import SSLError
 
 FLAGS = util.FLAGS
@@ -24,6 +28,7 @@ class HttpDownloader(DownloaderBase):
     def __init__(self, job):
         DownloaderBase.__init__(self, job)
         extractor = job.extractor
+        self.category = extractor.category
         self.downloading = False
 
         self.adjust_extension = self.config("adjust-extensions", True)
@@ -41,6 +46,7 @@ class HttpDownloader(DownloaderBase):
         self.verify = self.config("verify", extractor._verify)
         self.mtime = self.config("mtime", True)
         self.rate = self.config("rate")
+        self.segments = self.config("segments", 1)
         interval_429 = self.config("sleep-429")
 
         if not self.config("consume-content", False):
@@ -67,6 +73,14 @@ class HttpDownloader(DownloaderBase):
                 self.log.warning("Invalid chunk size (%r)", self.chunk_size)
                 chunk_size = 32768
             self.chunk_size = chunk_size
+        if self.segments > 1:
+            threshold = self.config("segments-threshold", "16M")
+            if not (segments_min := text.parse_bytes(threshold)):
+                self.log.warning("Invalid segments threshold (%r)", threshold)
+                segments_min = 16777216
+            self.segments_min = max(segments_min, self.segments)
+        else:
+            self.segments = 0
         if self.rate:
             func = util.build_selection_func(self.rate, 0, text.parse_bytes)
             if rmax := func.args[1] if hasattr(func, "args") else func():
@@ -101,12 +115,16 @@ class HttpDownloader(DownloaderBase):
                 util.remove_file(pathfmt.temppath)
 
     def _download_impl(self, url, pathfmt):
-        response = None
+        response = segments = None
         tries = code = 0
         msg = ""
+        segmented = self.segments
 
         metadata = self.metadata
         kwdict = pathfmt.kwdict
+        # extractors may reuse 'kwdict' for their next file
+        kwdict.pop("_http_hashes", None)
+        kwdict.pop("_http_size", None)
         expected_status = kwdict.get("_http_expected_status", ())
         adjust_extension = kwdict.get("_http_adjust_extension", self.adjust_extension)
 
@@ -114,6 +132,9 @@ class HttpDownloader(DownloaderBase):
             pathfmt.part_enable(self.partdir)
 
         while True:
+            bucket = ratelimit.bucket_url(url, self.category)
+            seconds = bucket.acquire()
+
             if tries:
                 if response:
                     self.release_conn(response)
@@ -123,15 +144,15 @@ class HttpDownloader(DownloaderBase):
                 if tries > self.retries:
                     return False
 
-                if code == 429 and self.interval_429:
-                    s = self.interval_429()
-                    time.sleep(s if s > tries else tries)
-                else:
-                    time.sleep(tries)
+                if seconds < tries:
+                    seconds = tries
                 code = 0
 
+            if seconds:
+                time.sleep(seconds)
+
             tries += 1
-            file_header = None
+            file_header = hashes = None
 
             # collect HTTP headers
             headers = {"Accept": "*/*"}
@@ -143,7 +164,10 @@ class HttpDownloader(DownloaderBase):
                 headers.update(self.headers)
             #   partial content
             if file_size := pathfmt.part_size():
-                headers["Range"] = f"bytes={file_size}-"
+                if segments is None and segmented and self.part:
+                    segments = _segments_load(pathfmt.temppath + ".segments")
+                if segments is None:
+                    headers["Range"] = f"bytes={file_size}-"
 
             # connect to (remote) source
             try:
@@ -191,6 +215,12 @@ class HttpDownloader(DownloaderBase):
                     self.log.warning(challenge)
 
                 if code in self.retry_codes or 500 <= code < 600:
+                    if code == 429 and self.interval_429:
+                        until = ratelimit.reset(response)
+                        if until is None:
+                            until = time.time() + self.interval_429()
+                        # delay all downloads and API requests for this site
+                        bucket.block(until)
                     continue
                 retry = kwdict.get("_http_retry")
                 if retry and retry(response):
@@ -307,11 +337,65 @@ class HttpDownloader(DownloaderBase):
                     response.close()
                     return True
 
+            # check for duplicates of already downloaded files
+            if not offset and size and (check := kwdict.get("_http_dedup")):
+                head = file_header or b""
+                try:
+                    while len(head) < dedup.FAST_SIZE:
+                        if not (data := next(content, None)):
+                            break
+                        head += data
+                except (RequestException, SSLError) as exc:
+                    msg = str(exc)
+                    continue
+                if check(pathfmt, size, head):
+                    response.close()
+                    pathfmt.temppath = ""
+                    return True
+                file_header = head
+
+            # download content over multiple connections
+            if (
+                segmented
+                and not offset
+                and size
+                and size >= self.segments_min
+                and response.headers.get("Accept-Ranges") == "bytes"
+                and kwdict.get("_http_method", "GET") == "GET"
+            ):
+                response.close()
+                if segments is None or segments["size"] != size:
+                    segments = _segments_split(size, self.segments)
+                    if file_size:
+                        self.log.debug("Unable to resume partial download")
+                self.downloading = True
+                try:
+                    result = self._download_segments(url, pathfmt, headers, segments)
+                except exception.StopExtraction:
+                    return False
+                if result is False:
+                    # ranged requests got answered with the whole file
+                    self.log.debug("Byte ranges not supported")
+                    util.remove_file(pathfmt.temppath + ".segments")
+                    util.remove_file(pathfmt.temppath)
+                    segmented = False
+                    segments = None
+                    tries -= 1
+                    continue
+                if result:
+                    msg = result
+                    output.stderr_write("\n")
+                    continue
+                break
+
             # set open mode
             if not offset:
                 mode = "w+b"
                 if file_size:
                     self.log.debug("Unable to resume partial download")
+                    if segments is not None:
+                        util.remove_file(pathfmt.temppath + ".segments")
+                        segments = None
             else:
                 mode = "r+b"
                 self.log.debug("Resuming download at byte %d", offset)
@@ -330,6 +414,11 @@ class HttpDownloader(DownloaderBase):
                         self._adjust_extension(pathfmt, fp.read(16))
                     fp.seek(offset)
 
+                # compute requested hash digests while writing
+                if pathfmt.hashes:
+                    hashes = self._hashes_init(pathfmt.hashes, fp, offset)
+                    content = _hashes_update(content, hashes)
+
                 self.out.start(pathfmt.path)
                 try:
                     self.receive(fp, content, size, offset)
@@ -350,6 +439,12 @@ class HttpDownloader(DownloaderBase):
                     output.stderr_write("\n")
                     continue
 
+                if hashes:
+                    kwdict["_http_hashes"] = {
+                        name: h.hexdigest() for name, h in hashes.items()
+                    }
+                    kwdict["_http_size"] = fp.tell()
+
             break
 
         self.downloading = False
@@ -363,6 +458,158 @@ class HttpDownloader(DownloaderBase):
 
         return True
 
+    def _download_segments(self, url, pathfmt, headers, segments):
+        """Transfer a file over concurrent ranged requests
+
+        'segments' holds the file's total size and a list of
+        [position, end] byte ranges, updated in place to be able to
+        resume a download. Return an error message, None on success,
+        or False when the server does not support byte ranges.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        size = segments["size"]
+        ranges = [rng for rng in segments["ranges"] if rng[0] < rng[1]]
+        remaining = sum(end - pos for pos, end in ranges)
+        resume = remaining < size
+
+        with pathfmt.open("r+b" if resume else "w+b") as fp:
+            if fp is None:
+                # '.part' file no longer exists
+                return None
+            if resume:
+                self.log.debug(
+                    "Resuming segmented download at %d of %d bytes",
+                    size - remaining,
+                    size,
+                )
+            else:
+                fp.truncate(size)
+
+            stop = threading.Event()
+            write = _pwrite_func(fp.fileno())
+            workers = len(ranges) or 1
+            rate = self.rate() / workers if self.rate else None
+            progress = self.progress
+            msg = None
+
+            state = pathfmt.temppath + ".segments" if self.part else None
+            if state:
+                _segments_store(state, segments)
+
+            self.out.start(pathfmt.path)
+            time_start = time.monotonic()
+            executor = ThreadPoolExecutor(workers, "segment")
+            receive = output.buffer_wrap(self._receive_segment)
+            try:
+                pending = [
+                    executor.submit(receive, url, headers, write, rng, rate, stop)
+                    for rng in ranges
+                ]
+                while pending:
+                    done, pending = wait(pending, 0.5, FIRST_COMPLETED)
+                    for future in done:
+                        if (result := future.result()) is not None:
+                            if msg is not False:
+                                msg = result
+                            stop.set()
+
+                    if FLAGS.DOWNLOAD is not None:
+                        FLAGS.process("DOWNLOAD")
+
+                    if progress is not None:
+                        time_elapsed = time.monotonic() - time_start
+                        bytes_downloaded = remaining - sum(
+                            end - pos for pos, end in ranges
+                        )
+                        if time_elapsed > progress:
+                            self.out.progress(
+                                size,
+                                size - remaining + bytes_downloaded,
+                                int(bytes_downloaded / time_elapsed),
+                            )
+            finally:
+                stop.set()
+                executor.shutdown()
+                if state:
+                    if msg is None and all(pos >= end for pos, end in ranges):
+                        util.remove_file(state)
+                    else:
+                        _segments_store(state, segments)
+
+            if msg is not None:
+                return msg
+
+            if pathfmt.hashes:
+                hashes = self._hashes_init(pathfmt.hashes, fp, size)
+                kwdict = pathfmt.kwdict
+                kwdict["_http_hashes"] = {
+                    name: h.hexdigest() for name, h in hashes.items()
+                }
+                kwdict["_http_size"] = size
+
+        return None
+
+    def _receive_segment(self, url, headers, write, rng, rate, stop):
+        """Download byte range 'rng' of 'url' (worker thread)"""
+        position, end = rng
+        headers = headers.copy()
+        headers["Range"] = f"bytes={position}-{end - 1}"
+
+        if seconds := ratelimit.bucket_url(url, self.category).acquire():
+            time.sleep(seconds)
+
+        try:
+            response = self.session.request(
+                "GET",
+                url,
+                stream=True,
+                headers=headers,
+                timeout=self.timeout,
+                proxies=self.proxies,
+                verify=self.verify,
+            )
+        except (RequestException, SSLError) as exc:
+            return str(exc)
+
+        try:
+            if response.status_code != 206:
+                if response.status_code == 200:
+                    # 'Range' header got ignored
+                    return False
+                return (
+                    f"'{response.status_code} {response.reason}' "
+                    f"for byte range {position}-{end - 1}"
+                )
+
+            bytes_downloaded = 0
+            time_start = time.monotonic()
+
+            for data in response.iter_content(self.chunk_size):
+                if stop.is_set():
+                    return None
+                if len(data) > end - position:
+                    data = data[: end - position]
+
+                write(data, position)
+                position += len(data)
+                rng[0] = position
+                if position >= end:
+                    return None
+
+                if rate is not None:
+                    bytes_downloaded += len(data)
+                    time_expected = bytes_downloaded / rate
+                    time_elapsed = time.monotonic() - time_start
+                    if time_expected > time_elapsed:
+                        time.sleep(time_expected - time_elapsed)
+
+            return f"incomplete byte range ({position} < {end})"
+        except (RequestException, SSLError) as exc:
+            return str(exc)
+        finally:
+            response.close()
+
     def release_conn(self, response):
         """Release connection back to pool by consuming response body"""
         try:
@@ -416,6 +663,27 @@ class HttpDownloader(DownloaderBase):
                 if time_expected > time_elapsed:
                     time.sleep(time_expected - time_elapsed)
 
+    def _hashes_init(self, names, fp, offset):
+        """Create hash objects and feed them the first 'offset' bytes of 'fp'"""
+        hashes = {}
+        for name in names:
+            try:
+                hashes[name] = hashlib.new(name)
+            except ValueError:
+                self.log.debug("Unsupported hash algorithm '%s'", name)
+
+        if offset and hashes:
+            fp.seek(0)
+            while offset > 0:
+                data = fp.read(min(offset, self.chunk_size))
+                if not data:
+                    break
+                offset -= len(data)
+                for h in hashes.values():
+                    h.update(data)
+
+        return hashes
+
     def _find_extension(self, response):
         """Get filename extension from MIME type"""
         mtype = response.headers.get("Content-Type", "image/jpeg")
@@ -449,6 +717,67 @@ class HttpDownloader(DownloaderBase):
         return False
 
 
+def _hashes_update(content, hashes):
+    """Update 'hashes' with each chunk of 'content'"""
+    updates = [h.update for h in hashes.values()]
+    for data in content:
+        for update in updates:
+            update(data)
+        yield data
+
+
+def _segments_split(size, count):
+    """Split 'size' bytes into 'count' byte ranges"""
+    step = -(-size // count)
+    return {
+        "size": size,
+        "ranges": [[pos, min(pos + step, size)] for pos in range(0, size, step)],
+    }
+
+
+def _segments_load(path):
+    """Load the state of a segmented download"""
+    try:
+        with open(path) as fp:
+            segments = json.load(fp)
+        if isinstance(segments["size"], int) and segments["ranges"]:
+            return segments
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+
+def _segments_store(path, segments):
+    """Store the state of a segmented download"""
+    with open(path, "w") as fp:
+        json.dump(segments, fp)
+
+
+if hasattr(os, "pwrite"):
+
+    def _pwrite_func(fd):
+        def write(data, position):
+            while data:
+                written = os.pwrite(fd, data, position)
+                data = data[written:]
+                position += written
+
+        return write
+
+else:
+
+    def _pwrite_func(fd):
+        lock = threading.Lock()
+
+        def write(data, position):
+            with lock:
+                os.lseek(fd, position, os.SEEK_SET)
+                while data:
+                    data = data[os.write(fd, data) :]
+
+        return write
+
+
 MIME_TYPES = {
     "image/jpeg": "jpg",
     "image/jpg": "jpg",
@@ -7,6 +7,7 @@
 # published by the Free Software Foundation.
 
 import sys
+import threading
 from ..text import re_compile
 
 modules = [
@@ -244,9 +245,21 @@ modules = [
 
 def find(url):
     """Find a suitable extractor for the given URL"""
-    for cls in _list_classes():
+    for cls in _candidates(url):
         if match := cls.pattern.match(url):
             return cls(match)
+
+    with _lock:
+        for module in _module_iter:
+            classes = add_module(module)
+            if isinstance(module, _LazyModule):
+                # add all remaining modules and use the dispatch index
+                for module in _module_iter:
+                    add_module(module)
+                return find(url)
+            for cls in classes:
+                if match := cls.pattern.match(url):
+                    return cls(match)
     return None
 
 
@@ -260,6 +273,10 @@ def add(cls):
 
 def add_module(module):
     """Add all extractors in 'module' to the list of available extractors"""
+    if isinstance(module, _LazyModule):
+        _cache.extend(module.classes)
+        return module.classes
+
     if classes := _get_classes(module):
         if isinstance(classes[0].pattern, str):
             for cls in classes:
@@ -279,18 +296,25 @@ def extractors():
 
 def _list_classes():
     """Yield available extractor classes"""
-    yield from _cache
-
-    for module in _module_iter:
-        yield from add_module(module)
+    with _lock:
+        for module in _module_iter:
+            add_module(module)
+        for cls in _cache:
+            if isinstance(cls, _LazyExtractor):
+                cls.load()
 
     globals()["_list_classes"] = lambda: _cache
+    yield from _cache
 
 
 def _modules_internal():
     globals_ = globals()
+    manifest = _load_manifest()
     for module_name in modules:
-        yield __import__(module_name, globals_, None, (), 1)
+        if (entry := manifest.get(module_name)) and not _instances(entry[0]):
+            yield _LazyModule(module_name, entry[1])
+        else:
+            yield __import__(module_name, globals_, None, (), 1)
 
 
 def _modules_path(path, files):
@@ -310,5 +334,354 @@ def _get_classes(module):
     ]
 
 
+def _load_manifest():
+    """Return the prebuilt manifest of all extractor modules"""
+    try:
+        from ._manifest import MODULES
+    except ImportError:
+        return {}
+    return MODULES
+
+
+def _instances(basecategories):
+    """Return True if there are user-defined instances for 'basecategories'"""
+    from .. import config
+
+    for basecategory in basecategories:
+        instances = config.get(("extractor",), basecategory)
+        if isinstance(instances, dict):
+            for info in instances.values():
+                if isinstance(info, dict) and "root" in info:
+                    return True
+    return False
+
+
+class _LazyModule:
+    """Extractor module listed in the manifest, but not imported yet"""
+
+    def __init__(self, name, entries):
+        self.__name__ = name
+        self.classes = [_LazyExtractor(name, *entry) for entry in entries]
+
+
+class _LazyExtractor:
+    """Placeholder for an extractor class of a not yet imported module
+
+    Imports the actual module when called or when its 'load()' method
+    gets used and replaces all of its placeholders in the class cache.
+    """
+
+    def __init__(
+        self, module, name, category, subcategory, basecategory, pattern, keys
+    ):
+        self.module = module
+        self.__name__ = name
+        self.category = category
+        self.subcategory = subcategory
+        self.basecategory = basecategory
+        self.source = pattern
+        self.keys = keys
+
+    def __getattr__(self, name):
+        if name != "pattern":
+            raise AttributeError(name)
+        self.pattern = pattern = re_compile(self.source)
+        return pattern
+
+    def __call__(self, match):
+        return self.load()(match)
+
+    def __repr__(self):
+        return f"<lazy extractor '{self.module}.{self.__name__}'>"
+
+    def load(self):
+        """Import and return the actual extractor class"""
+        global _index_last
+
+        with _lock:
+            module = __import__(self.module, globals(), None, (), 1)
+            classes = {cls.__name__: cls for cls in _get_classes(module)}
+            for cls in classes.values():
+                if isinstance(cls.pattern, str):
+                    cls.pattern = re_compile(cls.pattern)
+
+            for pos, cls in enumerate(_cache):
+                if isinstance(cls, _LazyExtractor) and cls.module == self.module:
+                    _cache[pos] = classes[cls.__name__]
+                    if cls is _index_last:
+                        _index_last = _cache[pos]
+
+        return classes[self.__name__]
+
+
+def _candidates(url):
+    """Return all loaded extractor classes that could match 'url'"""
+    if len(_cache) != _index_size or (
+        _cache and _cache[_index_size - 1] is not _index_last
+    ):
+        with _lock:
+            _index_update()
+
+    if not isinstance(url, str) or not url.isascii():
+        return _cache
+    key = url.lower()
+    if key[:8] == "https://":
+        key = key[8:]
+    elif key[:7] == "http://":
+        key = key[7:]
+
+    hits = []
+    get = _index_prefix.get
+    for length in _index_prefix_lengths:
+        if length > len(key):
+            break
+        if (positions := get(key[:length])) is not None:
+            hits.extend(positions)
+
+    host = _index_host(key).group().rstrip("\n")
+    get = _index_suffix.get
+    for length in _index_suffix_lengths:
+        if length > len(host):
+            break
+        if (positions := get(host[-length:])) is not None:
+            hits.extend(positions)
+
+    if not hits:
+        return [_cache[pos] for pos in _index_fallback]
+    hits.extend(_index_fallback)
+    return [_cache[pos] for pos in sorted(set(hits))]
+
+
+def _index_update():
+    """Add newly loaded extractor classes to the dispatch index"""
+    global _index_size, _index_last, _index_prefix_lengths, _index_suffix_lengths
+
+    if len(_cache) < _index_size or (
+        _index_size and _cache[_index_size - 1] is not _index_last
+    ):
+        _index_prefix.clear()
+        _index_suffix.clear()
+        _index_fallback.clear()
+        _index_size = 0
+
+    lengths_prefix = set(_index_prefix_lengths)
+    lengths_suffix = set(_index_suffix_lengths)
+
+    for pos in range(_index_size, len(_cache)):
+        cls = _cache[pos]
+        if isinstance(cls, _LazyExtractor):
+            keys = cls.keys
+        else:
+            keys = _index_keys(cls.pattern)
+        if not keys:
+            _index_fallback.append(pos)
+            continue
+        for suffix, key in keys:
+            if suffix:
+                _index_suffix.setdefault(key, []).append(pos)
+                lengths_suffix.add(len(key))
+            else:
+                _index_prefix.setdefault(key, []).append(pos)
+                lengths_prefix.add(len(key))
+
+    _index_size = len(_cache)
+    _index_last = _cache[-1] if _cache else None
+    _index_prefix_lengths = sorted(lengths_prefix)
+    _index_suffix_lengths = sorted(lengths_suffix)
+
+
+def _index_keys(pattern, limit=256):
+    """Return dispatch index keys for 'pattern'
+
+    Every URL matched by 'pattern' either starts with one of the returned
+    prefixes or has a host ending with one of the returned suffixes,
+    after removing its 'http(s)://' scheme and converting it to lowercase.
+
+    Return None if no such keys can be determined.
+    """
+    if pattern.flags & 8:  # re.MULTILINE
+        return None
+
+    try:
+        from re import _parser as sre_parse
+    except ImportError:
+        import sre_parse
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+    opened, closed = _index_expand(parsed, {(False, "")}, set(), limit, sre_parse)
+
+    keys = set()
+    for suffix, value in opened | closed:
+        value = value.lower()
+        host = _index_host(value).group()
+
+        if suffix:
+            if host == value or not host or host[-1] == ":":
+                return None
+            value = host
+        else:
+            if value.startswith("https://"):
+                value = value[8:]
+            elif value.startswith("http://"):
+                value = value[7:]
+            elif "https://".startswith(value) or "http://".startswith(value):
+                return None
+            if not (value := value[: len(_index_host(value).group()) + 1]):
+                return None
+
+        if not value.isascii():
+            return None
+        keys.add((suffix, value))
+    return keys
+
+
+def _index_expand(items, opened, closed, limit, c):
+    """Extend the partial matches in 'opened' by the regex ops in 'items'
+
+    A partial match is either a literal prefix (False, "…")
+    or a literal string following a part without '/', '?', and '#'
+    (True, "…"). Partial matches that cannot be extended any further
+    get moved to 'closed'.
+    """
+    for op, av in items:
+        if not opened:
+            break
+
+        if op is c.LITERAL:
+            opened = {(suffix, value + chr(av)) for suffix, value in opened}
+            continue
+
+        if op is c.IN:
+            if (chars := _index_chars(av, c)) and len(opened) * len(chars) <= limit:
+                opened = {
+                    (suffix, value + char) for suffix, value in opened for char in chars
+                }
+                continue
+
+        elif op is c.SUBPATTERN:
+            if not av[1] & 2:  # local re.IGNORECASE
+                opened, closed = _index_expand(av[-1], opened, closed, limit, c)
+                continue
+
+        elif op is c.BRANCH:
+            result = set()
+            for branch in av[1]:
+                o, closed = _index_expand(branch, opened, closed, limit, c)
+                result |= o
+            opened = result
+            continue
+
+        elif op is c.MAX_REPEAT or op is c.MIN_REPEAT:
+            if av[1] == 1:
+                o, closed = _index_expand(av[2], opened, closed, limit, c)
+                opened = (opened | o) if av[0] == 0 else o
+                continue
+
+        elif op is c.AT:
+            if av is c.AT_END or av is c.AT_END_STRING:
+                closed |= {
+                    (suffix, value + "\n") if suffix else (suffix, value)
+                    for suffix, value in opened
+                }
+                return set(), closed
+            continue
+
+        elif op is c.ASSERT or op is c.ASSERT_NOT:
+            continue
+
+        # cannot enumerate 'op'
+        if not _index_nohost([(op, av)], c):
+            closed |= opened
+            return set(), closed
+
+        wild = False
+        for suffix, value in opened:
+            if not suffix and value[:8] == "https://":
+                host = value[8:]
+            elif not suffix and value[:7] == "http://":
+                host = value[7:]
+            else:
+                host = value
+            if _index_host(host).group() != host or (not suffix and ":" in host):
+                # keep literal prefixes ending after a host
+                # or containing a custom scheme like 'tumblr:'
+                closed.add((suffix, value))
+            else:
+                wild = True
+        opened = {(True, "")} if wild else set()
+
+        if len(opened) + len(closed) > limit:
+            closed |= opened
+            return set(), closed
+
+    return opened, closed
+
+
+def _index_chars(items, c):
+    """Return all characters matched by a character set"""
+    chars = []
+    for op, av in items:
+        if op is c.LITERAL:
+            chars.append(chr(av))
+        elif op is c.RANGE and av[1] - av[0] < 16:
+            chars.extend(map(chr, range(av[0], av[1] + 1)))
+        else:
+            return None
+    return chars
+
+
+def _index_nohost(items, c):
+    """Return True if 'items' can never match '/', '?', or '#'"""
+    for op, av in items:
+        if op is c.IN:
+            negate = av and av[0][0] is c.NEGATE
+            found = set()
+            for iop, iav in av:
+                if iop is c.LITERAL:
+                    found.add(iav)
+                elif iop is c.RANGE:
+                    found.update(range(iav[0], iav[1] + 1))
+                elif iop is c.CATEGORY:
+                    if negate or iav not in (
+                        c.CATEGORY_DIGIT,
+                        c.CATEGORY_WORD,
+                        c.CATEGORY_SPACE,
+                    ):
+                        return False
+                elif iop is not c.NEGATE:
+                    return False
+            terminators = found.intersection((35, 47, 63))  # '#', '/', '?'
+            if len(terminators) != 3 if negate else terminators:
+                return False
+        elif op is c.LITERAL:
+            if av in (35, 47, 63):
+                return False
+        elif op is c.SUBPATTERN:
+            if not _index_nohost(av[-1], c):
+                return False
+        elif op is c.BRANCH:
+            for branch in av[1]:
+                if not _index_nohost(branch, c):
+                    return False
+        elif op is c.MAX_REPEAT or op is c.MIN_REPEAT:
+            if not _index_nohost(av[2], c):
+                return False
+        elif op is not c.AT and op is not c.ASSERT and op is not c.ASSERT_NOT:
+            return False
+    return True
+
+
 _cache = []
 _module_iter = _modules_internal()
+_lock = threading.RLock()
+_index_prefix = {}
+_index_prefix_lengths = ()
+_index_suffix = {}
+_index_suffix_lengths = ()
+_index_fallback = []
+_index_size = 0
+_index_last = None
+_index_host = re_compile(r"[^/?#\n]*").match
@@ -0,0 +1,1309 @@
+# -*- coding: utf-8 -*-
+
+# auto-generated by scripts/manifest.py
+
+"""Extractor classes, patterns, and dispatch keys of all modules"""
+
+MODULES = {
+    '2ch': ((), (
+        ('_2chThreadExtractor', '2ch', 'thread', '', '(?:https?://)?2ch\\.(su|life|hk)/([^/?#]+)/res/(\\d+)', ((False, '2ch.hk/'), (False, '2ch.life/'), (False, '2ch.su/'))),
+        ('_2chBoardExtractor', '2ch', 'board', '', '(?:https?://)?2ch\\.(su|life|hk)/([^/?#]+)/?$', ((False, '2ch.hk/'), (False, '2ch.life/'), (False, '2ch.su/'))),
+    )),
+    '2chan': ((), (
+        ('_2chanThreadExtractor', '2chan', 'thread', '', '(?:https?://)?([\\w-]+)\\.2chan\\.net/([^/?#]+)/res/(\\d+)', ((True, '.2chan.net'),)),
+    )),
+    '2chen': ((), (
+        ('_2chenThreadExtractor', '2chen', 'thread', '', '(?:https?://)?(?:sturdychan.help|2chen\\.(?:moe|club))/([^/?#]+)/(\\d+)', ((False, '2chen.club/'), (False, '2chen.moe/'), (False, 'sturdychan'))),
+        ('_2chenBoardExtractor', '2chen', 'board', '', '(?:https?://)?(?:sturdychan.help|2chen\\.(?:moe|club))/([^/?#]+)(?:/catalog|/?$)', ((False, '2chen.club/'), (False, '2chen.moe/'), (False, 'sturdychan'))),
+    )),
+    '35photo': ((), (
+        ('_35photoUserExtractor', '35photo', 'user', '', '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/(?!photo_|genre_|tags/|rating/)([^/?#]+)', ((False, '35photo.pro/'), (True, '.35photo.pro'))),
+        ('_35photoTagExtractor', '35photo', 'tag', '', '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/tags/([^/?#]+)', ((False, '35photo.pro/'), (True, '.35photo.pro'))),
+        ('_35photoGenreExtractor', '35photo', 'genre', '', '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/genre_(\\d+)(/new/)?', ((False, '35photo.pro/'), (True, '.35photo.pro'))),
+        ('_35photoImageExtractor', '35photo', 'image', '', '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/photo_(\\d+)', ((False, '35photo.pro/'), (True, '.35photo.pro'))),
+    )),
+    '3dbooru': (('booru',), (
+        ('_3dbooruTagExtractor', '3dbooru', 'tag', 'booru', '(?:https?://)?(?:www\\.)?behoimi\\.org/post(?:/(?:index)?)?\\?tags=(?P<tags>[^&#]+)', ((False, 'behoimi.org/'), (False, 'www.behoimi.org/'))),
+        ('_3dbooruPoolExtractor', '3dbooru', 'pool', 'booru', '(?:https?://)?(?:www\\.)?behoimi\\.org/pool/show/(?P<pool>\\d+)', ((False, 'behoimi.org/'), (False, 'www.behoimi.org/'))),
+        ('_3dbooruPostExtractor', '3dbooru', 'post', 'booru', '(?:https?://)?(?:www\\.)?behoimi\\.org/post/show/(?P<post>\\d+)', ((False, 'behoimi.org/'), (False, 'www.behoimi.org/'))),
+        ('_3dbooruPopularExtractor', '3dbooru', 'popular', 'booru', '(?:https?://)?(?:www\\.)?behoimi\\.org/post/popular_(?P<scale>by_(?:day|week|month)|recent)(?:\\?(?P<query>[^#]*))?', ((False, 'behoimi.org/'), (False, 'www.behoimi.org/'))),
+    )),
+    '4chan': ((), (
+        ('_4chanThreadExtractor', '4chan', 'thread', '', '(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/]+)/thread/(\\d+)', ((False, 'boards.4chan.org/'), (False, 'boards.4channel.org/'))),
+        ('_4chanBoardExtractor', '4chan', 'board', '', '(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/?#]+)/\\d*$', ((False, 'boards.4chan.org/'), (False, 'boards.4channel.org/'))),
+    )),
+    '4archive': ((), (
+        ('_4archiveThreadExtractor', '4archive', 'thread', '', '(?:https?://)?4archive\\.org/board/([^/?#]+)/thread/(\\d+)', ((False, '4archive.org/'),)),
+        ('_4archiveBoardExtractor', '4archive', 'board', '', '(?:https?://)?4archive\\.org/board/([^/?#]+)(?:/(\\d+))?/?$', ((False, '4archive.org/'),)),
+    )),
+    '4chanarchives': ((), (
+        ('_4chanarchivesThreadExtractor', '4chanarchives', 'thread', '', '(?:https?://)?4chanarchives\\.com/board/([^/?#]+)/thread/(\\d+)', ((False, '4chanarchives.com/'),)),
+        ('_4chanarchivesBoardExtractor', '4chanarchives', 'board', '', '(?:https?://)?4chanarchives\\.com/board/([^/?#]+)(?:/(\\d+))?/?$', ((False, '4chanarchives.com/'),)),
+    )),
+    '500px': ((), (
+        ('_500pxUserExtractor', '500px', 'user', '', '(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/|liked)(?:p/)?([^/?#]+)/?(?:$|[?#])', ((False, '500px.com/'), (False, 'web.500px.com/'))),
+        ('_500pxGalleryExtractor', '500px', 'gallery', '', '(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/)(?:p/)?([^/?#]+)/galleries/([^/?#]+)', ((False, '500px.com/'), (False, 'web.500px.com/'))),
+        ('_500pxFavoriteExtractor', '500px', 'favorite', '', '(?:https?://)?(?:web\\.)?500px\\.com/liked/?$', ((False, '500px.com/'), (False, 'web.500px.com/'))),
+        ('_500pxImageExtractor', '500px', 'image', '', '(?:https?://)?(?:web\\.)?500px\\.com/photo/(\\d+)', ((False, '500px.com/'), (False, 'web.500px.com/'))),
+    )),
+    '8chan': ((), (
+        ('_8chanThreadExtractor', '8chan', 'thread', '', '(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:res|last)/(\\d+)', ((False, '8chan.cc/'), (False, '8chan.moe/'), (False, '8chan.se/'))),
+        ('_8chanBoardExtractor', '8chan', 'board', '', '(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:(\\d+)\\.html)?$', ((False, '8chan.cc/'), (False, '8chan.moe/'), (False, '8chan.se/'))),
+    )),
+    '8muses': ((), (
+        ('_8musesAlbumExtractor', '8muses', 'album', '', '(?:https?://)?(?:comics\\.|www\\.)?8muses\\.com(/comics/album/[^?#]+)(\\?[^#]+)?', ((False, '8muses.com/'), (False, 'comics.8muses.com/'), (False, 'www.8muses.com/'))),
+    )),
+    'adultempire': ((), (
+        ('AdultempireGalleryExtractor', 'adultempire', 'gallery', '', '(?:https?://)?(?:www\\.)?adult(?:dvd)?empire\\.com(/(\\d+)/gallery\\.html)', ((False, 'adultdvdempire.com/'), (False, 'adultempire.com/'), (False, 'www.adultdvdempire.com/'), (False, 'www.adultempire.com/'))),
+    )),
+    'agnph': (('booru',), (
+        ('AgnphTagExtractor', 'agnph', 'tag', 'booru', '(?:https?://)?agn\\.ph/gallery/post/(?:\\?([^#]+))?$', ((False, 'agn.ph/'),)),
+        ('AgnphPostExtractor', 'agnph', 'post', 'booru', '(?:https?://)?agn\\.ph/gallery/post/show/(\\d+)', ((False, 'agn.ph/'),)),
+    )),
+    'ao3': ((), (
+        ('Ao3WorkExtractor', 'ao3', 'work', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/works/(\\d+)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3SeriesExtractor', 'ao3', 'series', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/series/(\\d+))', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3TagExtractor', 'ao3', 'tag', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/tags/([^/?#]+)/works(?:/?\\?.+)?)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3SearchExtractor', 'ao3', 'search', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/works/search/?\\?.+)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3UserExtractor', 'ao3', 'user', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/users/([^/?#]+(?:/pseuds/[^/?#]+)?)(?:/profile)?/?(?:$|\\?|#)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3UserWorksExtractor', 'ao3', 'user-works', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?works(?:/?\\?.+)?)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3UserSeriesExtractor', 'ao3', 'user-series', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?series(?:/?\\?.+)?)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3UserBookmarkExtractor', 'ao3', 'user-bookmark', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?bookmarks(?:/?\\?.+)?)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+        ('Ao3SubscriptionsExtractor', 'ao3', 'subscriptions', '', '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/subscriptions(?:/?\\?.+)?)', ((False, 'ao3.com/'), (False, 'ao3.net/'), (False, 'ao3.org/'), (False, 'archiveofourown.com/'), (False, 'archiveofourown.net/'), (False, 'archiveofourown.org/'), (False, 'www.ao3.com/'), (False, 'www.ao3.net/'), (False, 'www.ao3.org/'), (False, 'www.archiveofourown.com/'), (False, 'www.archiveofourown.net/'), (False, 'www.archiveofourown.org/'))),
+    )),
+    'arcalive': ((), (
+        ('ArcalivePostExtractor', 'arcalive', 'post', '', '(?:https?://)?(?:www\\.)?arca\\.live/b/(?:\\w+)/(\\d+)', ((False, 'arca.live/'), (False, 'www.arca.live/'))),
+        ('ArcaliveBoardExtractor', 'arcalive', 'board', '', '(?:https?://)?(?:www\\.)?arca\\.live/b/([^/?#]+)/?(?:\\?([^#]+))?$', ((False, 'arca.live/'), (False, 'www.arca.live/'))),
+        ('ArcaliveUserExtractor', 'arcalive', 'user', '', '(?:https?://)?(?:www\\.)?arca\\.live/u/@([^/?#]+)/?(?:\\?([^#]+))?$', ((False, 'arca.live/'), (False, 'www.arca.live/'))),
+    )),
+    'architizer': ((), (
+        ('ArchitizerProjectExtractor', 'architizer', 'project', '', '(?:https?://)?architizer\\.com/projects/([^/?#]+)', ((False, 'architizer.com/'),)),
+        ('ArchitizerFirmExtractor', 'architizer', 'firm', '', '(?:https?://)?architizer\\.com/firms/([^/?#]+)', ((False, 'architizer.com/'),)),
+    )),
+    'artstation': ((), (
+        ('ArtstationUserExtractor', 'artstation', 'user', '', '(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)(?:/albums/all)?|((?!www)[\\w-]+)\\.artstation\\.com(?:/projects)?)/?$', ((False, 'artstation.com/'), (False, 'www.artstation.com/'), (True, '.artstation.com'))),
+        ('ArtstationAlbumExtractor', 'artstation', 'album', '', '(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)|((?!www)[\\w-]+)\\.artstation\\.com)/albums/(\\d+)', ((False, 'artstation.com/'), (False, 'www.artstation.com/'), (True, '.artstation.com'))),
+        ('ArtstationLikesExtractor', 'artstation', 'likes', '', '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/likes', ((False, 'artstation.com/'), (False, 'www.artstation.com/'))),
+        ('ArtstationCollectionExtractor', 'artstation', 'collection', '', '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/collections/(\\d+)', ((False, 'artstation.com/'), (False, 'www.artstation.com/'))),
+        ('ArtstationCollectionsExtractor', 'artstation', 'collections', '', '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/collections/?$', ((False, 'artstation.com/'), (False, 'www.artstation.com/'))),
+        ('ArtstationChallengeExtractor', 'artstation', 'challenge', '', '(?:https?://)?(?:www\\.)?artstation\\.com/contests/[^/?#]+/challenges/(\\d+)/?(?:\\?sorting=([a-z]+))?', ((False, 'artstation.com/'), (False, 'www.artstation.com/'))),
+        ('ArtstationSearchExtractor', 'artstation', 'search', '', '(?:https?://)?(?:\\w+\\.)?artstation\\.com/search/?\\?([^#]+)', ((False, 'artstation.com/'), (True, '.artstation.com'))),
+        ('ArtstationArtworkExtractor', 'artstation', 'artwork', '', '(?:https?://)?(?:\\w+\\.)?artstation\\.com/artwork/?\\?([^#]+)', ((False, 'artstation.com/'), (True, '.artstation.com'))),
+        ('ArtstationImageExtractor', 'artstation', 'image', '', '(?:https?://)?(?:(?:[\\w-]+\\.)?artstation\\.com/(?:artwork|projects|search)|artstn\\.co/p)/(\\w+)', ((False, 'artstation.com/'), (False, 'artstn.co/'), (True, '.artstation.com'))),
+        ('ArtstationFollowingExtractor', 'artstation', 'following', '', '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/following', ((False, 'artstation.com/'), (False, 'www.artstation.com/'))),
+    )),
+    'aryion': ((), (
+        ('AryionGalleryExtractor', 'aryion', 'gallery', '', '(?:https?://)?(?:www\\.)?aryion\\.com/g4/(?:gallery/|user/|latest.php\\?name=)([^/?#]+)', ((False, 'aryion.com/'), (False, 'www.aryion.com/'))),
+        ('AryionFavoriteExtractor', 'aryion', 'favorite', '', '(?:https?://)?(?:www\\.)?aryion\\.com/g4/favorites/([^/?#]+)', ((False, 'aryion.com/'), (False, 'www.aryion.com/'))),
+        ('AryionTagExtractor', 'aryion', 'tag', '', '(?:https?://)?(?:www\\.)?aryion\\.com/g4/tags\\.php\\?([^#]+)', ((False, 'aryion.com/'), (False, 'www.aryion.com/'))),
+        ('AryionPostExtractor', 'aryion', 'post', '', '(?:https?://)?(?:www\\.)?aryion\\.com/g4/view/(\\d+)', ((False, 'aryion.com/'), (False, 'www.aryion.com/'))),
+    )),
+    'batoto': ((), (
+        ('BatotoChapterExtractor', 'batoto', 'chapter', '', '(?:https?://)?((?:ba|d|f|h|j|m|w)to\\.to|(?:(?:manga|read)toto|batocomic|[xz]bato)\\.(?:com|net|org)|comiko\\.(?:net|org)|bat(?:otoo|o?two)\\.com)/(?:title/[^/?#]+|chapter)/(\\d+)', ((False, 'bato.to/'), (False, 'batocomic.com/'), (False, 'batocomic.net/'), (False, 'batocomic.org/'), (False, 'batotoo.com/'), (False, 'batotwo.com/'), (False, 'battwo.com/'), (False, 'comiko.net/'), (False, 'comiko.org/'), (False, 'dto.to/'), (False, 'fto.to/'), (False, 'hto.to/'), (False, 'jto.to/'), (False, 'mangatoto.com/'), (False, 'mangatoto.net/'), (False, 'mangatoto.org/'), (False, 'mto.to/'), (False, 'readtoto.com/'), (False, 'readtoto.net/'), (False, 'readtoto.org/'), (False, 'wto.to/'), (False, 'xbato.com/'), (False, 'xbato.net/'), (False, 'xbato.org/'), (False, 'zbato.com/'), (False, 'zbato.net/'), (False, 'zbato.org/'))),
+        ('BatotoMangaExtractor', 'batoto', 'manga', '', '(?:https?://)?((?:ba|d|f|h|j|m|w)to\\.to|(?:(?:manga|read)toto|batocomic|[xz]bato)\\.(?:com|net|org)|comiko\\.(?:net|org)|bat(?:otoo|o?two)\\.com)/(?:title/(\\d+)[^/?#]*|series/(\\d+)(?:/[^/?#]*)?)/?$', ((False, 'bato.to/'), (False, 'batocomic.com/'), (False, 'batocomic.net/'), (False, 'batocomic.org/'), (False, 'batotoo.com/'), (False, 'batotwo.com/'), (False, 'battwo.com/'), (False, 'comiko.net/'), (False, 'comiko.org/'), (False, 'dto.to/'), (False, 'fto.to/'), (False, 'hto.to/'), (False, 'jto.to/'), (False, 'mangatoto.com/'), (False, 'mangatoto.net/'), (False, 'mangatoto.org/'), (False, 'mto.to/'), (False, 'readtoto.com/'), (False, 'readtoto.net/'), (False, 'readtoto.org/'), (False, 'wto.to/'), (False, 'xbato.com/'), (False, 'xbato.net/'), (False, 'xbato.org/'), (False, 'zbato.com/'), (False, 'zbato.net/'), (False, 'zbato.org/'))),
+    )),
+    'bbc': ((), (
+        ('BbcGalleryExtractor', 'bbc', 'gallery', '', '(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+(?!/galleries)(?:/[^/?#]+)?)$', ((False, 'bbc.co.uk/'), (False, 'www.bbc.co.uk/'))),
+        ('BbcProgrammeExtractor', 'bbc', 'programme', '', '(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+/galleries)(?:/?\\?page=(\\d+))?', ((False, 'bbc.co.uk/'), (False, 'www.bbc.co.uk/'))),
+    )),
+    'behance': ((), (
+        ('BehanceGalleryExtractor', 'behance', 'gallery', '', '(?:https?://)?(?:www\\.)?behance\\.net/gallery/(\\d+)', ((False, 'behance.net/'), (False, 'www.behance.net/'))),
+        ('BehanceUserExtractor', 'behance', 'user', '', '(?:https?://)?(?:www\\.)?behance\\.net/([^/?#]+)/?$', ((False, 'behance.net/'), (False, 'www.behance.net/'))),
+        ('BehanceCollectionExtractor', 'behance', 'collection', '', '(?:https?://)?(?:www\\.)?behance\\.net/collection/(\\d+)', ((False, 'behance.net/'), (False, 'www.behance.net/'))),
+    )),
+    'bellazon': ((), (
+        ('BellazonPostExtractor', 'bellazon', 'post', '', '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[\\w-]+(?:/page/\\d+)?)/?#findComment-(\\d+)', ((False, 'bellazon.com/'), (False, 'www.bellazon.com/'))),
+        ('BellazonThreadExtractor', 'bellazon', 'thread', '', '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[\\w-]+)(?:/page/(\\d+))?', ((False, 'bellazon.com/'), (False, 'www.bellazon.com/'))),
+        ('BellazonForumExtractor', 'bellazon', 'forum', '', '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/forum/\\d+-[\\w-]+)(?:/page/(\\d+))?', ((False, 'bellazon.com/'), (False, 'www.bellazon.com/'))),
+    )),
+    'bilibili': ((), (
+        ('BilibiliArticleExtractor', 'bilibili', 'article', '', '(?:https?://)?(?:t\\.bilibili\\.com|(?:www\\.)?bilibili.com/opus)/(\\d+)', ((False, 'bilibili'), (False, 't.bilibili.com/'), (False, 'www.bilibili'))),
+        ('BilibiliUserArticlesExtractor', 'bilibili', 'user-articles', '', '(?:https?://)?space\\.bilibili\\.com/(\\d+)/(?:article|upload/opus)', ((False, 'space.bilibili.com/'),)),
+        ('BilibiliUserArticlesFavoriteExtractor', 'bilibili', 'user-articles-favorite', '', '(?:https?://)?space\\.bilibili\\.com/(\\d+)/favlist\\?fid=opus', ((False, 'space.bilibili.com/'),)),
+    )),
+    'blogger': (('blogger',), (
+        ('BloggerPostExtractor', '', 'post', 'blogger', '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))(/\\d\\d\\d\\d/\\d\\d/[^/?#]+\\.html)', ((False, 'blogger:http:/'), (False, 'blogger:https:/'), (True, '.blogspot.com'))),
+        ('BloggerBlogExtractor', '', 'blog', 'blogger', '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/?$', ((False, 'blogger:http:/'), (False, 'blogger:https:/'), (True, '.blogspot.com'))),
+        ('BloggerSearchExtractor', '', 'search', 'blogger', '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/search/?\\?q=([^&#]+)', ((False, 'blogger:http:/'), (False, 'blogger:https:/'), (True, '.blogspot.com'))),
+        ('BloggerLabelExtractor', '', 'label', 'blogger', '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/search/label/([^/?#]+)', ((False, 'blogger:http:/'), (False, 'blogger:https:/'), (True, '.blogspot.com'))),
+    )),
+    'bluesky': ((), (
+        ('BlueskyUserExtractor', 'bluesky', 'user', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)$', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyPostsExtractor', 'bluesky', 'posts', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/posts', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyRepliesExtractor', 'bluesky', 'replies', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/replies', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyMediaExtractor', 'bluesky', 'media', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/media', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyVideoExtractor', 'bluesky', 'video', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/video', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyLikesExtractor', 'bluesky', 'likes', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/likes', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyFeedExtractor', 'bluesky', 'feed', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/feed/([^/?#]+)', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyListExtractor', 'bluesky', 'list', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/lists/([^/?#]+)', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyFollowingExtractor', 'bluesky', 'following', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/follows', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyPostExtractor', 'bluesky', 'post', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/post/([^/?#]+)', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyInfoExtractor', 'bluesky', 'info', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/info', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyAvatarExtractor', 'bluesky', 'avatar', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/avatar', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyBackgroundExtractor', 'bluesky', 'background', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/ba(?:nner|ckground)', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskySearchExtractor', 'bluesky', 'search', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/search(?:/|\\?q=)(.+)', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+        ('BlueskyHashtagExtractor', 'bluesky', 'hashtag', '', '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/hashtag/([^/?#]+)(?:/(top|latest))?', ((False, 'bsky.app/'), (False, 'bskye.app/'), (False, 'bskyx.app/'), (False, 'bsyy.app/'), (False, 'bsyye.app/'), (False, 'bsyyx.app/'), (False, 'cbsky.app/'), (False, 'cbskye.app/'), (False, 'cbskyx.app/'), (False, 'cbsyy.app/'), (False, 'cbsyye.app/'), (False, 'cbsyyx.app/'), (False, 'fxbsky.app/'), (False, 'fxbskye.app/'), (False, 'fxbskyx.app/'), (False, 'fxbsyy.app/'), (False, 'fxbsyye.app/'), (False, 'fxbsyyx.app/'), (False, 'main.bsky.dev/'), (False, 'vxbsky.app/'), (False, 'vxbskye.app/'), (False, 'vxbskyx.app/'), (False, 'vxbsyy.app/'), (False, 'vxbsyye.app/'), (False, 'vxbsyyx.app/'), (False, 'www.bsky.app/'), (False, 'www.bskye.app/'), (False, 'www.bskyx.app/'), (False, 'www.bsyy.app/'), (False, 'www.bsyye.app/'), (False, 'www.bsyyx.app/'), (False, 'www.cbsky.app/'), (False, 'www.cbskye.app/'), (False, 'www.cbskyx.app/'), (False, 'www.cbsyy.app/'), (False, 'www.cbsyye.app/'), (False, 'www.cbsyyx.app/'), (False, 'www.fxbsky.app/'), (False, 'www.fxbskye.app/'), (False, 'www.fxbskyx.app/'), (False, 'www.fxbsyy.app/'), (False, 'www.fxbsyye.app/'), (False, 'www.fxbsyyx.app/'), (False, 'www.vxbsky.app/'), (False, 'www.vxbskye.app/'), (False, 'www.vxbskyx.app/'), (False, 'www.vxbsyy.app/'), (False, 'www.vxbsyye.app/'), (False, 'www.vxbsyyx.app/'))),
+    )),
+    'boosty': ((), (
+        ('BoostyUserExtractor', 'boosty', 'user', '', '(?:https?://)?boosty\\.to/([^/?#]+)(?:\\?([^#]+))?$', ((False, 'boosty.to/'),)),
+        ('BoostyMediaExtractor', 'boosty', 'media', '', '(?:https?://)?boosty\\.to/([^/?#]+)/media/([^/?#]+)(?:\\?([^#]+))?', ((False, 'boosty.to/'),)),
+        ('BoostyFeedExtractor', 'boosty', 'feed', '', '(?:https?://)?boosty\\.to/(?:\\?([^#]+))?(?:$|#)', ((False, 'boosty.to/'),)),
+        ('BoostyPostExtractor', 'boosty', 'post', '', '(?:https?://)?boosty\\.to/([^/?#]+)/posts/([0-9a-f-]+)', ((False, 'boosty.to/'),)),
+        ('BoostyFollowingExtractor', 'boosty', 'following', '', '(?:https?://)?boosty\\.to/app/settings/subscriptions', ((False, 'boosty.to/'),)),
+        ('BoostyDirectMessagesExtractor', 'boosty', 'direct-messages', '', '(?:https?://)?boosty\\.to/app/messages/?\\?dialogId=(\\d+)', ((False, 'boosty.to/'),)),
+    )),
+    'booth': ((), (
+        ('BoothItemExtractor', 'booth', 'item', '', '(?:https?://)?(?:[\\w-]+\\.)?booth\\.pm/(?:\\w\\w/)?items/(\\d+)', ((False, 'booth.pm/'), (True, '.booth.pm'))),
+        ('BoothShopExtractor', 'booth', 'shop', '', '(?:https?://)?([\\w-]+\\.)booth\\.pm/(?:\\w\\w/)?(?:items)?', ((True, '.booth.pm'),)),
+    )),
+    'bunkr': (('lolisafe',), (
+        ('BunkrAlbumExtractor', 'bunkr', 'album', 'lolisafe', '(?:bunkr:(?:https?://)?([^/?#]+)|(?:https?://)?(?:app\\.)?(bunkr+\\.(?:s[kiu]|c[ir]|fi|p[hks]|ru|la|is|to|a[cx]|black|cat|media|red|site|ws|org)))/a/([^/?#]+)', ((False, 'bunkr:'), (False, 'bunkr:http:/'), (False, 'bunkr:https:/'), (True, '.ac'), (True, '.ax'), (True, '.black'), (True, '.cat'), (True, '.ci'), (True, '.cr'), (True, '.fi'), (True, '.is'), (True, '.la'), (True, '.media'), (True, '.org'), (True, '.ph'), (True, '.pk'), (True, '.ps'), (True, '.red'), (True, '.ru'), (True, '.si'), (True, '.site'), (True, '.sk'), (True, '.su'), (True, '.to'), (True, '.ws'))),
+        ('BunkrMediaExtractor', 'bunkr', 'media', 'lolisafe', '(?:bunkr:(?:https?://)?([^/?#]+)|(?:https?://)?(?:app\\.)?(bunkr+\\.(?:s[kiu]|c[ir]|fi|p[hks]|ru|la|is|to|a[cx]|black|cat|media|red|site|ws|org)))(/[fvid]/[^/?#]+)', ((False, 'bunkr:'), (False, 'bunkr:http:/'), (False, 'bunkr:https:/'), (True, '.ac'), (True, '.ax'), (True, '.black'), (True, '.cat'), (True, '.ci'), (True, '.cr'), (True, '.fi'), (True, '.is'), (True, '.la'), (True, '.media'), (True, '.org'), (True, '.ph'), (True, '.pk'), (True, '.ps'), (True, '.red'), (True, '.ru'), (True, '.si'), (True, '.site'), (True, '.sk'), (True, '.su'), (True, '.to'), (True, '.ws'))),
+    )),
+    'catbox': ((), (
+        ('CatboxAlbumExtractor', 'catbox', 'album', '', '(?:https?://)?(?:www\\.)?catbox\\.moe(/c/[^/?#]+)', ((False, 'catbox.moe/'), (False, 'www.catbox.moe/'))),
+        ('CatboxFileExtractor', 'catbox', 'file', '', '(?:https?://)?(?:files|litter|de)\\.catbox\\.moe/([^/?#]+)', ((False, 'de.catbox.moe/'), (False, 'files.catbox.moe/'), (False, 'litter.catbox.moe/'))),
+    )),
+    'chevereto': (('chevereto',), (
+        ('CheveretoImageExtractor', '', 'image', 'chevereto', '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:jpe?g\\d?\\.(?:su|pet|fish(?:ing)?|church)()|img\\.kiwi()|imagepond\\.net()|imglike\\.com()))(/im(?:g|age)/[^/?#]+)', ((False, 'chevereto:http:/'), (False, 'chevereto:https:/'), (False, 'imagepond.net/'), (False, 'img.kiwi/'), (False, 'imglike.com/'), (False, 'jpeg.church/'), (False, 'jpeg.fish/'), (False, 'jpeg.fishing/'), (False, 'jpeg.pet/'), (False, 'jpeg.su/'), (False, 'jpg.church/'), (False, 'jpg.fish/'), (False, 'jpg.fishing/'), (False, 'jpg.pet/'), (False, 'jpg.su/'), (True, '.church'), (True, '.fish'), (True, '.fishing'), (True, '.pet'), (True, '.su'))),
+        ('CheveretoVideoExtractor', '', 'video', 'chevereto', '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:jpe?g\\d?\\.(?:su|pet|fish(?:ing)?|church)()|img\\.kiwi()|imagepond\\.net()|imglike\\.com()))(/video/[^/?#]+)', ((False, 'chevereto:http:/'), (False, 'chevereto:https:/'), (False, 'imagepond.net/'), (False, 'img.kiwi/'), (False, 'imglike.com/'), (False, 'jpeg.church/'), (False, 'jpeg.fish/'), (False, 'jpeg.fishing/'), (False, 'jpeg.pet/'), (False, 'jpeg.su/'), (False, 'jpg.church/'), (False, 'jpg.fish/'), (False, 'jpg.fishing/'), (False, 'jpg.pet/'), (False, 'jpg.su/'), (True, '.church'), (True, '.fish'), (True, '.fishing'), (True, '.pet'), (True, '.su'))),
+        ('CheveretoAlbumExtractor', '', 'album', 'chevereto', '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:jpe?g\\d?\\.(?:su|pet|fish(?:ing)?|church)()|img\\.kiwi()|imagepond\\.net()|imglike\\.com()))(/a(?:lbum)?/[^/?#]+(?:/sub)?)', ((False, 'chevereto:http:/'), (False, 'chevereto:https:/'), (False, 'imagepond.net/'), (False, 'img.kiwi/'), (False, 'imglike.com/'), (False, 'jpeg.church/'), (False, 'jpeg.fish/'), (False, 'jpeg.fishing/'), (False, 'jpeg.pet/'), (False, 'jpeg.su/'), (False, 'jpg.church/'), (False, 'jpg.fish/'), (False, 'jpg.fishing/'), (False, 'jpg.pet/'), (False, 'jpg.su/'), (True, '.church'), (True, '.fish'), (True, '.fishing'), (True, '.pet'), (True, '.su'))),
+        ('CheveretoCategoryExtractor', '', 'category', 'chevereto', '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:jpe?g\\d?\\.(?:su|pet|fish(?:ing)?|church)()|img\\.kiwi()|imagepond\\.net()|imglike\\.com()))(/category/[^/?#]+)', ((False, 'chevereto:http:/'), (False, 'chevereto:https:/'), (False, 'imagepond.net/'), (False, 'img.kiwi/'), (False, 'imglike.com/'), (False, 'jpeg.church/'), (False, 'jpeg.fish/'), (False, 'jpeg.fishing/'), (False, 'jpeg.pet/'), (False, 'jpeg.su/'), (False, 'jpg.church/'), (False, 'jpg.fish/'), (False, 'jpg.fishing/'), (False, 'jpg.pet/'), (False, 'jpg.su/'), (True, '.church'), (True, '.fish'), (True, '.fishing'), (True, '.pet'), (True, '.su'))),
+        ('CheveretoUserExtractor', '', 'user', 'chevereto', '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:jpe?g\\d?\\.(?:su|pet|fish(?:ing)?|church)()|img\\.kiwi()|imagepond\\.net()|imglike\\.com()))(/[^/?#]+(?:/albums)?)', ((False, 'chevereto:http:/'), (False, 'chevereto:https:/'), (False, 'imagepond.net/'), (False, 'img.kiwi/'), (False, 'imglike.com/'), (False, 'jpeg.church/'), (False, 'jpeg.fish/'), (False, 'jpeg.fishing/'), (False, 'jpeg.pet/'), (False, 'jpeg.su/'), (False, 'jpg.church/'), (False, 'jpg.fish/'), (False, 'jpg.fishing/'), (False, 'jpg.pet/'), (False, 'jpg.su/'), (True, '.church'), (True, '.fish'), (True, '.fishing'), (True, '.pet'), (True, '.su'))),
+    )),
+    'cien': ((), (
+        ('CienArticleExtractor', 'cien', 'article', '', '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)/article/(\\d+)', ((False, 'ci-en.dlsite.com/'), (False, 'ci-en.net/'))),
+        ('CienCreatorExtractor', 'cien', 'creator', '', '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)(?:/article(?:\\?([^#]+))?)?/?$', ((False, 'ci-en.dlsite.com/'), (False, 'ci-en.net/'))),
+        ('CienRecentExtractor', 'cien', 'recent', '', '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/recent(?:\\?([^#]+))?', ((False, 'ci-en.dlsite.com/'), (False, 'ci-en.net/'))),
+        ('CienFollowingExtractor', 'cien', 'following', '', '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/subscription(/following)?', ((False, 'ci-en.dlsite.com/'), (False, 'ci-en.net/'))),
+    )),
+    'civitai': ((), (
+        ('CivitaiModelExtractor', 'civitai', 'model', '', '(?:https?://)?civitai\\.com/models/(\\d+)(?:/?\\?modelVersionId=(\\d+))?', ((False, 'civitai.com/'),)),
+        ('CivitaiImageExtractor', 'civitai', 'image', '', '(?:https?://)?civitai\\.com/images/(\\d+)', ((False, 'civitai.com/'),)),
+        ('CivitaiCollectionExtractor', 'civitai', 'collection', '', '(?:https?://)?civitai\\.com/collections/(\\d+)', ((False, 'civitai.com/'),)),
+        ('CivitaiPostExtractor', 'civitai', 'post', '', '(?:https?://)?civitai\\.com/posts/(\\d+)', ((False, 'civitai.com/'),)),
+        ('CivitaiTagExtractor', 'civitai', 'tag', '', '(?:https?://)?civitai\\.com/tag/([^/?&#]+)', ((False, 'civitai.com/'),)),
+        ('CivitaiSearchModelsExtractor', 'civitai', 'search-models', '', '(?:https?://)?civitai\\.com/search/models\\?([^#]+)', ((False, 'civitai.com/'),)),
+        ('CivitaiSearchImagesExtractor', 'civitai', 'search-images', '', '(?:https?://)?civitai\\.com/search/images\\?([^#]+)', ((False, 'civitai.com/'),)),
+        ('CivitaiModelsExtractor', 'civitai', 'models', '', '(?:https?://)?civitai\\.com/models(?:/?\\?([^#]+))?(?:$|#)', ((False, 'civitai.com/'),)),
+        ('CivitaiImagesExtractor', 'civitai', 'images', '', '(?:https?://)?civitai\\.com/images(?:/?\\?([^#]+))?(?:$|#)', ((False, 'civitai.com/'),)),
+        ('CivitaiVideosExtractor', 'civitai', 'videos', '', '(?:https?://)?civitai\\.com/videos(?:/?\\?([^#]+))?(?:$|#)', ((False, 'civitai.com/'),)),
+        ('CivitaiPostsExtractor', 'civitai', 'posts', '', '(?:https?://)?civitai\\.com/posts(?:/?\\?([^#]+))?(?:$|#)', ((False, 'civitai.com/'),)),
+        ('CivitaiUserExtractor', 'civitai', 'user', '', '(?:https?://)?civitai\\.com/user/([^/?#]+)/?(?:$|\\?|#)', ((False, 'civitai.com/'),)),
+        ('CivitaiUserModelsExtractor', 'civitai', 'user-models', '', '(?:https?://)?civitai\\.com/user/([^/?#]+)/models/?(?:\\?([^#]+))?', ((False, 'civitai.com/'),)),
+        ('CivitaiUserPostsExtractor', 'civitai', 'user-posts', '', '(?:https?://)?civitai\\.com/user/([^/?#]+)/posts/?(?:\\?([^#]+))?', ((False, 'civitai.com/'),)),
+        ('CivitaiUserImagesExtractor', 'civitai', 'user-images', '', '(?:https?://)?civitai\\.com/user/([^/?#]+)/images/?(?:\\?([^#]+))?', ((False, 'civitai.com/'),)),
+        ('CivitaiUserVideosExtractor', 'civitai', 'user-videos', '', '(?:https?://)?civitai\\.com/user/([^/?#]+)/videos/?(?:\\?([^#]+))?', ((False, 'civitai.com/'),)),
+        ('CivitaiUserCollectionsExtractor', 'civitai', 'user-collections', '', '(?:https?://)?civitai\\.com/user/([^/?#]+)/collections/?(?:\\?([^#]+))?', ((False, 'civitai.com/'),)),
+        ('CivitaiGeneratedExtractor', 'civitai', 'generated', '', '(?:https?://)?civitai\\.com/generate', ((False, 'civitai.com/'),)),
+    )),
+    'comick': ((), (
+        ('ComickCoversExtractor', 'comick', 'covers', '', '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/cover', ((False, 'comick.io/'), (False, 'www.comick.io/'))),
+        ('ComickChapterExtractor', 'comick', 'chapter', '', '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/(\\w+(?:-(?:chapter|volume)-[^/?#]+)?)', ((False, 'comick.io/'), (False, 'www.comick.io/'))),
+        ('ComickMangaExtractor', 'comick', 'manga', '', '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/?(?:\\?([^#]+))?', ((False, 'comick.io/'), (False, 'www.comick.io/'))),
+    )),
+    'comicvine': (('',), (
+        ('ComicvineTagExtractor', 'comicvine', 'tag', '', '(?:https?://)?comicvine\\.gamespot\\.com(/([^/?#]+)/(\\d+-\\d+)/images/.*)', ((False, 'comicvine.gamespot.com/'),)),
+    )),
+    'cyberdrop': (('lolisafe',), (
+        ('CyberdropAlbumExtractor', 'cyberdrop', 'album', 'lolisafe', '(?:https?://)?(?:www\\.)?cyberdrop\\.(?:me|to)/a/([^/?#]+)', ((False, 'cyberdrop.me/'), (False, 'cyberdrop.to/'), (False, 'www.cyberdrop.me/'), (False, 'www.cyberdrop.to/'))),
+        ('CyberdropMediaExtractor', 'cyberdrop', 'media', 'lolisafe', '(?:https?://)?(?:www\\.)?cyberdrop\\.(?:me|to)/f/([^/?#]+)', ((False, 'cyberdrop.me/'), (False, 'cyberdrop.to/'), (False, 'www.cyberdrop.me/'), (False, 'www.cyberdrop.to/'))),
+    )),
+    'cyberfile': ((), (
+        ('CyberfileFolderExtractor', 'cyberfile', 'folder', '', '(?:https?://)?(?:www\\.)?cyberfile\\.me/folder/([0-9a-f]+)', ((False, 'cyberfile.me/'), (False, 'www.cyberfile.me/'))),
+        ('CyberfileFileExtractor', 'cyberfile', 'file', '', '(?:https?://)?(?:www\\.)?cyberfile\\.me/([a-zA-Z0-9]+)', ((False, 'cyberfile.me/'), (False, 'www.cyberfile.me/'))),
+    )),
+    'danbooru': (('Danbooru',), (
+        ('DanbooruTagExtractor', '', 'tag', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/posts\\?(?:[^&#]*&)*tags=([^&#]*)', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+        ('DanbooruPoolExtractor', '', 'pool', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/pool(?:s|/show)/(\\d+)', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+        ('DanbooruFavgroupExtractor', '', 'favgroup', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/favorite_group(?:s|/show)/(\\d+)', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+        ('DanbooruPostExtractor', '', 'post', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/post(?:s|/show)/(\\d+)', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+        ('DanbooruPopularExtractor', '', 'popular', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/(?:explore/posts/)?popular(?:\\?([^#]*))?', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+        ('DanbooruArtistExtractor', '', 'artist', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/artists/(\\d+)', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+        ('DanbooruArtistSearchExtractor', '', 'artist-search', 'Danbooru', '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/artists/?\\?([^#]+)', ((False, 'aibooru.download/'), (False, 'aibooru.online/'), (False, 'booru.allthefallen.moe/'), (False, 'booru.borvar.art/'), (False, 'danbooru.donmai.us/'), (False, 'danbooru:http:/'), (False, 'danbooru:https:/'), (False, 'donmai.moe/'), (False, 'general.aibooru.download/'), (False, 'general.aibooru.online/'), (False, 'hijiribe.donmai.us/'), (False, 'safe.aibooru.download/'), (False, 'safe.aibooru.online/'), (False, 'safebooru.donmai.us/'), (False, 'sonohara.donmai.us/'))),
+    )),
+    'dankefuerslesen': ((), (
+        ('DankefuerslesenChapterExtractor', 'dankefuerslesen', 'chapter', '', '(?:https?://)?(?:www\\.)?danke\\.moe/read/manga/([\\w-]+)/([\\w-]+)', ((False, 'danke.moe/'), (False, 'www.danke.moe/'))),
+        ('DankefuerslesenMangaExtractor', 'dankefuerslesen', 'manga', '', '(?:https?://)?(?:www\\.)?danke\\.moe/read/manga/([^/?#]+)', ((False, 'danke.moe/'), (False, 'www.danke.moe/'))),
+    )),
+    'desktopography': ((), (
+        ('DesktopographySiteExtractor', 'desktopography', 'site', '', '(?:https?://)?desktopography\\.net/$', ((False, 'desktopography.net/'),)),
+        ('DesktopographyExhibitionExtractor', 'desktopography', 'exhibition', '', '(?:https?://)?desktopography\\.net/exhibition-([^/?#]+)/', ((False, 'desktopography.net/'),)),
+        ('DesktopographyEntryExtractor', 'desktopography', 'entry', '', '(?:https?://)?desktopography\\.net/portfolios/([\\w-]+)', ((False, 'desktopography.net/'),)),
+    )),
+    'deviantart': ((), (
+        ('DeviantartUserExtractor', 'deviantart', 'user', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/?$', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartGalleryExtractor', 'deviantart', 'gallery', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery(?:/all|/recommended-for-you|/?\\?catpath=)?/?$', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartAvatarExtractor', 'deviantart', 'avatar', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/avatar', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartBackgroundExtractor', 'deviantart', 'background', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/ba(?:nner|ckground)', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartFolderExtractor', 'deviantart', 'folder', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/([^/?#]+)/([^/?#]+)', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartStashExtractor', 'deviantart', 'stash', '', '(?:https?://)?(?:(?:www\\.)?deviantart\\.com/stash|sta\\.s(h))/([a-z0-9]+)', ((False, 'deviantart.com/'), (False, 'sta.sh/'), (False, 'www.deviantart.com/'))),
+        ('DeviantartFavoriteExtractor', 'deviantart', 'favorite', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites(?:/all|/?\\?catpath=)?/?$', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartCollectionExtractor', 'deviantart', 'collection', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites/([^/?#]+)/([^/?#]+)', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartJournalExtractor', 'deviantart', 'journal', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:posts(?:/journals)?|journal)/?(?:\\?.*)?$', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartStatusExtractor', 'deviantart', 'status', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/posts/statuses', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartTagExtractor', 'deviantart', 'tag', '', '(?:https?://)?www\\.deviantart\\.com/tag/([^/?#]+)', ((False, 'www.deviantart.com/'),)),
+        ('DeviantartWatchExtractor', 'deviantart', 'watch', '', '(?:https?://)?(?:www\\.)?deviantart\\.com/(?:watch/deviations|notifications/watch)()()', ((False, 'deviantart.com/'), (False, 'www.deviantart.com/'))),
+        ('DeviantartWatchPostsExtractor', 'deviantart', 'watch-posts', '', '(?:https?://)?(?:www\\.)?deviantart\\.com/watch/posts()()', ((False, 'deviantart.com/'), (False, 'www.deviantart.com/'))),
+        ('DeviantartDeviationExtractor', 'deviantart', 'deviation', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(art|journal)/(?:[^/?#]+-)?(\\d+)|(?:https?://)?(?:www\\.)?(?:fx)?deviantart\\.com/(?:view/|deviation/|view(?:-full)?\\.php/*\\?(?:[^#]+&)?id=)(\\d+)|(?:https?://)?fav\\.me/d([0-9a-z]+)', ((False, 'deviantart.com/'), (False, 'fav.me/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartScrapsExtractor', 'deviantart', 'scraps', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/(?:\\?catpath=)?scraps\\b', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartSearchExtractor', 'deviantart', 'search', '', '(?:https?://)?www\\.deviantart\\.com/search(?:/deviations)?/?\\?([^#]+)', ((False, 'www.deviantart.com/'),)),
+        ('DeviantartGallerySearchExtractor', 'deviantart', 'gallery-search', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/?\\?(q=[^#]+)', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+        ('DeviantartFollowingExtractor', 'deviantart', 'following', '', '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:about#)?watching', ((False, 'deviantart.com/'), (False, 'fxdeviantart.com/'), (False, 'www.deviantart.com/'), (False, 'www.fxdeviantart.com/'), (True, '.deviantart.com'), (True, '.fxdeviantart.com'))),
+    )),
+    'discord': ((), (
+        ('DiscordChannelExtractor', 'discord', 'channel', '', '(?:https?://)?discord\\.com/channels/(\\d+)/(?:\\d+/threads/)?(\\d+)/?$', ((False, 'discord.com/'),)),
+        ('DiscordMessageExtractor', 'discord', 'message', '', '(?:https?://)?discord\\.com/channels/(\\d+)/(\\d+)/(\\d+)/?$', ((False, 'discord.com/'),)),
+        ('DiscordServerExtractor', 'discord', 'server', '', '(?:https?://)?discord\\.com/channels/(\\d+)/?$', ((False, 'discord.com/'),)),
+        ('DiscordDirectMessagesExtractor', 'discord', 'direct-messages', '', '(?:https?://)?discord\\.com/channels/@me/(\\d+)/?$', ((False, 'discord.com/'),)),
+        ('DiscordDirectMessageExtractor', 'discord', 'direct-message', '', '(?:https?://)?discord\\.com/channels/@me/(\\d+)/(\\d+)/?$', ((False, 'discord.com/'),)),
+    )),
+    'dynastyscans': ((), (
+        ('DynastyscansChapterExtractor', 'dynastyscans', 'chapter', '', '(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/chapters/[^/?#]+)', ((False, 'dynasty-scans.com/'), (False, 'www.dynasty-scans.com/'))),
+        ('DynastyscansMangaExtractor', 'dynastyscans', 'manga', '', '(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/series/[^/?#]+)', ((False, 'dynasty-scans.com/'), (False, 'www.dynasty-scans.com/'))),
+        ('DynastyscansSearchExtractor', 'dynastyscans', 'search', '', '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/?(?:\\?([^#]+))?$', ((False, 'dynasty-scans.com/'), (False, 'www.dynasty-scans.com/'))),
+        ('DynastyscansImageExtractor', 'dynastyscans', 'image', '', '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/(\\d+)', ((False, 'dynasty-scans.com/'), (False, 'www.dynasty-scans.com/'))),
+        ('DynastyscansAnthologyExtractor', 'dynastyscans', 'anthology', '', '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/anthologies/([^/?#]+)', ((False, 'dynasty-scans.com/'), (False, 'www.dynasty-scans.com/'))),
+    )),
+    'e621': (('E621',), (
+        ('E621TagExtractor', '', 'tag', 'E621', '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/posts?(?:\\?[^#]*?tags=|/index/\\d+/)([^&#]*)', ((False, 'e621.cc/'), (False, 'e621.net/'), (False, 'e621:http:/'), (False, 'e621:https:/'), (False, 'e6ai.net/'), (False, 'e926.net/'))),
+        ('E621PoolExtractor', '', 'pool', 'E621', '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/pool(?:s|/show)/(\\d+)', ((False, 'e621.cc/'), (False, 'e621.net/'), (False, 'e621:http:/'), (False, 'e621:https:/'), (False, 'e6ai.net/'), (False, 'e926.net/'))),
+        ('E621PostExtractor', '', 'post', 'E621', '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/post(?:s|/show)/(\\d+)', ((False, 'e621.cc/'), (False, 'e621.net/'), (False, 'e621:http:/'), (False, 'e621:https:/'), (False, 'e6ai.net/'), (False, 'e926.net/'))),
+        ('E621PopularExtractor', '', 'popular', 'E621', '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/explore/posts/popular(?:\\?([^#]*))?', ((False, 'e621.cc/'), (False, 'e621.net/'), (False, 'e621:http:/'), (False, 'e621:https:/'), (False, 'e6ai.net/'), (False, 'e926.net/'))),
+        ('E621FavoriteExtractor', '', 'favorite', 'E621', '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/favorites(?:\\?([^#]*))?', ((False, 'e621.cc/'), (False, 'e621.net/'), (False, 'e621:http:/'), (False, 'e621:https:/'), (False, 'e6ai.net/'), (False, 'e926.net/'))),
+        ('E621FrontendExtractor', 'e621', 'frontend', 'E621', '(?:https?://)?e621\\.(?:cc/\\?tags|anthro\\.fr/\\?q)=([^&#]*)', ((False, 'e621.anthro.fr/'), (False, 'e621.cc/'))),
+    )),
+    'erome': ((), (
+        ('EromeAlbumExtractor', 'erome', 'album', '', '(?:https?://)?(?:www\\.)?erome\\.com/a/(\\w+)', ((False, 'erome.com/'), (False, 'www.erome.com/'))),
+        ('EromeUserExtractor', 'erome', 'user', '', '(?:https?://)?(?:www\\.)?erome\\.com/(?!a/|search\\?)([^/?#]+)(?:/?\\?([^#]+))?', ((False, 'erome.com/'), (False, 'www.erome.com/'))),
+        ('EromeSearchExtractor', 'erome', 'search', '', '(?:https?://)?(?:www\\.)?erome\\.com/search/?\\?(q=[^#]+)', ((False, 'erome.com/'), (False, 'www.erome.com/'))),
+    )),
+    'everia': ((), (
+        ('EveriaPostExtractor', 'everia', 'post', '', '(?:https?://)?everia\\.club(/\\d{4}/\\d{2}/\\d{2}/[^/?#]+)', ((False, 'everia.club/'),)),
+        ('EveriaTagExtractor', 'everia', 'tag', '', '(?:https?://)?everia\\.club(/tag/[^/?#]+)', ((False, 'everia.club/'),)),
+        ('EveriaCategoryExtractor', 'everia', 'category', '', '(?:https?://)?everia\\.club(/category/[^/?#]+)', ((False, 'everia.club/'),)),
+        ('EveriaDateExtractor', 'everia', 'date', '', '(?:https?://)?everia\\.club(/\\d{4}(?:/\\d{2})?(?:/\\d{2})?)(?:/page/\\d+)?/?$', ((False, 'everia.club/'),)),
+        ('EveriaSearchExtractor', 'everia', 'search', '', '(?:https?://)?everia\\.club/(?:page/\\d+/)?\\?s=([^&#]+)', ((False, 'everia.club/'),)),
+    )),
+    'exhentai': ((), (
+        ('ExhentaiGalleryExtractor', 'exhentai', 'gallery', '', '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org(?:/g/(\\d+)/([\\da-f]{10})|/s/([\\da-f]{10})/(\\d+)-(\\d+))', ((False, 'e-hentai.org/'), (False, 'exhentai.org/'), (False, 'g.e-hentai.org/'))),
+        ('ExhentaiSearchExtractor', 'exhentai', 'search', '', '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/(?:\\?([^#]*)|tag/([^/?#]+))', ((False, 'e-hentai.org/'), (False, 'exhentai.org/'), (False, 'g.e-hentai.org/'))),
+        ('ExhentaiFavoriteExtractor', 'exhentai', 'favorite', '', '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/favorites\\.php(?:\\?([^#]*)())?', ((False, 'e-hentai.org/'), (False, 'exhentai.org/'), (False, 'g.e-hentai.org/'))),
+    )),
+    'facebook': ((), (
+        ('FacebookPhotoExtractor', 'facebook', 'photo', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/photos/[^/?#]+/|photo(?:.php)?/?\\?(?:[^&#]+&)*fbid=)([^/?&#]+)[^/?#]*(?<!&setextract)$', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookSetExtractor', 'facebook', 'set', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:(?:media/set|photo)/?\\?(?:[^&#]+&)*set=([^&#]+)[^/?#]*(?<!&setextract)$|([^/?#]+/posts/[^/?#]+)|photo/\\?(?:[^&#]+&)*fbid=([^/?&#]+)&set=([^/?&#]+)&setextract)', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookVideoExtractor', 'facebook', 'video', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/videos/|watch/?\\?v=)([^/?&#]+)', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookInfoExtractor', 'facebook', 'info', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/info', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookAlbumsExtractor', 'facebook', 'albums', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/photos_albums(?:/([^/?#]+))?', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookPhotosExtractor', 'facebook', 'photos', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/photos(?:_by)?', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookAvatarExtractor', 'facebook', 'avatar', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/avatar', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+        ('FacebookUserExtractor', 'facebook', 'user', '', '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/?(?:$|\\?|#)', ((False, 'facebook.com/'), (True, '.facebook.com'))),
+    )),
+    'fanbox': ((), (
+        ('FanboxCreatorExtractor', 'fanbox', 'creator', '', '(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\.cc/@([\\w-]+))(?:/posts)?/?$', ((False, 'fanbox.cc/'), (False, 'www.fanbox.cc/'), (True, '.fanbox.cc'))),
+        ('FanboxPostExtractor', 'fanbox', 'post', '', '(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\.cc/@([\\w-]+))/posts/(\\d+)', ((False, 'fanbox.cc/'), (False, 'www.fanbox.cc/'), (True, '.fanbox.cc'))),
+        ('FanboxHomeExtractor', 'fanbox', 'home', '', '(?:https?://)?(?:www\\.)?fanbox\\.cc/?$', ((False, 'fanbox.cc'), (False, 'fanbox.cc/'), (False, 'www.fanbox.cc'), (False, 'www.fanbox.cc/'))),
+        ('FanboxSupportingExtractor', 'fanbox', 'supporting', '', '(?:https?://)?(?:www\\.)?fanbox\\.cc/home/supporting', ((False, 'fanbox.cc/'), (False, 'www.fanbox.cc/'))),
+        ('FanboxRedirectExtractor', 'fanbox', 'redirect', '', '(?:https?://)?(?:www\\.)?pixiv\\.net/fanbox/creator/(\\d+)', ((False, 'pixiv.net/'), (False, 'www.pixiv.net/'))),
+    )),
+    'fansly': ((), (
+        ('FanslyPostExtractor', 'fansly', 'post', '', '(?:https?://)?(?:www\\.)?fansly\\.com/post/(\\d+)', ((False, 'fansly.com/'), (False, 'www.fansly.com/'))),
+        ('FanslyHomeExtractor', 'fansly', 'home', '', '(?:https?://)?(?:www\\.)?fansly\\.com/home(?:/(?:subscribed()|list/(\\d+)))?', ((False, 'fansly.com/'), (False, 'www.fansly.com/'))),
+        ('FanslyListExtractor', 'fansly', 'list', '', '(?:https?://)?(?:www\\.)?fansly\\.com/lists/(\\d+)', ((False, 'fansly.com/'), (False, 'www.fansly.com/'))),
+        ('FanslyListsExtractor', 'fansly', 'lists', '', '(?:https?://)?(?:www\\.)?fansly\\.com/lists', ((False, 'fansly.com/'), (False, 'www.fansly.com/'))),
+        ('FanslyCreatorPostsExtractor', 'fansly', 'creator-posts', '', '(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/posts(?:/wall/(\\d+))?', ((False, 'fansly.com/'), (False, 'www.fansly.com/'))),
+        ('FanslyCreatorMediaExtractor', 'fansly', 'creator-media', '', '(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/media(?:/wall/(\\d+))?', ((False, 'fansly.com/'), (False, 'www.fansly.com/'))),
+    )),
+    'fantia': ((), (
+        ('FantiaCreatorExtractor', 'fantia', 'creator', '', '(?:https?://)?(?:www\\.)?fantia\\.jp/fanclubs/(\\d+)', ((False, 'fantia.jp/'), (False, 'www.fantia.jp/'))),
+        ('FantiaPostExtractor', 'fantia', 'post', '', '(?:https?://)?(?:www\\.)?fantia\\.jp/posts/(\\d+)', ((False, 'fantia.jp/'), (False, 'www.fantia.jp/'))),
+    )),
+    'fapello': ((), (
+        ('FapelloPostExtractor', 'fapello', 'post', '', '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/|popular_videos/)([^/?#]+)/(\\d+)', ((False, 'fapello.com/'), (False, 'fapello.su/'), (False, 'www.fapello.com/'), (False, 'www.fapello.su/'))),
+        ('FapelloModelExtractor', 'fapello', 'model', '', '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!top-(?:likes|followers)|popular_videos|videos|trending|search/?$)([^/?#]+)/?$', ((False, 'fapello.com/'), (False, 'fapello.su/'), (False, 'www.fapello.com/'), (False, 'www.fapello.su/'))),
+        ('FapelloPathExtractor', 'fapello', 'path', '', '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/?$)(top-(?:likes|followers)|videos|trending|popular_videos/[^/?#]+)/?$', ((False, 'fapello.com/'), (False, 'fapello.su/'), (False, 'www.fapello.com/'), (False, 'www.fapello.su/'))),
+    )),
+    'fapachi': ((), (
+        ('FapachiPostExtractor', 'fapachi', 'post', '', '(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search/)([^/?#]+)/media/(\\d+)', ((False, 'fapachi.com/'), (False, 'www.fapachi.com/'))),
+        ('FapachiUserExtractor', 'fapachi', 'user', '', '(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search(?:/|$))([^/?#]+)(?:/page/(\\d+))?$', ((False, 'fapachi.com/'), (False, 'www.fapachi.com/'))),
+    )),
+    'flickr': ((), (
+        ('FlickrImageExtractor', 'flickr', 'image', '', '(?:https?://)?(?:(?:(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/[^/?#]+/|[\\w-]+\\.static\\.?flickr\\.com/(?:\\d+/)+)(\\d+)|flic\\.kr/p/([A-Za-z1-9]+))', ((False, 'flic.kr/'), (False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'), (True, '.static.flickr.com'), (True, '.staticflickr.com'))),
+        ('FlickrAlbumExtractor', 'flickr', 'album', '', '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/(?:album|set)s(?:/(\\d+))?', ((False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'))),
+        ('FlickrGalleryExtractor', 'flickr', 'gallery', '', '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/galleries/(\\d+)', ((False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'))),
+        ('FlickrGroupExtractor', 'flickr', 'group', '', '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/groups/([^/?#]+)', ((False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'))),
+        ('FlickrUserExtractor', 'flickr', 'user', '', '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/?$', ((False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'))),
+        ('FlickrFavoriteExtractor', 'flickr', 'favorite', '', '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/favorites', ((False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'))),
+        ('FlickrSearchExtractor', 'flickr', 'search', '', '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/search/?\\?([^#]+)', ((False, 'flickr.com/'), (False, 'm.flickr.com/'), (False, 'secure.flickr.com/'), (False, 'www.flickr.com/'))),
+    )),
+    'furaffinity': ((), (
+        ('FuraffinityGalleryExtractor', 'furaffinity', 'gallery', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery/([^/?#]+)(?:$|/(?!folder/))', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinityFolderExtractor', 'furaffinity', 'folder', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery/([^/?#]+)/folder/(\\d+)(?:/([^/?#]+))?', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinityScrapsExtractor', 'furaffinity', 'scraps', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/scraps/([^/?#]+)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinityFavoriteExtractor', 'furaffinity', 'favorite', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/favorites/([^/?#]+)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinitySearchExtractor', 'furaffinity', 'search', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/search(?:/([^/?#]+))?/?[?&]([^#]+)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinityPostExtractor', 'furaffinity', 'post', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/(?:view|full)/(\\d+)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinityUserExtractor', 'furaffinity', 'user', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/user/([^/?#]+)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinityFollowingExtractor', 'furaffinity', 'following', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/watchlist/by/([^/?#]+)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+        ('FuraffinitySubmissionsExtractor', 'furaffinity', 'submissions', '', '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net(/msg/submissions(?:/[^/?#]+)?)', ((False, 'furaffinity.net/'), (False, 'fxfuraffinity.net/'), (False, 'fxraffinity.net/'), (False, 'sfw.furaffinity.net/'), (False, 'sfw.fxfuraffinity.net/'), (False, 'sfw.fxraffinity.net/'), (False, 'sfw.xfuraffinity.net/'), (False, 'www.furaffinity.net/'), (False, 'www.fxfuraffinity.net/'), (False, 'www.fxraffinity.net/'), (False, 'www.xfuraffinity.net/'), (False, 'xfuraffinity.net/'))),
+    )),
+    'furry34': (('booru',), (
+        ('Furry34PostExtractor', 'furry34', 'post', 'booru', '(?:https?://)?(?:www\\.)?furry34\\.com/post/(\\d+)', ((False, 'furry34.com/'), (False, 'www.furry34.com/'))),
+        ('Furry34PlaylistExtractor', 'furry34', 'playlist', 'booru', '(?:https?://)?(?:www\\.)?furry34\\.com/playlists/view/(\\d+)', ((False, 'furry34.com/'), (False, 'www.furry34.com/'))),
+        ('Furry34TagExtractor', 'furry34', 'tag', 'booru', '(?:https?://)?(?:www\\.)?furry34\\.com/(?:([^/?#]+))?(?:/?\\?([^#]+))?(?:$|#)', ((False, 'furry34.com/'), (False, 'www.furry34.com/'))),
+    )),
+    'fuskator': ((), (
+        ('FuskatorGalleryExtractor', 'fuskator', 'gallery', '', '(?:https?://)?fuskator\\.com/(?:thumbs|expanded)/([^/?#]+)', ((False, 'fuskator.com/'),)),
+        ('FuskatorSearchExtractor', 'fuskator', 'search', '', '(?:https?://)?fuskator\\.com(/(?:search|page)/.+)', ((False, 'fuskator.com/'),)),
+    )),
+    'gelbooru': (('booru',), (
+        ('GelbooruTagExtractor', 'gelbooru', 'tag', 'booru', '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=post&s=list&tags=([^&#]*)', ((False, 'gelbooru.com/'), (False, 'www.gelbooru.com/'))),
+        ('GelbooruPoolExtractor', 'gelbooru', 'pool', 'booru', '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=pool&s=show&id=(\\d+)', ((False, 'gelbooru.com/'), (False, 'www.gelbooru.com/'))),
+        ('GelbooruFavoriteExtractor', 'gelbooru', 'favorite', 'booru', '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=favorites&s=view&id=(\\d+)', ((False, 'gelbooru.com/'), (False, 'www.gelbooru.com/'))),
+        ('GelbooruPostExtractor', 'gelbooru', 'post', 'booru', '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?(?=(?:[^#]+&)?page=post(?:&|#|$))(?=(?:[^#]+&)?s=view(?:&|#|$))(?:[^#]+&)?id=(\\d+)', ((False, 'gelbooru.com/'), (False, 'www.gelbooru.com/'))),
+        ('GelbooruRedirectExtractor', 'gelbooru', 'redirect', 'booru', '(?:https?://)?(?:www\\.)?gelbooru\\.com/redirect\\.php\\?s=([^&#]+)', ((False, 'gelbooru.com/'), (False, 'www.gelbooru.com/'))),
+    )),
+    'gelbooru_v01': (('gelbooru_v01',), (
+        ('GelbooruV01TagExtractor', '', 'tag', 'gelbooru_v01', '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=post&s=list&tags=([^&#]+)', ((False, 'allgirl.booru.org/'), (False, 'drawfriends.booru.org/'), (False, 'gelbooru_v01:http:/'), (False, 'gelbooru_v01:https:/'), (False, 'illusioncards.booru.org/'), (False, 'the-collection.booru.org/'), (False, 'vidyart2.booru.org/'))),
+        ('GelbooruV01FavoriteExtractor', '', 'favorite', 'gelbooru_v01', '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=favorites&s=view&id=(\\d+)', ((False, 'allgirl.booru.org/'), (False, 'drawfriends.booru.org/'), (False, 'gelbooru_v01:http:/'), (False, 'gelbooru_v01:https:/'), (False, 'illusioncards.booru.org/'), (False, 'the-collection.booru.org/'), (False, 'vidyart2.booru.org/'))),
+        ('GelbooruV01PostExtractor', '', 'post', 'gelbooru_v01', '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=post&s=view&id=(\\d+)', ((False, 'allgirl.booru.org/'), (False, 'drawfriends.booru.org/'), (False, 'gelbooru_v01:http:/'), (False, 'gelbooru_v01:https:/'), (False, 'illusioncards.booru.org/'), (False, 'the-collection.booru.org/'), (False, 'vidyart2.booru.org/'))),
+    )),
+    'gelbooru_v02': (('gelbooru_v02',), (
+        ('GelbooruV02TagExtractor', '', 'tag', 'gelbooru_v02', '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=post&s=list&tags=([^&#]*)', ((False, 'gelbooru_v02:http:/'), (False, 'gelbooru_v02:https:/'), (False, 'hypnohub.net/'), (False, 'rule34.xxx/'), (False, 'safebooru.org/'), (False, 'tbib.org/'), (False, 'www.rule34.xxx/'), (False, 'xbooru.com/'))),
+        ('GelbooruV02PoolExtractor', '', 'pool', 'gelbooru_v02', '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=pool&s=show&id=(\\d+)', ((False, 'gelbooru_v02:http:/'), (False, 'gelbooru_v02:https:/'), (False, 'hypnohub.net/'), (False, 'rule34.xxx/'), (False, 'safebooru.org/'), (False, 'tbib.org/'), (False, 'www.rule34.xxx/'), (False, 'xbooru.com/'))),
+        ('GelbooruV02FavoriteExtractor', '', 'favorite', 'gelbooru_v02', '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=favorites&s=view&id=(\\d+)', ((False, 'gelbooru_v02:http:/'), (False, 'gelbooru_v02:https:/'), (False, 'hypnohub.net/'), (False, 'rule34.xxx/'), (False, 'safebooru.org/'), (False, 'tbib.org/'), (False, 'www.rule34.xxx/'), (False, 'xbooru.com/'))),
+        ('GelbooruV02PostExtractor', '', 'post', 'gelbooru_v02', '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=post&s=view&id=(\\d+)', ((False, 'gelbooru_v02:http:/'), (False, 'gelbooru_v02:https:/'), (False, 'hypnohub.net/'), (False, 'rule34.xxx/'), (False, 'safebooru.org/'), (False, 'tbib.org/'), (False, 'www.rule34.xxx/'), (False, 'xbooru.com/'))),
+    )),
+    'girlsreleased': ((), (
+        ('GirlsreleasedSetExtractor', 'girlsreleased', 'set', '', '(?:https?://)?(?:www\\.)?girlsreleased\\.com/set/(\\d+)', ((False, 'girlsreleased.com/'), (False, 'www.girlsreleased.com/'))),
+        ('GirlsreleasedModelExtractor', 'girlsreleased', 'model', '', '(?:https?://)?(?:www\\.)?girlsreleased\\.com/model/(\\d+(?:/.+)?)', ((False, 'girlsreleased.com/'), (False, 'www.girlsreleased.com/'))),
+        ('GirlsreleasedSiteExtractor', 'girlsreleased', 'site', '', '(?:https?://)?(?:www\\.)?girlsreleased\\.com/site/([^/?#]+(?:/model/\\d+/?.*)?)', ((False, 'girlsreleased.com/'), (False, 'www.girlsreleased.com/'))),
+    )),
+    'girlswithmuscle': ((), (
+        ('GirlswithmusclePostExtractor', 'girlswithmuscle', 'post', '', '(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/(\\d+)', ((False, 'girlswithmuscle.com/'), (False, 'www.girlswithmuscle.com/'))),
+        ('GirlswithmuscleSearchExtractor', 'girlswithmuscle', 'search', '', '(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/images/(.*)', ((False, 'girlswithmuscle.com/'), (False, 'www.girlswithmuscle.com/'))),
+    )),
+    'gofile': ((), (
+        ('GofileFolderExtractor', 'gofile', 'folder', '', '(?:https?://)?(?:www\\.)?gofile\\.io/d/([^/?#]+)', ((False, 'gofile.io/'), (False, 'www.gofile.io/'))),
+    )),
+    'hatenablog': ((), (
+        ('HatenablogEntryExtractor', 'hatenablog', 'entry', '', '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))/entry/([^?#]+)(?:\\?([^#]*))?(?:#.*)?$', ((False, 'hatenablog:http:/'), (False, 'hatenablog:https:/'), (True, '.hateblo.jp'), (True, '.hatenablog.com'), (True, '.hatenablog.jp'), (True, '.hatenadiary.com'))),
+        ('HatenablogHomeExtractor', 'hatenablog', 'home', '', '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/?)(?:\\?([^#]*))?(?:#.*)?$', ((False, 'hatenablog:http:/'), (False, 'hatenablog:https:/'), (True, '.hateblo.jp'), (True, '.hatenablog.com'), (True, '.hatenablog.jp'), (True, '.hatenadiary.com'))),
+        ('HatenablogArchiveExtractor', 'hatenablog', 'archive', '', '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/archive(?:/\\d+(?:/\\d+(?:/\\d+)?)?|/category/[^?#]+)?)(?:\\?([^#]*))?(?:#.*)?$', ((False, 'hatenablog:http:/'), (False, 'hatenablog:https:/'), (True, '.hateblo.jp'), (True, '.hatenablog.com'), (True, '.hatenablog.jp'), (True, '.hatenadiary.com'))),
+        ('HatenablogSearchExtractor', 'hatenablog', 'search', '', '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/search)(?:\\?([^#]*))?(?:#.*)?$', ((False, 'hatenablog:http:/'), (False, 'hatenablog:https:/'), (True, '.hateblo.jp'), (True, '.hatenablog.com'), (True, '.hatenablog.jp'), (True, '.hatenadiary.com'))),
+    )),
+    'hdoujin': ((), (
+        ('HdoujinGalleryExtractor', 'hdoujin', 'gallery', '', '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/(?:g|reader)/(\\d+)/(\\w+)', ((False, 'hdoujin.net/'), (False, 'hdoujin.org/'), (False, 'www.hdoujin.net/'), (False, 'www.hdoujin.org/'))),
+        ('HdoujinSearchExtractor', 'hdoujin', 'search', '', '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/(?:tag/([^/?#]+)|browse)?(?:/?\\?([^#]*))?$', ((False, 'hdoujin.net/'), (False, 'hdoujin.org/'), (False, 'www.hdoujin.net/'), (False, 'www.hdoujin.org/'))),
+        ('HdoujinFavoriteExtractor', 'hdoujin', 'favorite', '', '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/favorites(?:\\?([^#]*))?', ((False, 'hdoujin.net/'), (False, 'hdoujin.org/'), (False, 'www.hdoujin.net/'), (False, 'www.hdoujin.org/'))),
+    )),
+    'hentai2read': ((), (
+        ('Hentai2readChapterExtractor', 'hentai2read', 'chapter', '', '(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+/([^/?#]+))', ((False, 'hentai2read.com/'), (False, 'www.hentai2read.com/'))),
+        ('Hentai2readMangaExtractor', 'hentai2read', 'manga', '', '(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+)/?$', ((False, 'hentai2read.com/'), (False, 'www.hentai2read.com/'))),
+    )),
+    'hentaicosplays': (('hentaicosplays',), (
+        ('HentaicosplaysGalleryExtractor', '', 'gallery', 'hentaicosplays', '(?:hentaicosplays:(https?://[^/?#]+)|(?:https?://)?(?:(?:\\w\\w\\.)?hentai-cosplays?(?:-xxx)?\\.com()|(?:\\w\\w\\.)?hentai-img(?:-xxx)?\\.com()|(?:\\w\\w\\.)?porn-images?(?:-xxx)?\\.com()))/(?:image|story)/([\\w-]+)', ((False, 'hentai-cosplay-xxx.com/'), (False, 'hentai-cosplay.com/'), (False, 'hentai-cosplays-xxx.com/'), (False, 'hentai-cosplays.com/'), (False, 'hentai-img-xxx.com/'), (False, 'hentai-img.com/'), (False, 'hentaicosplays:http:/'), (False, 'hentaicosplays:https:/'), (False, 'porn-image-xxx.com/'), (False, 'porn-image.com/'), (False, 'porn-images-xxx.com/'), (False, 'porn-images.com/'), (True, '.hentai-cosplay-xxx.com'), (True, '.hentai-cosplay.com'), (True, '.hentai-cosplays-xxx.com'), (True, '.hentai-cosplays.com'), (True, '.hentai-img-xxx.com'), (True, '.hentai-img.com'), (True, '.porn-image-xxx.com'), (True, '.porn-image.com'), (True, '.porn-images-xxx.com'), (True, '.porn-images.com'))),
+    )),
+    'hentaifoundry': ((), (
+        ('HentaifoundryUserExtractor', 'hentaifoundry', 'user', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/user/([^/?#]+)/profile', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryPicturesExtractor', 'hentaifoundry', 'pictures', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/user/([^/?#]+)(?:/page/(\\d+))?/?$', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryScrapsExtractor', 'hentaifoundry', 'scraps', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/user/([^/?#]+)/scraps', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryFavoriteExtractor', 'hentaifoundry', 'favorite', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/user/([^/?#]+)/faves/pictures', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryTagExtractor', 'hentaifoundry', 'tag', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/tagged/([^/?#]+)', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryRecentExtractor', 'hentaifoundry', 'recent', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/recent/(\\d\\d\\d\\d-\\d\\d-\\d\\d)', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryPopularExtractor', 'hentaifoundry', 'popular', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/popular()', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryImageExtractor', 'hentaifoundry', 'image', '', '(https?://)?(?:www\\.|pictures\\.)?hentai-foundry\\.com/(?:pictures/user|[^/?#])/([^/?#]+)/(\\d+)', ((False, 'hentai-foundry.com/'), (False, 'pictures.hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryStoriesExtractor', 'hentaifoundry', 'stories', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/stories/user/([^/?#]+)(?:/page/(\\d+))?/?$', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+        ('HentaifoundryStoryExtractor', 'hentaifoundry', 'story', '', '(https?://)?(?:www\\.)?hentai-foundry\\.com/stories/user/([^/?#]+)/(\\d+)', ((False, 'hentai-foundry.com/'), (False, 'www.hentai-foundry.com/'))),
+    )),
+    'hentaihand': ((), (
+        ('HentaihandGalleryExtractor', 'hentaihand', 'gallery', '', '(?:https?://)?(?:www\\.)?hentaihand\\.com/\\w+/comic/([\\w-]+)', ((False, 'hentaihand.com/'), (False, 'www.hentaihand.com/'))),
+        ('HentaihandTagExtractor', 'hentaihand', 'tag', '', '(?i)(?:https?://)?(?:www\\.)?hentaihand\\.com/\\w+/(parody|character|tag|artist|group|language|category|relationship)/([^/?#]+)', ((False, 'hentaihand.com/'), (False, 'www.hentaihand.com/'))),
+    )),
+    'hentaihere': ((), (
+        ('HentaihereChapterExtractor', 'hentaihere', 'chapter', '', '(?:https?://)?(?:www\\.)?hentaihere\\.com/m/S(\\d+)/([^/?#]+)', ((False, 'hentaihere.com/'), (False, 'www.hentaihere.com/'))),
+        ('HentaihereMangaExtractor', 'hentaihere', 'manga', '', '(?:https?://)?(?:www\\.)?hentaihere\\.com(/m/S\\d+)/?$', ((False, 'hentaihere.com/'), (False, 'www.hentaihere.com/'))),
+    )),
+    'hentainexus': ((), (
+        ('HentainexusGalleryExtractor', 'hentainexus', 'gallery', '', '(?i)(?:https?://)?(?:www\\.)?hentainexus\\.com/(?:view|read)/(\\d+)', ((False, 'hentainexus.com/'), (False, 'www.hentainexus.com/'))),
+        ('HentainexusSearchExtractor', 'hentainexus', 'search', '', '(?i)(?:https?://)?(?:www\\.)?hentainexus\\.com(?:/page/\\d+)?/?(?:\\?(q=[^/?#]+))?$', ((False, 'hentainexus.com'), (False, 'hentainexus.com/'), (False, 'hentainexus.com?'), (False, 'www.hentainexus.com'), (False, 'www.hentainexus.com/'), (False, 'www.hentainexus.com?'))),
+    )),
+    'hiperdex': ((), (
+        ('HiperdexChapterExtractor', 'hiperdex', 'chapter', '', '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/mangas?/([^/?#]+)/([^/?#]+))', ((False, '1sthiperdex.com/'), (False, '1sthiperdex.info/'), (False, '1sthiperdex.net/'), (False, '1sthiperdex.top/'), (False, '1sthipertoon.com/'), (False, '1sthipertoon.info/'), (False, '1sthipertoon.net/'), (False, '1sthipertoon.top/'), (False, 'hiperdex.com/'), (False, 'hiperdex.info/'), (False, 'hiperdex.net/'), (False, 'hiperdex.top/'), (False, 'hipertoon.com/'), (False, 'hipertoon.info/'), (False, 'hipertoon.net/'), (False, 'hipertoon.top/'), (False, 'www.1sthiperdex.com/'), (False, 'www.1sthiperdex.info/'), (False, 'www.1sthiperdex.net/'), (False, 'www.1sthiperdex.top/'), (False, 'www.1sthipertoon.com/'), (False, 'www.1sthipertoon.info/'), (False, 'www.1sthipertoon.net/'), (False, 'www.1sthipertoon.top/'), (False, 'www.hiperdex.com/'), (False, 'www.hiperdex.info/'), (False, 'www.hiperdex.net/'), (False, 'www.hiperdex.top/'), (False, 'www.hipertoon.com/'), (False, 'www.hipertoon.info/'), (False, 'www.hipertoon.net/'), (False, 'www.hipertoon.top/'), (True, '.com'), (True, '.info'), (True, '.net'), (True, '.top'))),
+        ('HiperdexMangaExtractor', 'hiperdex', 'manga', '', '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/mangas?/([^/?#]+))/?$', ((False, '1sthiperdex.com/'), (False, '1sthiperdex.info/'), (False, '1sthiperdex.net/'), (False, '1sthiperdex.top/'), (False, '1sthipertoon.com/'), (False, '1sthipertoon.info/'), (False, '1sthipertoon.net/'), (False, '1sthipertoon.top/'), (False, 'hiperdex.com/'), (False, 'hiperdex.info/'), (False, 'hiperdex.net/'), (False, 'hiperdex.top/'), (False, 'hipertoon.com/'), (False, 'hipertoon.info/'), (False, 'hipertoon.net/'), (False, 'hipertoon.top/'), (False, 'www.1sthiperdex.com/'), (False, 'www.1sthiperdex.info/'), (False, 'www.1sthiperdex.net/'), (False, 'www.1sthiperdex.top/'), (False, 'www.1sthipertoon.com/'), (False, 'www.1sthipertoon.info/'), (False, 'www.1sthipertoon.net/'), (False, 'www.1sthipertoon.top/'), (False, 'www.hiperdex.com/'), (False, 'www.hiperdex.info/'), (False, 'www.hiperdex.net/'), (False, 'www.hiperdex.top/'), (False, 'www.hipertoon.com/'), (False, 'www.hipertoon.info/'), (False, 'www.hipertoon.net/'), (False, 'www.hipertoon.top/'), (True, '.com'), (True, '.info'), (True, '.net'), (True, '.top'))),
+        ('HiperdexArtistExtractor', 'hiperdex', 'artist', '', '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/manga-a(?:rtist|uthor)/(?:[^/?#]+))', ((False, '1sthiperdex.com/'), (False, '1sthiperdex.info/'), (False, '1sthiperdex.net/'), (False, '1sthiperdex.top/'), (False, '1sthipertoon.com/'), (False, '1sthipertoon.info/'), (False, '1sthipertoon.net/'), (False, '1sthipertoon.top/'), (False, 'hiperdex.com/'), (False, 'hiperdex.info/'), (False, 'hiperdex.net/'), (False, 'hiperdex.top/'), (False, 'hipertoon.com/'), (False, 'hipertoon.info/'), (False, 'hipertoon.net/'), (False, 'hipertoon.top/'), (False, 'www.1sthiperdex.com/'), (False, 'www.1sthiperdex.info/'), (False, 'www.1sthiperdex.net/'), (False, 'www.1sthiperdex.top/'), (False, 'www.1sthipertoon.com/'), (False, 'www.1sthipertoon.info/'), (False, 'www.1sthipertoon.net/'), (False, 'www.1sthipertoon.top/'), (False, 'www.hiperdex.com/'), (False, 'www.hiperdex.info/'), (False, 'www.hiperdex.net/'), (False, 'www.hiperdex.top/'), (False, 'www.hipertoon.com/'), (False, 'www.hipertoon.info/'), (False, 'www.hipertoon.net/'), (False, 'www.hipertoon.top/'), (True, '.com'), (True, '.info'), (True, '.net'), (True, '.top'))),
+    )),
+    'hitomi': ((), (
+        ('HitomiGalleryExtractor', 'hitomi', 'gallery', '', '(?:https?://)?hitomi\\.la/(?:manga|doujinshi|cg|gamecg|imageset|galleries|reader)/(?:[^/?#]+-)?(\\d+)', ((False, 'hitomi.la/'),)),
+        ('HitomiTagExtractor', 'hitomi', 'tag', '', '(?:https?://)?hitomi\\.la/(tag|artist|group|series|type|character)/([^/?#]+)\\.html', ((False, 'hitomi.la/'),)),
+        ('HitomiIndexExtractor', 'hitomi', 'index', '', '(?:https?://)?hitomi\\.la/(\\w+)-(\\w+)\\.html', ((False, 'hitomi.la/'),)),
+        ('HitomiSearchExtractor', 'hitomi', 'search', '', '(?:https?://)?hitomi\\.la/search\\.html\\?([^#]+)', ((False, 'hitomi.la/'),)),
+    )),
+    'hotleak': ((), (
+        ('HotleakPostExtractor', 'hotleak', 'post', '', '(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photos)(?:$|/))([^/]+)/(photo|video)/(\\d+)', ((False, 'hotleak.vip/'), (False, 'www.hotleak.vip/'))),
+        ('HotleakCreatorExtractor', 'hotleak', 'creator', '', '(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photos)(?:$|/))([^/?#]+)/?$', ((False, 'hotleak.vip/'), (False, 'www.hotleak.vip/'))),
+        ('HotleakCategoryExtractor', 'hotleak', 'category', '', '(?:https?://)?(?:www\\.)?hotleak\\.vip/(hot|creators|videos|photos)(?:/?\\?([^#]+))?', ((False, 'hotleak.vip/'), (False, 'www.hotleak.vip/'))),
+        ('HotleakSearchExtractor', 'hotleak', 'search', '', '(?:https?://)?(?:www\\.)?hotleak\\.vip/search(?:/?\\?([^#]+))', ((False, 'hotleak.vip/'), (False, 'www.hotleak.vip/'))),
+    )),
+    'idolcomplex': (('booru',), (
+        ('IdolcomplexTagExtractor', 'idolcomplex', 'tag', 'booru', '(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2})?(?:/posts)?/?\\?([^#]*)', ((False, 'idol.sankakucomplex.com/'), (False, 'idol.sankakucomplex.com?'), (False, 'idolcomplex.com/'), (False, 'idolcomplex.com?'), (False, 'www.idol.sankakucomplex.com/'), (False, 'www.idol.sankakucomplex.com?'), (False, 'www.idolcomplex.com/'), (False, 'www.idolcomplex.com?'))),
+        ('IdolcomplexPoolExtractor', 'idolcomplex', 'pool', 'booru', '(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2})?/pools?/(?:show/)?(\\w+)', ((False, 'idol.sankakucomplex.com/'), (False, 'idolcomplex.com/'), (False, 'www.idol.sankakucomplex.com/'), (False, 'www.idolcomplex.com/'))),
+        ('IdolcomplexPostExtractor', 'idolcomplex', 'post', 'booru', '(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2})?/posts?(?:/show)?/(\\w+)', ((False, 'idol.sankakucomplex.com/'), (False, 'idolcomplex.com/'), (False, 'www.idol.sankakucomplex.com/'), (False, 'www.idolcomplex.com/'))),
+    )),
+    'imagebam': ((), (
+        ('ImagebamGalleryExtractor', 'imagebam', 'gallery', '', '(?:https?://)?(?:www\\.)?imagebam\\.com(/(?:gallery/|view/G)[a-zA-Z0-9]+)', ((False, 'imagebam.com/'), (False, 'www.imagebam.com/'))),
+        ('ImagebamImageExtractor', 'imagebam', 'image', '', '(?:https?://)?(?:\\w+\\.)?imagebam\\.com(/(?:image/|view/M|(?:[0-9a-f]{2}/){3})[a-zA-Z0-9]+)', ((False, 'imagebam.com/'), (True, '.imagebam.com'))),
+    )),
+    'imagechest': ((), (
+        ('ImagechestGalleryExtractor', 'imagechest', 'gallery', '', '(?:https?://)?(?:www\\.)?imgchest\\.com/p/([A-Za-z0-9]{11})', ((False, 'imgchest.com/'), (False, 'www.imgchest.com/'))),
+        ('ImagechestUserExtractor', 'imagechest', 'user', '', '(?:https?://)?(?:www\\.)?imgchest\\.com/u/([^/?#]+)', ((False, 'imgchest.com/'), (False, 'www.imgchest.com/'))),
+    )),
+    'imagefap': ((), (
+        ('ImagefapGalleryExtractor', 'imagefap', 'gallery', '', '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:gallery\\.php\\?gid=|gallery/|pictures/)(\\d+)', ((False, 'beta.imagefap.com/'), (False, 'imagefap.com/'), (False, 'www.imagefap.com/'))),
+        ('ImagefapImageExtractor', 'imagefap', 'image', '', '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/photo/(\\d+)', ((False, 'beta.imagefap.com/'), (False, 'imagefap.com/'), (False, 'www.imagefap.com/'))),
+        ('ImagefapFolderExtractor', 'imagefap', 'folder', '', '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:organizer/|(?:usergallery\\.php\\?user(id)?=([^&#]+)&|profile/([^/?#]+)/galleries\\?)folderid=)(\\d+|-1)', ((False, 'beta.imagefap.com/'), (False, 'imagefap.com/'), (False, 'www.imagefap.com/'))),
+        ('ImagefapUserExtractor', 'imagefap', 'user', '', '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:profile(?:\\.php\\?user=|/)([^/?#]+)(?:/galleries)?|usergallery\\.php\\?userid=(\\d+))(?:$|#)', ((False, 'beta.imagefap.com/'), (False, 'imagefap.com/'), (False, 'www.imagefap.com/'))),
+    )),
+    'imgbb': ((), (
+        ('ImgbbAlbumExtractor', 'imgbb', 'album', '', '(?:https?://)?ibb\\.co/album/([^/?#]+)/?(?:\\?([^#]+))?', ((False, 'ibb.co/'),)),
+        ('ImgbbImageExtractor', 'imgbb', 'image', '', '(?:https?://)?ibb\\.co/([^/?#]+)', ((False, 'ibb.co/'),)),
+        ('ImgbbUserExtractor', 'imgbb', 'user', '', '(?:https?://)?([\\w-]+)\\.imgbb\\.com/?(?:\\?([^#]+))?', None),
+    )),
+    'imgbox': ((), (
+        ('ImgboxGalleryExtractor', 'imgbox', 'gallery', '', '(?:https?://)?(?:www\\.)?imgbox\\.com/g/([A-Za-z0-9]{10})', ((False, 'imgbox.com/'), (False, 'www.imgbox.com/'))),
+        ('ImgboxImageExtractor', 'imgbox', 'image', '', '(?:https?://)?(?:www\\.)?imgbox\\.com/([A-Za-z0-9]{8})', ((False, 'imgbox.com/'), (False, 'www.imgbox.com/'))),
+    )),
+    'imgpile': ((), (
+        ('ImgpilePostExtractor', 'imgpile', 'post', '', '(?:https?://)?(?:www\\.)?imgpile\\.com/p/(\\w+)', ((False, 'imgpile.com/'), (False, 'www.imgpile.com/'))),
+        ('ImgpileUserExtractor', 'imgpile', 'user', '', '(?:https?://)?(?:www\\.)?imgpile\\.com/u/([^/?#]+)', ((False, 'imgpile.com/'), (False, 'www.imgpile.com/'))),
+    )),
+    'imgth': ((), (
+        ('ImgthGalleryExtractor', 'imgth', 'gallery', '', '(?:https?://)?(?:www\\.)?imgth\\.com/gallery/(\\d+)', ((False, 'imgth.com/'), (False, 'www.imgth.com/'))),
+    )),
+    'imgur': ((), (
+        ('ImgurImageExtractor', 'imgur', 'image', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?!gallery|search)(?:r/\\w+/)?(?:[^/?#]+-)?(\\w{7}|\\w{5})[sbtmlh]?', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurAlbumExtractor', 'imgur', 'album', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/a/(?:[^/?#]+-)?(\\w{7}|\\w{5})', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurGalleryExtractor', 'imgur', 'gallery', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?:gallery|t/\\w+)/(?:[^/?#]+-)?(\\w{7}|\\w{5})', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurUserExtractor', 'imgur', 'user', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/(?!me(?:/|$|\\?|#))([^/?#]+)(?:/posts|/submitted)?/?$', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurFavoriteExtractor', 'imgur', 'favorite', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/favorites/?$', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurFavoriteFolderExtractor', 'imgur', 'favorite-folder', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/favorites/folder/(\\d+)', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurMeExtractor', 'imgur', 'me', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/me(?:/posts)?(/hidden)?', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurSubredditExtractor', 'imgur', 'subreddit', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/r/([^/?#]+)/?$', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurTagExtractor', 'imgur', 'tag', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/t/([^/?#]+)$', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+        ('ImgurSearchExtractor', 'imgur', 'search', '', '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/search(?:/[^?#]+)?/?\\?q=([^&#]+)', ((False, 'i.imgur.com/'), (False, 'i.imgur.io/'), (False, 'imgur.com/'), (False, 'imgur.io/'), (False, 'm.imgur.com/'), (False, 'm.imgur.io/'), (False, 'www.imgur.com/'), (False, 'www.imgur.io/'))),
+    )),
+    'imhentai': (('IMHentai',), (
+        ('ImhentaiGalleryExtractor', '', 'gallery', 'IMHentai', '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))/(?:gallery|view)/(\\d+)', ((False, 'hentaienvy.com/'), (False, 'hentaiera.com/'), (False, 'hentaifox.com/'), (False, 'hentairox.com/'), (False, 'hentaizap.com/'), (False, 'imhentai.xxx/'), (False, 'imhentai:http:/'), (False, 'imhentai:https:/'), (False, 'www.hentaienvy.com/'), (False, 'www.hentaiera.com/'), (False, 'www.hentaifox.com/'), (False, 'www.hentairox.com/'), (False, 'www.hentaizap.com/'), (False, 'www.imhentai.xxx/'))),
+        ('ImhentaiTagExtractor', '', 'tag', 'IMHentai', '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))(/(?:artist|category|character|group|language|parody|tag)/([^/?#]+))', ((False, 'hentaienvy.com/'), (False, 'hentaiera.com/'), (False, 'hentaifox.com/'), (False, 'hentairox.com/'), (False, 'hentaizap.com/'), (False, 'imhentai.xxx/'), (False, 'imhentai:http:/'), (False, 'imhentai:https:/'), (False, 'www.hentaienvy.com/'), (False, 'www.hentaiera.com/'), (False, 'www.hentaifox.com/'), (False, 'www.hentairox.com/'), (False, 'www.hentaizap.com/'), (False, 'www.imhentai.xxx/'))),
+        ('ImhentaiSearchExtractor', '', 'search', 'IMHentai', '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))/search(/?\\?[^#]+|/[^/?#]+/?)', ((False, 'hentaienvy.com/'), (False, 'hentaiera.com/'), (False, 'hentaifox.com/'), (False, 'hentairox.com/'), (False, 'hentaizap.com/'), (False, 'imhentai.xxx/'), (False, 'imhentai:http:/'), (False, 'imhentai:https:/'), (False, 'www.hentaienvy.com/'), (False, 'www.hentaiera.com/'), (False, 'www.hentaifox.com/'), (False, 'www.hentairox.com/'), (False, 'www.hentaizap.com/'), (False, 'www.imhentai.xxx/'))),
+    )),
+    'inkbunny': ((), (
+        ('InkbunnyUserExtractor', 'inkbunny', 'user', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?!s/)(gallery/|scraps/)?(\\w+)(?:$|[/?#])', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+        ('InkbunnyPoolExtractor', 'inkbunny', 'pool', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:poolview_process\\.php\\?pool_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=pool(?:&[^#]+)?))', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+        ('InkbunnyFavoriteExtractor', 'inkbunny', 'favorite', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:userfavorites_process\\.php\\?favs_user_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=userfavs(?:&[^#]+)?))', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+        ('InkbunnyUnreadExtractor', 'inkbunny', 'unread', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?:[^#]+&)?mode=unreadsubs(?:&[^#]+)?)', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+        ('InkbunnySearchExtractor', 'inkbunny', 'search', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?:[^#]+&)?mode=search(?:&[^#]+)?)', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+        ('InkbunnyFollowingExtractor', 'inkbunny', 'following', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:watchlist_process\\.php\\?mode=watching&user_id=(\\d+)|usersviewall\\.php\\?((?:[^#]+&)?mode=watching(?:&[^#]+)?))', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+        ('InkbunnyPostExtractor', 'inkbunny', 'post', '', '(?:https?://)?(?:www\\.)?inkbunny\\.net/s/(\\d+)', ((False, 'inkbunny.net/'), (False, 'www.inkbunny.net/'))),
+    )),
+    'instagram': ((), (
+        ('InstagramUserExtractor', 'instagram', 'user', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/?(?:$|[?#])', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramPostsExtractor', 'instagram', 'posts', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/posts', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramReelsExtractor', 'instagram', 'reels', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/reels', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramTaggedExtractor', 'instagram', 'tagged', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/tagged', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramGuideExtractor', 'instagram', 'guide', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/guide/[^/?#]+/(\\d+)', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramSavedExtractor', 'instagram', 'saved', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/saved(?:/all-posts)?/?$', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramCollectionExtractor', 'instagram', 'collection', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/saved/([^/?#]+)/([^/?#]+)', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramStoriesTrayExtractor', 'instagram', 'stories-tray', '', '(?:https?://)?(?:www\\.)?instagram\\.com/stories/me/?$()', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramStoriesExtractor', 'instagram', 'stories', '', '(?:https?://)?(?:www\\.)?instagram\\.com/s(?:tories/(?:highlights/(\\d+)|([^/?#]+)(?:/(\\d+))?)|/(aGlnaGxpZ2h0[^?#]+)(?:\\?story_media_id=(\\d+))?)', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramHighlightsExtractor', 'instagram', 'highlights', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/highlights', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramFollowersExtractor', 'instagram', 'followers', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/followers', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramFollowingExtractor', 'instagram', 'following', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/following', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramTagExtractor', 'instagram', 'tag', '', '(?:https?://)?(?:www\\.)?instagram\\.com/explore/tags/([^/?#]+)', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramInfoExtractor', 'instagram', 'info', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/info', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramAvatarExtractor', 'instagram', 'avatar', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/avatar', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+        ('InstagramPostExtractor', 'instagram', 'post', '', '(?:https?://)?(?:www\\.)?instagram\\.com/(?:share/()|[^/?#]+/)?(?:p|tv|reel)/([^/?#]+)', ((False, 'instagram.com/'), (False, 'www.instagram.com/'))),
+    )),
+    'issuu': ((), (
+        ('IssuuPublicationExtractor', 'issuu', 'publication', '', '(?:https?://)?issuu\\.com(/[^/?#]+/docs/[^/?#]+)', ((False, 'issuu.com/'),)),
+        ('IssuuUserExtractor', 'issuu', 'user', '', '(?:https?://)?issuu\\.com/([^/?#]+)(?:/(\\d*))?$', ((False, 'issuu.com/'),)),
+    )),
+    'itaku': ((), (
+        ('ItakuGalleryExtractor', 'itaku', 'gallery', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/gallery(?:/(\\d+))?', ((False, 'itaku.ee/'),)),
+        ('ItakuPostsExtractor', 'itaku', 'posts', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/posts(?:/(\\d+))?', ((False, 'itaku.ee/'),)),
+        ('ItakuStarsExtractor', 'itaku', 'stars', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/stars(?:/(\\d+))?', ((False, 'itaku.ee/'),)),
+        ('ItakuFollowingExtractor', 'itaku', 'following', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/following', ((False, 'itaku.ee/'),)),
+        ('ItakuFollowersExtractor', 'itaku', 'followers', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/followers', ((False, 'itaku.ee/'),)),
+        ('ItakuBookmarksExtractor', 'itaku', 'bookmarks', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/bookmarks/(image|user)/(\\d+)', ((False, 'itaku.ee/'),)),
+        ('ItakuUserExtractor', 'itaku', 'user', '', '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/?(?:$|\\?|#)', ((False, 'itaku.ee/'),)),
+        ('ItakuImageExtractor', 'itaku', 'image', '', '(?:https?://)?itaku\\.ee/images/(\\d+)', ((False, 'itaku.ee/'),)),
+        ('ItakuPostExtractor', 'itaku', 'post', '', '(?:https?://)?itaku\\.ee/posts/(\\d+)', ((False, 'itaku.ee/'),)),
+        ('ItakuSearchExtractor', 'itaku', 'search', '', '(?:https?://)?itaku\\.ee/home/images/?\\?([^#]+)', ((False, 'itaku.ee/'),)),
+    )),
+    'itchio': ((), (
+        ('ItchioGameExtractor', 'itchio', 'game', '', '(?:https?://)?(\\w+)\\.itch\\.io/([\\w-]+)', ((True, '.itch.io'),)),
+    )),
+    'iwara': ((), (
+        ('IwaraUserExtractor', 'iwara', 'user', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/?$', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraUserImagesExtractor', 'iwara', 'user-images', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/images(?:\\?([^#]+))?', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraUserVideosExtractor', 'iwara', 'user-videos', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/videos(?:\\?([^#]+))?', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraUserPlaylistsExtractor', 'iwara', 'user-playlists', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/playlists(?:\\?([^#]+))?', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraFollowingExtractor', 'iwara', 'following', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/following', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraFollowersExtractor', 'iwara', 'followers', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/followers', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraImageExtractor', 'iwara', 'image', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/image/([^/?#]+)', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraVideoExtractor', 'iwara', 'video', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/video/([^/?#]+)', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraPlaylistExtractor', 'iwara', 'playlist', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/playlist/([^/?#]+)', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraFavoriteExtractor', 'iwara', 'favorite', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/favorites(?:/(image|video)s)?', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraSearchExtractor', 'iwara', 'search', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/search\\?([^#]+)', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+        ('IwaraTagExtractor', 'iwara', 'tag', '', '(?:https?://)?(?:www\\.)?iwara\\.tv/(image|video)s(?:\\?([^#]+))?', ((False, 'iwara.tv/'), (False, 'www.iwara.tv/'))),
+    )),
+    'jschan': (('jschan',), (
+        ('JschanThreadExtractor', '', 'thread', 'jschan', '(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]+)/thread/(\\d+)\\.html', ((False, '94chan.org/'), (False, 'jschan:http:/'), (False, 'jschan:https:/'))),
+        ('JschanBoardExtractor', '', 'board', 'jschan', '(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]+)(?:/index\\.html|/catalog\\.html|/\\d+\\.html|/?$)', ((False, '94chan.org/'), (False, 'jschan:http:/'), (False, 'jschan:https:/'))),
+    )),
+    'kabeuchi': ((), (
+        ('KabeuchiUserExtractor', 'kabeuchi', 'user', '', '(?:https?://)?kabe-uchiroom\\.com/mypage/?\\?id=(\\d+)', ((False, 'kabe-uchiroom.com/'),)),
+    )),
+    'keenspot': ((), (
+        ('KeenspotComicExtractor', 'keenspot', 'comic', '', '(?:https?://)?(?!www\\.|forums\\.)([\\w-]+)\\.keenspot\\.com(/.+)?', None),
+    )),
+    'kemono': ((), (
+        ('KemonoUserExtractor', 'kemono', 'user', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+        ('KemonoPostsExtractor', 'kemono', 'posts', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/posts()()(?:/?\\?([^#]+))?', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+        ('KemonoPostExtractor', 'kemono', 'post', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)(/revisions?(?:/(\\d*))?)?', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+        ('KemonoDiscordExtractor', 'kemono', 'discord', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/discord/server/(\\d+)[/#](?:channel/)?(\\d+)', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+        ('KemonoDiscordServerExtractor', 'kemono', 'discord-server', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/discord/server/(\\d+)$', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+        ('KemonoFavoriteExtractor', 'kemono', 'favorite', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/(?:account/)?favorites()()(?:/?\\?([^#]+))?', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+        ('KemonoArtistsExtractor', 'kemono', 'artists', '', '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/artists(?:\\?([^#]+))?', ((False, 'beta.coomer.cr/'), (False, 'beta.coomer.party/'), (False, 'beta.coomer.st/'), (False, 'beta.coomer.su/'), (False, 'beta.kemono.cr/'), (False, 'beta.kemono.party/'), (False, 'beta.kemono.st/'), (False, 'beta.kemono.su/'), (False, 'coomer.cr/'), (False, 'coomer.party/'), (False, 'coomer.st/'), (False, 'coomer.su/'), (False, 'kemono.cr/'), (False, 'kemono.party/'), (False, 'kemono.st/'), (False, 'kemono.su/'), (False, 'www.coomer.cr/'), (False, 'www.coomer.party/'), (False, 'www.coomer.st/'), (False, 'www.coomer.su/'), (False, 'www.kemono.cr/'), (False, 'www.kemono.party/'), (False, 'www.kemono.st/'), (False, 'www.kemono.su/'))),
+    )),
+    'khinsider': ((), (
+        ('KhinsiderSoundtrackExtractor', 'khinsider', 'soundtrack', '', '(?:https?://)?downloads\\.khinsider\\.com/game-soundtracks/album/([^/?#]+)', ((False, 'downloads.khinsider.com/'),)),
+    )),
+    'komikcast': ((), (
+        ('KomikcastChapterExtractor', 'komikcast', 'chapter', '', '(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo?e)(/chapter/[^/?#]+/)', ((True, '.com'), (True, '.cz'), (True, '.la'), (True, '.li'), (True, '.lol'), (True, '.me'), (True, '.moe'), (True, '.site'))),
+        ('KomikcastMangaExtractor', 'komikcast', 'manga', '', '(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo?e)(/(?:komik/)?[^/?#]+/?)$', ((True, '.com'), (True, '.cz'), (True, '.la'), (True, '.li'), (True, '.lol'), (True, '.me'), (True, '.moe'), (True, '.site'))),
+    )),
+    'leakgallery': ((), (
+        ('LeakgalleryUserExtractor', 'leakgallery', 'user', '', '(?:https?://)?(?:www\\.)?leakgallery\\.com/(?!trending-medias|most-liked|random/medias)([^/?#]+)(?:/(Photos|Videos|All))?(?:/(MostRecent|MostViewed|MostLiked))?/?$', ((False, 'leakgallery.com/'), (False, 'www.leakgallery.com/'))),
+        ('LeakgalleryTrendingExtractor', 'leakgallery', 'trending', '', '(?:https?://)?(?:www\\.)?leakgallery\\.com/trending-medias(?:/([\\w-]+))?', ((False, 'leakgallery.com/'), (False, 'www.leakgallery.com/'))),
+        ('LeakgalleryMostlikedExtractor', 'leakgallery', 'mostliked', '', '(?:https?://)?(?:www\\.)?leakgallery\\.com/most-liked', ((False, 'leakgallery.com/'), (False, 'www.leakgallery.com/'))),
+        ('LeakgalleryPostExtractor', 'leakgallery', 'post', '', '(?:https?://)?(?:www\\.)?leakgallery\\.com/([^/?#]+)/(\\d+)', ((False, 'leakgallery.com/'), (False, 'www.leakgallery.com/'))),
+    )),
+    'lensdump': ((), (
+        ('LensdumpAlbumExtractor', 'lensdump', 'album', '', '(?:https?://)?lensdump\\.com/a/(\\w+)(?:/?\\?([^#]+))?', ((False, 'lensdump.com/'),)),
+        ('LensdumpAlbumsExtractor', 'lensdump', 'albums', '', '(?:https?://)?lensdump\\.com/(?![ai]/)([^/?#]+)(?:/?\\?([^#]+))?', ((False, 'lensdump.com/'),)),
+        ('LensdumpImageExtractor', 'lensdump', 'image', '', '(?:https?://)?(?:(?:i\\d?\\.)?lensdump\\.com|\\w\\.l3n\\.co)/i/(\\w+)', ((False, 'i.lensdump.com/'), (False, 'lensdump.com/'), (True, '.l3n.co'), (True, '.lensdump.com'))),
+    )),
+    'lexica': ((), (
+        ('LexicaSearchExtractor', 'lexica', 'search', '', '(?:https?://)?lexica\\.art/?\\?q=([^&#]+)', ((False, 'lexica.art/'), (False, 'lexica.art?'))),
+    )),
+    'lightroom': ((), (
+        ('LightroomGalleryExtractor', 'lightroom', 'gallery', '', '(?:https?://)?lightroom\\.adobe\\.com/shares/([0-9a-f]+)', ((False, 'lightroom.adobe.com/'),)),
+    )),
+    'livedoor': ((), (
+        ('LivedoorBlogExtractor', 'livedoor', 'blog', '', '(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/?(?:$|[?#])', ((False, 'blog.livedoor.jp/'),)),
+        ('LivedoorPostExtractor', 'livedoor', 'post', '', '(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/archives/(\\d+)', ((False, 'blog.livedoor.jp/'),)),
+    )),
+    'lofter': ((), (
+        ('LofterPostExtractor', 'lofter', 'post', '', '(?:https?://)?[\\w-]+\\.lofter\\.com/post/([0-9a-f]+)_([0-9a-f]+)', ((True, '.lofter.com'),)),
+        ('LofterBlogPostsExtractor', 'lofter', 'blog-posts', '', '(?:https?://)?(?:www\\.lofter\\.com/front/blog/home-page/([\\w-]+)|([\\w-]+)\\.lofter\\.com)/?(?:$|\\?|#)', ((False, 'www.lofter.com/'), (True, '.lofter.com'))),
+    )),
+    'luscious': ((), (
+        ('LusciousAlbumExtractor', 'luscious', 'album', '', '(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/(?:albums|pictures/c/[^/?#]+/album)/[^/?#]+_(\\d+)', ((False, 'luscious.net/'), (False, 'members.luscious.net/'), (False, 'www.luscious.net/'))),
+        ('LusciousSearchExtractor', 'luscious', 'search', '', '(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/albums/list/?(?:\\?([^#]+))?', ((False, 'luscious.net/'), (False, 'members.luscious.net/'), (False, 'www.luscious.net/'))),
+    )),
+    'lynxchan': (('lynxchan',), (
+        ('LynxchanThreadExtractor', '', 'thread', 'lynxchan', '(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)/res/(\\d+)', ((False, 'bbw-chan.link/'), (False, 'bbw-chan.nl/'), (False, 'endchan.gg/'), (False, 'endchan.net/'), (False, 'endchan.org/'), (False, 'kohlchan.net/'), (False, 'lynxchan:http:/'), (False, 'lynxchan:https:/'))),
+        ('LynxchanBoardExtractor', '', 'board', 'lynxchan', '(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)(?:/index|/catalog|/\\d+|/?$)', ((False, 'bbw-chan.link/'), (False, 'bbw-chan.nl/'), (False, 'endchan.gg/'), (False, 'endchan.net/'), (False, 'endchan.org/'), (False, 'kohlchan.net/'), (False, 'lynxchan:http:/'), (False, 'lynxchan:https:/'))),
+    )),
+    'madokami': ((), (
+        ('MadokamiMangaExtractor', 'madokami', 'manga', '', '(?:https?://)?manga\\.madokami\\.al/Manga/(\\w/\\w{2}/\\w{4}/.+)', ((False, 'manga.madokami.al/'),)),
+    )),
+    'mangadex': ((), (
+        ('MangadexCoversExtractor', 'mangadex', 'covers', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!follows|feed$)([0-9a-f-]+)(?:/[^/?#]+)?\\?tab=art', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+        ('MangadexChapterExtractor', 'mangadex', 'chapter', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/chapter/([0-9a-f-]+)', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+        ('MangadexMangaExtractor', 'mangadex', 'manga', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!follows|feed$)([0-9a-f-]+)', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+        ('MangadexFeedExtractor', 'mangadex', 'feed', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/feed$()', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+        ('MangadexFollowingExtractor', 'mangadex', 'following', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/follows(?:\\?([^#]+))?$', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+        ('MangadexListExtractor', 'mangadex', 'list', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/list/([0-9a-f-]+)(?:/[^/?#]*)?(?:\\?tab=(\\w+))?', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+        ('MangadexAuthorExtractor', 'mangadex', 'author', '', '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/author/([0-9a-f-]+)', ((False, 'mangadex.cc/'), (False, 'mangadex.org/'), (False, 'www.mangadex.cc/'), (False, 'www.mangadex.org/'))),
+    )),
+    'mangafox': ((), (
+        ('MangafoxChapterExtractor', 'mangafox', 'chapter', '', '(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^/?#]+/((?:v([^/?#]+)/)?c(\\d+)([^/?#]*)))', ((False, 'fanfox.net/'), (False, 'm.fanfox.net/'), (False, 'm.mangafox.me/'), (False, 'mangafox.me/'), (False, 'www.fanfox.net/'), (False, 'www.mangafox.me/'))),
+        ('MangafoxMangaExtractor', 'mangafox', 'manga', '', '(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^/?#]+)/?$', ((False, 'fanfox.net/'), (False, 'm.fanfox.net/'), (False, 'm.mangafox.me/'), (False, 'mangafox.me/'), (False, 'www.fanfox.net/'), (False, 'www.mangafox.me/'))),
+    )),
+    'mangahere': ((), (
+        ('MangahereChapterExtractor', 'mangahere', 'chapter', '', '(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co]/manga/([^/]+(?:/v0*(\\d+))?/c([^/?#]+))', ((False, 'm.mangahere.cc/'), (False, 'm.mangahere.co/'), (False, 'mangahere.cc/'), (False, 'mangahere.co/'), (False, 'www.mangahere.cc/'), (False, 'www.mangahere.co/'))),
+        ('MangahereMangaExtractor', 'mangahere', 'manga', '', '(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co](/manga/[^/?#]+/?)(?:#.*)?$', ((False, 'm.mangahere.cc/'), (False, 'm.mangahere.co/'), (False, 'mangahere.cc/'), (False, 'mangahere.co/'), (False, 'www.mangahere.cc/'), (False, 'www.mangahere.co/'))),
+    )),
+    'manganelo': (('manganelo',), (
+        ('ManganeloChapterExtractor', '', 'chapter', 'manganelo', '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+/chapter-[^/?#]+)', ((False, 'mangakakalot.gg/'), (False, 'manganato.gg/'), (False, 'manganelo:http:/'), (False, 'manganelo:https:/'), (False, 'natomanga.com/'), (False, 'nelomanga.net/'), (False, 'www.mangakakalot.gg/'), (False, 'www.manganato.gg/'), (False, 'www.natomanga.com/'), (False, 'www.nelomanga.net/'))),
+        ('ManganeloMangaExtractor', '', 'manga', 'manganelo', '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+)$', ((False, 'mangakakalot.gg/'), (False, 'manganato.gg/'), (False, 'manganelo:http:/'), (False, 'manganelo:https:/'), (False, 'natomanga.com/'), (False, 'nelomanga.net/'), (False, 'www.mangakakalot.gg/'), (False, 'www.manganato.gg/'), (False, 'www.natomanga.com/'), (False, 'www.nelomanga.net/'))),
+    )),
+    'mangapark': ((), (
+        ('MangaparkChapterExtractor', 'mangapark', 'chapter', '', '(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title/[^/?#]+/|comic/\\d+/[^/?#]+/[^/?#]+-i)(\\d+)', ((False, 'comicpark.com/'), (False, 'comicpark.io/'), (False, 'comicpark.me/'), (False, 'comicpark.net/'), (False, 'comicpark.org/'), (False, 'comicpark.to/'), (False, 'mangapark.com/'), (False, 'mangapark.io/'), (False, 'mangapark.me/'), (False, 'mangapark.net/'), (False, 'mangapark.org/'), (False, 'mangapark.to/'), (False, 'mpark.to/'), (False, 'parkmanga.com/'), (False, 'parkmanga.net/'), (False, 'parkmanga.org/'), (False, 'readpark.com/'), (False, 'readpark.io/'), (False, 'readpark.me/'), (False, 'readpark.net/'), (False, 'readpark.org/'), (False, 'readpark.to/'), (False, 'www.comicpark.com/'), (False, 'www.comicpark.io/'), (False, 'www.comicpark.me/'), (False, 'www.comicpark.net/'), (False, 'www.comicpark.org/'), (False, 'www.comicpark.to/'), (False, 'www.mangapark.com/'), (False, 'www.mangapark.io/'), (False, 'www.mangapark.me/'), (False, 'www.mangapark.net/'), (False, 'www.mangapark.org/'), (False, 'www.mangapark.to/'), (False, 'www.mpark.to/'), (False, 'www.parkmanga.com/'), (False, 'www.parkmanga.net/'), (False, 'www.parkmanga.org/'), (False, 'www.readpark.com/'), (False, 'www.readpark.io/'), (False, 'www.readpark.me/'), (False, 'www.readpark.net/'), (False, 'www.readpark.org/'), (False, 'www.readpark.to/'))),
+        ('MangaparkMangaExtractor', 'mangapark', 'manga', '', '(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title|comic)/(\\d+)(?:[/-][^/?#]*)?/?$', ((False, 'comicpark.com/'), (False, 'comicpark.io/'), (False, 'comicpark.me/'), (False, 'comicpark.net/'), (False, 'comicpark.org/'), (False, 'comicpark.to/'), (False, 'mangapark.com/'), (False, 'mangapark.io/'), (False, 'mangapark.me/'), (False, 'mangapark.net/'), (False, 'mangapark.org/'), (False, 'mangapark.to/'), (False, 'mpark.to/'), (False, 'parkmanga.com/'), (False, 'parkmanga.net/'), (False, 'parkmanga.org/'), (False, 'readpark.com/'), (False, 'readpark.io/'), (False, 'readpark.me/'), (False, 'readpark.net/'), (False, 'readpark.org/'), (False, 'readpark.to/'), (False, 'www.comicpark.com/'), (False, 'www.comicpark.io/'), (False, 'www.comicpark.me/'), (False, 'www.comicpark.net/'), (False, 'www.comicpark.org/'), (False, 'www.comicpark.to/'), (False, 'www.mangapark.com/'), (False, 'www.mangapark.io/'), (False, 'www.mangapark.me/'), (False, 'www.mangapark.net/'), (False, 'www.mangapark.org/'), (False, 'www.mangapark.to/'), (False, 'www.mpark.to/'), (False, 'www.parkmanga.com/'), (False, 'www.parkmanga.net/'), (False, 'www.parkmanga.org/'), (False, 'www.readpark.com/'), (False, 'www.readpark.io/'), (False, 'www.readpark.me/'), (False, 'www.readpark.net/'), (False, 'www.readpark.org/'), (False, 'www.readpark.to/'))),
+    )),
+    'mangaread': ((), (
+        ('MangareadChapterExtractor', 'mangaread', 'chapter', '', '(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+/[^/?#]+)', ((False, 'mangaread.org/'), (False, 'www.mangaread.org/'))),
+        ('MangareadMangaExtractor', 'mangaread', 'manga', '', '(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+)/?$', ((False, 'mangaread.org/'), (False, 'www.mangaread.org/'))),
+    )),
+    'mangoxo': ((), (
+        ('MangoxoAlbumExtractor', 'mangoxo', 'album', '', '(?:https?://)?(?:www\\.)?mangoxo\\.com/album/(\\w+)', ((False, 'mangoxo.com/'), (False, 'www.mangoxo.com/'))),
+        ('MangoxoChannelExtractor', 'mangoxo', 'channel', '', '(?:https?://)?(?:www\\.)?mangoxo\\.com/(\\w+)/album', ((False, 'mangoxo.com/'), (False, 'www.mangoxo.com/'))),
+    )),
+    'misskey': (('misskey',), (
+        ('MisskeyUserExtractor', '', 'user', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/?$', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyNotesExtractor', '', 'notes', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/notes', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyInfoExtractor', '', 'info', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/info', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyAvatarExtractor', '', 'avatar', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/avatar', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyBackgroundExtractor', '', 'background', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/ba(?:nner|ckground)', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyFollowingExtractor', '', 'following', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/following', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyNoteExtractor', '', 'note', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/notes/(\\w+)', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+        ('MisskeyFavoriteExtractor', '', 'favorite', 'misskey', '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/(?:my|api/i)/favorites', ((False, 'lesbian.energy/'), (False, 'misskey.art/'), (False, 'misskey.design/'), (False, 'misskey.io/'), (False, 'misskey:http:/'), (False, 'misskey:https:/'), (False, 'sushi.ski/'))),
+    )),
+    'motherless': ((), (
+        ('MotherlessMediaExtractor', 'motherless', 'media', '', '(?:https?://)?motherless\\.com/((?:g/[^/?#]+/|G[IV]?[A-Z0-9]+/)?(?!G)[A-Z0-9]+)', ((False, 'motherless.com/'),)),
+        ('MotherlessGalleryExtractor', 'motherless', 'gallery', '', '(?:https?://)?motherless\\.com/G([IVG])?([A-Z0-9]+)/?$', ((False, 'motherless.com/'),)),
+        ('MotherlessGroupExtractor', 'motherless', 'group', '', '(?:https?://)?motherless\\.com/g([iv]?)/?([a-z0-9_]+)/?$', ((False, 'motherless.com/'),)),
+    )),
+    'myhentaigallery': ((), (
+        ('MyhentaigalleryGalleryExtractor', 'myhentaigallery', 'gallery', '', '(?:https?://)?myhentaigallery\\.com/g(?:allery/(?:thumbnails|show))?/(\\d+)', ((False, 'myhentaigallery.com/'),)),
+    )),
+    'myportfolio': ((), (
+        ('MyportfolioGalleryExtractor', 'myportfolio', 'gallery', '', '(?:myportfolio:(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+\\.myportfolio\\.com))(/[^/?#]+)?', None),
+    )),
+    'naverblog': ((), (
+        ('NaverBlogPostExtractor', 'naver-blog', 'post', '', '(?:https?://)?blog\\.naver\\.com/(?:PostView\\.n(?:aver|hn)\\?blogId=(\\w+)&logNo=(\\d+)|(\\w+)/(\\d+)/?$)', ((False, 'blog.naver.com/'),)),
+        ('NaverBlogBlogExtractor', 'naver-blog', 'blog', '', '(?:https?://)?blog\\.naver\\.com/(?:PostList\\.n(?:aver|hn)\\?(?:[^&#]+&)*blogId=([^&#]+)|(\\w+)/?$)', ((False, 'blog.naver.com/'),)),
+    )),
+    'naverchzzk': ((), (
+        ('NaverChzzkCommentExtractor', 'naver-chzzk', 'comment', '', '(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community/detail/(\\d+)', ((False, 'chzzk.naver.com/'),)),
+        ('NaverChzzkCommunityExtractor', 'naver-chzzk', 'community', '', '(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community', ((False, 'chzzk.naver.com/'),)),
+    )),
+    'naverwebtoon': ((), (
+        ('NaverWebtoonEpisodeExtractor', 'naver-webtoon', 'episode', '', '(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/detail(?:\\.nhn)?\\?([^#]+)', ((False, 'comic.naver.com/'),)),
+        ('NaverWebtoonComicExtractor', 'naver-webtoon', 'comic', '', '(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/list(?:\\.nhn)?\\?([^#]+)', ((False, 'comic.naver.com/'),)),
+    )),
+    'nekohouse': ((), (
+        ('NekohousePostExtractor', 'nekohouse', 'post', '', '(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)', ((False, 'nekohouse.su/'),)),
+        ('NekohouseUserExtractor', 'nekohouse', 'user', '', '(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)', ((False, 'nekohouse.su/'),)),
+    )),
+    'newgrounds': ((), (
+        ('NewgroundsImageExtractor', 'newgrounds', 'image', '', '(?:https?://)?(?:(?:www\\.)?newgrounds\\.com/art/view/([^/?#]+)/[^/?#]+|art\\.ngfiles\\.com/images/\\d+/\\d+_([^_]+)_([^.]+))', ((False, 'art.ngfiles.com/'), (False, 'newgrounds.com/'), (False, 'www.newgrounds.com/'))),
+        ('NewgroundsMediaExtractor', 'newgrounds', 'media', '', '(?:https?://)?(?:www\\.)?newgrounds\\.com(/(?:portal/view|audio/listen)/\\d+)', ((False, 'newgrounds.com/'), (False, 'www.newgrounds.com/'))),
+        ('NewgroundsArtExtractor', 'newgrounds', 'art', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/art(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ((True, '.newgrounds.com'),)),
+        ('NewgroundsAudioExtractor', 'newgrounds', 'audio', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/audio(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ((True, '.newgrounds.com'),)),
+        ('NewgroundsMoviesExtractor', 'newgrounds', 'movies', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/movies(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ((True, '.newgrounds.com'),)),
+        ('NewgroundsGamesExtractor', 'newgrounds', 'games', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/games(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ((True, '.newgrounds.com'),)),
+        ('NewgroundsUserExtractor', 'newgrounds', 'user', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/?$', ((True, '.newgrounds.com'),)),
+        ('NewgroundsFavoriteExtractor', 'newgrounds', 'favorite', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites(?!/following)(?:/(art|audio|movies)(?:(?:/page/|/?\\?page=)(\\d+))?)?', ((True, '.newgrounds.com'),)),
+        ('NewgroundsFollowingExtractor', 'newgrounds', 'following', '', '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites/(following)(?:(?:/page/|/?\\?page=)(\\d+))?', ((True, '.newgrounds.com'),)),
+        ('NewgroundsSearchExtractor', 'newgrounds', 'search', '', '(?:https?://)?(?:www\\.)?newgrounds\\.com/search/conduct/([^/?#]+)/?\\?([^#]+)', ((False, 'newgrounds.com/'), (False, 'www.newgrounds.com/'))),
+    )),
+    'nhentai': ((), (
+        ('NhentaiGalleryExtractor', 'nhentai', 'gallery', '', '(?:https?://)?nhentai\\.net/g/(\\d+)', ((False, 'nhentai.net/'),)),
+        ('NhentaiTagExtractor', 'nhentai', 'tag', '', '(?:https?://)?nhentai\\.net(/(?:artist|category|character|group|language|parody|tag)/[^/?#]+(?:/popular[^/?#]*)?/?)(?:\\?([^#]+))?', ((False, 'nhentai.net/'),)),
+        ('NhentaiSearchExtractor', 'nhentai', 'search', '', '(?:https?://)?nhentai\\.net(/search/?)\\?([^#]+)', ((False, 'nhentai.net/'),)),
+        ('NhentaiFavoriteExtractor', 'nhentai', 'favorite', '', '(?:https?://)?nhentai\\.net(/favorites/?)(?:\\?([^#]+))?', ((False, 'nhentai.net/'),)),
+    )),
+    'nijie': (('Nijie',), (
+        ('NijieUserExtractor', '', 'user', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members\\.php\\?id=(\\d+)', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieIllustrationExtractor', '', 'illustration', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members_illust\\.php\\?id=(\\d+)', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieDoujinExtractor', '', 'doujin', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members_dojin\\.php\\?id=(\\d+)', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieFavoriteExtractor', '', 'favorite', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/user_like_illust_view\\.php\\?id=(\\d+)', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieNuitaExtractor', '', 'nuita', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/history_nuita\\.php\\?id=(\\d+)', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieFeedExtractor', '', 'feed', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/like_user_view\\.php', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieFollowedExtractor', '', 'followed', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/like_my\\.php', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+        ('NijieImageExtractor', '', 'image', 'Nijie', '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/view(?:_popup)?\\.php\\?id=(\\d+)', ((False, 'horne.red/'), (False, 'nijie.info/'), (False, 'nijie:http:/'), (False, 'nijie:https:/'), (False, 'www.horne.red/'), (False, 'www.nijie.info/'))),
+    )),
+    'nitter': (('nitter',), (
+        ('NitterTweetsExtractor', '', 'tweets', 'nitter', '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)(?:/tweets)?(?:$|\\?|#)', ((False, '/'), (False, 'nitter:http:/'), (False, 'nitter:https:/'))),
+        ('NitterRepliesExtractor', '', 'replies', 'nitter', '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/with_replies', ((False, '/'), (False, 'nitter:http:/'), (False, 'nitter:https:/'))),
+        ('NitterMediaExtractor', '', 'media', 'nitter', '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/media', ((False, '/'), (False, 'nitter:http:/'), (False, 'nitter:https:/'))),
+        ('NitterSearchExtractor', '', 'search', 'nitter', '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/search', ((False, '/'), (False, 'nitter:http:/'), (False, 'nitter:https:/'))),
+        ('NitterTweetExtractor', '', 'tweet', 'nitter', '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i/web|[^/?#]+)/status/(\\d+())', ((False, '/'), (False, 'nitter:http:/'), (False, 'nitter:https:/'))),
+    )),
+    'nozomi': ((), (
+        ('NozomiPostExtractor', 'nozomi', 'post', '', '(?:https?://)?nozomi\\.la/post/(\\d+)', ((False, 'nozomi.la/'),)),
+        ('NozomiIndexExtractor', 'nozomi', 'index', '', '(?:https?://)?nozomi\\.la/(?:(index(?:-Popular)?)-(\\d+)\\.html)?(?:$|#|\\?)', ((False, 'nozomi.la/'),)),
+        ('NozomiTagExtractor', 'nozomi', 'tag', '', '(?:https?://)?nozomi\\.la/tag/([^/?#]+)-(\\d+)\\.', ((False, 'nozomi.la/'),)),
+        ('NozomiSearchExtractor', 'nozomi', 'search', '', '(?:https?://)?nozomi\\.la/search\\.html\\?q=([^&#]+)', ((False, 'nozomi.la/'),)),
+    )),
+    'nsfwalbum': ((), (
+        ('NsfwalbumAlbumExtractor', 'nsfwalbum', 'album', '', '(?:https?://)?(?:www\\.)?nsfwalbum\\.com(/album/(\\d+))', ((False, 'nsfwalbum.com/'), (False, 'www.nsfwalbum.com/'))),
+    )),
+    'nudostar': ((), (
+        ('NudostarModelExtractor', 'nudostar', 'model', '', '(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/?)$', None),
+        ('NudostarImageExtractor', 'nudostar', 'image', '', '(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/(\\d+)/)', None),
+    )),
+    'paheal': ((), (
+        ('PahealTagExtractor', 'paheal', 'tag', 'shimmie2', '(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/list/([^/?#]+)', ((False, 'cosplay.paheal.net/'), (False, 'rule34.paheal.net/'), (False, 'rule63.paheal.net/'))),
+        ('PahealPostExtractor', 'paheal', 'post', 'shimmie2', '(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/view/(\\d+)', ((False, 'cosplay.paheal.net/'), (False, 'rule34.paheal.net/'), (False, 'rule63.paheal.net/'))),
+    )),
+    'patreon': ((), (
+        ('PatreonCreatorExtractor', 'patreon', 'creator', '', '(?:https?://)?(?:www\\.)?patreon\\.com/(?!(?:home|create|login|signup|search|posts|messages)(?:$|[/?#]))(?:profile/creators|(?:cw?/)?([^/?#]+)(?:/posts)?)/?(?:\\?([^#]+))?', ((False, 'patreon.com/'), (False, 'www.patreon.com/'))),
+        ('PatreonUserExtractor', 'patreon', 'user', '', '(?:https?://)?(?:www\\.)?patreon\\.com/home$', ((False, 'patreon.com/'), (False, 'www.patreon.com/'))),
+        ('PatreonPostExtractor', 'patreon', 'post', '', '(?:https?://)?(?:www\\.)?patreon\\.com/posts/([^/?#]+)', ((False, 'patreon.com/'), (False, 'www.patreon.com/'))),
+    )),
+    'pexels': ((), (
+        ('PexelsCollectionExtractor', 'pexels', 'collection', '', '(?:https?://)?(?:www\\.)?pexels\\.com/collections/((?:[^/?#]*-)?(\\w+))', ((False, 'pexels.com/'), (False, 'www.pexels.com/'))),
+        ('PexelsSearchExtractor', 'pexels', 'search', '', '(?:https?://)?(?:www\\.)?pexels\\.com/search/([^/?#]+)', ((False, 'pexels.com/'), (False, 'www.pexels.com/'))),
+        ('PexelsUserExtractor', 'pexels', 'user', '', '(?:https?://)?(?:www\\.)?pexels\\.com/(@(?:(?:[^/?#]*-)?(\\d+)|[^/?#]+))', ((False, 'pexels.com/'), (False, 'www.pexels.com/'))),
+        ('PexelsImageExtractor', 'pexels', 'image', '', '(?:https?://)?(?:www\\.)?pexels\\.com/photo/((?:[^/?#]*-)?\\d+)', ((False, 'pexels.com/'), (False, 'www.pexels.com/'))),
+    )),
+    'philomena': (('philomena',), (
+        ('PhilomenaPostExtractor', '', 'post', 'philomena', '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:images/)?(\\d+)', ((False, 'derpibooru.org/'), (False, 'furbooru.org/'), (False, 'philomena:http:/'), (False, 'philomena:https:/'), (False, 'ponybooru.org/'), (False, 'www.derpibooru.org/'), (False, 'www.ponybooru.org/'))),
+        ('PhilomenaSearchExtractor', '', 'search', 'philomena', '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:search/?\\?([^#]+)|tags/([^/?#]+))', ((False, 'derpibooru.org/'), (False, 'furbooru.org/'), (False, 'philomena:http:/'), (False, 'philomena:https:/'), (False, 'ponybooru.org/'), (False, 'www.derpibooru.org/'), (False, 'www.ponybooru.org/'))),
+        ('PhilomenaGalleryExtractor', '', 'gallery', 'philomena', '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/galleries/(\\d+)', ((False, 'derpibooru.org/'), (False, 'furbooru.org/'), (False, 'philomena:http:/'), (False, 'philomena:https:/'), (False, 'ponybooru.org/'), (False, 'www.derpibooru.org/'), (False, 'www.ponybooru.org/'))),
+    )),
+    'photovogue': ((), (
+        ('PhotovogueUserExtractor', 'photovogue', 'user', '', '(?:https?://)?(?:www\\.)?vogue\\.com/photovogue/photographers/(\\d+)', ((False, 'vogue.com/'), (False, 'www.vogue.com/'))),
+    )),
+    'picarto': ((), (
+        ('PicartoGalleryExtractor', 'picarto', 'gallery', '', '(?:https?://)?picarto\\.tv/([^/?#]+)/gallery', ((False, 'picarto.tv/'),)),
+    )),
+    'pictoa': ((), (
+        ('PictoaImageExtractor', 'pictoa', 'image', '', '(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)?(\\d+)/(\\d+)', ((False, 'pictoa.com.de/'), (False, 'pictoa.com/'), (True, '.pictoa.com'), (True, '.pictoa.com.de'))),
+        ('PictoaAlbumExtractor', 'pictoa', 'album', '', '(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)?(\\d+).html', ((False, 'pictoa.com.de/'), (False, 'pictoa.com/'), (True, '.pictoa.com'), (True, '.pictoa.com.de'))),
+    )),
+    'piczel': ((), (
+        ('PiczelUserExtractor', 'piczel', 'user', '', '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/([^/?#]+)/?$', ((False, 'piczel.tv/'), (False, 'www.piczel.tv/'))),
+        ('PiczelFolderExtractor', 'piczel', 'folder', '', '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/(?!image/)[^/?#]+/(\\d+)', ((False, 'piczel.tv/'), (False, 'www.piczel.tv/'))),
+        ('PiczelImageExtractor', 'piczel', 'image', '', '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/image/(\\d+)', ((False, 'piczel.tv/'), (False, 'www.piczel.tv/'))),
+    )),
+    'pillowfort': ((), (
+        ('PillowfortPostExtractor', 'pillowfort', 'post', '', '(?:https?://)?www\\.pillowfort\\.social/posts/(\\d+)', ((False, 'www.pillowfort.social/'),)),
+        ('PillowfortUserExtractor', 'pillowfort', 'user', '', '(?:https?://)?www\\.pillowfort\\.social/(?!posts/)([^/?#]+(?:/tagged/[^/?#]+)?)', ((False, 'www.pillowfort.social/'),)),
+    )),
+    'pinterest': ((), (
+        ('PinterestUserExtractor', 'pinterest', 'user', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)(?:/_saved)?/?$', None),
+        ('PinterestAllpinsExtractor', 'pinterest', 'allpins', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/pins/?$', None),
+        ('PinterestCreatedExtractor', 'pinterest', 'created', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/_created/?$', None),
+        ('PinterestSectionExtractor', 'pinterest', 'section', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/([^/?#]+)', None),
+        ('PinterestSearchExtractor', 'pinterest', 'search', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/search/pins/?\\?q=([^&#]+)', None),
+        ('PinterestPinExtractor', 'pinterest', 'pin', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+)(?!.*#related$)', None),
+        ('PinterestBoardExtractor', 'pinterest', 'board', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/?(?!.*#related$)', None),
+        ('PinterestRelatedPinExtractor', 'pinterest', 'related-pin', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+).*#related$', None),
+        ('PinterestRelatedBoardExtractor', 'pinterest', 'related-board', '', '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/?#related$', None),
+        ('PinterestPinitExtractor', 'pinterest', 'pinit', '', '(?:https?://)?pin\\.it/([^/?#]+)', ((False, 'pin.it/'),)),
+    )),
+    'pixeldrain': ((), (
+        ('PixeldrainFileExtractor', 'pixeldrain', 'file', '', '(?:https?://)?pixeldrain\\.com/(?:u|api/file)/(\\w+)', ((False, 'pixeldrain.com/'),)),
+        ('PixeldrainAlbumExtractor', 'pixeldrain', 'album', '', '(?:https?://)?pixeldrain\\.com/(?:l|api/list)/(\\w+)(?:#item=(\\d+))?', ((False, 'pixeldrain.com/'),)),
+        ('PixeldrainFolderExtractor', 'pixeldrain', 'folder', '', '(?:https?://)?pixeldrain\\.com/(?:d|api/filesystem)/([^?]+)', ((False, 'pixeldrain.com/'),)),
+    )),
+    'pixiv': ((), (
+        ('PixivUserExtractor', 'pixiv', 'user', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?u(?:sers)?/|member\\.php\\?id=|(?:mypage\\.php)?#id=)(\\d+)(?:$|[?#])', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivArtworksExtractor', 'pixiv', 'artworks', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+)/(?:artworks|illustrations|manga)(?:/([^/?#]+))?/?(?:$|[?#])|member_illust\\.php\\?id=(\\d+)(?:&([^#]+))?)', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivAvatarExtractor', 'pixiv', 'avatar', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/avatar', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivBackgroundExtractor', 'pixiv', 'background', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/background', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivMeExtractor', 'pixiv', 'me', '', '(?:https?://)?pixiv\\.me/([^/?#]+)', ((False, 'pixiv.me/'),)),
+        ('PixivWorkExtractor', 'pixiv', 'work', '', '(?:https?://)?(?:(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?artworks/|member_illust\\.php\\?(?:[^&]+&)*illust_id=)(\\d+)|(?:i(?:\\d+\\.pixiv|\\.pximg)\\.net/(?:(?:.*/)?img-[^/]+/img/\\d{4}(?:/\\d\\d){5}|img\\d+/img/[^/]+)|img\\d*\\.pixiv\\.net/img/[^/]+|(?:www\\.)?pixiv\\.net/i)/(\\d+))', ((False, 'i.pximg.net/'), (False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'), (True, '.pixiv.net'))),
+        ('PixivUnlistedExtractor', 'pixiv', 'unlisted', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?artworks/unlisted/(\\w+)', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivFavoriteExtractor', 'pixiv', 'favorite', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+)/(bookmarks/artworks|following)(?:/([^/?#]+))?|bookmark\\.php)(?:\\?([^#]*))?', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivRankingExtractor', 'pixiv', 'ranking', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/ranking\\.php(?:\\?([^#]*))?', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivSearchExtractor', 'pixiv', 'search', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?tags/([^/?#]+)(?:/[^/?#]+)?/?|search\\.php)(?:\\?([^#]+))?', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivFollowExtractor', 'pixiv', 'follow', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/bookmark_new_illust\\.php', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivPixivisionExtractor', 'pixiv', 'pixivision', '', '(?:https?://)?(?:www\\.)?pixivision\\.net/(?:en/)?a/(\\d+)', ((False, 'pixivision.net/'), (False, 'www.pixivision.net/'))),
+        ('PixivSeriesExtractor', 'pixiv', 'series', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/user/(\\d+)/series/(\\d+)', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivSketchExtractor', 'pixiv', 'sketch', '', '(?:https?://)?sketch\\.pixiv\\.net/@([^/?#]+)', ((False, 'sketch.pixiv.net/'),)),
+        ('PixivNovelNovelExtractor', 'pixiv-novel', 'novel', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/n(?:ovel/show\\.php\\?id=|/)(\\d+)', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivNovelUserExtractor', 'pixiv-novel', 'user', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/novels', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivNovelSeriesExtractor', 'pixiv-novel', 'series', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/novel/series/(\\d+)', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+        ('PixivNovelBookmarkExtractor', 'pixiv-novel', 'bookmark', '', '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/bookmarks/novels(?:/([^/?#]+))?(?:/?\\?([^#]+))?', ((False, 'phixiv.net/'), (False, 'pixiv.net/'), (False, 'touch.phixiv.net/'), (False, 'touch.pixiv.net/'), (False, 'www.phixiv.net/'), (False, 'www.pixiv.net/'))),
+    )),
+    'pixnet': ((), (
+        ('PixnetImageExtractor', 'pixnet', 'image', '', '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/photo/(\\d+)', None),
+        ('PixnetSetExtractor', 'pixnet', 'set', '', '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/set/(\\d+)', None),
+        ('PixnetFolderExtractor', 'pixnet', 'folder', '', '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/folder/(\\d+)', None),
+        ('PixnetUserExtractor', 'pixnet', 'user', '', '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net()(?:/blog|/album(?:/list)?)?/?(?:$|[?#])', None),
+    )),
+    'plurk': ((), (
+        ('PlurkTimelineExtractor', 'plurk', 'timeline', '', '(?:https?://)?(?:www\\.)?plurk\\.com/(?!p/)(\\w+)/?(?:$|[?#])', ((False, 'plurk.com/'), (False, 'www.plurk.com/'))),
+        ('PlurkPostExtractor', 'plurk', 'post', '', '(?:https?://)?(?:www\\.)?plurk\\.com/p/(\\w+)', ((False, 'plurk.com/'), (False, 'www.plurk.com/'))),
+    )),
+    'poipiku': ((), (
+        ('PoipikuUserExtractor', 'poipiku', 'user', '', '(?:https?://)?poipiku\\.com/(?:IllustListPcV\\.jsp\\?PG=(\\d+)&ID=)?(\\d+)/?(?:$|[?&#])', ((False, 'poipiku.com/'),)),
+        ('PoipikuPostExtractor', 'poipiku', 'post', '', '(?:https?://)?poipiku\\.com/(\\d+)/(\\d+)', ((False, 'poipiku.com/'),)),
+    )),
+    'poringa': ((), (
+        ('PoringaPostExtractor', 'poringa', 'post', '', '(?:https?://)?(?:www\\.)?poringa\\.net/posts/imagenes/(\\d+)', ((False, 'poringa.net/'), (False, 'www.poringa.net/'))),
+        ('PoringaUserExtractor', 'poringa', 'user', '', '(?:https?://)?(?:www\\.)?poringa\\.net/(\\w+)$', ((False, 'poringa.net/'), (False, 'www.poringa.net/'))),
+        ('PoringaSearchExtractor', 'poringa', 'search', '', '(?:https?://)?(?:www\\.)?poringa\\.net/buscar/\\?&?q=([^&#]+)', ((False, 'poringa.net/'), (False, 'www.poringa.net/'))),
+    )),
+    'pornhub': ((), (
+        ('PornhubGalleryExtractor', 'pornhub', 'gallery', '', '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/album/(\\d+)', ((False, 'pornhub.com/'), (True, '.pornhub.com'))),
+        ('PornhubGifExtractor', 'pornhub', 'gif', '', '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/gif/(\\d+)', ((False, 'pornhub.com/'), (True, '.pornhub.com'))),
+        ('PornhubUserExtractor', 'pornhub', 'user', '', '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/?$', ((False, 'pornhub.com/'), (True, '.pornhub.com'))),
+        ('PornhubPhotosExtractor', 'pornhub', 'photos', '', '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/(photos(?:/[^/?#]+)?)', ((False, 'pornhub.com/'), (True, '.pornhub.com'))),
+        ('PornhubGifsExtractor', 'pornhub', 'gifs', '', '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/(gifs(?:/[^/?#]+)?)', ((False, 'pornhub.com/'), (True, '.pornhub.com'))),
+    )),
+    'pornpics': ((), (
+        ('PornpicsGalleryExtractor', 'pornpics', 'gallery', '', '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/galleries/((?:[^/?#]+-)?(\\d+))', ((False, 'pornpics.com/'), (False, 'www.pornpics.com/'))),
+        ('PornpicsTagExtractor', 'pornpics', 'tag', '', '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/tags/([^/?#]+)', ((False, 'pornpics.com/'), (False, 'www.pornpics.com/'))),
+        ('PornpicsSearchExtractor', 'pornpics', 'search', '', '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(?:\\?q=|pornstars/|channels/)([^/&#]+)', ((False, 'pornpics.com/'), (False, 'www.pornpics.com/'))),
+    )),
+    'postmill': (('postmill',), (
+        ('PostmillPostExtractor', '', 'post', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))/f/(\\w+)/(\\d+)', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+        ('PostmillShortURLExtractor', '', 'shorturl', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/\\d+)$', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+        ('PostmillHomeExtractor', '', 'home', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/(?:featured|subscribed|all)?)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+        ('PostmillForumExtractor', '', 'forum', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/f/\\w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+        ('PostmillUserSubmissionsExtractor', '', 'usersubmissions', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/user/\\w+/submissions)()(?:\\?([^#]+))?$', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+        ('PostmillTagExtractor', '', 'tag', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/tag/\\w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+        ('PostmillSearchExtractor', '', 'search', 'postmill', '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/search)()\\?(q=[^#]+)$', ((False, 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion/'), (False, 'postmill:http:/'), (False, 'postmill:https:/'), (False, 'raddle.me/'))),
+    )),
+    'rawkuma': ((), (
+        ('RawkumaChapterExtractor', 'rawkuma', 'chapter', '', '(?:https?://)?rawkuma\\.(?:net|com)/([^/?#]+-chapter-\\d+(?:-\\d+)?)', ((False, 'rawkuma.com/'), (False, 'rawkuma.net/'))),
+        ('RawkumaMangaExtractor', 'rawkuma', 'manga', '', '(?:https?://)?rawkuma\\.(?:net|com)/manga/([^/?#]+)', ((False, 'rawkuma.com/'), (False, 'rawkuma.net/'))),
+    )),
+    'reactor': (('reactor',), (
+        ('ReactorTagExtractor', '', 'tag', 'reactor', '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/tag/([^/?#]+)(?:/[^/?#]+)?', None),
+        ('ReactorSearchExtractor', '', 'search', 'reactor', '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/search(?:/|\\?q=)([^/?#]+)', None),
+        ('ReactorUserExtractor', '', 'user', 'reactor', '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/user/([^/?#]+)', None),
+        ('ReactorPostExtractor', '', 'post', 'reactor', '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/post/(\\d+)', None),
+    )),
+    'readcomiconline': ((), (
+        ('ReadcomiconlineIssueExtractor', 'readcomiconline', 'issue', '', '(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]+/[^/?#]+\\?)([^#]+)', ((False, 'readcomiconline.li/'), (False, 'readcomiconline.to/'), (False, 'www.readcomiconline.li/'), (False, 'www.readcomiconline.to/'))),
+        ('ReadcomiconlineComicExtractor', 'readcomiconline', 'comic', '', '(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]+/?)$', ((False, 'readcomiconline.li/'), (False, 'readcomiconline.to/'), (False, 'www.readcomiconline.li/'), (False, 'www.readcomiconline.to/'))),
+    )),
+    'realbooru': (('booru',), (
+        ('RealbooruTagExtractor', 'realbooru', 'tag', 'booru', '(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=list&tags=([^&#]*)', ((False, 'realbooru.com/'),)),
+        ('RealbooruFavoriteExtractor', 'realbooru', 'favorite', 'booru', '(?:https?://)?realbooru\\.com/index\\.php\\?page=favorites&s=view&id=(\\d+)', ((False, 'realbooru.com/'),)),
+        ('RealbooruPoolExtractor', 'realbooru', 'pool', 'booru', '(?:https?://)?realbooru\\.com/index\\.php\\?page=pool&s=show&id=(\\d+)', ((False, 'realbooru.com/'),)),
+        ('RealbooruPostExtractor', 'realbooru', 'post', 'booru', '(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=view&id=(\\d+)', ((False, 'realbooru.com/'),)),
+    )),
+    'redbust': ((), (
+        ('RedbustGalleryExtractor', 'redbust', 'gallery', '', '(?:https?://)?redbust\\.com/([\\w-]+)/?$', ((False, 'redbust.com/'),)),
+        ('RedbustTagExtractor', 'redbust', 'tag', '', '(?:https?://)?redbust\\.com/tag/([\\w-]+)', ((False, 'redbust.com/'),)),
+        ('RedbustArchiveExtractor', 'redbust', 'archive', '', '(?:https?://)?redbust\\.com(/\\d{4}/\\d{2})', ((False, 'redbust.com/'),)),
+        ('RedbustImageExtractor', 'redbust', 'image', '', '(?:https?://)?redbust\\.com/(?!tag/|\\d{4}/)([\\w-]+)/([\\w-]+)/?$', ((False, 'redbust.com/'),)),
+    )),
+    'reddit': ((), (
+        ('RedditSubredditExtractor', 'reddit', 'subreddit', '', '(?:https?://)?(?:\\w+\\.)?reddit\\.com(/r/[^/?#]+(?:/([a-z]+))?)/?(?:\\?([^#]*))?(?:$|#)', ((False, 'reddit.com/'), (True, '.reddit.com'))),
+        ('RedditHomeExtractor', 'reddit', 'home', '', '(?:https?://)?(?:\\w+\\.)?reddit\\.com((?:/([a-z]+))?)/?(?:\\?([^#]*))?(?:$|#)', ((False, 'reddit.com'), (False, 'reddit.com#'), (False, 'reddit.com/'), (False, 'reddit.com?'), (True, '.reddit.com'))),
+        ('RedditUserExtractor', 'reddit', 'user', '', '(?:https?://)?(?:\\w+\\.)?reddit\\.com/u(?:ser)?/([^/?#]+(?:/([a-z]+))?)/?(?:\\?([^#]*))?$', ((False, 'reddit.com/'), (True, '.reddit.com'))),
+        ('RedditSubmissionExtractor', 'reddit', 'submission', '', '(?:https?://)?(?:(?:\\w+\\.)?reddit\\.com/(?:(?:r|u|user)/[^/?#]+/comments|gallery)|redd\\.it)/([a-z0-9]+)', ((False, 'redd.it/'), (False, 'reddit.com/'), (True, '.reddit.com'))),
+        ('RedditImageExtractor', 'reddit', 'image', '', '(?:https?://)?((?:i|preview)\\.redd\\.it|i\\.reddituploads\\.com)/([^/?#]+)(\\?[^#]*)?', ((False, 'i.redd.it/'), (False, 'i.reddituploads.com/'), (False, 'preview.redd.it/'))),
+        ('RedditRedirectExtractor', 'reddit', 'redirect', '', '(?:https?://)?(?:(?:\\w+\\.)?reddit\\.com/(?:(r|u|user)/([^/?#]+)))/s/([a-zA-Z0-9]{10})', ((False, 'reddit.com/'), (True, '.reddit.com'))),
+    )),
+    'redgifs': ((), (
+        ('RedgifsUserExtractor', 'redgifs', 'user', '', '(?:https?://)?(?:\\w+\\.)?redgifs\\.com/users/([^/?#]+)/?(?:\\?([^#]+))?$', ((False, 'redgifs.com/'), (True, '.redgifs.com'))),
+        ('RedgifsCollectionExtractor', 'redgifs', 'collection', '', '(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/([^/?#]+)', ((False, 'redgifs.com/'), (False, 'www.redgifs.com/'))),
+        ('RedgifsCollectionsExtractor', 'redgifs', 'collections', '', '(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/?$', ((False, 'redgifs.com/'), (False, 'www.redgifs.com/'))),
+        ('RedgifsNichesExtractor', 'redgifs', 'niches', '', '(?:https?://)?(?:www\\.)?redgifs\\.com/niches/([^/?#]+)/?(?:\\?([^#]+))?$', ((False, 'redgifs.com/'), (False, 'www.redgifs.com/'))),
+        ('RedgifsSearchExtractor', 'redgifs', 'search', '', '(?:https?://)?(?:\\w+\\.)?redgifs\\.com/(?:gifs/([^/?#]+)|search(?:/gifs)?()|browse)(?:/?\\?([^#]+))?', ((False, 'redgifs.com/'), (True, '.redgifs.com'))),
+        ('RedgifsImageExtractor', 'redgifs', 'image', '', '(?:https?://)?(?:(?:\\w+\\.)?redgifs\\.com/(?:watch|ifr)|(?:\\w+\\.)?gfycat\\.com(?:/gifs/detail|/\\w+)?|(?:www\\.)?gifdeliverynetwork\\.com|i\\.redgifs\\.com/i)/([A-Za-z0-9]+)', ((False, 'gfycat.com/'), (False, 'gifdeliverynetwork.com/'), (False, 'i.redgifs.com/'), (False, 'redgifs.com/'), (False, 'www.gifdeliverynetwork.com/'), (True, '.gfycat.com'), (True, '.redgifs.com'))),
+    )),
+    'rule34us': (('booru',), (
+        ('Rule34usTagExtractor', 'rule34us', 'tag', 'booru', '(?:https?://)?rule34\\.us/index\\.php\\?r=posts/index&q=([^&#]+)', ((False, 'rule34.us/'),)),
+        ('Rule34usPostExtractor', 'rule34us', 'post', 'booru', '(?:https?://)?rule34\\.us/index\\.php\\?r=posts/view&id=(\\d+)', ((False, 'rule34.us/'),)),
+    )),
+    'rule34vault': (('booru',), (
+        ('Rule34vaultPostExtractor', 'rule34vault', 'post', 'booru', '(?:https?://)?rule34vault\\.com/post/(\\d+)', ((False, 'rule34vault.com/'),)),
+        ('Rule34vaultPlaylistExtractor', 'rule34vault', 'playlist', 'booru', '(?:https?://)?rule34vault\\.com/playlists/view/(\\d+)', ((False, 'rule34vault.com/'),)),
+        ('Rule34vaultTagExtractor', 'rule34vault', 'tag', 'booru', '(?:https?://)?rule34vault\\.com/(?!p(?:ost|laylists)/)([^/?#]+)', ((False, 'rule34vault.com/'),)),
+    )),
+    'rule34xyz': (('booru',), (
+        ('Rule34xyzPostExtractor', 'rule34xyz', 'post', 'booru', '(?:https?://)?rule34\\.xyz/post/(\\d+)', ((False, 'rule34.xyz/'),)),
+        ('Rule34xyzPlaylistExtractor', 'rule34xyz', 'playlist', 'booru', '(?:https?://)?rule34\\.xyz/playlists/view/(\\d+)', ((False, 'rule34.xyz/'),)),
+        ('Rule34xyzTagExtractor', 'rule34xyz', 'tag', 'booru', '(?:https?://)?rule34\\.xyz/([^/?#]+)$', ((False, 'rule34.xyz/'),)),
+    )),
+    'saint': (('lolisafe',), (
+        ('SaintAlbumExtractor', 'saint', 'album', 'lolisafe', '(?:https?://)?saint\\d*\\.(?:su|pk|cr|to)/a/([^/?#]+)', ((True, '.cr'), (True, '.pk'), (True, '.su'), (True, '.to'))),
+        ('SaintMediaExtractor', 'saint', 'media', 'lolisafe', '(?:https?://)?saint\\d*\\.(?:su|pk|cr|to)(/(embe)?d/([^/?#]+))', ((True, '.cr'), (True, '.pk'), (True, '.su'), (True, '.to'))),
+    )),
+    'sankaku': (('booru',), (
+        ('SankakuTagExtractor', 'sankaku', 'tag', 'booru', '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2})?(?:/posts)?/?\\?([^#]*)', ((False, 'beta.sankakucomplex.com/'), (False, 'beta.sankakucomplex.com?'), (False, 'black.sankakucomplex.com/'), (False, 'black.sankakucomplex.com?'), (False, 'chan.sankakucomplex.com/'), (False, 'chan.sankakucomplex.com?'), (False, 'sankaku.app/'), (False, 'sankaku.app?'), (False, 'white.sankakucomplex.com/'), (False, 'white.sankakucomplex.com?'), (False, 'www.sankakucomplex.com/'), (False, 'www.sankakucomplex.com?'))),
+        ('SankakuPoolExtractor', 'sankaku', 'pool', 'booru', '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2})?/(?:books|pools?/show)/(\\w+)', ((False, 'beta.sankakucomplex.com/'), (False, 'black.sankakucomplex.com/'), (False, 'chan.sankakucomplex.com/'), (False, 'sankaku.app/'), (False, 'white.sankakucomplex.com/'), (False, 'www.sankakucomplex.com/'))),
+        ('SankakuPostExtractor', 'sankaku', 'post', 'booru', '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2})?/posts?(?:/show)?/(\\w+)', ((False, 'beta.sankakucomplex.com/'), (False, 'black.sankakucomplex.com/'), (False, 'chan.sankakucomplex.com/'), (False, 'sankaku.app/'), (False, 'white.sankakucomplex.com/'), (False, 'www.sankakucomplex.com/'))),
+        ('SankakuBooksExtractor', 'sankaku', 'books', 'booru', '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2})?/books/?\\?([^#]*)', ((False, 'beta.sankakucomplex.com/'), (False, 'black.sankakucomplex.com/'), (False, 'chan.sankakucomplex.com/'), (False, 'sankaku.app/'), (False, 'white.sankakucomplex.com/'), (False, 'www.sankakucomplex.com/'))),
+    )),
+    'sankakucomplex': ((), (
+        ('SankakucomplexArticleExtractor', 'sankakucomplex', 'article', '', '(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/(\\d\\d\\d\\d/\\d\\d/\\d\\d/[^/?#]+)', ((False, 'news.sankakucomplex.com/'), (False, 'www.sankakucomplex.com/'))),
+        ('SankakucomplexTagExtractor', 'sankakucomplex', 'tag', '', '(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/((?:tag|category|author)/[^/?#]+)', ((False, 'news.sankakucomplex.com/'), (False, 'www.sankakucomplex.com/'))),
+    )),
+    'schalenetwork': ((), (
+        ('SchalenetworkGalleryExtractor', 'schalenetwork', 'gallery', '', '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/(?:g|reader)/(\\d+)/(\\w+)', ((False, 'anchira.to/'), (False, 'hoshino.one/'), (False, 'koharu.to/'), (False, 'niyaniya.moe/'), (False, 'seia.to/'), (False, 'shupogaki.moe/'))),
+        ('SchalenetworkSearchExtractor', 'schalenetwork', 'search', '', '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/(?:tag/([^/?#]+)|browse)?(?:/?\\?([^#]*))?$', ((False, 'anchira.to/'), (False, 'hoshino.one/'), (False, 'koharu.to/'), (False, 'niyaniya.moe/'), (False, 'seia.to/'), (False, 'shupogaki.moe/'))),
+        ('SchalenetworkFavoriteExtractor', 'schalenetwork', 'favorite', '', '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/favorites(?:\\?([^#]*))?', ((False, 'anchira.to/'), (False, 'hoshino.one/'), (False, 'koharu.to/'), (False, 'niyaniya.moe/'), (False, 'seia.to/'), (False, 'shupogaki.moe/'))),
+    )),
+    'scrolller': ((), (
+        ('ScrolllerSubredditExtractor', 'scrolller', 'subreddit', '', '(?:https?://)?(?:www\\.)?scrolller\\.com(/r/[^/?#]+)(?:/?\\?([^#]+))?', ((False, 'scrolller.com/'), (False, 'www.scrolller.com/'))),
+        ('ScrolllerFollowingExtractor', 'scrolller', 'following', '', '(?:https?://)?(?:www\\.)?scrolller\\.com/following', ((False, 'scrolller.com/'), (False, 'www.scrolller.com/'))),
+        ('ScrolllerPostExtractor', 'scrolller', 'post', '', '(?:https?://)?(?:www\\.)?scrolller\\.com/(?!r/|following$)([^/?#]+)', ((False, 'scrolller.com/'), (False, 'www.scrolller.com/'))),
+    )),
+    'seiga': ((), (
+        ('SeigaUserExtractor', 'seiga', 'user', '', '(?:https?://)?(?:www\\.|(?:sp\\.)?seiga\\.)?nicovideo\\.jp/user/illust/(\\d+)(?:\\?(?:[^&]+&)*sort=([^&#]+))?', ((False, 'nicovideo.jp/'), (False, 'seiga.nicovideo.jp/'), (False, 'sp.seiga.nicovideo.jp/'), (False, 'www.nicovideo.jp/'))),
+        ('SeigaImageExtractor', 'seiga', 'image', '', '(?:https?://)?(?:(?:seiga\\.|www\\.)?nicovideo\\.jp/(?:seiga/im|image/source/)|sp\\.seiga\\.nicovideo\\.jp/seiga/#!/im|lohas\\.nicoseiga\\.jp/(?:thumb|(?:priv|o)/[^/]+/\\d+)/)(\\d+)', ((False, 'lohas.nicoseiga.jp/'), (False, 'nicovideo.jp/'), (False, 'seiga.nicovideo.jp/'), (False, 'sp.seiga.nicovideo.jp/'), (False, 'www.nicovideo.jp/'))),
+    )),
+    'senmanga': ((), (
+        ('SenmangaChapterExtractor', 'senmanga', 'chapter', '', '(?:https?://)?raw\\.senmanga\\.com(/[^/?#]+/[^/?#]+)', ((False, 'raw.senmanga.com/'),)),
+    )),
+    'sexcom': ((), (
+        ('SexcomPinExtractor', 'sexcom', 'pin', '', '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/(?:\\w\\w/(?:pic|gif|video)s|pin)/\\d+/?)(?!.*#related$)', ((False, 'sex.com/'), (False, 'www.sex.com/'))),
+        ('SexcomRelatedPinExtractor', 'sexcom', 'related-pin', '', '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/pin/(\\d+)/?).*#related$', ((False, 'sex.com/'), (False, 'www.sex.com/'))),
+        ('SexcomPinsExtractor', 'sexcom', 'pins', '', '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/pins/', ((False, 'sex.com/'), (False, 'www.sex.com/'))),
+        ('SexcomLikesExtractor', 'sexcom', 'likes', '', '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/likes/', ((False, 'sex.com/'), (False, 'www.sex.com/'))),
+        ('SexcomBoardExtractor', 'sexcom', 'board', '', '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/(?!(?:following|pins|repins|likes)/)([^/?#]+)', ((False, 'sex.com/'), (False, 'www.sex.com/'))),
+        ('SexcomSearchExtractor', 'sexcom', 'search', '', '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/(?:(pic|gif|video)s(?:\\?(search=[^#]+)$|/([^/?#]*))|search/(pic|gif|video)s)/?(?:\\?([^#]+))?', ((False, 'sex.com/'), (False, 'www.sex.com/'))),
+    )),
+    'shimmie2': (('shimmie2',), (
+        ('Shimmie2TagExtractor', '', 'tag', 'shimmie2', '(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xyz()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llection\\.pics()))/(?:index\\.php\\?q=/?)?post/list/([^/?#]+)(?:/(\\d+))?', ((False, 'booru.cavemanon.xyz/'), (False, 'co.llection.pics/'), (False, 'noz.rip/'), (False, 'rule34hentai.net/'), (False, 'shimmie2:http:/'), (False, 'shimmie2:https:/'), (False, 'vidya.pics/'))),
+        ('Shimmie2PostExtractor', '', 'post', 'shimmie2', '(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xyz()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llection\\.pics()))/(?:index\\.php\\?q=/?)?post/view/(\\d+)', ((False, 'booru.cavemanon.xyz/'), (False, 'co.llection.pics/'), (False, 'noz.rip/'), (False, 'rule34hentai.net/'), (False, 'shimmie2:http:/'), (False, 'shimmie2:https:/'), (False, 'vidya.pics/'))),
+    )),
+    'simpcity': ((), (
+        ('SimpcityPostExtractor', 'simpcity', 'post', '', '(?:https?://)?(?:www\\.)?simpcity\\.(?:cr|su)/(?:threads/[^/?#]+/post-|posts/)(\\d+)', ((False, 'simpcity.cr/'), (False, 'simpcity.su/'), (False, 'www.simpcity.cr/'), (False, 'www.simpcity.su/'))),
+        ('SimpcityThreadExtractor', 'simpcity', 'thread', '', '(?:https?://)?(?:www\\.)?simpcity\\.(?:cr|su)(/threads/(?:[^/?#]+\\.)?\\d+)(?:/page-(\\d+))?', ((False, 'simpcity.cr/'), (False, 'simpcity.su/'), (False, 'www.simpcity.cr/'), (False, 'www.simpcity.su/'))),
+        ('SimpcityForumExtractor', 'simpcity', 'forum', '', '(?:https?://)?(?:www\\.)?simpcity\\.(?:cr|su)(/forums/(?:[^/?#]+\\.)?\\d+)(?:/page-(\\d+))?', ((False, 'simpcity.cr/'), (False, 'simpcity.su/'), (False, 'www.simpcity.cr/'), (False, 'www.simpcity.su/'))),
+    )),
+    'simplyhentai': ((), (
+        ('SimplyhentaiGalleryExtractor', 'simplyhentai', 'gallery', '', '(?:https?://)?(?!videos\\.)([\\w-]+\\.)?simply-hentai\\.com(?!/(?:album|gifs?|images?|series)(?:/|$))((?:/(?!(?:page|all-pages)(?:/|\\.|$))[^/?#]+)+)', None),
+        ('SimplyhentaiImageExtractor', 'simplyhentai', 'image', '', '(?:https?://)?(?:www\\.)?(simply-hentai\\.com/(image|gif)/[^/?#]+)', ((False, 'simply-hentai.com/'), (False, 'www.simply-hentai.com/'))),
+        ('SimplyhentaiVideoExtractor', 'simplyhentai', 'video', '', '(?:https?://)?(videos\\.simply-hentai\\.com/[^/?#]+)', ((False, 'videos.simply-hentai.com/'),)),
+    )),
+    'sizebooru': (('booru',), (
+        ('SizebooruPostExtractor', 'sizebooru', 'post', 'booru', '(?:https?://)?(?:www\\.)?sizebooru\\.com/Details/(\\d+)', ((False, 'sizebooru.com/'), (False, 'www.sizebooru.com/'))),
+        ('SizebooruTagExtractor', 'sizebooru', 'tag', 'booru', '(?:https?://)?(?:www\\.)?sizebooru\\.com/Search/([^/?#]+)', ((False, 'sizebooru.com/'), (False, 'www.sizebooru.com/'))),
+        ('SizebooruGalleryExtractor', 'sizebooru', 'gallery', 'booru', '(?:https?://)?(?:www\\.)?sizebooru\\.com/Galleries/List/(\\d+)', ((False, 'sizebooru.com/'), (False, 'www.sizebooru.com/'))),
+        ('SizebooruUserExtractor', 'sizebooru', 'user', 'booru', '(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Uploads/([^/?#]+)', ((False, 'sizebooru.com/'), (False, 'www.sizebooru.com/'))),
+        ('SizebooruFavoriteExtractor', 'sizebooru', 'favorite', 'booru', '(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Favorites/([^/?#]+)', ((False, 'sizebooru.com/'), (False, 'www.sizebooru.com/'))),
+    )),
+    'skeb': ((), (
+        ('SkebPostExtractor', 'skeb', 'post', '', '(?:https?://)?skeb\\.jp/@([^/?#]+)/works/(\\d+)', ((False, 'skeb.jp/'),)),
+        ('SkebWorksExtractor', 'skeb', 'works', '', '(?:https?://)?skeb\\.jp/@([^/?#]+)/works', ((False, 'skeb.jp/'),)),
+        ('SkebSentrequestsExtractor', 'skeb', 'sentrequests', '', '(?:https?://)?skeb\\.jp/@([^/?#]+)/sent[ _-]?requests', ((False, 'skeb.jp/'),)),
+        ('SkebUserExtractor', 'skeb', 'user', '', '(?:https?://)?skeb\\.jp/@([^/?#]+)/?$', ((False, 'skeb.jp/'),)),
+        ('SkebSearchExtractor', 'skeb', 'search', '', '(?:https?://)?skeb\\.jp/search\\?q=([^&#]+)', ((False, 'skeb.jp/'),)),
+        ('SkebFollowingExtractor', 'skeb', 'following', '', '(?:https?://)?skeb\\.jp/@([^/?#]+)/following_creators', ((False, 'skeb.jp/'),)),
+        ('SkebFollowingUsersExtractor', 'skeb', 'following-users', '', '(?:https?://)?skeb\\.jp/following_users', ((False, 'skeb.jp/'),)),
+    )),
+    'slickpic': ((), (
+        ('SlickpicAlbumExtractor', 'slickpic', 'album', '', '(?:https?://)?([\\w-]+)\\.slickpic\\.com/albums/([^/?#]+)', ((True, '.slickpic.com'),)),
+        ('SlickpicUserExtractor', 'slickpic', 'user', '', '(?:https?://)?([\\w-]+)\\.slickpic\\.com(?:/gallery)?/?(?:$|[?#])', ((True, '.slickpic.com'),)),
+    )),
+    'slideshare': ((), (
+        ('SlidesharePresentationExtractor', 'slideshare', 'presentation', '', '(?:https?://)?(?:www\\.)?slideshare\\.net/(?:mobile/)?([^/?#]+)/([^/?#]+)', ((False, 'slideshare.net/'), (False, 'www.slideshare.net/'))),
+    )),
+    'smugmug': ((), (
+        ('SmugmugAlbumExtractor', 'smugmug', 'album', '', 'smugmug:album:([^:]+)$', ((False, 'smugmug:album:'),)),
+        ('SmugmugImageExtractor', 'smugmug', 'image', '', '(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.smugmug\\.com)(?:/[^/?#]+)+/i-([^/?#-]+)', None),
+        ('SmugmugPathExtractor', 'smugmug', 'path', '', '(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.smugmug\\.com)((?:/[^/?#a-fh-mo-z][^/?#]*)*)/?$', None),
+    )),
+    'soundgasm': ((), (
+        ('SoundgasmAudioExtractor', 'soundgasm', 'audio', '', '(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/([^/?#]+)', ((False, 'soundgasm.net/'), (False, 'www.soundgasm.net/'))),
+        ('SoundgasmUserExtractor', 'soundgasm', 'user', '', '(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/?$', ((False, 'soundgasm.net/'), (False, 'www.soundgasm.net/'))),
+    )),
+    'speakerdeck': ((), (
+        ('SpeakerdeckPresentationExtractor', 'speakerdeck', 'presentation', '', '(?:https?://)?(?:www\\.)?speakerdeck\\.com/([^/?#]+)/([^/?#]+)', ((False, 'speakerdeck.com/'), (False, 'www.speakerdeck.com/'))),
+    )),
+    'steamgriddb': ((), (
+        ('SteamgriddbAssetExtractor', 'steamgriddb', 'asset', '', '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(grid|hero|logo|icon)/(\\d+)', ((False, 'steamgriddb.com/'), (False, 'www.steamgriddb.com/'))),
+        ('SteamgriddbGridsExtractor', 'steamgriddb', 'grids', '', '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/grids(?:/(\\d+))?', ((False, 'steamgriddb.com/'), (False, 'www.steamgriddb.com/'))),
+        ('SteamgriddbHeroesExtractor', 'steamgriddb', 'heroes', '', '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/heroes(?:/(\\d+))?', ((False, 'steamgriddb.com/'), (False, 'www.steamgriddb.com/'))),
+        ('SteamgriddbLogosExtractor', 'steamgriddb', 'logos', '', '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/logos(?:/(\\d+))?', ((False, 'steamgriddb.com/'), (False, 'www.steamgriddb.com/'))),
+        ('SteamgriddbIconsExtractor', 'steamgriddb', 'icons', '', '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/icons(?:/(\\d+))?', ((False, 'steamgriddb.com/'), (False, 'www.steamgriddb.com/'))),
+    )),
+    'subscribestar': ((), (
+        ('SubscribestarUserExtractor', 'subscribestar', 'user', '', '(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/(?!posts/)([^/?#]+)', ((False, 'subscribestar.adult/'), (False, 'subscribestar.com/'), (False, 'www.subscribestar.adult/'), (False, 'www.subscribestar.com/'))),
+        ('SubscribestarPostExtractor', 'subscribestar', 'post', '', '(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/posts/(\\d+)', ((False, 'subscribestar.adult/'), (False, 'subscribestar.com/'), (False, 'www.subscribestar.adult/'), (False, 'www.subscribestar.com/'))),
+    )),
+    'szurubooru': (('szurubooru',), (
+        ('SzurubooruTagExtractor', '', 'tag', 'szurubooru', '(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.space()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/posts(?:/query=([^/?#]*))?', ((False, 'booru.bcbnsfw.space/'), (False, 'snootbooru.com/'), (False, 'szurubooru:http:/'), (False, 'szurubooru:https:/'), (False, 'visuabusters.com/'), (False, 'www.visuabusters.com/'))),
+        ('SzurubooruPostExtractor', '', 'post', 'szurubooru', '(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.space()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/post/(\\d+)', ((False, 'booru.bcbnsfw.space/'), (False, 'snootbooru.com/'), (False, 'szurubooru:http:/'), (False, 'szurubooru:https:/'), (False, 'visuabusters.com/'), (False, 'www.visuabusters.com/'))),
+    )),
+    'tapas': ((), (
+        ('TapasEpisodeExtractor', 'tapas', 'episode', '', '(?:https?://)?tapas\\.io/episode/(\\d+)', ((False, 'tapas.io/'),)),
+        ('TapasSeriesExtractor', 'tapas', 'series', '', '(?:https?://)?tapas\\.io/series/([^/?#]+)', ((False, 'tapas.io/'),)),
+        ('TapasCreatorExtractor', 'tapas', 'creator', '', '(?:https?://)?tapas\\.io/(?!series|episode)([^/?#]+)', ((False, 'tapas.io/'),)),
+    )),
+    'tcbscans': ((), (
+        ('TcbscansChapterExtractor', 'tcbscans', 'chapter', '', '(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)\\.(?:com|me)(/chapters/\\d+/[^/?#]+)', ((False, 'onepiecechapters.com/'), (False, 'onepiecechapters.me/'), (False, 'tcb-backup.bihar-mirchi.com/'), (False, 'tcb-backup.bihar-mirchi.me/'), (False, 'tcbscans.com/'), (False, 'tcbscans.me/'))),
+        ('TcbscansMangaExtractor', 'tcbscans', 'manga', '', '(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)\\.(?:com|me)(/mangas/\\d+/[^/?#]+)', ((False, 'onepiecechapters.com/'), (False, 'onepiecechapters.me/'), (False, 'tcb-backup.bihar-mirchi.com/'), (False, 'tcb-backup.bihar-mirchi.me/'), (False, 'tcbscans.com/'), (False, 'tcbscans.me/'))),
+    )),
+    'telegraph': ((), (
+        ('TelegraphGalleryExtractor', 'telegraph', 'gallery', '', '(?:https?://)(?:www\\.)??telegra\\.ph(/[^/?#]+)', ((False, 'telegra.ph/'), (False, 'www.telegra.ph/'))),
+    )),
+    'tenor': ((), (
+        ('TenorImageExtractor', 'tenor', 'image', '', '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?view/(?:[^/?#]*-)?(\\d+)', ((False, 'tenor.com/'),)),
+        ('TenorSearchExtractor', 'tenor', 'search', '', '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?search/([^/?#]+)', ((False, 'tenor.com/'),)),
+        ('TenorUserExtractor', 'tenor', 'user', '', '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?(?:users|official)/([^/?#]+)', ((False, 'tenor.com/'),)),
+    )),
+    'tiktok': ((), (
+        ('TiktokPostExtractor', 'tiktok', 'post', '', '(?:https?://)?(?:www\\.)?tiktokv?\\.com/(?:@([\\w_.-]*)|share)/(?:phot|vide)o/(\\d+)', ((False, 'tiktok.com/'), (False, 'tiktokv.com/'), (False, 'www.tiktok.com/'), (False, 'www.tiktokv.com/'))),
+        ('TiktokVmpostExtractor', 'tiktok', 'vmpost', '', '(?:https?://)?(?:(?:v[mt]\\.)?tiktok\\.com|(?:www\\.)?tiktok\\.com/t)/(?!@)([^/?#]+)', ((False, 'tiktok.com/'), (False, 'vm.tiktok.com/'), (False, 'vt.tiktok.com/'), (False, 'www.tiktok.com/'))),
+        ('TiktokUserExtractor', 'tiktok', 'user', '', '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/?(?:$|\\?|#)', ((False, 'tiktok.com/'), (False, 'tiktokv.com/'), (False, 'www.tiktok.com/'), (False, 'www.tiktokv.com/'))),
+    )),
+    'tmohentai': ((), (
+        ('TmohentaiGalleryExtractor', 'tmohentai', 'gallery', '', '(?:https?://)?tmohentai\\.com/(?:contents|reader)/(\\w+)', ((False, 'tmohentai.com/'),)),
+    )),
+    'toyhouse': ((), (
+        ('ToyhouseArtExtractor', 'toyhouse', 'art', '', '(?:https?://)?(?:www\\.)?toyhou\\.se/([^/?#]+)/art', ((False, 'toyhou.se/'), (False, 'www.toyhou.se/'))),
+        ('ToyhouseImageExtractor', 'toyhouse', 'image', '', '(?:https?://)?(?:(?:www\\.)?toyhou\\.se/~images|f\\d+\\.toyhou\\.se/file/[^/?#]+/(?:image|watermark)s)/(\\d+)', ((False, 'toyhou.se/'), (False, 'www.toyhou.se/'), (True, '.toyhou.se'))),
+    )),
+    'tsumino': ((), (
+        ('TsuminoGalleryExtractor', 'tsumino', 'gallery', '', '(?i)(?:https?://)?(?:www\\.)?tsumino\\.com/(?:entry|Book/Info|Read/(?:Index|View))/(\\d+)', ((False, 'tsumino.com/'), (False, 'www.tsumino.com/'))),
+        ('TsuminoSearchExtractor', 'tsumino', 'search', '', '(?i)(?:https?://)?(?:www\\.)?tsumino\\.com/(?:Books/?)?#(.+)', ((False, 'tsumino.com/'), (False, 'www.tsumino.com/'))),
+    )),
+    'tumblr': ((), (
+        ('TumblrUserExtractor', 'tumblr', 'user', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/page/\\d+|/archive)?/?$', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrPostExtractor', 'tumblr', 'post', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/(?:post/|image/)?(\\d+)', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrTagExtractor', 'tumblr', 'tag', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/archive)?/tagged/([^/?#]+)', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrDayExtractor', 'tumblr', 'day', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/day/(\\d\\d\\d\\d/\\d\\d/\\d\\d)', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrLikesExtractor', 'tumblr', 'likes', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/likes', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrFollowingExtractor', 'tumblr', 'following', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/following', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrFollowersExtractor', 'tumblr', 'followers', '', '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/followers', ((False, 'tumblr.com/'), (False, 'tumblr:'), (False, 'tumblr:http:/'), (False, 'tumblr:https:/'), (False, 'www.tumblr.com/'), (True, '.tumblr.com'))),
+        ('TumblrSearchExtractor', 'tumblr', 'search', '', '(?:https?://)?(?:www\\.)?tumblr\\.com/search/([^/?#]+)(?:/([^/?#]+)(?:/([^/?#]+))?)?(?:/?\\?([^#]+))?', ((False, 'tumblr.com/'), (False, 'www.tumblr.com/'))),
+    )),
+    'tumblrgallery': ((), (
+        ('TumblrgalleryTumblrblogExtractor', 'tumblrgallery', 'tumblrblog', '', '(?:https?://)?tumblrgallery\\.xyz(/tumblrblog/gallery/(\\d+)\\.html)', ((False, 'tumblrgallery.xyz/'),)),
+        ('TumblrgalleryPostExtractor', 'tumblrgallery', 'post', '', '(?:https?://)?tumblrgallery\\.xyz(/post/(\\d+)\\.html)', ((False, 'tumblrgallery.xyz/'),)),
+        ('TumblrgallerySearchExtractor', 'tumblrgallery', 'search', '', '(?:https?://)?tumblrgallery\\.xyz(/s\\.php\\?q=([^&#]+))', ((False, 'tumblrgallery.xyz/'),)),
+    )),
+    'tungsten': ((), (
+        ('TungstenPostExtractor', 'tungsten', 'post', '', '(?:https?://)?(?:www\\.)?tungsten\\.run/post/(\\w+)', ((False, 'tungsten.run/'), (False, 'www.tungsten.run/'))),
+        ('TungstenModelExtractor', 'tungsten', 'model', '', '(?:https?://)?(?:www\\.)?tungsten\\.run/model/(\\w+)(?:/?\\?model_version=(\\w+))?', ((False, 'tungsten.run/'), (False, 'www.tungsten.run/'))),
+        ('TungstenUserExtractor', 'tungsten', 'user', '', '(?:https?://)?(?:www\\.)?tungsten\\.run/user/([^/?#]+)(?:/posts)?/?(?:\\?([^#]+))?', ((False, 'tungsten.run/'), (False, 'www.tungsten.run/'))),
+    )),
+    'twibooru': (('philomena',), (
+        ('TwibooruPostExtractor', 'twibooru', 'post', 'philomena', '(?:https?://)?(?:www\\.)?twibooru\\.org/(\\d+)', ((False, 'twibooru.org/'), (False, 'www.twibooru.org/'))),
+        ('TwibooruSearchExtractor', 'twibooru', 'search', 'philomena', '(?:https?://)?(?:www\\.)?twibooru\\.org/(?:search/?\\?([^#]+)|tags/([^/?#]+))', ((False, 'twibooru.org/'), (False, 'www.twibooru.org/'))),
+        ('TwibooruGalleryExtractor', 'twibooru', 'gallery', 'philomena', '(?:https?://)?(?:www\\.)?twibooru\\.org/galleries/(\\d+)', ((False, 'twibooru.org/'), (False, 'www.twibooru.org/'))),
+    )),
+    'twitter': ((), (
+        ('TwitterHomeExtractor', 'twitter', 'home', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:home(?:/fo(?:llowing|r[-_ ]?you()))?|i/timeline)/?$', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterSearchExtractor', 'twitter', 'search', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/search/?\\?(?:[^&#]+&)*q=([^&#]+)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterHashtagExtractor', 'twitter', 'hashtag', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/hashtag/([^/?#]+)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterUserExtractor', 'twitter', 'user', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:([^/?#]+)/?(?:$|\\?|#)|i(?:/user/|ntent/user\\?user_id=)(\\d+))', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterTimelineExtractor', 'twitter', 'timeline', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/timeline(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterTweetsExtractor', 'twitter', 'tweets', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/tweets(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterRepliesExtractor', 'twitter', 'replies', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/with_replies(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterHighlightsExtractor', 'twitter', 'highlights', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/highlights(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterMediaExtractor', 'twitter', 'media', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/media(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterLikesExtractor', 'twitter', 'likes', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/likes(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterBookmarkExtractor', 'twitter', 'bookmark', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/bookmarks()', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterListExtractor', 'twitter', 'list', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/lists/(\\d+)/?$', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterListMembersExtractor', 'twitter', 'list-members', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/lists/(\\d+)/members', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterFollowingExtractor', 'twitter', 'following', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/following(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterFollowersExtractor', 'twitter', 'followers', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/followers(?!\\w)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterCommunityExtractor', 'twitter', 'community', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/communities/(\\d+)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterCommunitiesExtractor', 'twitter', 'communities', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/communities/?$', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterEventExtractor', 'twitter', 'event', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/events/(\\d+)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterTweetExtractor', 'twitter', 'tweet', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+|i/web)/status/(\\d+)/?(?:$|\\?|#|photo/|video/)', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterQuotesExtractor', 'twitter', 'quotes', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:[^/?#]+|i/web)/status/(\\d+)/quotes', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterInfoExtractor', 'twitter', 'info', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/info', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterAvatarExtractor', 'twitter', 'avatar', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/photo', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterBackgroundExtractor', 'twitter', 'background', '', '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/header_photo', ((False, 'fixupx.com/'), (False, 'fixvx.com/'), (False, 'fxtwitter.com/'), (False, 'mobile.fixupx.com/'), (False, 'mobile.fixvx.com/'), (False, 'mobile.fxtwitter.com/'), (False, 'mobile.twitter.com/'), (False, 'mobile.vxtwitter.com/'), (False, 'mobile.x.com/'), (False, 'twitter.com/'), (False, 'vxtwitter.com/'), (False, 'www.fixupx.com/'), (False, 'www.fixvx.com/'), (False, 'www.fxtwitter.com/'), (False, 'www.twitter.com/'), (False, 'www.vxtwitter.com/'), (False, 'www.x.com/'), (False, 'x.com/'))),
+        ('TwitterImageExtractor', 'twitter', 'image', '', 'https?://pbs\\.twimg\\.com/media/([\\w-]+)(?:\\?format=|\\.)(\\w+)', ((False, 'pbs.twimg.com/'),)),
+    )),
+    'urlgalleries': ((), (
+        ('UrlgalleriesGalleryExtractor', 'urlgalleries', 'gallery', '', '(?:https?://)()(?:(\\w+)\\.)?urlgalleries\\.net/(?:b/([^/?#]+)/)?(?:[\\w-]+-)?(\\d+)', ((False, 'urlgalleries.net/'), (True, '.urlgalleries.net'))),
+    )),
+    'unsplash': ((), (
+        ('UnsplashImageExtractor', 'unsplash', 'image', '', '(?:https?://)?unsplash\\.com/photos/([^/?#]+)', ((False, 'unsplash.com/'),)),
+        ('UnsplashUserExtractor', 'unsplash', 'user', '', '(?:https?://)?unsplash\\.com/@(\\w+)/?$', ((False, 'unsplash.com/'),)),
+        ('UnsplashFavoriteExtractor', 'unsplash', 'favorite', '', '(?:https?://)?unsplash\\.com/@(\\w+)/likes', ((False, 'unsplash.com/'),)),
+        ('UnsplashCollectionExtractor', 'unsplash', 'collection', '', '(?:https?://)?unsplash\\.com/collections/([^/?#]+)(?:/([^/?#]+))?', ((False, 'unsplash.com/'),)),
+        ('UnsplashSearchExtractor', 'unsplash', 'search', '', '(?:https?://)?unsplash\\.com/s/photos/([^/?#]+)(?:\\?([^#]+))?', ((False, 'unsplash.com/'),)),
+    )),
+    'uploadir': ((), (
+        ('UploadirFileExtractor', 'uploadir', 'file', '', '(?:https?://)?uploadir\\.com/(?:user/)?u(?:ploads)?/([^/?#]+)', ((False, 'uploadir.com/'),)),
+    )),
+    'urlshortener': (('urlshortener',), (
+        ('UrlshortenerLinkExtractor', '', 'link', 'urlshortener', '(?:urlshortener:(https?://[^/?#]+)|(?:https?://)?(?:bit\\.ly()|t\\.co()))(/[^/?#]+)', ((False, 'bit.ly/'), (False, 't.co/'), (False, 'urlshortener:http:/'), (False, 'urlshortener:https:/'))),
+    )),
+    'vanillarock': ((), (
+        ('VanillarockPostExtractor', 'vanillarock', 'post', '', '(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?!category/|tag/)[^/?#]+)/?$', ((False, 'vanilla-rock.com/'), (False, 'www.vanilla-rock.com/'))),
+        ('VanillarockTagExtractor', 'vanillarock', 'tag', '', '(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?:tag|category)/[^?#]+)', ((False, 'vanilla-rock.com/'), (False, 'www.vanilla-rock.com/'))),
+    )),
+    'vichan': (('vichan',), (
+        ('VichanThreadExtractor', '', 'thread', 'vichan', '(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\.li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)/res/(\\d+)', ((False, '8kun.top/'), (False, 'boards.guro.cx/'), (False, 'smuglo.li/'), (False, 'smugloli.net/'), (False, 'vichan:http:/'), (False, 'vichan:https:/'))),
+        ('VichanBoardExtractor', '', 'board', 'vichan', '(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\.li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)(?:/index|/catalog|/\\d+|/?$)', ((False, '8kun.top/'), (False, 'boards.guro.cx/'), (False, 'smuglo.li/'), (False, 'smugloli.net/'), (False, 'vichan:http:/'), (False, 'vichan:https:/'))),
+    )),
+    'vipergirls': ((), (
+        ('VipergirlsThreadExtractor', 'vipergirls', 'thread', '', '(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?(/page\\d+)?(?:$|#|\\?(?!p=))', ((False, 'vipergirls.to/'), (False, 'www.vipergirls.to/'))),
+        ('VipergirlsPostExtractor', 'vipergirls', 'post', '', '(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?\\?p=\\d+[^#]*#post(\\d+)', ((False, 'vipergirls.to/'), (False, 'www.vipergirls.to/'))),
+    )),
+    'vk': ((), (
+        ('VkPhotosExtractor', 'vk', 'photos', '', '(?:https://)?(?:www\\.|m\\.)?vk\\.com/(?:(?:albums|photos|id)(-?\\d+)|(?!(?:album|tag|wall)-?\\d+_?)([^/?#]+))', ((False, 'm.vk.com/'), (False, 'vk.com/'), (False, 'www.vk.com/'))),
+        ('VkAlbumExtractor', 'vk', 'album', '', '(?:https://)?(?:www\\.|m\\.)?vk\\.com/album(-?\\d+)_(\\d+)$', ((False, 'm.vk.com/'), (False, 'vk.com/'), (False, 'www.vk.com/'))),
+        ('VkTaggedExtractor', 'vk', 'tagged', '', '(?:https://)?(?:www\\.|m\\.)?vk\\.com/tag(-?\\d+)$', ((False, 'm.vk.com/'), (False, 'vk.com/'), (False, 'www.vk.com/'))),
+        ('VkWallPostExtractor', 'vk', 'wall-post', '', '(?:https://)?(?:www\\.|m\\.)?vk\\.com/wall(-?\\d+)_(\\d+)', ((False, 'm.vk.com/'), (False, 'vk.com/'), (False, 'www.vk.com/'))),
+    )),
+    'vsco': ((), (
+        ('VscoUserExtractor', 'vsco', 'user', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/?$', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoGalleryExtractor', 'vsco', 'gallery', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/(?:gallery|images)', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoCollectionExtractor', 'vsco', 'collection', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/collection', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoSpaceExtractor', 'vsco', 'space', '', '(?:https?://)?(?:www\\.)?vsco\\.co/spaces/([^/?#]+)', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoSpacesExtractor', 'vsco', 'spaces', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/spaces', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoAvatarExtractor', 'vsco', 'avatar', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/avatar', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoImageExtractor', 'vsco', 'image', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/media/([0-9a-fA-F]+)', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+        ('VscoVideoExtractor', 'vsco', 'video', '', '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/video/([^/?#]+)', ((False, 'vsco.co/'), (False, 'www.vsco.co/'))),
+    )),
+    'wallhaven': ((), (
+        ('WallhavenSearchExtractor', 'wallhaven', 'search', '', '(?:https?://)?wallhaven\\.cc/search(?:/?\\?([^#]+))?', ((False, 'wallhaven.cc/'),)),
+        ('WallhavenCollectionExtractor', 'wallhaven', 'collection', '', '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/(\\d+)', ((False, 'wallhaven.cc/'),)),
+        ('WallhavenUserExtractor', 'wallhaven', 'user', '', '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/?$', ((False, 'wallhaven.cc/'),)),
+        ('WallhavenCollectionsExtractor', 'wallhaven', 'collections', '', '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/?$', ((False, 'wallhaven.cc/'),)),
+        ('WallhavenUploadsExtractor', 'wallhaven', 'uploads', '', '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/uploads', ((False, 'wallhaven.cc/'),)),
+        ('WallhavenImageExtractor', 'wallhaven', 'image', '', '(?:https?://)?(?:wallhaven\\.cc/w/|whvn\\.cc/|w\\.wallhaven\\.cc/[a-z]+/\\w\\w/wallhaven-)(\\w+)', ((False, 'w.wallhaven.cc/'), (False, 'wallhaven.cc/'), (False, 'whvn.cc/'))),
+    )),
+    'wallpapercave': ((), (
+        ('WallpapercaveImageExtractor', 'wallpapercave', 'image', '', '(?:https?://)?(?:www\\.)?wallpapercave\\.com/', ((False, 'wallpapercave.com/'), (False, 'www.wallpapercave.com/'))),
+    )),
+    'warosu': ((), (
+        ('WarosuThreadExtractor', 'warosu', 'thread', '', '(?:https?://)?(?:www\\.)?warosu\\.org/([^/]+)/thread/(\\d+)', ((False, 'warosu.org/'), (False, 'www.warosu.org/'))),
+    )),
+    'weasyl': ((), (
+        ('WeasylSubmissionExtractor', 'weasyl', 'submission', '', '(?:https://)?(?:www\\.)?weasyl.com/(?:~[\\w~-]+/submissions|submission|view)/(\\d+)', ((False, 'weasyl'), (False, 'www.weasyl'))),
+        ('WeasylSubmissionsExtractor', 'weasyl', 'submissions', '', '(?:https://)?(?:www\\.)?weasyl.com/(?:~|submissions/)([\\w~-]+)/?$', ((False, 'weasyl'), (False, 'www.weasyl'))),
+        ('WeasylFolderExtractor', 'weasyl', 'folder', '', '(?:https://)?(?:www\\.)?weasyl.com/submissions/([\\w~-]+)\\?folderid=(\\d+)', ((False, 'weasyl'), (False, 'www.weasyl'))),
+        ('WeasylJournalExtractor', 'weasyl', 'journal', '', '(?:https://)?(?:www\\.)?weasyl.com/journal/(\\d+)', ((False, 'weasyl'), (False, 'www.weasyl'))),
+        ('WeasylJournalsExtractor', 'weasyl', 'journals', '', '(?:https://)?(?:www\\.)?weasyl.com/journals/([\\w~-]+)', ((False, 'weasyl'), (False, 'www.weasyl'))),
+        ('WeasylFavoriteExtractor', 'weasyl', 'favorite', '', '(?:https://)?(?:www\\.)?weasyl.com/favorites(?:\\?userid=(\\d+)|/([^/?#]+))', ((False, 'weasyl'), (False, 'www.weasyl'))),
+    )),
+    'webmshare': ((), (
+        ('WebmshareVideoExtractor', 'webmshare', 'video', '', '(?:https?://)?(?:s\\d+\\.)?webmshare\\.com/(?:play/|download-webm/)?(\\w{3,})', ((False, 'webmshare.com/'), (True, '.webmshare.com'))),
+    )),
+    'webtoons': ((), (
+        ('WebtoonsEpisodeExtractor', 'webtoons', 'episode', '', '(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+)/[^/?#]+)/viewer\\?([^#\'\\"]+)', ((False, 'webtoons.com/'), (False, 'www.webtoons.com/'))),
+        ('WebtoonsComicExtractor', 'webtoons', 'comic', '', '(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+))/list\\?([^#]+)', ((False, 'webtoons.com/'), (False, 'www.webtoons.com/'))),
+        ('WebtoonsArtistExtractor', 'webtoons', 'artist', '', '(?:https?://)?(?:www\\.)?webtoons\\.com/p/community/([^/?#]+)/u/([^/?#]+)', ((False, 'webtoons.com/'), (False, 'www.webtoons.com/'))),
+    )),
+    'weebcentral': ((), (
+        ('WeebcentralChapterExtractor', 'weebcentral', 'chapter', '', '(?:https?://)?(?:www\\.)?weebcentral\\.com(/chapters/(\\w+))', ((False, 'weebcentral.com/'), (False, 'www.weebcentral.com/'))),
+        ('WeebcentralMangaExtractor', 'weebcentral', 'manga', '', '(?:https?://)?(?:www\\.)?weebcentral\\.com/series/(\\w+)', ((False, 'weebcentral.com/'), (False, 'www.weebcentral.com/'))),
+    )),
+    'weibo': ((), (
+        ('WeiboUserExtractor', 'weibo', 'user', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?(?:$|#)', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboHomeExtractor', 'weibo', 'home', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=home', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboFeedExtractor', 'weibo', 'feed', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=feed', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboVideosExtractor', 'weibo', 'videos', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=video', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboNewvideoExtractor', 'weibo', 'newvideo', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=newVideo', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboArticleExtractor', 'weibo', 'article', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=article', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboAlbumExtractor', 'weibo', 'album', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=album', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+        ('WeiboStatusExtractor', 'weibo', 'status', '', '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(detail|status|\\d+)/(\\w+)', ((False, 'm.weibo.cn/'), (False, 'm.weibo.com/'), (False, 'weibo.cn/'), (False, 'weibo.com/'), (False, 'www.weibo.cn/'), (False, 'www.weibo.com/'))),
+    )),
+    'wikiart': ((), (
+        ('WikiartArtistExtractor', 'wikiart', 'artist', '', '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!\\w+-by-)([\\w-]+)/?$', ((False, 'wikiart.org/'), (False, 'www.wikiart.org/'))),
+        ('WikiartImageExtractor', 'wikiart', 'image', '', '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!(?:paintings|artists)-by-)([\\w-]+)/([\\w-]+)', ((False, 'wikiart.org/'), (False, 'www.wikiart.org/'))),
+        ('WikiartArtworksExtractor', 'wikiart', 'artworks', '', '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/paintings-by-([\\w-]+)/([\\w-]+)', ((False, 'wikiart.org/'), (False, 'www.wikiart.org/'))),
+        ('WikiartArtistsExtractor', 'wikiart', 'artists', '', '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/artists-by-([\\w-]+)/([\\w-]+)', ((False, 'wikiart.org/'), (False, 'www.wikiart.org/'))),
+    )),
+    'wikifeet': ((), (
+        ('WikifeetGalleryExtractor', 'wikifeet', 'gallery', '', '(?:https?://)(?:(?:www\\.)?wikifeetx?|men\\.wikifeet)\\.com/([^/?#]+)', ((False, 'men.wikifeet.com/'), (False, 'wikifeet.com/'), (False, 'wikifeetx.com/'), (False, 'www.wikifeet.com/'), (False, 'www.wikifeetx.com/'))),
+    )),
+    'wikimedia': (('wikimedia',), (
+        ('WikimediaArticleExtractor', '', 'article', 'wikimedia', '(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?:pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|species\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?mediawiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?mariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()))/(?!static/)([^?#]+)', ((False, 'archives.bulbagarden.net/'), (False, 'azurlane.koumakan.jp/'), (False, 'bulbapedia.bulbagarden.net/'), (False, 'commons.wikimedia.org/'), (False, 'mariowiki.com/'), (False, 'mediawiki.org/'), (False, 'pidgi.net/'), (False, 'species.wikimedia.org/'), (False, 'wikimedia:http:/'), (False, 'wikimedia:https:/'), (False, 'www.mariowiki.com/'), (False, 'www.mediawiki.org/'), (False, 'www.pidgi.net/'), (True, '.fandom.com'), (True, '.wiki.gg'), (True, '.wikibooks.org'), (True, '.wikidata.org'), (True, '.wikinews.org'), (True, '.wikipedia.org'), (True, '.wikiquote.org'), (True, '.wikisource.org'), (True, '.wikiversity.org'), (True, '.wikivoyage.org'), (True, '.wiktionary.org'))),
+        ('WikimediaWikiExtractor', '', 'wiki', 'wikimedia', '(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?:pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|species\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?mediawiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?mariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()))/?$', ((False, 'archives.bulbagarden.net'), (False, 'archives.bulbagarden.net/'), (False, 'azurlane.koumakan.jp'), (False, 'azurlane.koumakan.jp/'), (False, 'bulbapedia.bulbagarden.net'), (False, 'bulbapedia.bulbagarden.net/'), (False, 'commons.wikimedia.org'), (False, 'commons.wikimedia.org/'), (False, 'mariowiki.com'), (False, 'mariowiki.com/'), (False, 'mediawiki.org'), (False, 'mediawiki.org/'), (False, 'pidgi.net'), (False, 'pidgi.net/'), (False, 'species.wikimedia.org'), (False, 'species.wikimedia.org/'), (False, 'wikimedia:http:/'), (False, 'wikimedia:https:/'), (False, 'www.mariowiki.com'), (False, 'www.mariowiki.com/'), (False, 'www.mediawiki.org'), (False, 'www.mediawiki.org/'), (False, 'www.pidgi.net'), (False, 'www.pidgi.net/'), (True, '.fandom.com'), (True, '.wiki.gg'), (True, '.wikibooks.org'), (True, '.wikidata.org'), (True, '.wikinews.org'), (True, '.wikipedia.org'), (True, '.wikiquote.org'), (True, '.wikisource.org'), (True, '.wikiversity.org'), (True, '.wikivoyage.org'), (True, '.wiktionary.org'))),
+    )),
+    'xasiat': ((), (
+        ('XasiatAlbumExtractor', 'xasiat', 'album', '', '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/(\\d+)/[^/?#]+)', ((False, 'www.xasiat.com/'), (False, 'xasiat.com/'))),
+        ('XasiatTagExtractor', 'xasiat', 'tag', '', '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/tags/[^/?#]+)', ((False, 'www.xasiat.com/'), (False, 'xasiat.com/'))),
+        ('XasiatCategoryExtractor', 'xasiat', 'category', '', '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/categories/[^/?#]+)', ((False, 'www.xasiat.com/'), (False, 'xasiat.com/'))),
+        ('XasiatModelExtractor', 'xasiat', 'model', '', '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/models/[^/?#]+)', ((False, 'www.xasiat.com/'), (False, 'xasiat.com/'))),
+    )),
+    'xfolio': ((), (
+        ('XfolioWorkExtractor', 'xfolio', 'work', '', '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/works/(\\d+)', ((False, 'xfolio.jp/'),)),
+        ('XfolioUserExtractor', 'xfolio', 'user', '', '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)(?:/works)?/?(?:$|\\?|#)', ((False, 'xfolio.jp/'),)),
+        ('XfolioSeriesExtractor', 'xfolio', 'series', '', '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/series/(\\d+)', ((False, 'xfolio.jp/'),)),
+    )),
+    'xhamster': ((), (
+        ('XhamsterGalleryExtractor', 'xhamster', 'gallery', '', '(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.porncache\\.net))(/photos/gallery/[^/?#]+)', ((False, 'xhamster.com/'), (False, 'xhamster.desi/'), (False, 'xhamster.one/'), (False, 'xhamster.porncache.net/'), (True, '.com'), (True, '.desi'), (True, '.one'), (True, '.xhamster.com'), (True, '.xhamster.desi'), (True, '.xhamster.one'), (True, '.xhamster.porncache.net'))),
+        ('XhamsterUserExtractor', 'xhamster', 'user', '', '(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.porncache\\.net))/users/([^/?#]+)(?:/photos)?/?(?:$|[?#])', ((False, 'xhamster.com/'), (False, 'xhamster.desi/'), (False, 'xhamster.one/'), (False, 'xhamster.porncache.net/'), (True, '.com'), (True, '.desi'), (True, '.one'), (True, '.xhamster.com'), (True, '.xhamster.desi'), (True, '.xhamster.one'), (True, '.xhamster.porncache.net'))),
+    )),
+    'xvideos': ((), (
+        ('XvideosGalleryExtractor', 'xvideos', 'gallery', '', '(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)?channels)/([^/?#]+)/photos/(\\d+)', ((False, 'www.xvideos.com/'), (False, 'xvideos.com/'))),
+        ('XvideosUserExtractor', 'xvideos', 'user', '', '(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)?channels)/([^/?#]+)/?(?:#.*)?$', ((False, 'www.xvideos.com/'), (False, 'xvideos.com/'))),
+    )),
+    'yiffverse': (('booru',), (
+        ('YiffversePostExtractor', 'yiffverse', 'post', 'booru', '(?:https?://)?(?:www\\.)?yiffverse\\.com/post/(\\d+)', ((False, 'www.yiffverse.com/'), (False, 'yiffverse.com/'))),
+        ('YiffversePlaylistExtractor', 'yiffverse', 'playlist', 'booru', '(?:https?://)?(?:www\\.)?yiffverse\\.com/playlist/(\\d+)', ((False, 'www.yiffverse.com/'), (False, 'yiffverse.com/'))),
+        ('YiffverseTagExtractor', 'yiffverse', 'tag', 'booru', '(?:https?://)?(?:www\\.)?yiffverse\\.com/(?:tag/([^/?#]+))?(?:/?\\?([^#]+))?(?:$|#)', ((False, 'www.yiffverse.com/'), (False, 'yiffverse.com/'))),
+    )),
+    'zerochan': (('booru',), (
+        ('ZerochanTagExtractor', 'zerochan', 'tag', 'booru', '(?:https?://)?(?:www\\.)?zerochan\\.net/(?!\\d+$)([^/?#]+)/?(?:\\?([^#]+))?', ((False, 'www.zerochan.net/'), (False, 'zerochan.net/'))),
+        ('ZerochanImageExtractor', 'zerochan', 'image', 'booru', '(?:https?://)?(?:www\\.)?zerochan\\.net/(\\d+)', ((False, 'www.zerochan.net/'), (False, 'zerochan.net/'))),
+    )),
+    'booru': ((), (
+    )),
+    'moebooru': (('moebooru',), (
+        ('MoebooruTagExtractor', '', 'tag', 'moebooru', '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post\\?(?:[^&#]*&)*tags=([^&#]*)', ((False, 'konachan.com/'), (False, 'konachan.net/'), (False, 'lolibooru.moe/'), (False, 'moebooru:http:/'), (False, 'moebooru:https:/'), (False, 'sakugabooru.com/'), (False, 'www.sakugabooru.com/'), (False, 'yande.re/'))),
+        ('MoebooruPoolExtractor', '', 'pool', 'moebooru', '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/pool/show/(\\d+)', ((False, 'konachan.com/'), (False, 'konachan.net/'), (False, 'lolibooru.moe/'), (False, 'moebooru:http:/'), (False, 'moebooru:https:/'), (False, 'sakugabooru.com/'), (False, 'www.sakugabooru.com/'), (False, 'yande.re/'))),
+        ('MoebooruPostExtractor', '', 'post', 'moebooru', '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post/show/(\\d+)', ((False, 'konachan.com/'), (False, 'konachan.net/'), (False, 'lolibooru.moe/'), (False, 'moebooru:http:/'), (False, 'moebooru:https:/'), (False, 'sakugabooru.com/'), (False, 'www.sakugabooru.com/'), (False, 'yande.re/'))),
+        ('MoebooruPopularExtractor', '', 'popular', 'moebooru', '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post/popular_(by_(?:day|week|month)|recent)(?:\\?([^#]*))?', ((False, 'konachan.com/'), (False, 'konachan.net/'), (False, 'lolibooru.moe/'), (False, 'moebooru:http:/'), (False, 'moebooru:https:/'), (False, 'sakugabooru.com/'), (False, 'www.sakugabooru.com/'), (False, 'yande.re/'))),
+    )),
+    'foolfuuka': (('foolfuuka',), (
+        ('FoolfuukaThreadExtractor', '', 'thread', 'foolfuuka', '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/thread/(\\d+)', ((False, '4plebs.org/'), (False, 'arch.b4k.co/'), (False, 'arch.b4k.dev/'), (False, 'archive.4plebs.org/'), (False, 'archive.palanq.win/'), (False, 'archive.rebeccablacktech.com/'), (False, 'archived.moe/'), (False, 'archiveofsins.com/'), (False, 'boards.fireden.net/'), (False, 'desuarchive.org/'), (False, 'foolfuuka:http:/'), (False, 'foolfuuka:https:/'), (False, 'rbt.asia/'), (False, 'rebeccablacktech.com/'), (False, 'thebarchive.com/'), (False, 'www.archiveofsins.com/'))),
+        ('FoolfuukaBoardExtractor', '', 'board', 'foolfuuka', '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)(?:/(?:page/)?(\\d*))?$', ((False, '4plebs.org/'), (False, 'arch.b4k.co/'), (False, 'arch.b4k.dev/'), (False, 'archive.4plebs.org/'), (False, 'archive.palanq.win/'), (False, 'archive.rebeccablacktech.com/'), (False, 'archived.moe/'), (False, 'archiveofsins.com/'), (False, 'boards.fireden.net/'), (False, 'desuarchive.org/'), (False, 'foolfuuka:http:/'), (False, 'foolfuuka:https:/'), (False, 'rbt.asia/'), (False, 'rebeccablacktech.com/'), (False, 'thebarchive.com/'), (False, 'www.archiveofsins.com/'))),
+        ('FoolfuukaSearchExtractor', '', 'search', 'foolfuuka', '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/search((?:/[^/?#]+/[^/?#]+)+)', ((False, '4plebs.org/'), (False, 'arch.b4k.co/'), (False, 'arch.b4k.dev/'), (False, 'archive.4plebs.org/'), (False, 'archive.palanq.win/'), (False, 'archive.rebeccablacktech.com/'), (False, 'archived.moe/'), (False, 'archiveofsins.com/'), (False, 'boards.fireden.net/'), (False, 'desuarchive.org/'), (False, 'foolfuuka:http:/'), (False, 'foolfuuka:https:/'), (False, 'rbt.asia/'), (False, 'rebeccablacktech.com/'), (False, 'thebarchive.com/'), (False, 'www.archiveofsins.com/'))),
+        ('FoolfuukaGalleryExtractor', '', 'gallery', 'foolfuuka', '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/gallery(?:/(\\d+))?', ((False, '4plebs.org/'), (False, 'arch.b4k.co/'), (False, 'arch.b4k.dev/'), (False, 'archive.4plebs.org/'), (False, 'archive.palanq.win/'), (False, 'archive.rebeccablacktech.com/'), (False, 'archived.moe/'), (False, 'archiveofsins.com/'), (False, 'boards.fireden.net/'), (False, 'desuarchive.org/'), (False, 'foolfuuka:http:/'), (False, 'foolfuuka:https:/'), (False, 'rbt.asia/'), (False, 'rebeccablacktech.com/'), (False, 'thebarchive.com/'), (False, 'www.archiveofsins.com/'))),
+    )),
+    'foolslide': (('foolslide',), (
+        ('FoolslideChapterExtractor', '', 'chapter', 'foolslide', '(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/read/[^/?#]+/[a-z-]+/\\d+/\\d+(?:/\\d+)?)', ((False, '/'), (False, 'foolslide:http:/'), (False, 'foolslide:https:/'))),
+        ('FoolslideMangaExtractor', '', 'manga', 'foolslide', '(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/series/[^/?#]+)', ((False, '/'), (False, 'foolslide:http:/'), (False, 'foolslide:https:/'))),
+    )),
+    'mastodon': (('mastodon',), (
+        ('MastodonUserExtractor', '', 'user', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)(?:/media)?/?$', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+        ('MastodonBookmarkExtractor', '', 'bookmark', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/bookmarks', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+        ('MastodonFavoriteExtractor', '', 'favorite', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/favourites', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+        ('MastodonListExtractor', '', 'list', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/lists/(\\w+)', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+        ('MastodonHashtagExtractor', '', 'hashtag', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/tags/(\\w+)', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+        ('MastodonFollowingExtractor', '', 'following', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)/following', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+        ('MastodonStatusExtractor', '', 'status', 'mastodon', '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@[^/?#]+|(?:users/[^/?#]+/)?(?:statuses|notice|objects()))/(?!following)([^/?#]+)', ((False, 'baraag.net/'), (False, 'mastodon.social/'), (False, 'mastodon:http:/'), (False, 'mastodon:https:/'), (False, 'pawoo.net/'))),
+    )),
+    'shopify': (('shopify',), (
+        ('ShopifyCollectionExtractor', '', 'collection', 'shopify', '(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.com()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www\\.)?windsorstore\\.com()))(/collections/[\\w-]+)/?(?:$|[?#])', ((False, 'chelseacrew.com/'), (False, 'fashionnova.com/'), (False, 'loungeunderwear.com/'), (False, 'michaels.com.au/'), (False, 'modcloth.com/'), (False, 'ohpolly.com/'), (False, 'omgmiamiswimwear.com/'), (False, 'pinupgirlclothing.com/'), (False, 'raidlondon.com/'), (False, 'shopify:http:/'), (False, 'shopify:https:/'), (False, 'unique-vintage.com/'), (False, 'windsorstore.com/'), (False, 'www.chelseacrew.com/'), (False, 'www.fashionnova.com/'), (False, 'www.ohpolly.com/'), (False, 'www.omgmiamiswimwear.com/'), (False, 'www.raidlondon.com/'), (False, 'www.unique-vintage.com/'), (False, 'www.windsorstore.com/'), (True, '.loungeunderwear.com'))),
+        ('ShopifyProductExtractor', '', 'product', 'shopify', '(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.com()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www\\.)?windsorstore\\.com()))((?:/collections/[\\w-]+)?/products/[\\w-]+)', ((False, 'chelseacrew.com/'), (False, 'fashionnova.com/'), (False, 'loungeunderwear.com/'), (False, 'michaels.com.au/'), (False, 'modcloth.com/'), (False, 'ohpolly.com/'), (False, 'omgmiamiswimwear.com/'), (False, 'pinupgirlclothing.com/'), (False, 'raidlondon.com/'), (False, 'shopify:http:/'), (False, 'shopify:https:/'), (False, 'unique-vintage.com/'), (False, 'windsorstore.com/'), (False, 'www.chelseacrew.com/'), (False, 'www.fashionnova.com/'), (False, 'www.ohpolly.com/'), (False, 'www.omgmiamiswimwear.com/'), (False, 'www.raidlondon.com/'), (False, 'www.unique-vintage.com/'), (False, 'www.windsorstore.com/'), (True, '.loungeunderwear.com'))),
+    )),
+    'lolisafe': (('lolisafe',), (
+        ('LolisafeAlbumExtractor', '', 'album', 'lolisafe', '(?:lolisafe:(https?://[^/?#]+)|(?:https?://)?(?:))/a/([^/?#]+)', ((False, '/'), (False, 'lolisafe:http:/'), (False, 'lolisafe:https:/'))),
+    )),
+    'imagehosts': ((), (
+        ('ImxtoImageExtractor', 'imxto', 'image', 'imagehost', '(?:https?://)?(?:www\\.)?((?:imx\\.to|img\\.yt)/(?:i/|img-)(\\w+)(\\.html)?)', ((False, 'img.yt/'), (False, 'imx.to/'), (False, 'www.img.yt/'), (False, 'www.imx.to/'))),
+        ('ImxtoGalleryExtractor', 'imxto', 'gallery', 'imagehost', '(?:https?://)?(?:www\\.)?(imx\\.to/g/([^/?#]+))', ((False, 'imx.to/'), (False, 'www.imx.to/'))),
+        ('AcidimgImageExtractor', 'acidimg', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?acidimg\\.cc/img-([a-z0-9]+)\\.html)', ((False, 'acidimg.cc/'), (False, 'www.acidimg.cc/'))),
+        ('ImagevenueImageExtractor', 'imagevenue', 'image', 'imagehost', '(?:https?://)?((?:www|img\\d+)\\.imagevenue\\.com/([A-Z0-9]{8,10}|view/.*|img\\.php\\?.*))', ((False, 'www.imagevenue.com/'), (True, '.imagevenue.com'))),
+        ('ImagetwistImageExtractor', 'imagetwist', 'image', 'imagehost', '(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/([a-z0-9]{12}))', ((False, 'imagehaha.com/'), (False, 'imagetwist.com/'), (False, 'phun.imagehaha.com/'), (False, 'phun.imagetwist.com/'), (False, 'www.imagehaha.com/'), (False, 'www.imagetwist.com/'))),
+        ('ImagetwistGalleryExtractor', 'imagetwist', 'gallery', 'imagehost', '(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/(p/[^/?#]+/\\d+))', ((False, 'imagehaha.com/'), (False, 'imagetwist.com/'), (False, 'phun.imagehaha.com/'), (False, 'phun.imagetwist.com/'), (False, 'www.imagehaha.com/'), (False, 'www.imagetwist.com/'))),
+        ('ImgadultImageExtractor', 'imgadult', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?imgadult\\.com/img-([0-9a-f]+)\\.html)', ((False, 'imgadult.com/'), (False, 'www.imgadult.com/'))),
+        ('ImgspiceImageExtractor', 'imgspice', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?imgspice\\.com/([^/?#]+))', ((False, 'imgspice.com/'), (False, 'www.imgspice.com/'))),
+        ('PixhostImageExtractor', 'pixhost', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?pixhost\\.(?:to|org)/show/\\d+/(\\d+)_[^/?#]+)', ((False, 'pixhost.org/'), (False, 'pixhost.to/'), (False, 'www.pixhost.org/'), (False, 'www.pixhost.to/'))),
+        ('PixhostGalleryExtractor', 'pixhost', 'gallery', 'imagehost', '(?:https?://)?((?:www\\.)?pixhost\\.(?:to|org)/gallery/([^/?#]+))', ((False, 'pixhost.org/'), (False, 'pixhost.to/'), (False, 'www.pixhost.org/'), (False, 'www.pixhost.to/'))),
+        ('PostimgImageExtractor', 'postimg', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)/(?!gallery/)(?:image/)?([^/?#]+)/?)', ((False, 'pixxxels.cc/'), (False, 'pixxxels.org/'), (False, 'postimages.cc/'), (False, 'postimages.org/'), (False, 'postimg.cc/'), (False, 'postimg.org/'), (False, 'www.pixxxels.cc/'), (False, 'www.pixxxels.org/'), (False, 'www.postimages.cc/'), (False, 'www.postimages.org/'), (False, 'www.postimg.cc/'), (False, 'www.postimg.org/'))),
+        ('PostimgGalleryExtractor', 'postimg', 'gallery', 'imagehost', '(?:https?://)?((?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)/gallery/([^/?#]+))', ((False, 'pixxxels.cc/'), (False, 'pixxxels.org/'), (False, 'postimages.cc/'), (False, 'postimages.org/'), (False, 'postimg.cc/'), (False, 'postimg.org/'), (False, 'www.pixxxels.cc/'), (False, 'www.pixxxels.org/'), (False, 'www.postimages.cc/'), (False, 'www.postimages.org/'), (False, 'www.postimg.cc/'), (False, 'www.postimg.org/'))),
+        ('TurboimagehostImageExtractor', 'turboimagehost', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?turboimagehost\\.com/p/(\\d+)/[^/?#]+\\.html)', ((False, 'turboimagehost.com/'), (False, 'www.turboimagehost.com/'))),
+        ('TurboimagehostGalleryExtractor', 'turboimagehost', 'gallery', 'imagehost', '(?:https?://)?((?:www\\.)?turboimagehost\\.com/album/(\\d+)/([^/?#]*))', ((False, 'turboimagehost.com/'), (False, 'www.turboimagehost.com/'))),
+        ('ViprImageExtractor', 'vipr', 'image', 'imagehost', '(?:https?://)?(vipr\\.im/(\\w+))', ((False, 'vipr.im/'),)),
+        ('ImgclickImageExtractor', 'imgclick', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?imgclick\\.net/([^/?#]+))', ((False, 'imgclick.net/'), (False, 'www.imgclick.net/'))),
+        ('FappicImageExtractor', 'fappic', 'image', 'imagehost', '(?:https?://)?(?:www\\.|img\\d+\\.)?fappic\\.com/(?:i/\\d+/())?(\\w{10,})(?:/|\\.)\\w+', ((False, 'fappic.com/'), (False, 'www.fappic.com/'), (True, '.fappic.com'))),
+        ('PicstateImageExtractor', 'picstate', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?picstate\\.com/view/full/([^/?#]+))', ((False, 'picstate.com/'), (False, 'www.picstate.com/'))),
+        ('ImgdriveImageExtractor', 'imgdrive', 'image', 'imagehost', '(?:https?://)?(?:www\\.)?(img(drive|taxi|wallet)\\.(?:com|net)/img-(\\w+)\\.html)', ((False, 'imgdrive.com/'), (False, 'imgdrive.net/'), (False, 'imgtaxi.com/'), (False, 'imgtaxi.net/'), (False, 'imgwallet.com/'), (False, 'imgwallet.net/'), (False, 'www.imgdrive.com/'), (False, 'www.imgdrive.net/'), (False, 'www.imgtaxi.com/'), (False, 'www.imgtaxi.net/'), (False, 'www.imgwallet.com/'), (False, 'www.imgwallet.net/'))),
+        ('SilverpicImageExtractor', 'silverpic', 'image', 'imagehost', '(?:https?://)?((?:www\\.)?silverpic\\.com/([a-z0-9]{10,})/[\\S]+\\.html)', ((False, 'silverpic.com/'), (False, 'www.silverpic.com/'))),
+    )),
+    'directlink': ((), (
+        ('DirectlinkExtractor', 'directlink', '', '', '(?i)https?://(?P<domain>[^/?#]+)/(?P<path>[^?#]+\\.(?:jpe?g|jpe|png|gif|bmp|svg|web[mp]|avif|heic|psd|mp4|m4v|mov|mkv|og[gmv]|wav|mp3|opus|zip|rar|7z|pdf|swf))(?:\\?(?P<query>[^#]*))?(?:#(?P<fragment>.*))?$', None),
+    )),
+    'recursive': ((), (
+        ('RecursiveExtractor', 'recursive', '', '', 'r(?:ecursive)?:', ((False, 'r:'), (False, 'recursive:'))),
+    )),
+    'oauth': ((), (
+        ('OAuthFlickr', 'oauth', 'flickr', '', 'oauth:flickr$', ((False, 'oauth:flickr'),)),
+        ('OAuthSmugmug', 'oauth', 'smugmug', '', 'oauth:smugmug$', ((False, 'oauth:smugmug'),)),
+        ('OAuthTumblr', 'oauth', 'tumblr', '', 'oauth:tumblr$', ((False, 'oauth:tumblr'),)),
+        ('OAuthDeviantart', 'oauth', 'deviantart', '', 'oauth:deviantart$', ((False, 'oauth:deviantart'),)),
+        ('OAuthReddit', 'oauth', 'reddit', '', 'oauth:reddit$', ((False, 'oauth:reddit'),)),
+        ('OAuthMastodon', 'oauth', 'mastodon', '', 'oauth:mastodon:(?:https?://)?([^/?#]+)', ((False, 'oauth:mastodon:'), (False, 'oauth:mastodon:http:/'), (False, 'oauth:mastodon:https:/'))),
+        ('OAuthPixiv', 'oauth', 'pixiv', '', 'oauth:pixiv$', ((False, 'oauth:pixiv'),)),
+    )),
+    'noop': ((), (
+        ('NoopExtractor', 'noop', '', '', '(?i)noo?p$', ((False, 'noop'), (False, 'nop'))),
+    )),
+    'ytdl': ((), (
+        ('YoutubeDLExtractor', 'ytdl', '', '', 'ytdl:(.*)', ((False, 'ytdl:'),)),
+    )),
+    'generic': ((), (
+        ('GenericExtractor', 'generic', '', '', '(?i)(?P<generic>g(?:eneric)?:)(?P<scheme>https?://)?(?P<domain>[-\\w\\.]+)(?P<path>/[^?#]*)?(?:\\?(?P<query>[^#]*))?(?:\\#(?P<fragment>.*))?', ((False, 'g:'), (False, 'g:http:/'), (False, 'g:https:/'), (False, 'generic:'), (False, 'generic:http:/'), (False, 'generic:https:/'))),
+    )),
+}
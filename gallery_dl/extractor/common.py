@@ -23,7 +23,7 @@ from datetime import datetime
 from xml.etree import ElementTree
 from requests.adapters import HTTPAdapter
 from .message import Message
-from .. import config, output, text, util, cache, exception
+from .. import config, output, text, util, cache, exception, ratelimit
 
 urllib3 = requests.packages.urllib3
 
@@ -37,6 +37,8 @@ class Extractor:
     directory_fmt = ("{category}",)
     filename_fmt = "{filename}.{extension}"
     archive_fmt = ""
+    # '<hash algorithm>:<format string>' of a trusted file digest
+    digest_fmt = ""
     status = 0
     root = ""
     cookies_domain = ""
@@ -49,7 +51,6 @@ class Extractor:
     request_interval = 0.0
     request_interval_min = 0.0
     request_interval_429 = 60.0
-    request_timestamp = 0.0
 
     def __init__(self, match):
         self.log = logging.getLogger(self.category)
@@ -182,8 +183,8 @@ class Extractor:
         response = challenge = None
         tries = 1
 
-        if self._interval and interval:
-            seconds = self._interval() - (time.time() - Extractor.request_timestamp)
+        if interval:
+            seconds = self._bucket.acquire(self._interval() if self._interval else 0.0)
             if seconds > 0.0:
                 self.sleep(seconds, "request")
 
@@ -241,7 +242,7 @@ class Extractor:
                     break
 
             finally:
-                Extractor.request_timestamp = time.time()
+                self._bucket.release()
 
             self.log.debug("%s (%s/%s)", msg, tries, retries + 1)
             if tries > retries:
@@ -253,10 +254,14 @@ class Extractor:
                 if seconds < s:
                     seconds = s
             if code == 429 and self._interval_429:
-                s = self._interval_429()
-                if seconds < s:
-                    seconds = s
-                self.wait(seconds=seconds, reason="429 Too Many Requests")
+                until = ratelimit.reset(response)
+                if until is None:
+                    s = self._interval_429()
+                    if seconds < s:
+                        seconds = s
+                    self.wait(seconds=seconds, reason="429 Too Many Requests")
+                else:
+                    self.wait(until=until, reason="429 Too Many Requests")
             else:
                 self.sleep(seconds, "retry")
             tries += 1
@@ -335,6 +340,8 @@ class Extractor:
         seconds += adjust
         if seconds <= 0.0:
             return
+        # delay all other requests to this site as well
+        ratelimit.bucket(self.category).block(until + adjust)
 
         if reason:
             t = datetime.fromtimestamp(until).time()
@@ -404,6 +411,9 @@ class Extractor:
         self._interval_429 = util.build_duration_func(
             self.config("sleep-429", self.request_interval_429),
         )
+        self._bucket = ratelimit.bucket(
+            self.category, self.config("sleep-request-burst")
+        )
 
         if self._retries < 0:
             self._retries = float("inf")
@@ -529,12 +539,29 @@ class Extractor:
         else:
             ssl_ctx = None
 
+        pool_size = (
+            self.config("pool-connections", 10),
+            self.config("pool-maxsize", 10),
+        )
+
         adapter = _build_requests_adapter(
-            ssl_options, ssl_ciphers, ssl_ctx, source_address
+            ssl_options, ssl_ciphers, ssl_ctx, source_address, pool_size
         )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
+        if self.config("http2"):
+            try:
+                adapter = _build_http2_adapter(
+                    ssl_options, ssl_ciphers, ssl_ctx, source_address, pool_size
+                )
+            except ImportError as exc:
+                self.log.error(
+                    "Unable to enable HTTP/2 (%s: %s)", exc.__class__.__name__, exc
+                )
+            else:
+                session.mount("https://", adapter)
+
     def _init_cookies(self):
         """Populate the session's cookiejar"""
         self.cookies = self.session.cookies
@@ -558,8 +585,7 @@ class Extractor:
         elif isinstance(cookies_source, str):
             path = util.expand_path(cookies_source)
             try:
-                with open(path) as fp:
-                    cookies = util.cookiestxt_load(fp)
+                cookies, index, cached = _cookiestxt_load(path)
             except ValueError as exc:
                 self.log.warning(
                     "cookies: Invalid Netscape cookies.txt file " "'%s' (%s: %s)",
@@ -575,7 +601,14 @@ class Extractor:
                     exc,
                 )
             else:
-                self.log.debug("cookies: Loading cookies from '%s'", cookies_source)
+                if cached:
+                    self.log.debug(
+                        "cookies: Using cached cookies from '%s'", cookies_source
+                    )
+                else:
+                    self.log.debug("cookies: Loading cookies from '%s'", cookies_source)
+                if self.cookies_domain:
+                    cookies = index.get(_cookies_domain_key(self.cookies_domain), ())
                 set_cookie = self.cookies.set_cookie
                 for cookie in cookies:
                     set_cookie(cookie)
@@ -586,10 +619,12 @@ class Extractor:
             cookies = CACHE_COOKIES.get(key)
 
             if cookies is None:
-                from ..cookies import load_cookies
+                from ..cookies import load_cookies_cached
 
                 try:
-                    cookies = load_cookies(cookies_source)
+                    cookies = load_cookies_cached(
+                        cookies_source, self.config("cookies-cache", 0)
+                    )
                 except Exception as exc:
                     self.log.warning("cookies: %s", exc)
                     cookies = ()
@@ -623,18 +658,51 @@ class Extractor:
             if not path:
                 return
 
-        path_tmp = path + ".tmp"
-        try:
-            with open(path_tmp, "w") as fp:
-                util.cookiestxt_store(fp, self.cookies)
-            os.replace(path_tmp, path)
-        except OSError as exc:
-            self.log.error(
-                "cookies: Failed to write to '%s' " "(%s: %s)",
-                path,
-                exc.__class__.__name__,
-                exc,
-            )
+        with _cookiestxt_lock:
+            cookies = self.cookies
+            if self.cookies_domain:
+                # keep cookies of other domains from the file's current content,
+                # which might have been updated by other jobs or processes
+                try:
+                    current = _cookiestxt_load(path)[0]
+                except FileNotFoundError:
+                    current = ()
+                except Exception as exc:
+                    self.log.debug(
+                        "cookies: Failed to read '%s' (%s: %s)",
+                        path,
+                        exc.__class__.__name__,
+                        exc,
+                    )
+                    current = ()
+
+                key = _cookies_domain_key(self.cookies_domain)
+                merged = {
+                    (c.domain, c.path, c.name): c
+                    for c in current
+                    if _cookies_domain_key(c.domain) != key
+                }
+                for c in cookies:
+                    merged[(c.domain, c.path, c.name)] = c
+                cookies = list(merged.values())
+            else:
+                cookies = list(cookies)
+
+            path_tmp = path + ".tmp"
+            try:
+                with open(path_tmp, "w") as fp:
+                    util.cookiestxt_store(fp, cookies)
+                os.replace(path_tmp, path)
+            except OSError as exc:
+                CACHE_COOKIES_TXT.pop(path, None)
+                self.log.error(
+                    "cookies: Failed to write to '%s' " "(%s: %s)",
+                    path,
+                    exc.__class__.__name__,
+                    exc,
+                )
+            else:
+                _cookiestxt_cache(path, [c for c in cookies if c.domain])
 
     def cookies_update(self, cookies, domain=""):
         """Update the session's cookiejar with 'cookies'"""
@@ -1042,55 +1110,137 @@ class BaseExtractor(Extractor):
 
 class RequestsAdapter(HTTPAdapter):
 
-    def __init__(self, ssl_context=None, source_address=None):
+    def __init__(
+        self,
+        ssl_context=None,
+        source_address=None,
+        pool_connections=10,
+        pool_maxsize=10,
+    ):
         self.ssl_context = ssl_context
         self.source_address = source_address
-        HTTPAdapter.__init__(self)
+        # connections opened and requests sent by already discarded pools
+        self.num_connections = self.num_requests = 0
+        HTTPAdapter.__init__(self, pool_connections, pool_maxsize)
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
         kwargs["source_address"] = self.source_address
-        return HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        self._track_pools(self.poolmanager)
 
-    def proxy_manager_for(self, *args, **kwargs):
+    def proxy_manager_for(self, proxy, **kwargs):
+        if proxy in self.proxy_manager:
+            return self.proxy_manager[proxy]
         kwargs["ssl_context"] = self.ssl_context
         kwargs["source_address"] = self.source_address
-        return HTTPAdapter.proxy_manager_for(self, *args, **kwargs)
+        manager = HTTPAdapter.proxy_manager_for(self, proxy, **kwargs)
+        self._track_pools(manager)
+        return manager
+
+    def connection_stats(self):
+        """Return the number of opened and reused connections"""
+        opened = self.num_connections
+        requests = self.num_requests
 
+        for manager in (self.poolmanager, *self.proxy_manager.values()):
+            pools = manager.pools
+            for key in pools.keys():
+                if pool := pools.get(key):
+                    opened += pool.num_connections
+                    requests += pool.num_requests
 
-def _build_requests_adapter(ssl_options, ssl_ciphers, ssl_ctx, source_address):
+        return opened, requests - opened
 
-    key = (ssl_options, ssl_ciphers, ssl_ctx, source_address)
+    def _track_pools(self, manager):
+        pools = manager.pools
+        dispose = pools.dispose_func
+
+        def dispose_func(pool):
+            self.num_connections += pool.num_connections
+            self.num_requests += pool.num_requests
+            if dispose is not None:
+                dispose(pool)
+
+        pools.dispose_func = dispose_func
+
+
+def connection_stats():
+    """Return the number of opened and reused connections of all adapters"""
+    opened = reused = 0
+    for adapter in tuple(CACHE_ADAPTERS.values()):
+        o, r = adapter.connection_stats()
+        opened += o
+        reused += r
+    return opened, reused
+
+
+def _build_requests_adapter(
+    ssl_options, ssl_ciphers, ssl_ctx, source_address, pool_size=(10, 10)
+):
+
+    key = (ssl_options, ssl_ciphers, ssl_ctx, source_address, pool_size)
     try:
         return CACHE_ADAPTERS[key]
     except KeyError:
         pass
 
     if ssl_options or ssl_ciphers or ssl_ctx:
-        if ssl_ctx is None:
-            ssl_context = urllib3.connection.create_urllib3_context(
-                options=ssl_options or None, ciphers=ssl_ciphers
-            )
-            if not requests.__version__ < "2.32":
-                # https://github.com/psf/requests/pull/6731
-                ssl_context.load_verify_locations(requests.certs.where())
-        else:
-            ssl_ctx_orig = urllib3.util.ssl_.SSLContext
-            try:
-                urllib3.util.ssl_.SSLContext = ssl_ctx
-                ssl_context = urllib3.connection.create_urllib3_context(
-                    options=ssl_options or None, ciphers=ssl_ciphers
-                )
-            finally:
-                urllib3.util.ssl_.SSLContext = ssl_ctx_orig
+        ssl_context = _build_ssl_context(ssl_options, ssl_ciphers, ssl_ctx)
         ssl_context.check_hostname = False
     else:
         ssl_context = None
 
-    adapter = CACHE_ADAPTERS[key] = RequestsAdapter(ssl_context, source_address)
+    adapter = CACHE_ADAPTERS[key] = RequestsAdapter(
+        ssl_context, source_address, *pool_size
+    )
+    return adapter
+
+
+def _build_http2_adapter(
+    ssl_options, ssl_ciphers, ssl_ctx, source_address, pool_size=(10, 10)
+):
+
+    key = ("http2", ssl_options, ssl_ciphers, ssl_ctx, source_address, pool_size)
+    try:
+        return CACHE_ADAPTERS[key]
+    except KeyError:
+        pass
+
+    from ..http2 import HTTP2Adapter
+
+    def ssl_context_factory():
+        ssl_context = _build_ssl_context(ssl_options, ssl_ciphers, ssl_ctx)
+        if ssl_ctx is None and requests.__version__ < "2.32":
+            ssl_context.load_verify_locations(requests.certs.where())
+        return ssl_context
+
+    adapter = CACHE_ADAPTERS[key] = HTTP2Adapter(
+        ssl_context_factory, source_address, *pool_size
+    )
     return adapter
 
 
+def _build_ssl_context(ssl_options, ssl_ciphers, ssl_ctx):
+    if ssl_ctx is None:
+        ssl_context = urllib3.connection.create_urllib3_context(
+            options=ssl_options or None, ciphers=ssl_ciphers
+        )
+        if not requests.__version__ < "2.32":
+            # https://github.com/psf/requests/pull/6731
+            ssl_context.load_verify_locations(requests.certs.where())
+    else:
+        ssl_ctx_orig = urllib3.util.ssl_.SSLContext
+        try:
+            urllib3.util.ssl_.SSLContext = ssl_ctx
+            ssl_context = urllib3.connection.create_urllib3_context(
+                options=ssl_options or None, ciphers=ssl_ciphers
+            )
+        finally:
+            urllib3.util.ssl_.SSLContext = ssl_ctx_orig
+    return ssl_context
+
+
 @cache.cache(maxage=86400, keyarg=0)
 def _browser_useragent(browser):
     """Get User-Agent header from default browser"""
@@ -1140,6 +1290,52 @@ def _browser_useragent(browser):
 
 CACHE_ADAPTERS = {}
 CACHE_COOKIES = {}
+CACHE_COOKIES_TXT = {}
+_cookiestxt_lock = threading.Lock()
+
+
+def _cookiestxt_load(path):
+    """Return the cookies of a cookies.txt file and an index by domain
+
+    Files get parsed only once and again after their modification time
+    or size changed.
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    entry = CACHE_COOKIES_TXT.get(path)
+    if entry is not None and entry[0] == stamp:
+        return entry[1], entry[2], True
+
+    with open(path) as fp:
+        cookies = util.cookiestxt_load(fp)
+
+    return cookies, _cookiestxt_cache(path, cookies, stamp), False
+
+
+def _cookiestxt_cache(path, cookies, stamp=None):
+    """Store 'cookies' as current content of 'path' and return their index"""
+    if stamp is None:
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+    index = {}
+    for cookie in cookies:
+        key = _cookies_domain_key(cookie.domain)
+        try:
+            index[key].append(cookie)
+        except KeyError:
+            index[key] = [cookie]
+
+    CACHE_COOKIES_TXT[path] = (stamp, cookies, index)
+    return index
+
+
+def _cookies_domain_key(domain):
+    """Return the last two labels of 'domain'"""
+    return ".".join(domain.lstrip(".").rsplit(".", 2)[-2:]).lower()
+
+
 CATEGORY_MAP = ()
 
 
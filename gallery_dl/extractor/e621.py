@@ -18,6 +18,7 @@ class E621Extractor(danbooru.DanbooruExtractor):
     """Base class for e621 extractors"""
 
     basecategory = "E621"
+    digest_fmt = "md5:{file[md5]}"
     page_limit = 750
     page_start = None
     per_page = 320
@@ -27,6 +27,7 @@ class KemonoExtractor(Extractor):
     directory_fmt = ("{category}", "{service}", "{user}")
     filename_fmt = "{id}_{title[:180]}_{num:>02}_{filename[:180]}.{extension}"
     archive_fmt = "{service}_{user}_{id}_{num}"
+    digest_fmt = "sha256:{hash}"
     cookies_domain = ".kemono.cr"
 
     def __init__(self, match):
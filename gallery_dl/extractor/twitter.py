@@ -12,7 +12,9 @@ from .common import Extractor, Message, Dispatch
 from .. import text, util, exception
 from ..cache import cache, memcache
 import itertools
+import threading
 import random
+import time
 
 BASE_PATTERN = (
     r"(?:https?://)?(?:www\.|mobile\.)?" r"(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\.com"
@@ -31,6 +33,7 @@ class TwitterExtractor(Extractor):
     cookies_names = ("auth_token",)
     root = "https://x.com"
     browser = "firefox"
+    incremental = False
 
     def __init__(self, match):
         Extractor.__init__(self, match)
@@ -55,6 +58,9 @@ class TwitterExtractor(Extractor):
             )
 
         self._cursor = None
+        self._sync_cursor = None
+        if self.incremental:
+            self.incremental = self.config("incremental", False)
         self._user = None
         self._user_obj = None
         self._user_cache = {}
@@ -83,6 +89,8 @@ class TwitterExtractor(Extractor):
             ).findall
 
         tweets = self.tweets()
+        if self.incremental:
+            tweets = self._sync_tweets(tweets)
         if self.config("expand"):
             tweets = self._expand_tweets(tweets)
         for tweet in tweets:
@@ -643,12 +651,75 @@ class TwitterExtractor(Extractor):
             self._update_cursor = util.identity
         elif isinstance(cursor, str):
             return cursor
+        else:
+            return self._sync_cursor
 
     def _update_cursor(self, cursor):
         self.log.debug("Cursor: %s", cursor)
         self._cursor = cursor
         return cursor
 
+    def _sync_tweets(self, tweets):
+        """Stop at the newest Tweet of the previous run and save progress
+
+        The sync state of each (user, timeline) pair is stored in the cache
+        database as a dict with the following entries:
+
+        - 'newest': sort index of the newest Tweet of the last completed run
+        - 'top'   : sort index of the newest Tweet of the current run
+        - 'cursor': position to resume an interrupted run from
+
+        Runs stopped on purpose count as completed.
+        """
+        user_id = self.api._user_id_by_screen_name(self.user)
+        key = (user_id, self.subcategory)
+        state = _sync_state(key) or {}
+        newest = state.get("newest")
+        top = state.get("top")
+
+        if (cursor := state.get("cursor")) and self.config("cursor", True) is True:
+            self.log.info("Resuming from cursor %s", cursor)
+            self._sync_cursor = cursor
+
+        cursor = self._cursor
+        try:
+            for tweet in tweets:
+                if "_pinned" not in tweet and "quoted_by_id_str" not in (
+                    tweet.get("legacy") or tweet
+                ):
+                    index = _sort_index(tweet)
+                    if newest is not None and index <= newest:
+                        self.log.info(
+                            "Reached previously synced Tweet %s", tweet.get("rest_id")
+                        )
+                        break
+                    if top is None:
+                        top = index
+
+                yield tweet
+
+                if self._cursor != cursor:
+                    cursor = self._cursor
+                    _sync_state.update(
+                        key, {"newest": newest, "top": top, "cursor": cursor}
+                    )
+        except (GeneratorExit, exception.StopExtraction, exception.TerminateExtraction):
+            # stopped on purpose ('--range', 'skip: abort', etc)
+            _sync_state.update(
+                key, {"newest": top or newest, "top": None, "cursor": None}
+            )
+            raise
+        except BaseException:
+            # save the position reached when interrupted by an error
+            if self._cursor != cursor:
+                _sync_state.update(
+                    key, {"newest": newest, "top": top, "cursor": self._cursor}
+                )
+            raise
+
+        self._cursor = None
+        _sync_state.update(key, {"newest": top or newest, "top": None, "cursor": None})
+
     def metadata(self):
         """Return general metadata"""
         return {}
@@ -769,6 +840,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
     subcategory = "timeline"
     pattern = rf"{USER_PATTERN}/timeline(?!\w)"
     example = "https://x.com/USER/timeline"
+    incremental = True
 
     def _init_cursor(self):
         if self._cursor:
@@ -792,7 +864,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
         elif isinstance(cursor, str):
             self._cursor = cursor
         else:
-            cursor = None
+            cursor = self._cursor = self._sync_cursor
 
         if cursor:
             state = cursor.partition("/")[0]
@@ -911,6 +983,7 @@ class TwitterLikesExtractor(TwitterExtractor):
     subcategory = "likes"
     pattern = rf"{USER_PATTERN}/likes(?!\w)"
     example = "https://x.com/USER/likes"
+    incremental = True
 
     def metadata(self):
         return {"user_likes": self.user}
@@ -1212,6 +1285,10 @@ class TwitterImageExtractor(Extractor):
 
 class TwitterAPI:
     client_transaction = None
+    client_transaction_refresh = 0
+    client_transaction_expires = 0
+    client_transaction_lock = threading.Lock()
+    client_transaction_csrf = None
 
     def __init__(self, extractor):
         self.extractor = extractor
@@ -1739,32 +1816,64 @@ class TwitterAPI:
                 "gt", guest_token, domain=self.extractor.cookies_domain
             )
 
-    @cache(maxage=10800)
-    def _client_transaction(self):
-        self.log.info("Initializing client transaction keys")
-
-        from .. import transaction_id
-
-        ct = transaction_id.ClientTransaction()
-        ct.initialize(self.extractor)
-
-        # update 'x-csrf-token' header (#7467)
-        csrf_token = self.extractor.cookies.get(
-            "ct0", domain=self.extractor.cookies_domain
-        )
-        if csrf_token:
+    def _transaction_id(self, url, method="GET"):
+        now = time.time()
+        if now >= self.client_transaction_expires:
+            with self.client_transaction_lock:
+                if time.time() >= self.client_transaction_expires:
+                    self._client_transaction_update()
+        elif (
+            now >= self.client_transaction_refresh
+            and self.client_transaction_lock.acquire(False)
+        ):
+            # replace keys before they expire without blocking API calls
+            threading.Thread(
+                target=self._client_transaction_refresh, daemon=True
+            ).start()
+
+        if csrf_token := self.client_transaction_csrf:
+            # apply the token set while refreshing keys
+            self.client_transaction_csrf = None
             self.headers["x-csrf-token"] = csrf_token
 
-        return ct
-
-    def _transaction_id(self, url, method="GET"):
-        if self.client_transaction is None:
-            TwitterAPI.client_transaction = self._client_transaction()
         path = url[url.find("/", 8) :]
         self.headers["x-client-transaction-id"] = (
             self.client_transaction.generate_transaction_id(method, path)
         )
 
+    def _client_transaction_update(self):
+        self._client_transaction_set(*_client_transaction.lookup((self,)))
+
+    def _client_transaction_set(self, ct, expires):
+        TwitterAPI.client_transaction = ct
+        TwitterAPI.client_transaction_expires = expires
+        TwitterAPI.client_transaction_refresh = expires - 1800
+
+    def _client_transaction_refresh(self):
+        try:
+            ctcache = _client_transaction
+            result = ctcache.db.get(ctcache.key + "-")
+            if result and result[1] > time.time() + 1800:
+                # adopt keys stored by another process
+                ctcache.cache[""] = result
+                return self._client_transaction_set(*result)
+
+            # fetch new keys without holding the cache database lock
+            # and without modifying 'self.headers' from this thread
+            headers = {}
+            ct = ctcache.func(self, headers)
+            self._client_transaction_set(ct, ctcache.update("", ct))
+            self.client_transaction_csrf = headers.get("x-csrf-token")
+        except Exception as exc:
+            self.log.warning(
+                "Failed to refresh client transaction keys (%s: %s)",
+                exc.__class__.__name__,
+                exc,
+            )
+            TwitterAPI.client_transaction_refresh = time.time() + 300
+        finally:
+            self.client_transaction_lock.release()
+
     def _call(self, endpoint, params, method="GET", auth=True, root=None):
         url = (root or self.root) + endpoint
 
@@ -2050,6 +2159,8 @@ class TwitterAPI:
                     tweets.append(pinned_tweet)
                 elif instructions[-1]["type"] == "TimelinePinEntry":
                     tweets.append(instructions[-1]["entry"])
+                if tweets:
+                    tweets[0]["_pinned"] = True
                 pinned_tweet = False
 
             for entry in entries:
@@ -2105,6 +2216,8 @@ class TwitterAPI:
                         tweet = tweet["tweet"]
                     legacy = tweet["legacy"]
                     tweet["sortIndex"] = entry.get("sortIndex")
+                    if "_pinned" in entry:
+                        tweet["_pinned"] = True
                 except KeyError:
                     extr.log.debug(
                         "Skipping %s (deleted)",
@@ -2292,6 +2405,37 @@ class TwitterAPI:
         return variables
 
 
+def _sort_index(tweet):
+    """Return the position of 'tweet' in its timeline as integer"""
+    return int(
+        tweet.get("sortIndex") or tweet.get("_retweet_id_str") or tweet["rest_id"]
+    )
+
+
+@cache(maxage=365 * 86400, keyarg=0)
+def _sync_state(key):
+    return None
+
+
+@cache(maxage=10800)
+def _client_transaction(api, headers=None):
+    api.log.info("Initializing client transaction keys")
+
+    from .. import transaction_id
+
+    ct = transaction_id.ClientTransaction()
+    ct.initialize(api.extractor)
+
+    # update 'x-csrf-token' header (#7467)
+    csrf_token = api.extractor.cookies.get("ct0", domain=api.extractor.cookies_domain)
+    if csrf_token:
+        if headers is None:
+            headers = api.headers
+        headers["x-csrf-token"] = csrf_token
+
+    return ct
+
+
 @cache(maxage=365 * 86400, keyarg=1)
 def _login_impl(extr, username, password):
 
@@ -13,6 +13,7 @@ import sys
 import time
 import string
 import _string
+import keyword
 import datetime
 import operator
 from . import text, util
@@ -205,6 +206,239 @@ class StringFormatter:
             return lambda obj: fmt(conversion(obj))
 
 
+class CompiledFormatter:
+    """Compile a format string into a single Python function
+
+    Supports the same syntax and produces the same results as
+    StringFormatter, but inlines field access and most conversions
+    and format specifiers instead of calling a chain of closures.
+    """
+
+    def __init__(self, format_string, default=NONE, fmt=format):
+        self.format_map = _Compiler(default, fmt).compile(format_string)
+
+
+class _Compiler:
+    """Generate the source code of a CompiledFormatter's format_map"""
+
+    def __init__(self, default, fmt):
+        self.format = fmt
+        self.namespace = {"_default": default}
+        self.fmt = "format" if fmt is format else self.const(fmt)
+        self.lines = []
+        self.temps = 0
+
+    def compile(self, format_string):
+        template = []
+        parts = []
+        strings = True
+        fields = 0
+
+        for literal_text, field_name, format_spec, conv in _string.formatter_parser(
+            format_string
+        ):
+            if literal_text:
+                template.append(literal_text.replace("{", "{{").replace("}", "}}"))
+                parts.append(repr(literal_text))
+            if field_name:
+                fields += 1
+                value = self.field_access(field_name)
+                var = self.temp()
+                template.append(f"{{{var}}}")
+
+                if format_spec or conv or self.fmt != "format":
+                    expr, is_str = self.field_format(format_spec, conv, value)
+                    strings = strings and is_str
+                    parts.append(var)
+                else:
+                    # let the f-string call format()
+                    expr = value
+                    parts.append(f"format({var})")
+                self.lines.append(f"    {var} = {expr}")
+
+        if len(parts) == 1 and not fields:
+            result = repr(format_string)
+        elif strings:
+            result = "f" + repr("".join(template))
+        elif len(parts) == 1:
+            result = parts[0]
+        else:
+            # concatenate instead of using an f-string
+            # to raise the same TypeError for non-string values
+            result = " + ".join(parts)
+
+        self.lines.append(f"    return {result}")
+        source = "def format_map(kwdict):\n" + "\n".join(self.lines)
+        exec(compile(source, "<format string>", "exec"), self.namespace)
+        return self.namespace["format_map"]
+
+    def const(self, value):
+        """Return a name referring to 'value' inside the generated code"""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def temp(self):
+        """Return the name of a new local variable"""
+        self.temps += 1
+        return f"_t{self.temps}"
+
+    def field_access(self, field_name):
+        """Return an expression evaluating to the value of 'field_name'"""
+        lines = self.lines
+        var = self.temp()
+
+        if "|" in field_name:
+            lines.append("    while True:")
+            for name in field_name.split("|"):
+                lines.append("        try:")
+                lines.append(f"            {var} = {self.field_expr(name)}")
+                lines.append(f"            if {var}:")
+                lines.append("                break")
+                lines.append("        except Exception:")
+                lines.append(f"            {var} = None")
+            lines.append(f"        if {var} is None:")
+            lines.append(f"            {var} = _default")
+            lines.append("        break")
+            return var
+
+        if field_name[0] != "'":
+            key, rest = _string.formatter_field_name_split(field_name)
+            if key not in _GLOBALS and next(rest, None) is None:
+                key = repr(key)
+                return f"(kwdict[{key}] if {key} in kwdict else _default)"
+
+        lines.append("    try:")
+        lines.append(f"        {var} = {self.field_expr(field_name)}")
+        lines.append("    except Exception:")
+        lines.append(f"        {var} = _default")
+        return var
+
+    def field_expr(self, field_name):
+        """Return an expression accessing 'field_name' in 'kwdict'"""
+        if field_name[0] == "'":
+            return repr(field_name[1:-1])
+
+        first, rest = _string.formatter_field_name_split(field_name)
+        if first in _GLOBALS:
+            expr = f"{self.const(_GLOBALS[first])}()"
+        else:
+            expr = f"kwdict[{first!r}]"
+
+        for is_attr, key in rest:
+            if is_attr:
+                if key.isidentifier() and not keyword.iskeyword(key):
+                    expr = f"{expr}.{key}"
+                else:
+                    expr = f"getattr({expr}, {key!r})"
+            elif isinstance(key, int):
+                expr = f"{expr}[{key}]"
+            elif ":" in key:
+                if key[0] == "b":
+                    func = _bytesgetter(_slice(key[1:]))
+                    expr = f"{self.const(func)}({expr})"
+                else:
+                    expr = f"{expr}[{_slice_expr(_slice(key))}]"
+            elif key[0] == "-":
+                expr = f"{expr}[{int(key)}]"
+            else:
+                key = key.strip("\"'")
+                expr = f"{expr}[{key!r}]"
+
+        return expr
+
+    def field_format(self, format_spec, conversion, value):
+        """Return an expression applying a replacement field's format"""
+        if conversion:
+            value = f"{self.const(_CONVERSIONS[conversion])}({value})"
+            if not format_spec:
+                return value, False
+        return self.format_spec(format_spec, value)
+
+    def format_spec(self, format_spec, value):
+        """Return an expression formatting 'value' according to 'format_spec'
+
+        Returns a tuple of this expression and a flag
+        indicating whether it always evaluates to a string.
+        """
+        if not format_spec:
+            return f"{self.fmt}({value})", self.fmt == "format"
+
+        spec = format_spec[0]
+        if spec in _COMPILERS:
+            return _COMPILERS[spec](self, format_spec, value)
+        if spec in _FORMAT_SPECIFIERS:
+            func = _FORMAT_SPECIFIERS[spec](format_spec, self.format)
+            return f"{self.const(func)}({value})", False
+        return f"format({value}, {format_spec!r})", True
+
+    def _optional(self, format_spec, value):
+        before, after, format_spec = format_spec.split(_SEPARATOR, 2)
+        before = before[1:]
+        var = self.temp()
+
+        expr, is_str = self.format_spec(format_spec, var)
+        if not is_str:
+            expr = f"format({expr})"
+        if before:
+            expr = f"{before!r} + {expr}"
+        if after:
+            expr = f"{expr} + {after!r}"
+        return f"({expr} if ({var} := {value}) else '')", True
+
+    def _slice(self, format_spec, value):
+        indices, _, format_spec = format_spec.partition("]")
+        if indices[1] == "b":
+            func = _bytesgetter(_slice(indices[2:]))
+            value = f"{self.const(func)}({value})"
+        else:
+            value = f"{value}[{_slice_expr(_slice(indices[1:]))}]"
+        return self.format_spec(format_spec, value)
+
+    def _arithmetic(self, format_spec, value):
+        op, _, format_spec = format_spec.partition(_SEPARATOR)
+        number = int(op[2:])
+        op = op[1]
+        if op in "+-*":
+            value = f"({value} {op} {number})"
+        return self.format_spec(format_spec, value)
+
+    def _conversion(self, format_spec, value):
+        conversions, _, format_spec = format_spec.partition(_SEPARATOR)
+        if len(conversions) <= 2:
+            conversions = conversions[1]
+        else:
+            conversions = conversions[1:]
+        for conv in conversions:
+            value = f"{self.const(_CONVERSIONS[conv])}({value})"
+        return self.format_spec(format_spec, value)
+
+    def _join(self, format_spec, value):
+        separator, _, format_spec = format_spec.partition(_SEPARATOR)
+        var = self.temp()
+        value = (
+            f"({var} if isinstance(({var} := {value}), str) "
+            f"else {separator[1:]!r}.join({var}))"
+        )
+        return self.format_spec(format_spec, value)
+
+    def _maxlen(self, format_spec, value):
+        maxlen, replacement, format_spec = format_spec.split(_SEPARATOR, 2)
+        maxlen = text.parse_int(maxlen[1:])
+        var = self.temp()
+
+        expr, is_str = self.format_spec(format_spec, value)
+        return (
+            f"({var} if len(({var} := {expr})) <= {maxlen} else {replacement!r})",
+            is_str,
+        )
+
+    def _replace(self, format_spec, value):
+        old, new, format_spec = format_spec.split(_SEPARATOR, 2)
+        value = f"{value}.replace({old[1:]!r}, {new!r})"
+        return self.format_spec(format_spec, value)
+
+
 class ExpressionFormatter:
     """Generate text by evaluating a Python expression"""
 
@@ -329,6 +563,13 @@ def _slice(indices):
     )
 
 
+def _slice_expr(slice):
+    return ":".join(
+        "" if index is None else str(index)
+        for index in (slice.start, slice.stop, slice.step)
+    )
+
+
 def _bytesgetter(slice, encoding=sys.getfilesystemencoding()):
 
     def apply_slice_bytes(obj):
@@ -558,6 +799,7 @@ _literal = Literal()
 _CACHE = {}
 _SEPARATOR = "/"
 _FORMATTERS = {
+    "C": CompiledFormatter,
     "E": ExpressionFormatter,
     "F": FStringFormatter,
     "J": JinjaFormatter,
@@ -613,3 +855,12 @@ _FORMAT_SPECIFIERS = {
     "S": _parse_sort,
     "X": _parse_limit,
 }
+_COMPILERS = {
+    "?": _Compiler._optional,
+    "[": _Compiler._slice,
+    "A": _Compiler._arithmetic,
+    "C": _Compiler._conversion,
+    "J": _Compiler._join,
+    "L": _Compiler._maxlen,
+    "R": _Compiler._replace,
+}
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""HTTP/2 transport adapter for requests sessions based on httpx"""
+
+import os
+import ssl
+import threading
+import http.client
+import httpx
+import h2  # noqa F401
+from requests import exceptions
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from requests.models import Response
+
+# connection-specific headers not allowed in HTTP/2 requests
+# https://www.rfc-editor.org/rfc/rfc9113#section-8.2.2
+CONNECTION_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+class HTTP2Adapter(BaseAdapter):
+    """Send requests over multiplexed HTTP/2 connections
+
+    'ssl_context_factory' returns a new SSLContext with the same
+    options and ciphers a RequestsAdapter would use.
+    """
+
+    def __init__(
+        self,
+        ssl_context_factory,
+        source_address=None,
+        pool_connections=10,
+        pool_maxsize=10,
+    ):
+        BaseAdapter.__init__(self)
+        self.ssl_context_factory = ssl_context_factory
+        self.local_address = source_address[0] if source_address else None
+        self.limits = httpx.Limits(
+            max_connections=pool_maxsize * pool_connections,
+            max_keepalive_connections=pool_maxsize,
+        )
+        self.transports = {}
+        self.lock = threading.Lock()
+        self.streams = set()
+        self.num_requests = 0
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        transport = self.transport_for(verify, cert, select_proxy(request.url, proxies))
+
+        headers = [
+            (key, value)
+            for key, value in request.headers.items()
+            if key.lower() not in CONNECTION_HEADERS
+        ]
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = {"connect": connect, "read": read, "write": read, "pool": read}
+        else:
+            timeout = dict.fromkeys(("connect", "read", "write", "pool"), timeout)
+
+        req = httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=request.body,
+            extensions={"timeout": timeout},
+        )
+
+        try:
+            resp = transport.handle_request(req)
+        except httpx.ConnectTimeout as exc:
+            raise exceptions.ConnectTimeout(exc, request=request)
+        except httpx.TimeoutException as exc:
+            raise exceptions.ReadTimeout(exc, request=request)
+        except httpx.ProxyError as exc:
+            raise exceptions.ProxyError(exc, request=request)
+        except httpx.TransportError as exc:
+            raise exceptions.ConnectionError(exc, request=request)
+
+        if network_stream := resp.extensions.get("network_stream"):
+            with self.lock:
+                self.num_requests += 1
+                self.streams.add(id(network_stream))
+
+        response = self.build_response(request, resp)
+        if not stream:
+            response.content
+        return response
+
+    def build_response(self, request, resp):
+        """Build a requests.Response from an httpx.Response"""
+        response = Response()
+        response.status_code = resp.status_code
+        response.reason = resp.reason_phrase
+        response.headers = headers = CaseInsensitiveDict()
+        for key, value in resp.headers.multi_items():
+            if key in headers:
+                headers[key] = f"{headers[key]}, {value}"
+            else:
+                headers[key] = value
+        response.encoding = get_encoding_from_headers(headers)
+        response.raw = raw = HTTP2Response(resp, request)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        extract_cookies_to_jar(response.cookies, request, raw)
+        return response
+
+    def transport_for(self, verify, cert, proxy):
+        """Return a transport for 'verify', 'cert', and 'proxy'
+
+        'cert' is the path of a client certificate file
+        or a (certificate, key) tuple like for requests.
+        """
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        key = (verify, cert, proxy)
+        try:
+            return self.transports[key]
+        except KeyError:
+            pass
+
+        with self.lock:
+            if key in self.transports:
+                return self.transports[key]
+
+            ssl_context = self.ssl_context_factory()
+            if verify:
+                ssl_context.verify_mode = ssl.CERT_REQUIRED
+                ssl_context.check_hostname = True
+                if isinstance(verify, str):
+                    if os.path.isdir(verify):
+                        ssl_context.load_verify_locations(capath=verify)
+                    else:
+                        ssl_context.load_verify_locations(cafile=verify)
+            else:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            if cert:
+                if isinstance(cert, str):
+                    ssl_context.load_cert_chain(cert)
+                else:
+                    ssl_context.load_cert_chain(*cert)
+
+            transport = self.transports[key] = httpx.HTTPTransport(
+                verify=ssl_context,
+                http2=True,
+                limits=self.limits,
+                proxy=proxy,
+                local_address=self.local_address,
+            )
+            return transport
+
+    def connection_stats(self):
+        """Return the number of opened and reused connections"""
+        opened = len(self.streams)
+        return opened, self.num_requests - opened
+
+    def close(self):
+        with self.lock:
+            for transport in self.transports.values():
+                transport.close()
+            self.transports.clear()
+
+
+class HTTP2Response:
+    """File-like view of an httpx.Response body for requests.Response.raw"""
+
+    chunked = False
+
+    def __init__(self, response, request):
+        self.response = response
+        self.status = response.status_code
+        self.version = 20 if response.http_version == "HTTP/2" else 11
+        self.buffer = b""
+        self.content = response.iter_bytes()
+        self.request = request
+
+        # used by 'extract_cookies_to_jar()'
+        msg = http.client.HTTPMessage()
+        for key, value in response.headers.multi_items():
+            msg[key] = value
+        self._original_response = _OriginalResponse(msg)
+
+    def read(self, amt=None, decode_content=True):
+        """Read up to 'amt' bytes of decoded content"""
+        buffer = self.buffer
+        try:
+            while amt is None or len(buffer) < amt:
+                data = next(self.content, None)
+                if data is None:
+                    break
+                buffer += data
+        except httpx.TimeoutException as exc:
+            raise exceptions.ConnectionError(exc, request=self.request)
+        except (httpx.TransportError, httpx.DecodingError) as exc:
+            raise exceptions.ChunkedEncodingError(exc, request=self.request)
+
+        if amt is None:
+            self.buffer = b""
+            return buffer
+        self.buffer = buffer[amt:]
+        return buffer[:amt]
+
+    def stream(self, amt=65536, decode_content=True):
+        while data := self.read(amt):
+            yield data
+
+    def close(self):
+        self.response.close()
+
+    def release_conn(self):
+        self.response.close()
+
+
+class _OriginalResponse:
+    __slots__ = ("msg",)
+
+    def __init__(self, msg):
+        self.msg = msg
@@ -6,9 +6,13 @@
 # it under the terms of the GNU General Public License version 2 as
 # published by the Free Software Foundation.
 
+import os
 import sys
+import copy
+import queue
 import errno
 import logging
+import threading
 import functools
 import collections
 
@@ -27,6 +31,7 @@ from . import (
     version,
 )
 from .extractor.message import Message
+from .extractor.common import AsynchronousMixin
 
 stdout_write = output.stdout_write
 FLAGS = util.FLAGS
@@ -148,9 +153,11 @@ class Job:
         if sleep:
             extractor.sleep(sleep(), "extractor")
 
+        messages = self.messages()
         try:
-            for msg in extractor:
+            for msg in messages:
                 self.dispatch(msg)
+            self.handle_end()
         except exception.StopExtraction as exc:
             if exc.depth > 1 and exc.target != extractor.__class__.subcategory:
                 exc.depth -= 1
@@ -194,6 +201,8 @@ class Job:
             if msg is None:
                 log.info("No results for %s", extractor.url)
         finally:
+            if messages is not extractor:
+                messages.close()
             self.handle_finalize()
             extractor.finalize()
 
@@ -201,6 +210,60 @@ class Job:
             self.status |= s
         return self.status
 
+    def messages(self):
+        """Return an iterator over all extractor messages"""
+        extr = self.extractor
+        if (size := extr.config("prefetch")) and not isinstance(
+            extr, AsynchronousMixin
+        ):
+            return self._prefetch_messages(extr, size)
+        return extr
+
+    def _prefetch_messages(self, messages, size):
+        """Collect up to 'size' messages in a separate thread"""
+        results = queue.Queue(size)
+        stop = threading.Event()
+
+        def produce():
+            items = None
+            try:
+                items = iter(messages)
+                for msg in items:
+                    if stop.is_set():
+                        break
+                    # extractors may reuse and modify
+                    # the same kwdict for their next result
+                    results.put(msg[:-1] + (msg[-1].copy(),))
+                    if stop.is_set():
+                        break
+                else:
+                    results.put(None)
+            except BaseException as exc:
+                results.put(exc)
+            finally:
+                if stop.is_set() and hasattr(items, "close"):
+                    items.close()
+
+        thread = threading.Thread(target=output.buffer_wrap(produce), daemon=True)
+        thread.start()
+        try:
+            while True:
+                msg = results.get()
+                if msg is None:
+                    break
+                if isinstance(msg, BaseException):
+                    raise msg
+                yield msg
+        finally:
+            if thread.is_alive():
+                # let the producer thread stop at its next result
+                stop.set()
+                try:
+                    while True:
+                        results.get_nowait()
+                except queue.Empty:
+                    pass
+
     def dispatch(self, msg):
         """Call the appropriate message handler"""
         if msg[0] == Message.Url:
@@ -236,6 +299,9 @@ class Job:
     def handle_queue(self, url, kwdict):
         """Handle Message.Queue"""
 
+    def handle_end(self):
+        """Handle the end of extractor results"""
+
     def handle_finalize(self):
         """Handle job finalization"""
 
@@ -307,11 +373,20 @@ class DownloadJob(Job):
         self.sleep = None
         self.hooks = ()
         self.downloaders = {}
+        self.pool = None
+        self.pp_pool = None
         self.out = output.select()
         self.visited = parent.visited if parent else set()
         self._extractor_filter = None
         self._skipcnt = 0
 
+    def messages(self):
+        messages = Job.messages(self)
+        extr = self.extractor
+        if (size := extr.config("archive-prefetch")) and extr.config("archive"):
+            return self._prefetch_archive(messages, size)
+        return messages
+
     def handle_url(self, url, kwdict):
         """Download the resource specified in 'url'"""
         hooks = self.hooks
@@ -333,6 +408,9 @@ class DownloadJob(Job):
         if pathfmt.extension and not self.metadata_http:
             pathfmt.build_path()
 
+            if self.pool is not None:
+                # wait for an earlier download to the same file
+                self.pool.wait_path(pathfmt.realpath)
             if pathfmt.exists():
                 if archive and self._archive_write_skip:
                     archive.add(kwdict)
@@ -343,7 +421,8 @@ class DownloadJob(Job):
             for callback in hooks["prepare-after"]:
                 callback(pathfmt)
 
-            if kwdict.pop("_file_recheck", False) and pathfmt.exists():
+            recheck = kwdict.pop("_file_recheck", False)
+            if kwdict.pop("_file_skip", False) or recheck and pathfmt.exists():
                 if archive and self._archive_write_skip:
                     archive.add(kwdict)
                 self.handle_skip()
@@ -352,6 +431,11 @@ class DownloadJob(Job):
         if self.sleep:
             self.extractor.sleep(self.sleep(), "download")
 
+        if self.pool is not None:
+            # transfer file on a worker thread
+            self.pool.submit(url, kwdict, pathfmt)
+            return
+
         # download from URL
         if not self.download(url):
 
@@ -363,18 +447,20 @@ class DownloadJob(Job):
                 if self.download(url):
                     break
             else:
-                # download failed
-                self.status |= 4
-                self.log.error("Failed to download %s", pathfmt.filename or url)
-                if "error" in hooks:
-                    for callback in hooks["error"]:
-                        callback(pathfmt)
+                self.handle_error(url, pathfmt)
                 return
 
+        self.handle_download(kwdict, pathfmt)
+
+    def handle_download(self, kwdict, pathfmt):
+        """Finish a completed download"""
+        hooks = self.hooks
+        archive = self.archive
+
         if not pathfmt.temppath:
             if archive and self._archive_write_skip:
                 archive.add(kwdict)
-            self.handle_skip()
+            self.handle_skip(pathfmt)
             return
 
         # run post processors
@@ -392,11 +478,21 @@ class DownloadJob(Job):
             for callback in hooks["after"]:
                 callback(pathfmt)
 
+    def handle_error(self, url, pathfmt):
+        """Handle a failed download"""
+        self.status |= 4
+        self.log.error("Failed to download %s", pathfmt.filename or url)
+        if "error" in self.hooks:
+            for callback in self.hooks["error"]:
+                callback(pathfmt)
+
     def handle_directory(self, kwdict):
         """Set and create the target directory for downloads"""
         if not self.pathfmt:
             self.initialize(kwdict)
         else:
+            if self.pool is not None:
+                self.pool.wait()
             if "post-after" in self.hooks:
                 for callback in self.hooks["post-after"]:
                     callback(self.pathfmt)
@@ -479,7 +575,16 @@ class DownloadJob(Job):
         else:
             self._write_unsupported(url)
 
+    def handle_end(self):
+        if self.pool is not None:
+            self.pool.wait()
+
     def handle_finalize(self):
+        if self.pool is not None:
+            self.pool.close()
+        if self.pp_pool is not None:
+            self.pp_pool.wait()
+
         if self.archive:
             if not self.status:
                 self.archive.finalize()
@@ -496,6 +601,8 @@ class DownloadJob(Job):
             if "finalize" in hooks:
                 for callback in hooks["finalize"]:
                     callback(pathfmt)
+            if self.pp_pool is not None:
+                self.pp_pool.close()
             if self.status:
                 if "finalize-error" in hooks:
                     for callback in hooks["finalize-error"]:
@@ -505,8 +612,106 @@ class DownloadJob(Job):
                     for callback in hooks["finalize-success"]:
                         callback(pathfmt)
 
-    def handle_skip(self):
-        pathfmt = self.pathfmt
+    def _prefetch_archive(self, messages, size):
+        """Look up archive IDs of up to 'size' consecutive files at once"""
+        buffer = []
+        messages = iter(messages)
+
+        while True:
+            try:
+                msg = next(messages)
+            except StopIteration:
+                break
+            except Exception:
+                # handle all files received before the error
+                if buffer:
+                    self._prefetch_archive_ids(buffer)
+                    yield from buffer
+                raise
+
+            if msg[0] == Message.Url:
+                # extractors may reuse and modify
+                # the same kwdict for their next result
+                buffer.append((msg[0], msg[1], msg[2].copy()))
+                if len(buffer) < size:
+                    continue
+                if self._prefetch_archive_ids(buffer):
+                    raise self._skipexc
+                yield from buffer
+                buffer = []
+            else:
+                if buffer:
+                    if self._prefetch_archive_ids(buffer):
+                        raise self._skipexc
+                    yield from buffer
+                    buffer = []
+                yield msg
+
+        if buffer:
+            if self._prefetch_archive_ids(buffer):
+                raise self._skipexc
+            yield from buffer
+
+    def _prefetch_archive_ids(self, messages):
+        """Prefetch archive IDs of 'messages'
+
+        Return True if skipping all of them would reach the 'abort:N' limit.
+        """
+        if not (archive := self.archive):
+            return False
+
+        # build archive IDs from copies of each kwdict
+        # with the same metadata 'handle_url()' will see
+        kwdicts = []
+        metadata_url = self.metadata_url
+        extension_map = self.pathfmt.extension_map
+        for _, url, kwdict in messages:
+            kwdict = kwdict.copy()
+            if metadata_url:
+                kwdict[metadata_url] = url
+            self.update_kwdict(kwdict)
+            ext = kwdict.get("extension")
+            kwdict["extension"] = extension_map(ext, ext)
+            kwdicts.append(kwdict)
+
+        try:
+            archived = archive.prefetch(kwdicts)
+        except Exception as exc:
+            self.log.debug(
+                "Failed to prefetch archive IDs (%s: %s)",
+                exc.__class__.__name__,
+                exc,
+            )
+            return False
+
+        # stop without handling each file when all of them are archived
+        # and nothing else could change how their skips get counted
+        if (
+            not archived
+            or not self._skipexc
+            or self._skipftr
+            or self.pred_url is not util.true
+            or "prepare" in self.hooks
+            or "skip" in self.hooks
+        ):
+            return False
+        if self.pool is not None and self.pool.pending:
+            # successful downloads still in progress reset the skip count
+            skipcnt = len(kwdicts)
+        else:
+            skipcnt = self._skipcnt + len(kwdicts)
+        if skipcnt < self._skipmax:
+            return False
+
+        self.log.debug("Skipping %s archived files", len(kwdicts))
+        return True
+
+    def handle_skip(self, pathfmt=None):
+        if pathfmt is None:
+            if self.pool is not None and self.pool.pending:
+                # handle after all previously submitted downloads
+                return self.pool.skip(self.pathfmt)
+            pathfmt = self.pathfmt
         if "skip" in self.hooks:
             for callback in self.hooks["skip"]:
                 callback(pathfmt)
@@ -520,9 +725,13 @@ class DownloadJob(Job):
 
     def download(self, url):
         """Download 'url'"""
-        if downloader := self.get_downloader(url[: url.find(":")]):
+        return self._download(url, self.pathfmt, self.downloaders)
+
+    def _download(self, url, pathfmt, downloaders):
+        """Download 'url' to 'pathfmt' using one of 'downloaders'"""
+        if downloader := self.get_downloader(url[: url.find(":")], downloaders):
             try:
-                return downloader.download(url, self.pathfmt)
+                return downloader.download(url, pathfmt)
             except OSError as exc:
                 if exc.errno == errno.ENOSPC:
                     raise
@@ -531,10 +740,12 @@ class DownloadJob(Job):
         self._write_unsupported(url)
         return False
 
-    def get_downloader(self, scheme):
+    def get_downloader(self, scheme, downloaders=None):
         """Return a downloader suitable for 'scheme'"""
+        if downloaders is None:
+            downloaders = self.downloaders
         try:
-            return self.downloaders[scheme]
+            return downloaders[scheme]
         except KeyError:
             pass
 
@@ -546,9 +757,9 @@ class DownloadJob(Job):
             self.log.error("'%s:' URLs are not supported/enabled", scheme)
 
         if cls and cls.scheme == "http":
-            self.downloaders["http"] = self.downloaders["https"] = instance
+            downloaders["http"] = downloaders["https"] = instance
         else:
-            self.downloaders[scheme] = instance
+            downloaders[scheme] = instance
         return instance
 
     def initialize(self, kwdict=None):
@@ -565,6 +776,9 @@ class DownloadJob(Job):
         if not cfg("download", True):
             # monkey-patch method to do nothing and always return True
             self.download = pathfmt.fix_extension
+        elif (workers := config.interpolate(("downloader",), "workers", 1)) > 1:
+            self.pool = DownloadPool(self, workers)
+            extr.log.debug("Using %s download workers", workers)
 
         if archive_path := cfg("archive"):
             archive_table = cfg("archive-table")
@@ -585,6 +799,9 @@ class DownloadJob(Job):
                     cfg("archive-mode"),
                     cfg("archive-pragma"),
                     kwdict,
+                    None,
+                    cfg("archive-batch-size"),
+                    cfg("archive-batch-interval"),
                 )
             except Exception as exc:
                 extr.log.warning(
@@ -630,6 +847,7 @@ class DownloadJob(Job):
             pathfmt.exists = lambda x=None: False
             if self.archive:
                 self.archive.check = pathfmt.exists
+                self.archive.prefetch = util.noop
 
         if not cfg("postprocess", True):
             return
@@ -710,22 +928,55 @@ class DownloadJob(Job):
                         callback(pathfmt)
 
     def register_hooks(self, hooks, options=None):
-        expr = options.get("filter") if options else None
+        if not options:
+            options = {}
 
-        if expr:
+        if expr := options.get("filter"):
             condition = util.compile_filter(expr)
-            for hook, callback in hooks.items():
-                self.hooks[hook].append(
-                    functools.partial(self._call_hook, callback, condition)
-                )
-        else:
-            for hook, callback in hooks.items():
-                self.hooks[hook].append(callback)
+            hooks = {
+                hook: functools.partial(self._call_hook, callback, condition)
+                for hook, callback in hooks.items()
+            }
+
+        if events := options.get("background"):
+            hooks = self._background_hooks(hooks, events, options)
+
+        for hook, callback in hooks.items():
+            self.hooks[hook].append(callback)
 
     def _call_hook(self, callback, condition, pathfmt):
         if condition(pathfmt.kwdict):
             callback(pathfmt)
 
+    def _background_hooks(self, hooks, events, options):
+        """Move 'hooks' callbacks for 'events' onto a PostProcessorPool"""
+        if events is True:
+            events = ("after",)
+        elif isinstance(events, str):
+            events = events.split(",")
+
+        pool = self.pp_pool
+        if pool is None:
+            workers = self.extractor.config("postprocessor-workers")
+            if not workers or workers < 1:
+                workers = os.cpu_count() or 1
+            pool = self.pp_pool = PostProcessorPool(self, workers)
+            self.extractor.log.debug("Using %s post processor workers", workers)
+
+        name = options.get("name") or "postprocessor"
+        slot = PostProcessorPool.Slot(name, options.get("background-limit", 1))
+        hooks = hooks.copy()
+        for event in events:
+            if event not in hooks:
+                continue
+            if event in ("init", "prepare", "prepare-after", "file"):
+                self.log.warning(
+                    "%s: '%s' hooks cannot run in the background", name, event
+                )
+                continue
+            hooks[event] = functools.partial(pool.submit, hooks[event], slot)
+        return hooks
+
     def _build_extractor_filter(self):
         clist = self.extractor.config("whitelist")
         if clist is not None:
@@ -741,6 +992,225 @@ class DownloadJob(Job):
         return util.build_extractor_filter(clist, negate, special)
 
 
+class DownloadPool:
+    """Transfer files on a bounded pool of worker threads
+
+    Files are prepared and submitted by the job's own thread. Downloads
+    run concurrently, each worker thread with its own set of downloader
+    instances, but post processor hooks, archive writes, and skip
+    handling run on the job's thread in submission order.
+
+    Files with the same target path are not downloaded at the same time.
+    """
+
+    def __init__(self, job, workers):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.job = job
+        self.local = threading.local()
+        self.pending = collections.deque()
+        self.paths = collections.Counter()
+        self.maxpending = workers * 2
+        self.executor = ThreadPoolExecutor(workers, "download")
+
+    def submit(self, url, kwdict, pathfmt):
+        """Schedule the download of 'url' to a snapshot of 'pathfmt'"""
+        kwdict = kwdict.copy()
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = kwdict
+
+        if pathfmt.extension:
+            self.paths[pathfmt.realpath] += 1
+        future = self.executor.submit(
+            output.buffer_wrap(self.download), url, kwdict, pathfmt
+        )
+        self.pending.append((future, url, kwdict, pathfmt))
+        self.process(len(self.pending) >= self.maxpending)
+
+    def skip(self, pathfmt):
+        """Schedule skip handling for a snapshot of 'pathfmt'"""
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = pathfmt.kwdict.copy()
+        self.pending.append((None, None, None, pathfmt))
+        self.process()
+
+    def process(self, block=False):
+        """Finish completed downloads in submission order"""
+        pending = self.pending
+        job = self.job
+
+        while pending and (block or pending[0][0] is None or pending[0][0].done()):
+            future, url, kwdict, pathfmt = pending.popleft()
+
+            if future is None:
+                job.handle_skip(pathfmt)
+                continue
+            block = False
+
+            if pathfmt.extension:
+                self._release(pathfmt.realpath)
+            if future.result():
+                job.handle_download(kwdict, pathfmt)
+            else:
+                job.handle_error(url, pathfmt)
+
+    def wait_path(self, path):
+        """Finish pending downloads until none of them targets 'path'"""
+        while path in self.paths:
+            self.process(True)
+
+    def _release(self, path):
+        paths = self.paths
+        if paths[path] <= 1:
+            del paths[path]
+        else:
+            paths[path] -= 1
+
+    def wait(self):
+        """Finish all pending downloads"""
+        while self.pending:
+            self.process(True)
+
+    def close(self):
+        """Finish pending downloads and stop all worker threads"""
+        if self.pending:
+            # extraction was interrupted; do not raise 'skip' exceptions
+            # for downloads that were already in progress
+            self.job._skipexc = None
+        try:
+            self.wait()
+        except BaseException:
+            for future, _, _, _ in self.pending:
+                if future is not None:
+                    future.cancel()
+            self.pending.clear()
+            self.paths.clear()
+            self.executor.shutdown(False)
+            raise
+        self.executor.shutdown()
+
+    def download(self, url, kwdict, pathfmt):
+        """Download 'url' and its fallback URLs (worker thread)"""
+        try:
+            downloaders = self.local.downloaders
+        except AttributeError:
+            downloaders = self.local.downloaders = {}
+
+        job = self.job
+        if job._download(url, pathfmt, downloaders):
+            return True
+
+        fallback = kwdict.get("_fallback", ()) if job.fallback else ()
+        for num, url in enumerate(fallback, 1):
+            util.remove_file(pathfmt.temppath)
+            job.log.info("Trying fallback URL #%d", num)
+            if job._download(url, pathfmt, downloaders):
+                return True
+        return False
+
+
+class PostProcessorPool:
+    """Run post processor hooks on a bounded pool of worker threads
+
+    Each hook call gets its own snapshot of 'pathfmt' and its kwdict.
+    Calls of the same Slot run at most 'limit' at the same time and,
+    with a limit of 1, in the order they were submitted. Errors get
+    logged and added to the job's status on the job's thread.
+    """
+
+    class Slot:
+        __slots__ = ("name", "limit", "running", "waiting")
+
+        def __init__(self, name, limit):
+            self.name = name
+            self.limit = max(int(limit), 1)
+            self.running = 0
+            self.waiting = collections.deque()
+
+    def __init__(self, job, workers):
+        from concurrent.futures import ThreadPoolExecutor, Future
+
+        self.job = job
+        self.log = job.get_logger("postprocessor")
+        self.future = Future
+        self.lock = threading.Lock()
+        self.pending = collections.deque()
+        self.maxpending = workers * 4
+        self.executor = ThreadPoolExecutor(workers, "postprocessor")
+
+    def submit(self, callback, slot, pathfmt):
+        """Schedule 'callback' for a snapshot of 'pathfmt'"""
+        if self.executor is None:
+            # pool is closed; run late hooks on the job's thread
+            return callback(pathfmt)
+
+        snapshot = copy.copy(pathfmt)
+        snapshot.kwdict = pathfmt.kwdict.copy()
+        future = self.future()
+        self.pending.append((future, slot))
+
+        with self.lock:
+            if slot.running < slot.limit:
+                slot.running += 1
+                self.executor.submit(
+                    output.buffer_wrap(self.run), slot, callback, snapshot, future
+                )
+            else:
+                slot.waiting.append((callback, snapshot, future))
+        self.process(len(self.pending) >= self.maxpending)
+
+    def run(self, slot, callback, pathfmt, future):
+        """Run 'callback' and all calls waiting for 'slot' (worker thread)"""
+        while True:
+            try:
+                future.set_result(callback(pathfmt))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+            with self.lock:
+                if not slot.waiting:
+                    slot.running -= 1
+                    return
+                callback, pathfmt, future = slot.waiting.popleft()
+
+    def process(self, block=False):
+        """Report results of completed hook calls in submission order"""
+        pending = self.pending
+        job = self.job
+
+        while pending and (block or pending[0][0].done()):
+            future, slot = pending.popleft()
+            block = False
+
+            if (exc := future.exception()) is None:
+                continue
+            if isinstance(exc, exception.ControlException) or not isinstance(
+                exc, Exception
+            ):
+                raise exc
+
+            self.log.error("%s: %s: %s", slot.name, exc.__class__.__name__, exc)
+            self.log.debug("", exc_info=exc)
+            if isinstance(exc, exception.GalleryDLException):
+                job.status |= exc.code
+            else:
+                job.status |= 1
+
+    def wait(self):
+        """Wait for all pending hook calls"""
+        while self.pending:
+            self.process(True)
+
+    def close(self):
+        """Wait for pending hook calls and stop all worker threads"""
+        executor = self.executor
+        self.executor = None
+        try:
+            self.wait()
+        finally:
+            executor.shutdown()
+
+
 class SimulationJob(DownloadJob):
     """Simulate the extraction process without downloading anything"""
 
@@ -926,6 +1396,7 @@ class DataJob(Job):
     """Collect extractor results and dump them"""
 
     resolve = False
+    shared = False
 
     def __init__(
         self, url, parent=None, file=sys.stdout, ensure_ascii=True, resolve=False
@@ -942,6 +1413,14 @@ class DataJob(Job):
 
         private = config.get(("output",), "private")
         self.filter = dict.copy if private else util.filter_dict
+        self.num_to_str = config.get(("output",), "num-to-str", False)
+
+        self.stream = bool(file) and config.get(("output",), "stream", False)
+        if self.stream:
+            # write each message immediately instead of collecting them
+            self.handle_url = self.handle_url_stream
+            self.handle_directory = self.handle_directory_stream
+            self.handle_queue = self.handle_queue_stream
 
         if self.resolve > 0:
             self.handle_queue = self.handle_queue_resolve
@@ -962,20 +1441,28 @@ class DataJob(Job):
             pass
         except Exception as exc:
             self.exception = exc
-            self.data.append(
-                (
-                    -1,
-                    {
-                        "error": exc.__class__.__name__,
-                        "message": str(exc),
-                    },
-                )
+            error = (
+                -1,
+                {
+                    "error": exc.__class__.__name__,
+                    "message": str(exc),
+                },
             )
+            if self.stream:
+                try:
+                    self.write(error)
+                except exception.StopExtraction:
+                    pass
+            else:
+                self.data.append(error)
         except BaseException:
             pass
 
+        if self.stream:
+            return 0
+
         # convert numbers to string
-        if config.get(("output",), "num-to-str", False):
+        if not self.shared and config.get(("output",), "num-to-str", False):
             for msg in self.data:
                 util.transform_dict(msg[-1], util.number_to_string)
 
@@ -1013,14 +1500,50 @@ class DataJob(Job):
             extr = extractor.find(url)
 
         if not extr:
+            if self.stream:
+                return self.handle_queue_stream(url, kwdict)
             kwdict = self.filter(kwdict)
             self.data_urls.append(url)
             self.data_meta.append(kwdict)
             return self.data.append((Message.Queue, url, kwdict))
 
-        job = self.__class__(extr, self, None, self.ascii, self.resolve - 1)
-        job.data = self.data
-        job.data_urls = self.data_urls
-        job.data_post = self.data_post
-        job.data_meta = self.data_meta
+        if self.stream:
+            job = self.__class__(extr, self, self.file, self.ascii, self.resolve - 1)
+        else:
+            job = self.__class__(extr, self, None, self.ascii, self.resolve - 1)
+            job.data = self.data
+            job.data_urls = self.data_urls
+            job.data_post = self.data_post
+            job.data_meta = self.data_meta
+            # let this job convert numbers after its extractor has finished
+            job.shared = True
         job.run()
+
+    def handle_url_stream(self, url, kwdict):
+        self.write((Message.Url, url, self.filter(kwdict)))
+
+    def handle_directory_stream(self, kwdict):
+        self.write((Message.Directory, self.filter(kwdict)))
+
+    def handle_queue_stream(self, url, kwdict):
+        self.write((Message.Queue, url, self.filter(kwdict)))
+
+    def write(self, msg):
+        """Write 'msg' as a single line of JSON"""
+        if self.num_to_str:
+            # nested objects are still in use by the extractor
+            kwdict = copy.deepcopy(msg[-1])
+            util.transform_dict(kwdict, util.number_to_string)
+            msg = (*msg[:-1], kwdict)
+        try:
+            util.dump_json(msg, self.file, self.ascii, None)
+            self.file.flush()
+        except OSError as exc:
+            self.extractor.log.error(
+                "Unable to write JSON output (%s: %s)", exc.__class__.__name__, exc
+            )
+            raise exception.StopExtraction()
+        except Exception as exc:
+            self.extractor.log.warning(
+                "Failed to write JSON data (%s: %s)", exc.__class__.__name__, exc
+            )
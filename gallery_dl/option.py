@@ -334,6 +334,18 @@ def build_parser():
         help="Delete cached login sessions, cookies, etc. for MODULE "
         "(ALL to delete everything)",
     )
+    general.add_argument(
+        "--archive-maintain",
+        dest="archive_maintain",
+        metavar="ACTIONS",
+        nargs="?",
+        const="stats",
+        help=(
+            "Run maintenance ACTIONS on the --download-archive FILE "
+            "(stats, shard, compact, optimize; default: stats). "
+            "Use with -s to only show what 'shard' would do"
+        ),
+    )
     general.add_argument(
         "--compat",
         dest="category-map",
@@ -431,6 +443,14 @@ def build_parser():
         const=False,
         help="Do not prompt for passwords/tokens",
     )
+    input.add_argument(
+        "--jobs",
+        dest="jobs",
+        metavar="N",
+        type=int,
+        action=ConfigAction,
+        help="Number of input URLs to process concurrently (default: 1)",
+    )
 
     output = parser.add_argument_group("Output Options")
     output.add_argument(
@@ -488,6 +508,15 @@ def build_parser():
         const=128,
         help="Print JSON information; resolve intermediary URLs",
     )
+    output.add_argument(
+        "--stream",
+        dest="stream",
+        action="store_true",
+        help=(
+            "Print JSON information of each result on a separate line "
+            "as soon as it is available (use with -j/-J)"
+        ),
+    )
     output.add_argument(
         "-s",
         "--simulate",
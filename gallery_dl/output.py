@@ -10,10 +10,10 @@ import os
 import sys
 import shutil
 import logging
+import threading
 import unicodedata
 from . import config, util, formatter
 
-
 # --------------------------------------------------------------------
 # Globals
 
@@ -290,6 +290,88 @@ def setup_logging_handler(key, fmt=LOG_FORMAT, lvl=LOG_LEVEL, mode="w"):
     return handler
 
 
+# --------------------------------------------------------------------
+# Output buffering
+
+
+class BufferedStream:
+    """Stream proxy that collects the output of buffering threads"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def write(self, s):
+        if (buffer := getattr(_buffer_local, "buffer", None)) is None:
+            return self.stream.write(s)
+        buffer.append((self.stream, s))
+        return len(s)
+
+    def flush(self):
+        if getattr(_buffer_local, "buffer", None) is None:
+            self.stream.flush()
+
+
+def buffer_streams():
+    """Replace standard streams with BufferedStream proxies"""
+    proxies = {}
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name, None)
+        if stream is not None and not isinstance(stream, BufferedStream):
+            proxy = proxies[id(stream)] = BufferedStream(stream)
+            setattr(sys, name, proxy)
+
+    for handler in logging.getLogger().handlers:
+        if handler.__class__ is logging.StreamHandler:
+            if proxy := proxies.get(id(handler.stream)):
+                handler.stream = proxy
+
+
+def buffer_begin():
+    """Start collecting the current thread's output"""
+    _buffer_local.buffer = []
+
+
+def buffer_end():
+    """Write all collected output of the current thread at once"""
+    buffer = _buffer_local.buffer
+    _buffer_local.buffer = None
+
+    with _buffer_lock:
+        streams = set()
+        for stream, s in buffer:
+            stream.write(s)
+            streams.add(stream)
+        for stream in streams:
+            stream.flush()
+
+
+def buffer_wrap(func):
+    """Return a callable that runs 'func' with the current thread's buffer
+
+    Use this for functions passed to other threads,
+    so their output ends up in the same buffer.
+    """
+    if (buffer := getattr(_buffer_local, "buffer", None)) is None:
+        return func
+
+    def wrap(*args, **kwargs):
+        previous = getattr(_buffer_local, "buffer", None)
+        _buffer_local.buffer = buffer
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _buffer_local.buffer = previous
+
+    return wrap
+
+
+_buffer_local = threading.local()
+_buffer_lock = threading.Lock()
+
+
 # --------------------------------------------------------------------
 # Utility functions
 
@@ -87,6 +87,8 @@ class PathFormat:
         self.path = ""
         self.realpath = ""
         self.temppath = ""
+        # hash algorithms for downloaders to compute while writing files
+        self.hashes = set()
 
         extension_map = config("extension-map")
         if extension_map is None:
@@ -9,6 +9,7 @@
 """Common classes and constants used by postprocessor modules."""
 
 from .. import archive
+import os
 
 
 class PostProcessor:
@@ -21,6 +22,49 @@ class PostProcessor:
     def __repr__(self):
         return self.__class__.__name__
 
+    def _digests(self, pathfmt, path):
+        """Return hash digests computed while downloading 'path'
+
+        Return None when there are none or 'path' has changed since.
+        """
+        kwdict = pathfmt.kwdict
+        digests = kwdict.get("_http_hashes")
+        if not digests or path != pathfmt.temppath:
+            return None
+        try:
+            if os.stat(path).st_size != kwdict.get("_http_size"):
+                return None
+        except OSError:
+            return None
+        return digests
+
+    def _register_finalize(self, job, callback, options):
+        """Register 'callback' as 'finalize' hook
+
+        'filter' does not apply to it, since it has to handle
+        everything collected from previous files.
+        """
+        if "filter" in options:
+            options = options.copy()
+            del options["filter"]
+        job.register_hooks({"finalize": callback}, options)
+
+    def _background_options(self, options, serial=False):
+        """Return 'options' for registering this post processor's hooks
+
+        Hooks of post processors keeping state across files ('serial')
+        or using an archive get run one at a time in the background.
+        """
+        if (
+            (serial or options.get("archive"))
+            and options.get("background")
+            and options.get("background-limit", 1) != 1
+        ):
+            self.log.warning("'background-limit' is not supported in this mode")
+            options = options.copy()
+            options["background-limit"] = 1
+        return options
+
     def _init_archive(self, job, options, prefix=None):
         if archive_path := options.get("archive"):
             extr = job.extractor
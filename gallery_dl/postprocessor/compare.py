@@ -10,6 +10,7 @@
 
 from .common import PostProcessor
 from .. import text, util, output, exception
+import hashlib
 import os
 
 
@@ -19,6 +20,8 @@ class ComparePP(PostProcessor):
         PostProcessor.__init__(self, job)
         if options.get("shallow"):
             self._compare = self._compare_size
+        else:
+            job.pathfmt.hashes.add("sha256")
         self._equal_exc = self._equal_cnt = 0
 
         if equal := options.get("equal"):
@@ -44,7 +47,7 @@ class ComparePP(PostProcessor):
 
     def replace(self, pathfmt):
         try:
-            if self._compare(pathfmt.realpath, pathfmt.temppath):
+            if self._compare(pathfmt.realpath, pathfmt.temppath, pathfmt):
                 return self._equal(pathfmt)
         except OSError:
             pass
@@ -53,7 +56,7 @@ class ComparePP(PostProcessor):
     def enumerate(self, pathfmt):
         num = 1
         try:
-            while not self._compare(pathfmt.realpath, pathfmt.temppath):
+            while not self._compare(pathfmt.realpath, pathfmt.temppath, pathfmt):
                 pathfmt.prefix = prefix = format(num) + "."
                 pathfmt.kwdict["extension"] = prefix + pathfmt.extension
                 pathfmt.build_path()
@@ -63,12 +66,27 @@ class ComparePP(PostProcessor):
             pass
         self._equal_cnt = 0
 
-    def _compare(self, f1, f2):
+    def _compare(self, f1, f2, pathfmt):
+        digests = self._digests(pathfmt, f2)
+        if digests and "sha256" in digests:
+            # only read 'f1' and compare it against the digest
+            # computed while downloading 'f2'
+            if os.stat(f1).st_size != pathfmt.kwdict["_http_size"]:
+                return False
+            return self._compare_digest(f1, digests["sha256"])
         return self._compare_size(f1, f2) and self._compare_content(f1, f2)
 
-    def _compare_size(self, f1, f2):
+    def _compare_size(self, f1, f2, pathfmt=None):
         return os.stat(f1).st_size == os.stat(f2).st_size
 
+    def _compare_digest(self, f1, digest):
+        h = hashlib.sha256()
+        size = 16384
+        with open(f1, "rb") as fp:
+            while data := fp.read(size):
+                h.update(data)
+        return h.hexdigest() == digest
+
     def _compare_content(self, f1, f2):
         size = 16384
         with open(f1, "rb") as fp1, open(f2, "rb") as fp2:
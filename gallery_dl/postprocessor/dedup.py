@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Replace duplicate files with links to already downloaded ones"""
+
+from .common import PostProcessor
+from .. import dedup, formatter
+import os
+
+
+class DedupPP(PostProcessor):
+
+    def __init__(self, job, options):
+        PostProcessor.__init__(self, job)
+
+        path = options.get("database")
+        if not path:
+            path = os.path.join(job.pathfmt.basedirectory, ".dedup.sqlite3")
+        self.index = dedup.connect(path, options.get("database-pragma"))
+
+        self.action = action = options.get("action") or "hardlink"
+        if action not in ("hardlink", "symlink", "reflink", "skip"):
+            raise ValueError(f"Invalid action '{action}'")
+        self.algorithm = options.get("hash") or "sha256"
+        # let downloaders compute this digest while writing files
+        job.pathfmt.hashes.add(self.algorithm)
+
+        digest = options.get("digest-format")
+        if digest is None:
+            digest = job.extractor.digest_fmt
+        if digest:
+            self.digest_algorithm, _, digest = digest.partition(":")
+            self.digest = formatter.parse(digest, "").format_map
+            job.pathfmt.hashes.add(self.digest_algorithm)
+        else:
+            self.digest = None
+        self.probe = options.get("probe", False)
+
+        events = options.get("event")
+        if events is None:
+            events = ("file",)
+        elif isinstance(events, str):
+            events = events.split(",")
+        hooks = {event: self.run for event in events}
+        if self.digest or self.probe:
+            hooks["prepare-after"] = self.check
+        job.register_hooks(hooks, options)
+
+    def check(self, pathfmt):
+        """Look for duplicates before downloading a file"""
+        kwdict = pathfmt.kwdict
+        if not pathfmt.extension:
+            return
+
+        if strong := self._digest(kwdict):
+            if canonical := self.index.find_digest(strong):
+                if self._replace(pathfmt, canonical):
+                    kwdict["_file_skip"] = True
+                return
+
+        if self.probe:
+            kwdict["_http_dedup"] = self.check_probe
+
+    def check_probe(self, pathfmt, size, head):
+        """Look for duplicates by file size and the first bytes of a file
+
+        Called by the http downloader before writing any data.
+        """
+        if canonical := self.index.find_fast(size, dedup.fast_hash(head)):
+            return self._replace(pathfmt, canonical)
+        return False
+
+    def run(self, pathfmt):
+        path = pathfmt.temppath
+        if not path or not os.path.isfile(path):
+            path = pathfmt.realpath
+        size = os.stat(path).st_size
+
+        digests = self._digests(pathfmt, path)
+        if digests and self.algorithm in digests:
+            fast, strong = dedup.file_hashes(path, None)
+            strong = digests[self.algorithm]
+        else:
+            fast, strong = dedup.file_hashes(path, self.algorithm)
+        strong = f"{self.algorithm}:{strong}"
+
+        canonical = self.index.find(size, strong)
+        if canonical is None or os.path.samefile(canonical, path):
+            self.index.add(size, fast, strong, pathfmt.realpath)
+            if (digest := self._digest(pathfmt.kwdict)) and digests:
+                # only index trusted digests that match the file's content
+                algorithm, _, value = digest.partition(":")
+                if digests.get(algorithm) == value:
+                    self.index.add(size, fast, digest, pathfmt.realpath)
+            return
+
+        if self.action == "skip":
+            self.log.info("Skipping duplicate of '%s'", canonical)
+            self._delete(pathfmt, path)
+            return
+
+        if self._replace(pathfmt, canonical):
+            if path != pathfmt.realpath:
+                self._delete(pathfmt, path)
+            # do not change the modification time of 'canonical'
+            pathfmt.kwdict["_mtime_http"] = pathfmt.kwdict["_mtime_meta"] = None
+
+    def _replace(self, pathfmt, canonical):
+        """Create a link to 'canonical' at 'pathfmt.realpath'"""
+        if self.action == "skip":
+            self.log.info("Skipping duplicate of '%s'", canonical)
+            return True
+
+        try:
+            os.makedirs(pathfmt.realdirectory, exist_ok=True)
+            dedup.link(canonical, pathfmt.realpath, self.action)
+        except OSError as exc:
+            self.log.warning(
+                "Failed to create %s to '%s' (%s: %s)",
+                self.action,
+                canonical,
+                exc.__class__.__name__,
+                exc,
+            )
+            return False
+
+        self.log.debug("Replaced duplicate of '%s' with a %s", canonical, self.action)
+        return True
+
+    def _digest(self, kwdict):
+        """Return the trusted digest provided by 'kwdict'"""
+        if self.digest and (value := self.digest(kwdict)):
+            return f"{self.digest_algorithm}:{value.lower()}"
+        return None
+
+    def _delete(self, pathfmt, path):
+        if path == pathfmt.temppath:
+            pathfmt.delete = True
+        else:
+            os.unlink(path)
+
+
+__postprocessor__ = DedupPP
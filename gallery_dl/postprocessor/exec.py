@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-# Copyright 2018-2023 Mike Fährmann
+# Copyright 2018-2025 Mike Fährmann
 #
 # This program is free software; you can redistribute it and/or modify
 # it under the terms of the GNU General Public License version 2 as
@@ -10,7 +10,9 @@
 
 from .common import PostProcessor
 from .. import util, formatter
+import collections
 import subprocess
+import json
 import os
 
 
@@ -29,13 +31,53 @@ class ExecPP(PostProcessor):
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
 
+        self.running = None
+        serial = False
         if cmds := options.get("commands"):
-            self.cmds = [self._prepare_cmd(c) for c in cmds]
+            self.cmds = [
+                (execute == self.exec_string, args)
+                for execute, args in map(self._prepare_cmd, cmds)
+            ]
             execute = self.exec_many
         else:
             execute, self.args = self._prepare_cmd(options["command"])
-            if options.get("async", False):
-                self._exec = self._popen
+            self.shell = execute == self.exec_string
+
+            if asynchronous := options.get("async", False):
+                if asynchronous is True:
+                    self._exec = self._popen
+                else:
+                    # run up to 'asynchronous' commands at the same time
+                    self.running = collections.deque()
+                    self.running_max = max(int(asynchronous), 1)
+                    execute = self.exec_async
+
+            mode = options.get("mode")
+            if mode == "batch":
+                self.batch = []
+                self.batch_size = options.get("batch-size", 100)
+                execute = self.exec_batch
+                serial = True
+                self._register_finalize(job, self.finalize_batch, options)
+            elif mode == "stdin":
+                self.process = None
+                self.pending = []
+                if options.get("stdin-format") == "json":
+                    self._stdin_line = self._stdin_json
+                    self._json_encode = json.JSONEncoder(
+                        ensure_ascii=False,
+                        check_circular=False,
+                        default=util.json_default,
+                    ).encode
+                execute = self.exec_stdin
+                serial = True
+                self._register_finalize(job, self.finalize_stdin, options)
+            elif mode:
+                self.log.warning("Invalid mode '%s'", mode)
+
+            if self.running is not None:
+                serial = True
+                self._register_finalize(job, self.finalize_async, options)
 
         self.session = False
         self.creationflags = 0
@@ -50,7 +92,10 @@ class ExecPP(PostProcessor):
             events = ("after",)
         elif isinstance(events, str):
             events = events.split(",")
-        job.register_hooks({event: execute for event in events}, options)
+        job.register_hooks(
+            {event: execute for event in events},
+            self._background_options(options, serial),
+        )
 
         self._init_archive(job, options)
 
@@ -68,12 +113,7 @@ class ExecPP(PostProcessor):
         if archive and archive.check(kwdict):
             return
 
-        kwdict["_directory"] = pathfmt.realdirectory
-        kwdict["_filename"] = pathfmt.filename
-        kwdict["_path"] = pathfmt.realpath
-
-        args = [arg.format_map(kwdict) for arg in self.args]
-        args[0] = os.path.expanduser(args[0])
+        args = self._build_list(pathfmt)
         retcode = self._exec(args, False)
 
         if archive:
@@ -85,32 +125,216 @@ class ExecPP(PostProcessor):
         if archive and archive.check(pathfmt.kwdict):
             return
 
-        self.pathfmt = pathfmt
-        args = self._sub(self._replace, self.args)
-        retcode = self._exec(args, True)
+        retcode = self._exec(self._build_string(pathfmt), True)
 
         if archive:
             archive.add(pathfmt.kwdict)
         return retcode
 
     def exec_many(self, pathfmt):
-        if archive := self.archive:
-            if archive.check(pathfmt.kwdict):
-                return
-            self.archive = False
+        archive = self.archive
+        if archive and archive.check(pathfmt.kwdict):
+            return
 
         retcode = 0
-        for execute, args in self.cmds:
-            self.args = args
-            if retcode := execute(pathfmt):
+        for shell, args in self.cmds:
+            if shell:
+                args = self._build_string(pathfmt, args)
+            else:
+                args = self._build_list(pathfmt, args)
+            if retcode := self._exec(args, shell):
                 # non-zero exit status
                 break
 
         if archive:
-            self.archive = archive
             archive.add(pathfmt.kwdict)
         return retcode
 
+    def exec_async(self, pathfmt):
+        if self.archive and self.archive.check(pathfmt.kwdict):
+            return
+
+        if self.shell:
+            args = self._build_string(pathfmt)
+        else:
+            args = self._build_list(pathfmt)
+        self._run(args, (self._snapshot(pathfmt.kwdict),))
+
+    def exec_batch(self, pathfmt):
+        kwdict = pathfmt.kwdict
+        if self.archive and self.archive.check(kwdict):
+            return
+
+        self.batch.append(
+            (
+                kwdict.copy(),
+                pathfmt.realdirectory,
+                pathfmt.filename,
+                pathfmt.realpath,
+            )
+        )
+        if len(self.batch) >= self.batch_size:
+            self._exec_batch()
+
+    def finalize_batch(self, pathfmt):
+        self._exec_batch()
+
+    def _exec_batch(self):
+        batch = self.batch
+        if not batch:
+            return
+        self.batch = []
+
+        kwdict, directory, filename, path = batch[0]
+        if self.shell:
+            paths = [quote(entry[3]) for entry in batch]
+
+            def replace(match):
+                nonlocal paths
+                name = match[1]
+                if name == "_directory":
+                    return quote(directory)
+                if name == "_filename":
+                    value = [quote(entry[2]) for entry in batch]
+                else:
+                    value = paths
+                paths = None
+                return " ".join(value)
+
+            args = self._sub(replace, self.args)
+            if paths:
+                args += " " + " ".join(paths)
+        else:
+            kwdict["_directory"] = directory
+            kwdict["_filename"] = filename
+            kwdict["_path"] = path
+
+            args = []
+            paths = [entry[3] for entry in batch]
+            for arg in self.args:
+                value = arg.format_map(kwdict)
+                if value == path:
+                    args.extend(paths)
+                    paths = None
+                else:
+                    args.append(value)
+            if paths:
+                args.extend(paths)
+            args[0] = os.path.expanduser(args[0])
+
+        self._run(args, [entry[0] for entry in batch])
+
+    def exec_stdin(self, pathfmt):
+        kwdict = pathfmt.kwdict
+        if self.archive and self.archive.check(kwdict):
+            return
+
+        if self.process is None:
+            if self.shell:
+                args = self._build_string(pathfmt)
+            else:
+                args = self._build_list(pathfmt)
+            self.process = self._popen(
+                args, self.shell, stdin=subprocess.PIPE, text=True, encoding="utf-8"
+            )
+
+        try:
+            self.process.stdin.write(self._stdin_line(pathfmt) + "\n")
+            self.process.stdin.flush()
+        except OSError as exc:
+            self.log.warning(
+                "Unable to send '%s' to command (%s: %s)",
+                pathfmt.realpath,
+                exc.__class__.__name__,
+                exc,
+            )
+        else:
+            self.pending.append(self._snapshot(kwdict))
+
+    def finalize_stdin(self, pathfmt):
+        process = self.process
+        if process is None:
+            return
+        self.process = None
+
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        self._finish(process, process.args, self.pending, process.wait())
+        self.pending = []
+
+    def finalize_async(self, pathfmt):
+        self._wait(0)
+
+    def _run(self, args, kwdicts):
+        """Run 'args' and archive 'kwdicts' after it succeeded"""
+        if self.running is None:
+            self._finish(None, args, kwdicts, self._exec(args, self.shell))
+        else:
+            self._wait(self.running_max - 1)
+            self.running.append((self._popen(args, self.shell), args, kwdicts))
+
+    def _wait(self, maximum):
+        """Wait until no more than 'maximum' commands are running"""
+        running = self.running
+        for entry in tuple(running):
+            if entry[0].poll() is not None:
+                running.remove(entry)
+                self._finish(*entry, entry[0].returncode)
+
+        while len(running) > maximum:
+            process, args, kwdicts = running.popleft()
+            self._finish(process, args, kwdicts, process.wait())
+
+    def _snapshot(self, kwdict):
+        """Return a copy of 'kwdict' to archive after a command finished
+
+        Extractors may reuse and modify 'kwdict' for the next file.
+        """
+        return kwdict.copy() if self.archive else None
+
+    def _finish(self, process, args, kwdicts, retcode):
+        if retcode:
+            if process is not None:
+                self.log.warning(
+                    "'%s' returned with non-zero exit status (%d)", args, retcode
+                )
+        elif self.archive:
+            for kwdict in kwdicts:
+                self.archive.add(kwdict)
+
+    def _build_list(self, pathfmt, args=None):
+        kwdict = pathfmt.kwdict
+        kwdict["_directory"] = pathfmt.realdirectory
+        kwdict["_filename"] = pathfmt.filename
+        kwdict["_path"] = pathfmt.realpath
+
+        if args is None:
+            args = self.args
+        args = [arg.format_map(kwdict) for arg in args]
+        args[0] = os.path.expanduser(args[0])
+        return args
+
+    def _build_string(self, pathfmt, args=None):
+        def replace(match):
+            name = match[1]
+            if name == "_directory":
+                return quote(pathfmt.realdirectory)
+            if name == "_filename":
+                return quote(pathfmt.filename)
+            return quote(pathfmt.realpath)
+
+        return self._sub(replace, self.args if args is None else args)
+
+    def _stdin_line(self, pathfmt):
+        return pathfmt.realpath
+
+    def _stdin_json(self, pathfmt):
+        data = util.filter_dict(pathfmt.kwdict)
+        data["_path"] = pathfmt.realpath
+        return self._json_encode(data)
+
     def _exec(self, args, shell):
         if retcode := self._popen(args, shell).wait():
             self.log.warning(
@@ -118,22 +342,15 @@ class ExecPP(PostProcessor):
             )
         return retcode
 
-    def _popen(self, args, shell):
+    def _popen(self, args, shell, **kwargs):
         self.log.debug("Running '%s'", args)
         return util.Popen(
             args,
             shell=shell,
             creationflags=self.creationflags,
             start_new_session=self.session,
+            **kwargs,
         )
 
-    def _replace(self, match):
-        name = match[1]
-        if name == "_directory":
-            return quote(self.pathfmt.realdirectory)
-        if name == "_filename":
-            return quote(self.pathfmt.filename)
-        return quote(self.pathfmt.realpath)
-
 
 __postprocessor__ = ExecPP
@@ -33,6 +33,9 @@ class HashPP(PostProcessor):
         else:
             self.hashes = (("md5", "md5"), ("sha1", "sha1"))
 
+        # let downloaders compute digests while writing files
+        job.pathfmt.hashes.update(name for _, name in self.hashes)
+
         events = options.get("event")
         if events is None:
             events = ("file",)
@@ -41,6 +44,17 @@ class HashPP(PostProcessor):
         job.register_hooks({event: self.run for event in events}, options)
 
     def run(self, pathfmt):
+        if digests := self._digests(pathfmt, pathfmt.temppath):
+            try:
+                for key, name in self.hashes:
+                    pathfmt.kwdict[key] = digests[name]
+            except KeyError:
+                pass
+            else:
+                if self.filename:
+                    pathfmt.build_path()
+                return
+
         hashes = [(key, hashlib.new(name)) for key, name in self.hashes]
 
         size = self.chunk_size
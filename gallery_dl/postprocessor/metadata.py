@@ -10,8 +10,10 @@
 
 from .common import PostProcessor
 from .. import util, formatter
+import sqlite3
 import json
 import sys
+import io
 import os
 
 
@@ -25,6 +27,15 @@ class MetadataPP(PostProcessor):
         omode = "w"
         filename = None
 
+        if sink := options.get("sink"):
+            if sink not in SINKS:
+                self.log.warning("Invalid sink '%s'", sink)
+                sink = None
+            elif mode in ("modify", "delete"):
+                sink = None
+            else:
+                filename = "metadata." + SINKS[sink].extension
+
         if mode == "tags":
             self.write = self._write_tags
             ext = "txt"
@@ -45,11 +56,11 @@ class MetadataPP(PostProcessor):
                 cfmt = "\n".join(cfmt) + "\n"
             self._content_fmt = formatter.parse(cfmt).format_map
             ext = "txt"
-        elif mode == "jsonl":
+        elif mode == "jsonl" or sink:
             self.write = self._write_json
             self._json_encode = self._make_encoder(options).encode
             omode = "a"
-            filename = "data.jsonl"
+            filename = filename or "data.jsonl"
         else:
             self.write = self._write_json
             self._json_encode = self._make_encoder(options, 4).encode
@@ -93,12 +104,25 @@ class MetadataPP(PostProcessor):
         else:
             self.extension = options.get("extension", ext)
 
+        if sink and self.run != self._run_stdout:
+            self.run = self._run_sink
+            self.sink = None
+            self._sink_class = SINKS[sink]
+            self._sink_buffer = options.get("sink-buffer", 100)
+            if sink_path := options.get("sink-path"):
+                sink_path = util.expand_path(sink_path)
+                self._sink_path = lambda _: sink_path
+            self._register_finalize(job, self.finalize, options)
+
         events = options.get("event")
         if events is None:
             events = ("file",)
         elif isinstance(events, str):
             events = events.split(",")
-        job.register_hooks({event: self.run for event in events}, options)
+        job.register_hooks(
+            {event: self.run for event in events},
+            self._background_options(options, self.run == self._run_sink),
+        )
 
         self._init_archive(job, options, "_MD_")
         self.filter = self._make_filter(options)
@@ -139,6 +163,58 @@ class MetadataPP(PostProcessor):
         if self.mtime:
             pathfmt.set_mtime(path)
 
+    def _run_sink(self, pathfmt):
+        kwdict = pathfmt.kwdict
+        if self.archive and self.archive.check(kwdict):
+            return
+
+        path = self._sink_path(pathfmt)
+        if self.meta_path is not None:
+            kwdict[self.meta_path] = path
+
+        sink = self.sink
+        if sink is None or sink.path != path:
+            if sink is not None:
+                self._sink_close(sink)
+            sink = self.sink = self._sink_class(path, self.encoding)
+
+        key = pathfmt.realpath
+        if self.skip and sink.contains(key):
+            return
+
+        fp = io.StringIO()
+        self.write(fp, kwdict)
+        # extractors may reuse and modify 'kwdict' for the next file
+        sink.add(key, fp.getvalue(), kwdict.copy() if self.archive else None)
+
+        if len(sink.records) >= self._sink_buffer:
+            self._sink_flush(sink)
+
+    def _sink_path(self, pathfmt):
+        if util.WINDOWS and pathfmt.extended:
+            directory = pathfmt._extended_path(self._directory(pathfmt))
+        else:
+            directory = self._directory(pathfmt)
+        return directory + self._filename(pathfmt)
+
+    def _sink_flush(self, sink):
+        kwdicts = sink.flush()
+        if self.archive:
+            for kwdict in kwdicts:
+                self.archive.add(kwdict)
+
+    def _sink_close(self, sink):
+        try:
+            self._sink_flush(sink)
+        finally:
+            sink.close()
+
+    def finalize(self, pathfmt):
+        if self.sink is not None:
+            sink = self.sink
+            self.sink = None
+            self._sink_close(sink)
+
     def _run_stdout(self, pathfmt):
         self.write(sys.stdout, pathfmt.kwdict)
 
@@ -274,6 +350,128 @@ class MetadataPP(PostProcessor):
         )
 
 
+class JSONLSink:
+    """Append buffered metadata records to a JSON Lines file"""
+
+    extension = "jsonl"
+
+    def __init__(self, path, encoding):
+        self.path = path
+        self.encoding = encoding
+        self.records = []
+        self.keys = None
+
+    def contains(self, key):
+        """Return True if a record for 'key' exists"""
+        if self.keys is None:
+            self.keys = self._load_keys()
+        return key in self.keys
+
+    def add(self, key, data, kwdict):
+        """Add a record to the write buffer
+
+        'kwdict' gets returned by flush() once 'data' has been written.
+        """
+        if self.keys is not None:
+            self.keys.add(key)
+        if data[:1] == "{":
+            # store 'key' in JSON records to recognize them in later runs
+            sep = "" if data[1:].lstrip()[:1] == "}" else ", "
+            data = f'{{"_path": {json.dumps(key)}{sep}{data[1:]}'
+        self.records.append((key, data, kwdict))
+
+    def _load_keys(self):
+        keys = set()
+        try:
+            with open(self.path, encoding=self.encoding) as fp:
+                for line in fp:
+                    if '"_path"' not in line:
+                        continue
+                    try:
+                        keys.add(json.loads(line)["_path"])
+                    except Exception:
+                        pass
+        except FileNotFoundError:
+            pass
+        for record in self.records:
+            keys.add(record[0])
+        return keys
+
+    def flush(self):
+        """Write all buffered records and return their kwdicts"""
+        records = self.records
+        if not records:
+            return ()
+        self.records = []
+
+        data = "".join([record[1] for record in records])
+        try:
+            with open(self.path, "a", encoding=self.encoding) as fp:
+                fp.write(data)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding=self.encoding) as fp:
+                fp.write(data)
+        return [record[2] for record in records]
+
+    def close(self):
+        pass
+
+
+class SQLiteSink(JSONLSink):
+    """Insert buffered metadata records into an SQLite3 table"""
+
+    extension = "sqlite3"
+
+    def __init__(self, path, encoding):
+        JSONLSink.__init__(self, path, encoding)
+        self.keys = set()
+        try:
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        except sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS metadata "
+            "(path TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        self.connection = con
+
+    def add(self, key, data, kwdict):
+        self.keys.add(key)
+        self.records.append((key, data, kwdict))
+
+    def contains(self, key):
+        if key in self.keys:
+            return True
+        cursor = self.connection.execute(
+            "SELECT 1 FROM metadata WHERE path=? LIMIT 1", (key,)
+        )
+        return cursor.fetchone() is not None
+
+    def flush(self):
+        records = self.records
+        if not records:
+            return ()
+        self.records = []
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO metadata VALUES (?,?)",
+                [(key, data.rstrip("\n")) for key, data, _ in records],
+            )
+        return [record[2] for record in records]
+
+    def close(self):
+        self.connection.close()
+
+
+SINKS = {
+    "jsonl": JSONLSink,
+    "sqlite": SQLiteSink,
+}
+
+
 def _traverse(obj, key):
     name, _, key = key.partition("[")
     obj = obj[name]
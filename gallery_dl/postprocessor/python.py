@@ -30,7 +30,9 @@ class PythonPP(PostProcessor):
             events = ("file",)
         elif isinstance(events, str):
             events = events.split(",")
-        job.register_hooks({event: self.run for event in events}, options)
+        job.register_hooks(
+            {event: self.run for event in events}, self._background_options(options)
+        )
 
     def run(self, pathfmt):
         self.function(pathfmt.kwdict)
@@ -11,9 +11,12 @@
 from .common import PostProcessor
 from .. import util, output
 import subprocess
+import threading
 import tempfile
 import zipfile
 import shutil
+import copy
+import io
 import os
 
 try:
@@ -26,6 +29,16 @@ except ImportError:
         return a
 
 
+# decoders for image2pipe input by frame filename extension
+PIPE_CODECS = {
+    "jpg": "mjpeg",
+    "jpeg": "mjpeg",
+    "png": "png",
+    "gif": "gif",
+    "webp": "webp",
+}
+
+
 class UgoiraPP(PostProcessor):
 
     def __init__(self, job, options):
@@ -65,12 +78,34 @@ class UgoiraPP(PostProcessor):
                 ext = "zip"
             self._convert_impl = self.convert_to_archive
             self._tempdir = util.NullContext
+        elif mode == "image2pipe":
+            self._convert_impl = self.convert_to_animation_pipe
+            self._tempdir = util.NullContext
+            # fallback for frame delays without a usable common divisor
+            self._process = self._process_concat
+            self._finalize = None
         else:
             self._process = self._process_concat
             self._finalize = None
         self.extension = "webm" if ext is None else ext
         self.log.debug("using %s demuxer", mode)
 
+        processes = options.get("processes", 1)
+        if mode != "image2pipe" or processes == 1:
+            if processes != 1:
+                self.log.warning("'processes' requires 'mode' \"image2pipe\"")
+            self.executor = None
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            cpus = os.cpu_count() or 1
+            processes = min(processes, cpus) if processes > 0 else cpus
+            # each worker thread drives one FFmpeg process
+            self.executor = ThreadPoolExecutor(processes, "ugoira")
+            self.slots = threading.BoundedSemaphore(processes * 2)
+            self.log.debug("using %s FFmpeg processes", processes)
+            self._register_finalize(job, self.finalize, options)
+
         rate = options.get("framerate", "auto")
         if rate == "uniform":
             self.uniform = True
@@ -177,7 +212,7 @@ class UgoiraPP(PostProcessor):
             return
         self._zip_source = False
 
-        with tempfile.TemporaryDirectory() as tempdir:
+        with self._tempdir() as tempdir:
             for frame in self._files:
 
                 # update frame filename extension
@@ -202,7 +237,7 @@ class UgoiraPP(PostProcessor):
             self._frames = self._files
             if self.convert(pathfmt, tempdir):
                 self.log.info(pathfmt.filename)
-                if self.delete:
+                if self.delete and self.executor is None:
                     self.log.debug("Deleting frames")
                     for frame in self._files:
                         util.remove_file(frame["path"])
@@ -256,6 +291,150 @@ class UgoiraPP(PostProcessor):
                 pathfmt.set_mtime()
             return True
 
+    def convert_to_animation_pipe(self, pathfmt, tempdir):
+        """Stream frames into FFmpeg's stdin without extracting them"""
+        frames = self._frames
+        rate_in, rate_out = self.calculate_framerate(frames)
+        if rate_in:
+            repeats = None
+        else:
+            delay = self._delay_gcd(frames)
+            if delay < 10:
+                self.log.debug("non-uniform delays; using concat demuxer")
+                return self._convert_fallback(pathfmt)
+            rate_in = f"1000/{delay}"
+            repeats = [frame["delay"] // delay for frame in frames]
+
+        args = [self.ffmpeg, "-f", "image2pipe", "-framerate", rate_in]
+        ext = frames[0]["file"].rpartition(".")[2].lower()
+        if codec := PIPE_CODECS.get(ext):
+            # image2pipe does not reliably detect the codec of its input
+            args += ("-c:v", codec)
+        args += ("-i", "-")
+        if rate_out:
+            args += ("-r", str(rate_out))
+        if self.args_pp:
+            args += self.args_pp
+        if self.args:
+            args += self.args
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+
+        if self.executor is None:
+            if self._zip_source:
+                frames = self._read_frames(frames, pathfmt.temppath)
+            else:
+                frames = self._read_frames(frames)
+            return self._convert_pipe(pathfmt, args, frames, repeats)
+
+        # read all frames on this thread, since a downloaded ZIP archive
+        # gets deleted right after this post processor returns
+        if self._zip_source:
+            with open(pathfmt.temppath, "rb") as fp:
+                data = fp.read()
+            frames = self._read_frames(frames, io.BytesIO(data))
+            path = os.path.splitext(pathfmt.realpath)[0] + ".zip"
+            restore = ((path, data),) if self.delete else None
+            delete = None
+        else:
+            # frame files get deleted by the worker after a successful conversion
+            delete = [frame["path"] for frame in frames] if self.delete else None
+            frames = self._read_frames(frames)
+            restore = None
+
+        snapshot = copy.copy(pathfmt)
+        snapshot.kwdict = pathfmt.kwdict.copy()
+        self.slots.acquire()
+        self.executor.submit(
+            output.buffer_wrap(self._convert_pipe_async),
+            snapshot,
+            args,
+            frames,
+            repeats,
+            restore,
+            delete,
+        )
+        return True
+
+    def _convert_pipe(self, pathfmt, args, frames, repeats):
+        try:
+            if self.twopass:
+                frames = list(frames)
+                if "-f" not in self.args:
+                    args += ("-f", self.extension)
+                with tempfile.TemporaryDirectory() as tempdir:
+                    args += ("-passlogfile", tempdir + "/ffmpeg2pass", "-pass")
+                    self._exec_pipe(args + ["1", "-y", os.devnull], frames, repeats)
+                    self._exec_pipe(args + ["2", pathfmt.realpath], frames, repeats)
+            else:
+                args.append(pathfmt.realpath)
+                self._exec_pipe(args, frames, repeats)
+        except OSError as exc:
+            output.stderr_write("\n")
+            self.log.error(
+                "Unable to invoke FFmpeg (%s: %s)", exc.__class__.__name__, exc
+            )
+            self.log.debug("", exc_info=exc)
+            pathfmt.realpath = pathfmt.temppath
+        except Exception as exc:
+            output.stderr_write("\n")
+            self.log.error("%s: %s", exc.__class__.__name__, exc)
+            self.log.debug("", exc_info=exc)
+            pathfmt.realpath = pathfmt.temppath
+        else:
+            if self.mtime:
+                pathfmt.set_mtime()
+            return True
+
+    def _convert_pipe_async(self, pathfmt, args, frames, repeats, restore, delete):
+        path = pathfmt.realpath
+        try:
+            if self._convert_pipe(pathfmt, args, frames, repeats):
+                if delete:
+                    self.log.debug("Deleting frames")
+                    for path in delete:
+                        util.remove_file(path)
+                return
+            # remove incomplete output and restore a deleted ZIP archive
+            util.remove_file(path)
+            if restore:
+                for path, data in restore:
+                    with open(path, "wb") as fp:
+                        fp.write(data)
+        finally:
+            self.slots.release()
+
+    def _convert_fallback(self, pathfmt):
+        with tempfile.TemporaryDirectory() as tempdir:
+            if self._zip_source:
+                with zipfile.ZipFile(pathfmt.temppath) as zfile:
+                    zfile.extractall(tempdir)
+            else:
+                for frame in self._frames:
+                    self._copy_file(frame["path"], tempdir + "/" + frame["file"])
+            return self.convert_to_animation(pathfmt, tempdir)
+
+    def _read_frames(self, frames, zpath=None):
+        """Return the contents of all 'frames'
+
+        Frames get read lazily from a ZIP archive at 'zpath'
+        or eagerly from their individual files.
+        """
+        if zpath is None:
+            result = []
+            for frame in frames:
+                with open(frame["path"], "rb") as fp:
+                    result.append(fp.read())
+            return result
+        return self._read_frames_zip(frames, zpath)
+
+    def _read_frames_zip(self, frames, zpath):
+        with zipfile.ZipFile(zpath) as zfile:
+            for frame in frames:
+                yield zfile.read(frame["file"])
+
+    def finalize(self, pathfmt):
+        self.executor.shutdown()
+
     def convert_to_archive(self, pathfmt, tempdir):
         frames = self._frames
 
@@ -317,6 +496,28 @@ class UgoiraPP(PostProcessor):
             raise ValueError()
         return retcode
 
+    def _exec_pipe(self, args, frames, repeats):
+        self.log.debug(args)
+        out = None if self.output else subprocess.DEVNULL
+        process = util.Popen(args, stdin=subprocess.PIPE, stdout=out, stderr=out)
+        try:
+            with process.stdin as stdin:
+                for index, data in enumerate(frames):
+                    for _ in range(repeats[index] if repeats else 1):
+                        stdin.write(data)
+        except BrokenPipeError:
+            pass  # check exit status below
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+
+        if retcode := process.wait():
+            output.stderr_write("\n")
+            self.log.error("Non-zero exit status when running %s (%s)", args, retcode)
+            raise ValueError()
+        return retcode
+
     def _copy_file(self, src, dst):
         shutil.copyfile(src, dst)
 
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Per-site request scheduling"""
+
+import time
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from . import text, util
+
+
+class Bucket:
+    """Token bucket limiting the request rate for a single site"""
+
+    def __init__(self, burst=1):
+        self.burst = burst
+        self.tokens = float(burst)
+        self.timestamp = 0.0
+        self.until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, interval=0.0):
+        """Reserve a request slot
+
+        Return the number of seconds to wait before sending the request.
+        """
+        with self.lock:
+            now = time.time()
+
+            if interval <= 0.0:
+                # only wait for blocks and leave tokens
+                # to requests with an interval to the same site
+                seconds = self.until - now
+                return seconds if seconds > 0.0 else 0.0
+
+            tokens = self.tokens + (now - self.timestamp) / interval
+            if tokens > self.burst:
+                tokens = self.burst
+            if tokens >= 1.0:
+                tokens -= 1.0
+                seconds = 0.0
+            else:
+                seconds = (1.0 - tokens) * interval
+                tokens = 0.0
+
+            if self.until - now > seconds:
+                seconds = self.until - now
+
+            self.tokens = tokens
+            self.timestamp = now + seconds
+            return seconds
+
+    def release(self):
+        """Mark the end of a request"""
+        with self.lock:
+            now = time.time()
+            if now > self.timestamp:
+                self.timestamp = now
+
+    def block(self, until):
+        """Delay all requests until timestamp 'until'"""
+        with self.lock:
+            if until > self.until:
+                self.until = until
+
+
+def bucket(key, burst=None):
+    """Return the Bucket for 'key'"""
+    try:
+        bucket = _buckets[key]
+    except KeyError:
+        with _lock:
+            bucket = _buckets.get(key)
+            if bucket is None:
+                bucket = _buckets[key] = Bucket(burst or 1)
+                return bucket
+
+    if burst and burst != bucket.burst:
+        bucket.burst = burst
+    return bucket
+
+
+def bucket_url(url, category=None):
+    """Return the Bucket for the host of 'url'
+
+    With 'category', this host gets mapped to the Bucket of
+    that extractor category, which is then shared by all requests
+    to the site's API and its download hosts.
+    """
+    host = text.root_from_url(url)
+    if category:
+        _hosts[host] = category
+        return bucket(category)
+    return bucket(_hosts.get(host, host))
+
+
+def reset(response, now=None):
+    """Return the timestamp at which a rate limit gets lifted
+
+    Supports 'Retry-After' headers as well as the many variations
+    of 'X-RateLimit-Reset' (seconds, Unix timestamps, and dates).
+    Return None if 'response' does not contain any such header.
+    """
+    headers = response.headers
+    for name in (
+        "Retry-After",
+        "X-RateLimit-Retry-After",
+        "X-RateLimit-Reset",
+        "RateLimit-Reset",
+    ):
+        if value := headers.get(name):
+            break
+    else:
+        return None
+
+    if now is None:
+        now = time.time()
+
+    try:
+        value = float(value)
+    except ValueError:
+        pass
+    else:
+        # values larger than 10^9 are absolute Unix timestamps,
+        # some APIs even return them in milliseconds
+        if value > 1e12:
+            return value / 1000.0
+        if value > 1e9:
+            return value
+        return now + value
+
+    # HTTP date
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except Exception:
+        pass
+
+    # ISO 8601 date
+    value = util.re(r"\.\d+").sub("", value).replace("Z", "+00:00")
+    dt = text.parse_datetime(value)
+    if isinstance(dt, datetime):
+        return util.datetime_to_timestamp(dt)
+    return None
+
+
+_buckets = {}
+_hosts = {}
+_lock = threading.Lock()
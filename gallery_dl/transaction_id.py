@@ -21,7 +21,7 @@ import time
 import random
 import hashlib
 import binascii
-import itertools
+import functools
 from . import text, util
 from .cache import cache
 
@@ -130,28 +130,23 @@ class ClientTransaction:
     def generate_transaction_id(
         self, method, path, keyword="obfiowerehiring", rndnum=3
     ):
-        bytes_key = self.key_bytes
-
         nowf = time.time()
         nowi = int(nowf)
         now = nowi - 1682924400
-        bytes_time = (
-            (now) & 0xFF,  # noqa: E202
-            (now >> 8) & 0xFF,  # noqa: E222
-            (now >> 16) & 0xFF,
-            (now >> 24) & 0xFF,
-        )
 
         payload = f"{method}!{path}!{now}{keyword}{self.animation_key}"
-        bytes_hash = hashlib.sha256(payload.encode()).digest()[:16]
-
-        num = (random.randrange(16) << 4) + int((nowf - nowi) * 16.0)
-        result = bytes(
-            byte ^ num
-            for byte in itertools.chain(
-                (0,), bytes_key, bytes_time, bytes_hash, (rndnum,)
+        result = b"".join(
+            (
+                b"\0",
+                self.key_bytes,
+                (now & 0xFFFFFFFF).to_bytes(4, "little"),
+                hashlib.sha256(payload.encode()).digest()[:16],
+                bytes((rndnum,)),
             )
         )
+
+        num = (random.randrange(16) << 4) + int((nowf - nowi) * 16.0)
+        result = result.translate(xor_table(num))
         return binascii.b2a_base64(result).rstrip(b"=\n")
 
 
@@ -222,6 +217,12 @@ def rotation_matrix_2d(deg):
 # Utilities
 
 
+@functools.lru_cache(maxsize=None)
+def xor_table(num):
+    """Return a bytes.translate() table XOR-ing each byte with 'num'"""
+    return bytes(byte ^ num for byte in range(256))
+
+
 def float_to_hex(numf):
     numi = int(numf)
 
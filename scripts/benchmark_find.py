@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Compare extractor.find() against a linear scan over all patterns"""
+
+import util  # noqa F401
+import sys
+import time
+
+from gallery_dl import extractor
+from test import results
+
+
+def find_linear(url):
+    for cls in classes:
+        if cls.pattern.match(url):
+            return cls
+    return None
+
+
+def find_indexed(url):
+    for cls in extractor._candidates(url):
+        if cls.pattern.match(url):
+            return cls
+    return None
+
+
+def benchmark(func, urls, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for url in urls:
+            func(url)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / len(urls)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    urls = [result["#url"] for result in results.all()]
+    urls.append("https://unsupported.example.org/path/to/page.html")
+
+    for url in urls:
+        if find_linear(url) is not find_indexed(url):
+            sys.exit(f"Mismatch for '{url}'")
+
+    linear = benchmark(find_linear, urls, rounds)
+    indexed = benchmark(find_indexed, urls, rounds)
+
+    print(f"{len(urls)} URLs, {len(classes)} extractor classes")
+    print(f"linear : {linear * 1e6:8.2f} µs/lookup")
+    print(f"indexed: {indexed * 1e6:8.2f} µs/lookup")
+    print(f"speedup: {linear / indexed:8.2f}x")
+
+
+classes = list(extractor._list_classes())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Compare StringFormatter against CompiledFormatter
+
+Uses the 'filename_fmt' and 'directory_fmt' format strings
+of all extractor classes.
+"""
+
+import util  # noqa F401
+import sys
+import time
+import _string
+import datetime
+
+from gallery_dl import extractor, formatter
+
+
+SAMPLES = (
+    "Sample Value",
+    12345,
+    datetime.datetime(2010, 1, 1),
+)
+
+
+def format_strings():
+    result = set()
+    for cls in extractor._list_classes():
+        fmt = cls.filename_fmt
+        if isinstance(fmt, str):
+            result.add(fmt)
+        fmts = cls.directory_fmt
+        if isinstance(fmts, (list, tuple)):
+            result.update(fmt for fmt in fmts if isinstance(fmt, str))
+    return sorted(result)
+
+
+def build_kwdict(format_string, value):
+    kwdict = {"extension": "jpg"}
+    for _, field_name, _, _ in _string.formatter_parser(format_string):
+        if not field_name:
+            continue
+        for name in field_name.split("|"):
+            key, rest = _string.formatter_field_name_split(name)
+            # build nested dicts for '{user[name]}' fields
+            obj = kwdict
+            for is_attr, index in rest:
+                if is_attr or not isinstance(index, str) or ":" in index:
+                    break
+                if not isinstance(obj.get(key), dict):
+                    obj[key] = {}
+                obj = obj[key]
+                key = index.strip("\"'")
+            obj.setdefault(key, value)
+    return kwdict
+
+
+def prepare(format_string):
+    """Return both formatters and a kwdict they produce the same output for"""
+    fmt_string = formatter.StringFormatter(format_string).format_map
+    fmt_compiled = formatter.CompiledFormatter(format_string).format_map
+
+    for value in SAMPLES:
+        kwdict = build_kwdict(format_string, value)
+        try:
+            expected = fmt_string(kwdict)
+        except Exception:
+            continue
+        if fmt_compiled(kwdict) != expected:
+            sys.exit(f"Mismatch for '{format_string}'")
+        return fmt_string, fmt_compiled, kwdict
+    return None
+
+
+def benchmark(cases, rounds, index):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for case in cases:
+            func = case[index]
+            kwdict = case[2]
+            for _ in range(100):
+                func(kwdict)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / (len(cases) * 100)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    strings = format_strings()
+    cases = [case for case in map(prepare, strings) if case]
+
+    closures = benchmark(cases, rounds, 0)
+    compiled = benchmark(cases, rounds, 1)
+
+    print(f"{len(cases)} of {len(strings)} format strings")
+    print(f"closures: {closures * 1e6:8.2f} µs/call")
+    print(f"compiled: {compiled * 1e6:8.2f} µs/call")
+    print(f"speedup : {closures / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
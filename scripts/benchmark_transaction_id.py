@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Measure the cost of Twitter 'x-client-transaction-id' generation
+
+Uses random key bytes and animation frame data
+instead of values extracted from x.com.
+"""
+
+import util  # noqa F401
+import sys
+import time
+import random
+
+from gallery_dl import transaction_id
+
+
+PATHS = (
+    "/i/api/graphql/q6xj5bs0hapm9309hexA_g/UserByScreenName",
+    "/i/api/graphql/Y59DTUMfcKmUAATiT2SlTw/UserTweets",
+    "/i/api/graphql/nBS-WpgA6ZG0CyNHD517JQ/TweetDetail",
+    "/i/api/2/search/adaptive.json",
+)
+
+
+def build_transaction(rng):
+    ct = transaction_id.ClientTransaction()
+    ct.key_bytes = bytes(rng.randrange(256) for _ in range(48))
+    ct.animation_key = ct.animate(
+        [rng.randrange(256) for _ in range(11)], rng.random()
+    )
+    return ct
+
+
+def benchmark(func, args, rounds, calls=10000):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls // len(args)):
+            for arg in args:
+                func(*arg)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / (calls // len(args) * len(args))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    rng = random.Random(0)
+    ct = build_transaction(rng)
+
+    results = (
+        (
+            "generate_transaction_id",
+            ct.generate_transaction_id,
+            [("GET", path) for path in PATHS],
+        ),
+        (
+            "animate",
+            ct.animate,
+            [
+                ([rng.randrange(256) for _ in range(11)], rng.random())
+                for _ in range(16)
+            ],
+        ),
+        (
+            "cubic_value",
+            transaction_id.cubic_value,
+            [([rng.random() for _ in range(4)], rng.random()) for _ in range(16)],
+        ),
+        (
+            "float_to_hex",
+            transaction_id.float_to_hex,
+            [(round(rng.random(), 2),) for _ in range(16)],
+        ),
+    )
+
+    for name, func, args in results:
+        print(f"{name:<24}: {benchmark(func, args, rounds) * 1e6:8.2f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,4 +8,5 @@ hiddenimports = [
     for module in package.modules
 ]
 
+hiddenimports.append("gallery_dl.extractor._manifest")
 hiddenimports.append("yt_dlp")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Generate gallery_dl/extractor/_manifest.py"""
+
+import os
+import sys
+
+import util
+from gallery_dl import extractor
+from gallery_dl.extractor import common
+
+
+def build_manifest():
+    manifest = []
+
+    for name in extractor.modules:
+        module = __import__(
+            "gallery_dl.extractor." + name, None, None, (name,), 0)
+
+        basecategories = []
+        classes = []
+        for cls in extractor._get_classes(module):
+            pattern = cls.pattern
+            if isinstance(pattern, str):
+                pattern = cls.pattern = extractor.re_compile(pattern)
+
+            if issubclass(cls, common.BaseExtractor) and \
+                    cls.basecategory not in basecategories:
+                basecategories.append(cls.basecategory)
+
+            keys = extractor._index_keys(pattern)
+            classes.append((
+                cls.__name__,
+                cls.category,
+                cls.subcategory,
+                cls.basecategory,
+                pattern.pattern,
+                tuple(sorted(keys)) if keys else None,
+            ))
+
+        manifest.append((name, tuple(basecategories), classes))
+
+    return manifest
+
+
+def generate_output(manifest):
+    GENERATOR = "/".join(os.path.normpath(__file__).split(os.sep)[-2:])
+
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        "",
+        f"# auto-generated by {GENERATOR}",
+        "",
+        '"""Extractor classes, patterns, and dispatch keys of all modules"""',
+        "",
+        "MODULES = {",
+    ]
+    for name, basecategories, classes in manifest:
+        lines.append(f"    {name!r}: ({basecategories!r}, (")
+        for entry in classes:
+            lines.append(f"        {entry!r},")
+        lines.append("    )),")
+    lines.append("}")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def main(path=None):
+    manifest = build_manifest()
+
+    if path is None:
+        path = util.path("gallery_dl", "extractor", "_manifest.py")
+    with util.lazy(path) as fp:
+        fp.write(generate_output(manifest))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -161,6 +161,17 @@ supportedsites() {
     fi
 }
 
+manifest() {
+    cd "${ROOTDIR}"
+    echo Checking if "${MANIFEST}" is up to date
+
+    ./scripts/manifest.py
+    if ! git diff --quiet "${MANIFEST}"; then
+        echo "updated ${MANIFEST} contains changes"
+        exit 4
+    fi
+}
+
 upload-git() {
     cd "${ROOTDIR}"
     echo Pushing changes to github
@@ -184,6 +195,7 @@ ROOTDIR="$(realpath "$(dirname "$0")/..")/"
 README="README.rst"
 CHANGELOG="CHANGELOG.md"
 SUPPORTEDSITES="./docs/supportedsites.md"
+MANIFEST="./gallery_dl/extractor/_manifest.py"
 
 LASTTAG="$(git describe --abbrev=0 --tags)"
 OLDVERSION="${LASTTAG#v}"
@@ -203,6 +215,7 @@ fi
 
 prompt
 supportedsites
+manifest
 cleanup
 update
 changelog
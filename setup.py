@@ -117,6 +117,7 @@ def build_setuptools():
                 "pyyaml",
                 "toml; python_version < '3.11'",
                 "truststore; python_version >= '3.10'",
+                "httpx[http2]",
                 "secretstorage; sys_platform == 'linux'",
             ],
         },
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import io
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import archive  # noqa E402
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_contains(self):
+        bloom = archive.BloomFilter(capacity=100)
+
+        keys = [f"key{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertEqual(bloom.count, 1000)
+        self.assertGreater(len(bloom.filters), 1)
+        for key in keys:
+            self.assertIn(key, bloom)
+
+        false_positives = sum(
+            1 for i in range(1000) if f"other{i}" in bloom)
+        self.assertLess(false_positives, 100)
+
+
+class TestDownloadArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.archive = archive.connect(":memory:", "test", "{id}")
+        self.archive.cursor.executemany(
+            "INSERT INTO archive VALUES (?)", [
+                (f"test{i}",) for i in range(0, 1000, 2)])
+
+    def tearDown(self):
+        self.archive.close()
+
+    def test_check(self):
+        self.assertTrue(self.archive.check({"id": 2}))
+        self.assertFalse(self.archive.check({"id": 3}))
+
+    def test_prefetch(self):
+        arch = self.archive
+        kwdicts = [{"id": i} for i in range(1000)]
+        arch.prefetch(kwdicts)
+        self.assertEqual(len(arch._prefetched), 1000)
+
+        with patch.object(arch, "cursor") as cursor:
+            for kwdict in kwdicts:
+                self.assertEqual(
+                    bool(arch.check(kwdict)), not kwdict["id"] % 2)
+            cursor.execute.assert_not_called()
+        self.assertEqual(arch._prefetched, {})
+
+        # consumed entries get looked up again
+        self.assertTrue(arch.check({"id": 2}))
+        self.assertFalse(arch.check({"id": 3}))
+
+    def test_prefetch_archived(self):
+        arch = self.archive
+        self.assertTrue(arch.prefetch([{"id": 0}, {"id": 2}, {"id": 2}]))
+        self.assertFalse(arch.prefetch([{"id": 0}, {"id": 1}]))
+
+
+class TestDownloadArchiveBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "archive.sqlite3")
+        archive._filters.clear()
+
+    def tearDown(self):
+        archive._filters.clear()
+        self.directory.cleanup()
+
+    def _connect(self, prefix="test", size=None, interval=None):
+        return archive.connect(
+            self.path, prefix, "{id}", None, "batch",
+            batch_size=size, batch_interval=interval)
+
+    def _entries(self):
+        with sqlite3.connect(self.path) as con:
+            return {row[0] for row in con.execute("SELECT entry FROM archive")}
+
+    def test_check(self):
+        with sqlite3.connect(self.path) as con:
+            con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+            con.executemany("INSERT INTO archive VALUES (?)", (
+                ("test1",), ("test2",), ("other3",)))
+
+        arch = self._connect()
+        self.assertIsInstance(arch, archive.DownloadArchiveBatch)
+        self.assertEqual(arch.filter.count, 2)
+
+        with patch.object(arch, "cursor") as cursor:
+            self.assertFalse(arch.check({"id": 3}))
+            cursor.execute.assert_not_called()
+
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertTrue(arch.check({"id": 2}))
+        arch.close()
+
+    def test_add(self):
+        arch = self._connect(size=3)
+
+        arch.add({"id": 1})
+        arch.add({"id": 2})
+        self.assertEqual(self._entries(), set())
+        self.assertTrue(arch.check({"id": 1}))
+
+        arch.add({"id": 3})
+        self.assertEqual(self._entries(), {"test1", "test2", "test3"})
+
+        arch.add({"id": 4})
+        arch.close()
+        self.assertEqual(
+            self._entries(), {"test1", "test2", "test3", "test4"})
+
+    def test_add_interval(self):
+        arch = self._connect(interval=60.0)
+
+        with patch("time.monotonic") as monotonic:
+            monotonic.return_value = arch.timestamp + 30.0
+            arch.add({"id": 1})
+            self.assertEqual(self._entries(), set())
+
+            monotonic.return_value = arch.timestamp + 60.0
+            arch.add({"id": 2})
+            self.assertEqual(self._entries(), {"test1", "test2"})
+        arch.close()
+
+    def test_shared_filter(self):
+        arch1 = self._connect()
+        arch2 = self._connect()
+        self.assertIs(arch1.filter, arch2.filter)
+
+        arch1.add({"id": 1})
+        arch1.close()
+        self.assertTrue(arch2.check({"id": 1}))
+        arch2.close()
+
+    def test_modified(self):
+        arch = self._connect()
+        arch.watch.interval = 0.0
+        self.assertFalse(arch.check({"id": 1}))
+
+        # entries written by another process are not in the Bloom filter
+        with sqlite3.connect(self.path) as con:
+            con.execute("INSERT INTO archive VALUES ('test1')")
+        con.close()
+        self.assertNotIn("test1", arch.filter)
+
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertFalse(arch.check({"id": 2}))
+        self.assertTrue(arch.watch.stale)
+
+        arch.prefetch([{"id": 1}, {"id": 2}])
+        self.assertEqual(arch._prefetched, {"test1": True, "test2": False})
+        arch.close()
+
+    def test_modified_same_process(self):
+        arch1 = self._connect(size=1)
+        arch2 = self._connect()
+        arch1.watch.interval = 0.0
+
+        arch1.add({"id": 1})
+        arch2.add({"id": 2})
+        arch2.commit()
+        self.assertEqual(self._entries(), {"test1", "test2"})
+
+        with patch.object(arch1, "cursor") as cursor:
+            self.assertFalse(arch1.check({"id": 3}))
+            cursor.execute.assert_not_called()
+        self.assertFalse(arch1.watch.stale)
+        arch1.close()
+        arch2.close()
+
+    def test_prefetch(self):
+        with sqlite3.connect(self.path) as con:
+            con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+            con.executemany("INSERT INTO archive VALUES (?)", (
+                ("test1",), ("test2",)))
+
+        arch = self._connect()
+        arch.add({"id": 3})
+        self.assertTrue(arch.prefetch([{"id": i} for i in range(1, 4)]))
+        self.assertFalse(arch.prefetch([{"id": i} for i in range(1, 6)]))
+        self.assertEqual(arch._prefetched, {"test1": True, "test2": True})
+
+        with patch.object(arch, "cursor") as cursor:
+            for i in range(1, 6):
+                self.assertEqual(bool(arch.check({"id": i})), i <= 3)
+            cursor.execute.assert_not_called()
+        arch.close()
+
+
+class TestMaintenance(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "archive.sqlite3")
+        archive._filters.clear()
+
+        with sqlite3.connect(self.path) as con:
+            con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+            con.executemany("INSERT INTO archive VALUES (?)", [
+                (f"{prefix}{i}",)
+                for prefix in ("foo", "foobar", "baz")
+                for i in range(10)
+            ])
+        con.close()
+
+    def tearDown(self):
+        archive._filters.clear()
+        self.directory.cleanup()
+
+    def _maintain(self, actions, simulate=False):
+        with patch("sys.stdout", io.StringIO()) as stdout:
+            self.assertEqual(archive.maintain(
+                self.path, actions, ("foo", "foobar", "bar"), simulate), 0)
+        return stdout.getvalue()
+
+    def test_stats(self):
+        stats = self._maintain("stats")
+        self.assertIn("Table   : archive\nEntries : 30\n", stats)
+        self.assertRegex(stats, r"\n  foobar +10 ")
+        self.assertRegex(stats, r"\n  foo +10 ")
+        self.assertRegex(stats, r"\n  - +10 ")
+
+    def test_compact(self):
+        self._maintain("compact")
+        self.assertIn(
+            "Table   : archive (compact)\nEntries : 30\n",
+            self._maintain("stats"))
+
+        for num, mode in enumerate((None, "memory", "batch"), 10):
+            arch = archive.connect(self.path, "foo", "{id}", None, mode)
+            self.assertTrue(arch.compact)
+            self.assertTrue(arch.check({"id": 1}))
+            self.assertTrue(arch.check({"id": "bar9"}))
+            self.assertFalse(arch.check({"id": num}))
+
+            arch.add({"id": num})
+            arch.finalize()
+            arch.close()
+
+        arch = archive.connect(self.path, "baz", "{id}")
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertFalse(arch.check({"id": 10}))
+        arch.add({"id": 10})
+        arch.close()
+
+        stats = self._maintain("stats")
+        self.assertIn("Entries : 34\n", stats)
+        self.assertRegex(stats, r"\n  foo +13 ")
+        self.assertRegex(stats, r"\n  baz +1 ")
+
+    def test_shard(self):
+        self._maintain("shard,optimize")
+
+        arch = archive.connect(self.path, "", "{id}", "{category}", None,
+                               kwdict={"category": "foobar"})
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertFalse(arch.check({"id": 10}))
+        arch.close()
+
+        arch = archive.connect(self.path, "baz", "{id}")
+        self.assertTrue(arch.check({"id": 1}))
+        arch.close()
+
+        stats = self._maintain("stats")
+        self.assertIn("Table   : archive\nEntries : 10\n", stats)
+        self.assertIn("Table   : foo\nEntries : 10\n", stats)
+        self.assertIn("Table   : foobar\nEntries : 10\n", stats)
+        self.assertNotIn("Table   : bar\n", stats)
+
+    def test_shard_simulate(self):
+        with self.assertLogs("archive", "INFO") as log:
+            self._maintain("shard,compact,optimize", True)
+        self.assertEqual(log.output, [
+            "INFO:archive:Would move 10 'foo' IDs into table \"foo\"",
+            "INFO:archive:Would move 10 'foobar' IDs into table \"foobar\" "
+            "(also matching 'foo')",
+        ])
+
+        stats = self._maintain("stats")
+        self.assertIn("Table   : archive\nEntries : 30\n", stats)
+        self.assertNotIn("Table   : foo\n", stats)
+        self.assertNotIn("(compact)", stats)
+
+    def test_shard_error(self):
+        # 'archive' stays unchanged when not all IDs could be copied
+        with sqlite3.connect(self.path) as con:
+            con.execute("CREATE TABLE foo (entry TEXT PRIMARY KEY "
+                        "CHECK (entry != '5'))")
+        con.close()
+
+        with self.assertLogs("archive", "ERROR"):
+            self.assertEqual(archive.maintain(
+                self.path, "shard", ("foo", "foobar")), 1)
+
+        stats = self._maintain("stats")
+        self.assertIn("Table   : archive\nEntries : 30\n", stats)
+        self.assertNotIn("Table   : foobar\n", stats)
+
+    def test_invalid(self):
+        self.assertEqual(archive.maintain(self.path, "stats,foo"), 2)
+        self.assertEqual(archive.maintain(self.path + ".nope", "stats"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,9 @@ import sys
 import unittest
 from unittest.mock import patch
 
+import json
 import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import config, util  # noqa E402
@@ -132,6 +134,43 @@ class TestCache(unittest.TestCase):
             self.assertEqual(ex(2, 2, 2), 9)
             self.assertEqual(ex(1, 1, 1), 9)
 
+    def test_lookup_mem(self):
+        @cache.memcache(maxage=10)
+        def lk(a):
+            return a
+
+        with patch("time.time") as tmock:
+            tmock.return_value = 100.0
+            self.assertEqual(lk.lookup((1,)), (1, 110))
+            self.assertEqual(lk.lookup((2,), margin=5), (1, 110))
+
+            # new value when expiring within 'margin' seconds
+            tmock.return_value = 106.0
+            self.assertEqual(lk.lookup((3,)), (1, 110))
+            self.assertEqual(lk.lookup((4,), margin=5), (4, 116))
+            self.assertEqual(lk(5), 4)
+
+    def test_lookup_db(self):
+        @cache.cache(maxage=10)
+        def lk(a):
+            return a
+
+        with patch("time.time") as tmock:
+            tmock.return_value = 100.0
+            self.assertEqual(lk.lookup((1,)), (1, 110))
+            self.assertEqual(lk.lookup((2,), margin=5), (1, 110))
+
+            # new value when expiring within 'margin' seconds
+            tmock.return_value = 106.0
+            self.assertEqual(lk.lookup((3,)), (1, 110))
+            self.assertEqual(lk.lookup((4,), margin=5), (4, 116))
+            self.assertEqual(lk(5), 4)
+
+            # value refreshed by another process
+            lk.db.set(lk.key + "-", 7, 130)
+            self.assertEqual(lk.lookup((8,), margin=5), (4, 116))
+            self.assertEqual(lk.lookup((8,), margin=20), (7, 130))
+
     def test_update_mem_simple(self):
         @cache.memcache(keyarg=0)
         def up(a, b, c):
@@ -221,6 +260,141 @@ class TestCache(unittest.TestCase):
         self.assertEqual(db.cache[1][0], 3)
         self.assertEqual(db.cache[2][0], 6)
 
+    def test_lru(self):
+        @cache.memcache(keyarg=0)
+        def lru(a):
+            return a * 2
+
+        lru.cache.maxsize = 3
+        for i in range(3):
+            self.assertEqual(lru(i), i * 2)
+        self.assertEqual(list(lru.cache), [0, 1, 2])
+
+        lru(0)
+        self.assertEqual(list(lru.cache), [1, 2, 0])
+
+        lru(3)
+        self.assertEqual(list(lru.cache), [2, 0, 3])
+
+    def test_lru_maxsize_config(self):
+        @cache.memcache(keyarg=0)
+        def lru(a):
+            return a * 2
+
+        # 'memory-entries' set after creating the cache
+        config.set(("cache",), "memory-entries", 2)
+        try:
+            for i in range(3):
+                self.assertEqual(lru(i), i * 2)
+        finally:
+            config.unset(("cache",), "memory-entries")
+        self.assertEqual(lru.cache.maxsize, 2)
+        self.assertEqual(list(lru.cache), [1, 2])
+
+    def test_database_lock(self):
+        @cache.cache(keyarg=0, maxage=10)
+        def dbl(a):
+            return a
+
+        db = cache.DatabaseCacheDecorator.db
+        self.assertEqual(dbl(1), 1)
+        dbl.cache.clear()
+
+        # results already in the database do not require a lock
+        with patch.object(db, "lock") as lock:
+            self.assertEqual(dbl(1), 1)
+            lock.assert_not_called()
+
+        dbl.cache.clear()
+        dbl.invalidate(1)
+        with patch.object(db, "lock", wraps=db.lock) as lock:
+            self.assertEqual(dbl(1), 1)
+            lock.assert_called_once_with()
+
+    def test_database_lock_threads(self):
+        db = cache.DatabaseCacheDecorator.db
+        thread = threading.Thread(
+            target=db.set, args=("test-lock-thread", 1, 2**31))
+
+        # writes from other threads wait for the current transaction
+        # and are not affected by its rollback
+        with self.assertRaises(ValueError):
+            with db.lock():
+                db.set("test-lock-main", 1, 2**31)
+                thread.start()
+                thread.join(0.1)
+                self.assertTrue(thread.is_alive())
+                raise ValueError()
+        thread.join()
+
+        self.assertIsNone(db.get("test-lock-main"))
+        self.assertEqual(db.get("test-lock-thread"), (1, 2**31))
+        db.delete("test-lock-thread")
+
+    def test_database_purge(self):
+        db = cache.DatabaseCacheDecorator.db
+        db.set("test-purge-1", 1, 100)
+        db.set("test-purge-2", 2, 200)
+        db.set("test-purge-3", 3, 300)
+
+        self.assertEqual(db.purge(200), 2)
+        self.assertIsNone(db.get("test-purge-1"))
+        self.assertIsNone(db.get("test-purge-2"))
+        self.assertEqual(db.get("test-purge-3"), (3, 300))
+        db.delete("test-purge-3")
+
+    def test_database_purge_interval(self):
+        db = cache.DatabaseCacheDecorator.db
+        db.set("test-purge-1", 1, 100)
+
+        # expired entries get deleted while storing new ones
+        # once 'purge_interval' seconds have passed
+        db.purge_interval = 0
+        try:
+            db.set("test-purge-2", 2, 2**31)
+        finally:
+            del db.purge_interval
+        self.assertIsNone(db.get("test-purge-1"))
+        self.assertEqual(db.get("test-purge-2"), (2, 2**31))
+
+        db.set("test-purge-1", 1, 100)
+        db.set("test-purge-3", 3, 2**31)
+        self.assertEqual(db.get("test-purge-1"), (1, 100))
+        db.delete("test-purge-1")
+        db.delete("test-purge-2")
+        db.delete("test-purge-3")
+
+    def test_database_format(self):
+        db = cache.DatabaseCacheDecorator.db
+        values = ("token", {"a": [1, 2.5, None]}, ("tuple",), {1: "int"})
+
+        for value in values:
+            db.set("test-format", value, 100)
+            self.assertEqual(db.get("test-format"), (value, 100))
+
+        db.json = True
+        try:
+            for value in values:
+                db.set("test-format", value, 100)
+                (data,) = db.connection.execute(
+                    "SELECT value FROM data WHERE key='test-format'"
+                ).fetchone()
+                self.assertEqual(db.get("test-format"), (value, 100))
+                self.assertEqual(type(db.get("test-format")[0]), type(value))
+
+                # values not surviving a JSON round trip use pickle
+                if json.loads(json.dumps(value)) == value:
+                    self.assertIsInstance(data, str)
+                else:
+                    self.assertIsInstance(data, bytes)
+
+            # values not serializable as JSON fall back to pickle
+            db.set("test-format", {"set"}, 100)
+            self.assertEqual(db.get("test-format"), ({"set"}, 100))
+        finally:
+            db.json = False
+            db.delete("test-format")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,10 +16,12 @@ import time
 import logging
 import datetime
 import tempfile
+import http.cookiejar
 from os.path import join
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import config, extractor  # noqa E402
+from gallery_dl import config, extractor, cache, util  # noqa E402
+from gallery_dl import cookies as cookies_module  # noqa E402
 
 
 class TestCookiejar(unittest.TestCase):
@@ -62,6 +64,86 @@ class TestCookiejar(unittest.TestCase):
     def test_invalid_filename(self):
         self._test_warning(join(self.path.name, "nothing"), FileNotFoundError)
 
+    def test_cookiefile_cache(self):
+        path = join(self.path.name, "cache.txt")
+        with open(path, "w") as fp:
+            fp.write("""# HTTP Cookie File
+.example.org\tTRUE\t/\tFALSE\t253402210800\tNAME\tVALUE
+""")
+        config.set((), "cookies", path)
+
+        with mock.patch("gallery_dl.util.cookiestxt_load",
+                        wraps=util.cookiestxt_load) as mock_load:
+            cookies1 = _get_extractor("test").cookies
+            cookies2 = _get_extractor("test").cookies
+            self.assertEqual(mock_load.call_count, 1)
+            self.assertEqual(cookies1.get("NAME"), "VALUE")
+            self.assertEqual(cookies2.get("NAME"), "VALUE")
+
+            with open(path, "a") as fp:
+                fp.write(".example.org\tTRUE\t/\tFALSE\t0\tFOO\tBAR\n")
+            cookies = _get_extractor("test").cookies
+            self.assertEqual(mock_load.call_count, 2)
+            self.assertEqual(len(cookies), 2)
+
+    def test_cookiefile_domain(self):
+        path = join(self.path.name, "domain.txt")
+        with open(path, "w") as fp:
+            fp.write("""# HTTP Cookie File
+.example.org\tTRUE\t/\tFALSE\t0\tA\t1
+.exhentai.org\tTRUE\t/\tFALSE\t0\tB\t2
+forums.e-hentai.org\tFALSE\t/\tFALSE\t0\tC\t3
+""")
+        config.set((), "cookies", path)
+        config.set((), "cookies-update", True)
+
+        extr = _get_extractor("exhentai")
+        self.assertEqual(
+            sorted(c.name for c in extr.cookies), ["B"])
+
+        extr.cookies.set("D", "4", domain=".exhentai.org")
+        extr.cookies_store()
+
+        with open(path) as fp:
+            cookies = {c.name: c.value for c in util.cookiestxt_load(fp)}
+        self.assertEqual(
+            cookies, {"A": "1", "B": "2", "C": "3", "D": "4"})
+        config.unset((), "cookies-update")
+
+    def test_cookiefile_shared(self):
+        path = join(self.path.name, "shared.txt")
+        with open(path, "w") as fp:
+            fp.write("""# HTTP Cookie File
+.example.org\tTRUE\t/\tFALSE\t0\tA\t1
+.exhentai.org\tTRUE\t/\tFALSE\t0\tB\t2
+.nijie.info\tTRUE\t/\tFALSE\t0\tC\t3
+""")
+        config.set((), "cookies", path)
+        config.set((), "cookies-update", True)
+
+        # two extractors with different domains storing to the same file
+        exhentai = _get_extractor("exhentai")
+        nijie = _get_extractor("nijie")
+
+        exhentai.cookies.set("D", "4", domain=".exhentai.org")
+        exhentai.cookies_store()
+        nijie.cookies.set("E", "5", domain=".nijie.info")
+        nijie.cookies_store()
+
+        # file modified by another process
+        with open(path, "a") as fp:
+            fp.write(".example.org\tTRUE\t/\tFALSE\t0\tF\t6\n")
+        exhentai.cookies_store()
+
+        with open(path) as fp:
+            cookies = {c.name: c.value for c in util.cookiestxt_load(fp)}
+        self.assertEqual(cookies, {
+            "A": "1", "B": "2", "C": "3", "D": "4", "E": "5", "F": "6"})
+
+        cookies = _get_extractor("nijie").cookies
+        self.assertEqual(sorted(c.name for c in cookies), ["C", "E"])
+        config.unset((), "cookies-update")
+
     def _test_warning(self, filename, exc):
         config.set((), "cookies", filename)
         log = logging.getLogger("generic")
@@ -100,6 +182,34 @@ class TestCookiedict(unittest.TestCase):
                 self.assertEqual(c.domain, extr.cookies_domain)
 
 
+class TestCookiesBrowser(unittest.TestCase):
+
+    def test_cache(self):
+        db = cache.DatabaseBackend(":memory:")
+        cookies = [http.cookiejar.Cookie(
+            0, "NAME", "VALUE", None, False, ".example.org", True, True,
+            "/", False, False, None, False, None, None, {})]
+        spec = ("chrome", None, None, None, ".example.org")
+
+        with mock.patch.object(cache.DatabaseCacheDecorator, "db", db), \
+                mock.patch("gallery_dl.cookies.load_cookies",
+                           return_value=cookies) as mock_load:
+            result = cookies_module.load_cookies_cached(spec, 0)
+            self.assertIs(result, cookies)
+            self.assertEqual(mock_load.call_count, 1)
+
+            for _ in range(2):
+                result = cookies_module.load_cookies_cached(spec, 60)
+                self.assertEqual(len(result), 1)
+                self.assertEqual(result[0].name , "NAME")
+                self.assertEqual(result[0].value, "VALUE")
+            self.assertEqual(mock_load.call_count, 2)
+
+            with mock.patch("time.time", return_value=time.time() + 120):
+                cookies_module.load_cookies_cached(spec, 60)
+            self.assertEqual(mock_load.call_count, 3)
+
+
 class TestCookieLogin(unittest.TestCase):
 
     def tearDown(self):
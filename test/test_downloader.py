@@ -13,6 +13,7 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 
 import re
+import json
 import logging
 import os.path
 import binascii
@@ -22,6 +23,7 @@ import http.server
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import downloader, extractor, output, config, path  # noqa E402
+from gallery_dl import ratelimit  # noqa E402
 from gallery_dl.downloader.http import MIME_TYPES, SIGNATURE_CHECKS # noqa E402
 
 
@@ -280,6 +282,133 @@ class TestHTTPDownloader(TestDownloaderBase):
         self._run_test("png", None, DATA["png"], "gif", "png")
         self._run_test("gif", None, DATA["gif"], "jpg", "gif")
 
+    def test_http_hashes(self):
+        import hashlib
+        for input in (None, DATA["jpg"][:123]):
+            pathfmt = self._prepare_destination(input, extension="jpg")
+            pathfmt.hashes = {"md5", "sha256", "invalid"}
+            try:
+                self.assertTrue(self.downloader.download(
+                    f"{self.address}/jpg", pathfmt))
+            finally:
+                pathfmt.hashes = set()
+
+            kwdict = pathfmt.kwdict
+            self.assertEqual(kwdict["_http_size"], len(DATA["jpg"]))
+            self.assertEqual(kwdict["_http_hashes"], {
+                "md5"   : hashlib.md5(DATA["jpg"]).hexdigest(),
+                "sha256": hashlib.sha256(DATA["jpg"]).hexdigest(),
+            })
+
+    def test_http_bucket(self):
+        pathfmt = self._prepare_destination(None, extension="jpg")
+        self.assertTrue(self.downloader.download(
+            f"{self.address}/jpg", pathfmt))
+
+        # downloads share the rate limit bucket of their extractor
+        self.assertIs(ratelimit.bucket_url(f"{self.address}/png"),
+                      ratelimit.bucket(self.job.extractor.category))
+
+    def test_http_hashes_reused_kwdict(self):
+        pathfmt = self._prepare_destination(None, extension="jpg")
+        pathfmt.kwdict["_http_hashes"] = {"sha256": "0123456789abcdef"}
+        pathfmt.kwdict["_http_size"] = 8
+
+        self.assertTrue(self.downloader.download(
+            f"{self.address}/jpg", pathfmt))
+        self.assertNotIn("_http_hashes", pathfmt.kwdict)
+        self.assertNotIn("_http_size", pathfmt.kwdict)
+
+    def test_http_segments(self):
+        self.downloader.segments = 3
+        self.downloader.segments_min = 100
+        receive = self.downloader._receive_segment
+        try:
+            with patch.object(self.downloader, "_receive_segment",
+                              wraps=receive) as rs:
+                # too small for segmented downloads
+                self._run_test("gif", None, DATA["gif"], "gif", "gif")
+                self.assertEqual(rs.call_count, 0)
+
+                self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
+                self._run_test("jpg", DATA["jpg"][:123], DATA["jpg"],
+                               "jpg", "jpg")
+                self.assertEqual(rs.call_count, 6)
+        finally:
+            self.downloader.segments = 0
+
+    def test_http_segments_unsupported(self):
+        self.downloader.segments = 3
+        self.downloader.segments_min = 100
+        receive = self.downloader._receive_segment
+        try:
+            with patch.object(self.downloader, "_receive_segment",
+                              wraps=receive) as rs, \
+                    self.assertLogs(self.downloader.log.name, "DEBUG") as log:
+                # server ignoring 'Range' headers
+                self._run_test("jpg?norange", None, DATA["jpg"], "jpg", "jpg")
+            self.assertEqual(rs.call_count, 3)
+            self.assertIn("Byte ranges not supported", log.output[0])
+            self.assertNotIn("WARNING", "".join(log.output))
+        finally:
+            self.downloader.segments = 0
+
+    def test_http_segments_resume(self):
+        size = len(DATA["jpg"])
+        self.downloader.segments = 2
+        self.downloader.segments_min = 100
+
+        # first segment finished, second segment half done
+        half = size // 2
+        quarter = half + (size - half) // 2
+        content = (DATA["jpg"][:quarter] +
+                   bytes(size - quarter))
+
+        pathfmt = self._prepare_destination(None, extension="jpg")
+        part = pathfmt.temppath + ".part"
+        state = part + ".segments"
+        with open(part, "wb") as fp:
+            fp.write(content)
+        with open(state, "w") as fp:
+            json.dump({
+                "size"  : size,
+                "ranges": [[half, half], [quarter, size]],
+            }, fp)
+
+        receive = self.downloader._receive_segment
+        try:
+            with patch.object(self.downloader, "_receive_segment",
+                              wraps=receive) as rs:
+                self.assertTrue(self.downloader.download(
+                    f"{self.address}/jpg", pathfmt))
+            self.assertEqual(rs.call_count, 1)
+        finally:
+            self.downloader.segments = 0
+
+        self.assertEqual(pathfmt.temppath, part)
+        with open(part, "rb") as fp:
+            self.assertEqual(fp.read(), DATA["jpg"])
+        self.assertFalse(os.path.exists(state))
+
+    def test_http_dedup(self):
+        calls = []
+
+        def check(pathfmt, size, head):
+            calls.append((size, head))
+            return size == len(DATA["jpg"])
+
+        for ext, skipped in (("jpg", True), ("png", False)):
+            pathfmt = self._prepare_destination(None, extension=ext)
+            pathfmt.kwdict["_http_dedup"] = check
+            self.assertTrue(self.downloader.download(
+                f"{self.address}/{ext}", pathfmt))
+            self.assertEqual(calls[-1], (len(DATA[ext]), DATA[ext]))
+            if skipped:
+                self.assertEqual(pathfmt.temppath, "")
+            else:
+                with open(pathfmt.temppath, "rb") as fp:
+                    self.assertEqual(fp.read(), DATA[ext])
+
     def test_http_filesize_min(self):
         url = f"{self.address}/gif"
         pathfmt = self._prepare_destination(None, extension=None)
@@ -319,24 +448,27 @@ class TestTextDownloader(TestDownloaderBase):
 class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
 
     def do_GET(self):
+        path, _, query = self.path.partition("?")
         try:
-            output = DATA[self.path[1:]]
+            output = DATA[path[1:]]
         except KeyError:
             self.send_response(404)
             self.wfile.write(self.path.encode())
             return
 
-        headers = {"Content-Length": len(output)}
+        headers = {"Content-Length": len(output), "Accept-Ranges": "bytes"}
 
-        if "Range" in self.headers:
+        if "Range" in self.headers and query != "norange":
             status = 206
 
-            match = re.match(r"bytes=(\d+)-", self.headers["Range"])
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers["Range"])
             start = int(match[1])
+            end = int(match[2]) if match[2] else len(output) - 1
 
             headers["Content-Range"] = \
-                f"bytes {start}-{len(output) - 1}/{len(output)}"
-            output = output[start:]
+                f"bytes {start}-{end}/{len(output)}"
+            output = output[start:end+1]
+            headers["Content-Length"] = len(output)
         else:
             status = 200
 
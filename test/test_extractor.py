@@ -10,18 +10,26 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, call
 
+import re
+import ssl
 import time
 import string
 from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import extractor, util  # noqa E402
-from gallery_dl.extractor import mastodon  # noqa E402
+from gallery_dl import extractor, config, util  # noqa E402
+from gallery_dl.extractor import common, mastodon  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 from gallery_dl.extractor.directlink import DirectlinkExtractor  # noqa E402
 
+try:
+    import httpx, h2  # noqa E401 F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
 _list_classes = extractor._list_classes
 
 try:
@@ -87,6 +95,94 @@ class TestExtractorModule(unittest.TestCase):
         self.assertEqual(classes[0], FakeExtractor)
         self.assertIsInstance(extractor.find(uri), FakeExtractor)
 
+    def test_index_keys(self):
+        def keys(pattern):
+            return extractor._index_keys(re.compile(pattern))
+
+        self.assertEqual(
+            keys(r"(?:https?://)?(?:www\.)?example\.(?:com|org)/(\d+)"), {
+                (False, "example.com/"),
+                (False, "example.org/"),
+                (False, "www.example.com/"),
+                (False, "www.example.org/"),
+            })
+        self.assertEqual(
+            keys(r"(?:https?://)?(?:[\w-]+\.)?example\.com(?:/|$)"), {
+                (False, "example.com/"),
+                (False, "example.com"),
+                (True, ".example.com"),
+            })
+        self.assertEqual(
+            keys(r"(?i)example:(?:https?://)?([^/?#]+)"), {
+                (False, "example:"),
+                (False, "example:https:/"),
+                (False, "example:http:/"),
+            })
+
+        self.assertIsNone(keys(r"(?:https?://)?[\w-]+\.example\.com"))
+        self.assertIsNone(keys(r"(?:https?://)?[^/]+/(\d+)"))
+        self.assertIsNone(keys(r".*"))
+
+    def test_index_candidates(self):
+        classes = list(extractor._list_classes())
+
+        url = "https://www.pixiv.net/en/artworks/966412"
+        candidates = extractor._candidates(url)
+        self.assertLess(len(candidates), 50)
+        self.assertIn(extractor.find(url).__class__, candidates)
+
+        self.assertEqual(extractor._candidates("NONASCII:Ä"), classes)
+
+    def test_lazy(self):
+        if not extractor._load_manifest():
+            raise unittest.SkipTest("no manifest")
+
+        url = "https://www.pixiv.net/en/artworks/966412"
+        extr = extractor.find(url)
+        self.assertEqual(extr.__class__.__name__, "PixivWorkExtractor")
+
+        for cls in extractor._cache:
+            if cls.__module__ == "gallery_dl.extractor.pixiv":
+                self.assertNotIsInstance(cls, extractor._LazyExtractor)
+            elif cls.category == "twitter":
+                self.assertIsInstance(cls, extractor._LazyExtractor)
+
+        self.assertIsNone(extractor.find("https://unsupported.example.org/"))
+        for cls in extractor.extractors():
+            self.assertNotIsInstance(cls, extractor._LazyExtractor)
+
+    def test_lazy_instances(self):
+        manifest = extractor._load_manifest()
+        if not manifest:
+            raise unittest.SkipTest("no manifest")
+        basecategories = manifest["mastodon"][0]
+        self.assertEqual(basecategories, ("mastodon",))
+
+        self.assertFalse(extractor._instances(basecategories))
+        config.set(("extractor",), "mastodon", {
+            "foobar": {"root": "https://foobar.example.org"},
+        })
+        try:
+            self.assertTrue(extractor._instances(basecategories))
+        finally:
+            config.clear()
+
+    def test_manifest(self):
+        """Ensure extractor/_manifest.py is up to date"""
+        manifest = extractor._load_manifest()
+        if not manifest:
+            raise unittest.SkipTest("no manifest")
+
+        self.assertEqual(list(manifest), extractor.modules)
+
+        classes = {cls.__name__: cls for cls in extractor.extractors()}
+        for name, (_, entries) in manifest.items():
+            for entry in entries:
+                cls = classes[entry[0]]
+                self.assertEqual(
+                    (cls.category, cls.subcategory, cls.basecategory,
+                     cls.pattern.pattern), entry[1:5], entry[0])
+
     def test_from_url(self):
         for uri in self.VALID_URIS:
             cls = extractor.find(uri).__class__
@@ -262,6 +358,109 @@ class TestExtractorWait(unittest.TestCase):
         return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
 
 
+class TestExtractorSession(unittest.TestCase):
+
+    def setUp(self):
+        common.CACHE_ADAPTERS.clear()
+
+    def tearDown(self):
+        config.clear()
+
+    def test_adapter_shared(self):
+        extr1 = extractor.find("generic:https://example.org/")
+        extr2 = extractor.find("generic:https://example.com/")
+        extr1.initialize()
+        extr2.initialize()
+
+        self.assertIsNot(extr1.session, extr2.session)
+        self.assertIs(extr1.session.get_adapter("https://"),
+                      extr2.session.get_adapter("https://"))
+
+    def test_adapter_pool_size(self):
+        config.set(("extractor",), "pool-connections", 2)
+        config.set(("extractor",), "pool-maxsize", 32)
+        extr = extractor.find("generic:https://example.org/")
+        extr.initialize()
+
+        adapter = extr.session.get_adapter("https://")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_connection_stats(self):
+        self.assertEqual(common.connection_stats(), (0, 0))
+
+        extr = extractor.find("generic:https://example.org/")
+        extr.initialize()
+        adapter = extr.session.get_adapter("https://")
+
+        pool = adapter.poolmanager.connection_from_url("https://example.org/")
+        pool.num_connections = 2
+        pool.num_requests = 5
+        self.assertEqual(common.connection_stats(), (2, 3))
+
+        # counters of discarded pools are kept
+        adapter.poolmanager.clear()
+        self.assertEqual(common.connection_stats(), (2, 3))
+
+        pool = adapter.poolmanager.connection_from_url("https://example.com/")
+        pool.num_connections = 1
+        pool.num_requests = 1
+        self.assertEqual(common.connection_stats(), (3, 3))
+
+    @unittest.skipIf(HTTP2, "httpx and h2 installed")
+    def test_http2_unavailable(self):
+        config.set(("extractor",), "http2", True)
+        extr = extractor.find("generic:https://example.org/")
+
+        with self.assertLogs(extr.log, "ERROR"):
+            extr.initialize()
+        self.assertIsInstance(
+            extr.session.get_adapter("https://"), common.RequestsAdapter)
+
+    @unittest.skipIf(not HTTP2, "httpx or h2 not installed")
+    def test_http2(self):
+        config.set(("extractor",), "http2", True)
+        config.set(("extractor",), "ciphers", "firefox")
+        extr = extractor.find("generic:https://example.org/")
+        extr.initialize()
+
+        from gallery_dl.http2 import HTTP2Adapter
+        adapter = extr.session.get_adapter("https://")
+        self.assertIsInstance(adapter, HTTP2Adapter)
+        self.assertIsInstance(
+            extr.session.get_adapter("http://"), common.RequestsAdapter)
+
+        ctx_http2 = adapter.ssl_context_factory()
+        ctx_http1 = extr.session.get_adapter("http://").ssl_context
+        self.assertEqual(ctx_http2.get_ciphers(), ctx_http1.get_ciphers())
+        self.assertEqual(ctx_http2.options, ctx_http1.options)
+
+    @unittest.skipIf(not HTTP2, "httpx or h2 not installed")
+    def test_http2_cert(self):
+        from gallery_dl.http2 import HTTP2Adapter
+        adapter = HTTP2Adapter(ssl.create_default_context)
+
+        with patch.object(ssl.SSLContext, "load_cert_chain") as load:
+            transport = adapter.transport_for(True, None, None)
+            transport_pem = adapter.transport_for(True, "client.pem", None)
+            transport_key = adapter.transport_for(
+                True, ["client.crt", "client.key"], None)
+
+            self.assertIs(
+                adapter.transport_for(True, "client.pem", None), transport_pem)
+            self.assertIs(
+                adapter.transport_for(True, ("client.crt", "client.key"), None),
+                transport_key)
+        adapter.close()
+
+        self.assertEqual(load.call_args_list, [
+            call("client.pem"),
+            call("client.crt", "client.key"),
+        ])
+        self.assertIsNot(transport, transport_pem)
+        self.assertIsNot(transport_pem, transport_key)
+
+
 class TextExtractorOAuth(unittest.TestCase):
 
     def test_oauth1(self):
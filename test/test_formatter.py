@@ -470,6 +470,18 @@ class TestFormatter(unittest.TestCase):
         with self.assertRaises(OSError):
             formatter.parse("\fT /")
 
+    def test_compiled(self):
+        fmt = formatter.parse("\fC {a!l:?[/]/} {d[a]|d[b]:>4} {l:J-/}")
+        self.assertIsInstance(fmt, formatter.CompiledFormatter)
+        self.assertEqual(fmt.format_map(self.kwdict), "[hello world]  foo a-b-c")
+
+        fmt = formatter.parse("\fC {missing}/{d[missing]}", "-")
+        self.assertEqual(fmt.format_map(self.kwdict), "-/-")
+
+        fmt = formatter.parse("\fC {a}{l!n}")
+        with self.assertRaises(TypeError):
+            fmt.format_map(self.kwdict)
+
     def test_expression(self):
         self._run_test("\fE a", self.kwdict["a"])
         self._run_test(
@@ -640,10 +652,15 @@ def noarg():
             self.assertEqual(fmt0.format_map(self.kwdict), "")
 
     def _run_test(self, format_string, result, default=None, fmt=format):
-        fmt = formatter.parse(format_string, default, fmt)
-        output = fmt.format_map(self.kwdict)
+        formatter_ = formatter.parse(format_string, default, fmt)
+        output = formatter_.format_map(self.kwdict)
         self.assertEqual(output, result, format_string)
 
+        if format_string[:1] != "\f":
+            formatter_ = formatter.parse("\fC " + format_string, default, fmt)
+            output = formatter_.format_map(self.kwdict)
+            self.assertEqual(output, result, "\fC " + format_string)
+
 
 if __name__ == "__main__":
     unittest.main()
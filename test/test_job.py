@@ -10,12 +10,17 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import io
+import json
+import sqlite3
+import time
+import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import job, config, text  # noqa E402
+from gallery_dl import job, config, text, exception  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 
 
@@ -65,6 +70,336 @@ class TestDownloadJob(TestJob):
         self.assertEqual(func(TestExtractorParent), False)
         self.assertEqual(func(TestExtractorAlt)   , False)
 
+    def test_workers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set(("downloader",), "workers", 3)
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            paths = []
+            with patch.object(tjob.out, "success", paths.append):
+                tjob.run()
+
+            self.assertIsNotNone(tjob.pool)
+            self.assertEqual(tjob.status, 0)
+            self.assertEqual(len(paths), 10)
+            for num, path in enumerate(paths):
+                self.assertEqual(os.path.basename(path), f"test_{num}.txt")
+                with open(path) as fp:
+                    self.assertEqual(fp.read(), str(num))
+
+    def test_workers_skip_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set(("downloader",), "workers", 3)
+            config.set((), "skip", "abort:2")
+
+            directory = os.path.join(tmpdir, "test_category")
+            os.makedirs(directory)
+            for num in range(1, 10, 2):
+                with open(os.path.join(directory, f"test_{num}.txt"), "w"):
+                    pass
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            paths = []
+            with patch.object(tjob.out, "success", paths.append), \
+                    patch.object(tjob.out, "skip", paths.append):
+                tjob.run()
+
+            # no two consecutive skips
+            self.assertEqual(tjob.status, 0)
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                [f"test_{num}.txt" for num in range(10)],
+            )
+
+    def test_workers_same_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set(("downloader",), "workers", 3)
+            config.set((), "filename", "same.{extension}")
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            success = []
+            skip = []
+            with patch.object(tjob.out, "success", success.append), \
+                    patch.object(tjob.out, "skip", skip.append):
+                tjob.run()
+
+            self.assertEqual(tjob.status, 0)
+            self.assertEqual(len(success), 1)
+            self.assertEqual(len(skip), 9)
+            with open(success[0]) as fp:
+                self.assertEqual(fp.read(), "0")
+
+    def _run_background(self, function, options):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "postprocessor-workers", 4)
+            config.set((), "postprocessors", [dict({
+                "name"    : "python",
+                "function": "module:function",
+                "event"   : "after",
+            }, **options)])
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            module = type(sys)("module")
+            module.function = function
+            with patch("gallery_dl.util.import_file", return_value=module):
+                tjob.run()
+        return tjob
+
+    def test_postprocessor_background(self):
+        calls = []
+
+        def function(kwdict):
+            calls.append((kwdict["num"], threading.current_thread().name))
+
+        tjob = self._run_background(function, {"background": True})
+
+        self.assertIsNotNone(tjob.pp_pool)
+        self.assertIsNone(tjob.pp_pool.executor)
+        self.assertEqual(tjob.status, 0)
+        self.assertEqual([num for num, _ in calls], list(range(10)))
+        for _, name in calls:
+            self.assertTrue(name.startswith("postprocessor"), name)
+
+    def test_postprocessor_background_limit(self):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def function(kwdict):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        tjob = self._run_background(function, {
+            "background"      : "after",
+            "background-limit": 2,
+        })
+
+        self.assertEqual(tjob.status, 0)
+        self.assertEqual(active[0], 0)
+        self.assertLessEqual(active[1], 2)
+
+    def test_postprocessor_background_exec(self):
+        commands = []
+
+        def popen(args, **kwargs):
+            commands.append(args)
+            time.sleep(0.01)
+            process = Mock()
+            process.wait.return_value = 0
+            return process
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "postprocessor-workers", 4)
+            config.set((), "postprocessors", [{
+                "name"            : "exec",
+                "commands"        : ["a {_filename}", ["b", "{_filename}"]],
+                "background"      : True,
+                "background-limit": 3,
+            }])
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            with patch("gallery_dl.util.Popen", popen):
+                tjob.run()
+
+        self.assertEqual(tjob.status, 0)
+        self.assertEqual(sorted(map(str, commands)), sorted(
+            str(cmd)
+            for num in range(10)
+            for cmd in (f"a test_{num}.txt", ["b", f"test_{num}.txt"])
+        ))
+
+    def test_postprocessor_background_archive(self):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def function(kwdict):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                self.assertLogs("postprocessor.python", "WARNING"):
+            tjob = self._run_background(function, {
+                "background"      : True,
+                "background-limit": 3,
+                "archive"         : os.path.join(tmpdir, "archive.sqlite3"),
+            })
+
+        self.assertEqual(tjob.status, 0)
+        self.assertEqual(active[1], 1)
+
+    def test_postprocessor_background_error(self):
+        calls = []
+
+        def function(kwdict):
+            if kwdict["num"] == 3:
+                raise ValueError("test")
+            calls.append(kwdict["num"])
+
+        with self.assertLogs("postprocessor", level="ERROR") as log_info:
+            tjob = self._run_background(function, {"background": ["after"]})
+
+        self.assertEqual(tjob.status, 1)
+        self.assertEqual(calls, [0, 1, 2, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(log_info.output, [
+            "ERROR:postprocessor:python: ValueError: test"])
+
+    def test_archive_prefetch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", path)
+            config.set((), "archive-format", "{num}")
+            config.set((), "archive-prefetch", 4)
+
+            with sqlite3.connect(path) as con:
+                con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+                con.executemany("INSERT INTO archive VALUES (?)", [
+                    (f"test_category{i}",) for i in range(5)])
+            con.close()
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            paths = []
+            with patch.object(tjob.out, "success", paths.append), \
+                    patch.object(job.archive.DownloadArchive, "prefetch",
+                                 autospec=True,
+                                 side_effect=job.archive.DownloadArchive
+                                 .prefetch) as prefetch:
+                tjob.run()
+
+            self.assertEqual(prefetch.call_count, 3)
+            self.assertEqual(
+                [len(call.args[1]) for call in prefetch.call_args_list],
+                [4, 4, 2])
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                [f"test_{num}.txt" for num in range(5, 10)])
+
+    def _run_archive_prefetch(self, skip, entries):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", path)
+            config.set((), "archive-format", "{num}")
+            config.set((), "archive-prefetch", 4)
+            config.set((), "skip", skip)
+
+            with sqlite3.connect(path) as con:
+                con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+                con.executemany("INSERT INTO archive VALUES (?)", [
+                    (f"test_category{i}",) for i in entries])
+            con.close()
+
+            extr = TestExtractorText.from_url("test:text")
+            tjob = self.jobclass(extr)
+            skipped = []
+            success = []
+            with patch.object(tjob.out, "skip", skipped.append), \
+                    patch.object(tjob.out, "success", success.append):
+                tjob.run()
+
+        return (
+            [os.path.basename(path) for path in skipped],
+            [os.path.basename(path) for path in success],
+        )
+
+    def test_archive_prefetch_abort(self):
+        # all files of the first page are archived
+        self.assertEqual(
+            self._run_archive_prefetch("abort:3", range(5)), ([], []))
+
+        # skipping them would not reach the limit
+        self.assertEqual(
+            self._run_archive_prefetch("abort:6", range(5)), (
+                [f"test_{num}.txt" for num in range(5)],
+                [f"test_{num}.txt" for num in range(5, 10)],
+            ))
+
+        # not all files of the first page are archived
+        self.assertEqual(
+            self._run_archive_prefetch("abort:2", (0, 1, 3)),
+            (["test_0.txt", "test_1.txt"], []))
+
+        config.set((), "skip-filter", "num > 0")
+        self.assertEqual(
+            self._run_archive_prefetch("abort:3", range(5)),
+            (["test_0.txt", "test_1.txt", "test_2.txt", "test_3.txt"], []))
+
+    def test_archive_prefetch_shared_kwdict(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", os.path.join(tmpdir, "archive.db"))
+            config.set((), "archive-format", "{num}")
+            config.set((), "archive-prefetch", 4)
+
+            extr = TestExtractorText.from_url("test:text")
+            extr.shared = True
+            tjob = self.jobclass(extr)
+            paths = []
+            with patch.object(tjob.out, "success", paths.append):
+                tjob.run()
+
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                [f"test_{num}.txt" for num in range(10)])
+
+    def test_prefetch(self):
+        config.set((), "prefetch", 3)
+
+        for shared in (False, True):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                config.set((), "base-directory", tmpdir)
+                extr = TestExtractorText.from_url("test:text")
+                extr.shared = shared
+                tjob = self.jobclass(extr)
+                paths = []
+                with patch.object(tjob.out, "success", paths.append):
+                    tjob.run()
+
+                self.assertEqual(tjob.status, 0)
+                self.assertEqual(
+                    [os.path.basename(path) for path in paths],
+                    [f"test_{num}.txt" for num in range(10)])
+
+    def test_prefetch_exception(self):
+        config.set((), "prefetch", 3)
+        extr = TestExtractorException.from_url("test:exception")
+        tjob = self.jobclass(extr)
+        with self.assertLogs(level="ERROR") as log_info:
+            self.assertEqual(tjob.run(), 1)
+        self.assertIn("ZeroDivisionError", log_info.output[0])
+
+    def test_prefetch_abort(self):
+        config.set((), "prefetch", 3)
+        extr = TestExtractorText.from_url("test:text")
+        extr.infinite = True
+        tjob = self.jobclass(extr)
+
+        def dispatch(msg):
+            if msg[0] == Message.Url and msg[2]["num"] >= 5:
+                raise exception.StopExtraction()
+
+        with patch.object(tjob, "dispatch", dispatch):
+            self.assertEqual(tjob.run(), 0)
+        self.assertTrue(extr.closed.wait(5.0))
+
 
 class TestKeywordJob(TestJob):
     jobclass = job.KeywordJob
@@ -358,6 +693,107 @@ class TestDataJob(TestJob):
         self.assertEqual(tjob.data[-1][0], Message.Url)
         self.assertEqual(tjob.data[-1][2]["num"], "3")
 
+    def test_num_string_resolve(self):
+        config.set(("output",), "num-to-str", True)
+        extr = TestExtractorParent.from_url("test:parent")
+        tjob = self.jobclass(extr, file=io.StringIO(), resolve=1)
+
+        nums = []
+        handle_url = tjob.handle_url
+
+        def check(url, kwdict):
+            # numbers of earlier results are still unchanged
+            nums.append(tjob.data_meta[0]["num"] if tjob.data_meta else None)
+            handle_url(url, kwdict)
+
+        with patch.object(job.DataJob, "handle_url", side_effect=check):
+            tjob.run()
+
+        self.assertEqual(nums, [None] + [1] * 8)
+        self.assertEqual(tjob.data[-1][2]["num"], "3")
+
+    def test_stream(self):
+        config.set(("output",), "stream", True)
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr, file=io.StringIO())
+
+        with patch.object(tjob.file, "flush") as flush:
+            tjob.run()
+        self.assertEqual(flush.call_count, 4)
+        self.assertEqual(tjob.data, [])
+        self.assertEqual(tjob.data_urls, [])
+
+        lines = tjob.file.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        msgs = [json.loads(line) for line in lines]
+        self.assertEqual(msgs[0][0], Message.Directory)
+        self.assertEqual(msgs[0][1]["user"], {"id": 123, "name": "test"})
+        for num, msg in enumerate(msgs[1:], 1):
+            self.assertEqual(msg[0], Message.Url)
+            self.assertEqual(msg[1], f"https://example.org/{num}.jpg")
+            self.assertEqual(msg[2]["num"], num)
+            self.assertEqual(msg[2]["tags"], ["foo", "bar", "テスト"])
+
+    def test_stream_resolve(self):
+        config.set(("output",), "stream", True)
+        config.set(("output",), "num-to-str", True)
+        extr = TestExtractorParent.from_url("test:parent")
+        tjob = self.jobclass(extr, file=io.StringIO(), resolve=1)
+        tjob.run()
+
+        msgs = [json.loads(line)
+                for line in tjob.file.getvalue().splitlines()]
+        self.assertEqual(len(msgs), 12)
+        self.assertEqual(
+            [msg[0] for msg in msgs],
+            [Message.Directory, Message.Url, Message.Url, Message.Url] * 3)
+        self.assertEqual(msgs[-1][2]["num"], "3")
+
+    def test_stream_num_string(self):
+        config.set(("output",), "stream", True)
+        config.set(("output",), "num-to-str", True)
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr, file=io.StringIO())
+        tjob.run()
+
+        msgs = [json.loads(line)
+                for line in tjob.file.getvalue().splitlines()]
+        self.assertEqual(msgs[0][1]["user"], {"id": "123", "name": "test"})
+        self.assertEqual(msgs[3][2]["user"], {"id": "123", "name": "test"})
+        self.assertEqual(msgs[3][2]["num"], "3")
+
+        # objects of the extractor remain unchanged
+        self.assertEqual(extr.user, {"id": 123, "name": "test"})
+
+    def test_stream_write_error(self):
+        config.set(("output",), "stream", True)
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr, file=io.StringIO())
+
+        with patch.object(tjob.file, "write",
+                          side_effect=BrokenPipeError(32, "Broken pipe")), \
+                self.assertLogs("test_category", "ERROR") as log:
+            self.assertEqual(tjob.run(), 0)
+
+        self.assertEqual(len(log.output), 1)
+        self.assertEqual(
+            log.output[0],
+            "ERROR:test_category:Unable to write JSON output "
+            "(BrokenPipeError: [Errno 32] Broken pipe)")
+
+    def test_stream_exception(self):
+        config.set(("output",), "stream", True)
+        extr = TestExtractorException.from_url("test:exception")
+        tjob = self.jobclass(extr, file=io.StringIO())
+        tjob.run()
+        self.assertEqual(
+            json.loads(tjob.file.getvalue()),
+            [-1, {
+                "error"  : "ZeroDivisionError",
+                "message": "division by zero",
+            }],
+        )
+
 
 class TestExtractor(Extractor):
     category = "test_category"
@@ -417,6 +853,32 @@ class TestExtractorException(Extractor):
         return 1/0
 
 
+class TestExtractorText(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_text"
+    directory_fmt = ("{category}",)
+    filename_fmt = "test_{num}.{extension}"
+    pattern = r"test:text$"
+
+    shared = False
+    infinite = False
+
+    def items(self):
+        self.closed = threading.Event()
+        yield Message.Directory, {}
+        kwdict = {"extension": "txt"}
+        num = 0
+        try:
+            while num < 10 or self.infinite:
+                if not self.shared:
+                    kwdict = {"extension": "txt"}
+                kwdict["num"] = num
+                yield Message.Url, f"text:{num}", kwdict
+                num += 1
+        finally:
+            self.closed.set()
+
+
 class TestExtractorAlt(Extractor):
     category = "test_category_alt"
     subcategory = "test_subcategory"
@@ -7,9 +7,11 @@
 # it under the terms of the GNU General Public License version 2 as
 # published by the Free Software Foundation.
 
+import io
 import os
 import sys
 import unittest
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import output  # noqa E402
@@ -152,5 +154,62 @@ class TestShortenEAW(unittest.TestCase):
         self.assertEqual(f(s, 19, "")   , "幻-想-郷###幻-想-郷")
 
 
+class TestBufferedStream(unittest.TestCase):
+
+    def test_buffer(self):
+        out = io.StringIO()
+        err = io.StringIO()
+        stdout = output.BufferedStream(out)
+        stderr = output.BufferedStream(err)
+
+        stdout.write("a\n")
+        self.assertEqual(out.getvalue(), "a\n")
+
+        output.buffer_begin()
+        try:
+            stdout.write("b\n")
+            stderr.write("c\n")
+            stdout.write("d\n")
+            self.assertEqual(out.getvalue(), "a\n")
+            self.assertEqual(err.getvalue(), "")
+
+            def other_thread():
+                stdout.write("e\n")
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join()
+            self.assertEqual(out.getvalue(), "a\ne\n")
+        finally:
+            output.buffer_end()
+
+        self.assertEqual(out.getvalue(), "a\ne\nb\nd\n")
+        self.assertEqual(err.getvalue(), "c\n")
+
+        stderr.write("f\n")
+        self.assertEqual(err.getvalue(), "c\nf\n")
+
+    def test_buffer_wrap(self):
+        out = io.StringIO()
+        stdout = output.BufferedStream(out)
+
+        def write(s):
+            stdout.write(s)
+
+        self.assertIs(output.buffer_wrap(write), write)
+
+        output.buffer_begin()
+        try:
+            stdout.write("a\n")
+            thread = threading.Thread(target=output.buffer_wrap(write),
+                                      args=("b\n",))
+            thread.start()
+            thread.join()
+            self.assertEqual(out.getvalue(), "")
+        finally:
+            output.buffer_end()
+
+        self.assertEqual(out.getvalue(), "a\nb\n")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,16 +12,18 @@ import sys
 import unittest
 from unittest.mock import Mock, mock_open, patch, call
 
+import json
 import shutil
 import logging
 import zipfile
 import tempfile
+import subprocess
 import collections
 from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import extractor, output, path, util  # noqa E402
-from gallery_dl import postprocessor, config  # noqa E402
+from gallery_dl import postprocessor, config, dedup  # noqa E402
 from gallery_dl.postprocessor.common import PostProcessor  # noqa E402
 
 
@@ -88,6 +90,7 @@ class BasePostprocessorTest(unittest.TestCase):
 
     def tearDown(self):
         self.job.hooks.clear()
+        self.job.pathfmt.hashes.clear()
 
     def _create(self, options=None, data=None):
         kwdict = {"category": "test", "filename": "file", "extension": "ext"}
@@ -191,6 +194,129 @@ class DirectoryTest(BasePostprocessorTest):
         self.assertEqual(self.pathfmt.realpath, f"{path}/file.ext")
 
 
+class DedupTest(BasePostprocessorTest):
+
+    def _download(self, filename, content, kwdict=None):
+        if kwdict is None:
+            kwdict = {}
+        kwdict["filename"] = filename
+        kwdict["extension"] = "ext"
+
+        pathfmt = self.pathfmt
+        pathfmt.set_filename(kwdict)
+        pathfmt.build_path()
+        pathfmt.temppath = pathfmt.realpath + ".part"
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.temppath, "wb") as fp:
+            fp.write(content)
+
+        self._trigger()
+        pathfmt.finalize()
+        return pathfmt.realpath
+
+    def test_dedup_hardlink(self):
+        database = os.path.join(self.dir.name, "dedup-hardlink.db")
+        self._create({"database": database})
+        self.assertIn("sha256", self.job.pathfmt.hashes)
+
+        path1 = self._download("file1", b"Foo Bar\n")
+        path2 = self._download("file2", b"Foo Baz\n")
+        path3 = self._download("file3", b"Foo Bar\n")
+
+        self.assertFalse(os.path.samefile(path1, path2))
+        self.assertTrue(os.path.samefile(path1, path3))
+        self.assertFalse(os.path.exists(path3 + ".part"))
+
+        # stale entry
+        os.unlink(path1)
+        os.unlink(path3)
+        path4 = self._download("file4", b"Foo Bar\n")
+        path5 = self._download("file5", b"Foo Bar\n")
+        self.assertTrue(os.path.samefile(path4, path5))
+
+    @unittest.skipIf(util.WINDOWS, "not POSIX")
+    def test_dedup_symlink(self):
+        database = os.path.join(self.dir.name, "dedup-symlink.db")
+        self._create({"database": database, "action": "symlink"})
+
+        path1 = self._download("sym1", b"Foo Bar\n")
+        path2 = self._download("sym2", b"Foo Bar\n")
+        self.assertTrue(os.path.islink(path2))
+        self.assertEqual(os.readlink(path2), path1)
+
+    def test_dedup_skip(self):
+        database = os.path.join(self.dir.name, "dedup-skip.db")
+        self._create({"database": database, "action": "skip"})
+
+        path1 = self._download("skip1", b"Foo Bar\n")
+        path2 = self._download("skip2", b"Foo Bar\n")
+        self.assertTrue(os.path.exists(path1))
+        self.assertFalse(os.path.exists(path2))
+
+    def test_dedup_precomputed(self):
+        database = os.path.join(self.dir.name, "dedup-precomputed.db")
+        self._create({"database": database})
+
+        self._download("pre1", b"Foo Bar\n")
+        self._download("pre2", b"Foo Bar\n", {
+            "_http_hashes": {"sha256": "0123456789abcdef"},
+            "_http_size"  : 8,
+        })
+
+        index = dedup.connect(database)
+        self.assertEqual(index.lookup(8, "sha256:0123456789abcdef"),
+                         self.pathfmt.realpath)
+
+    def test_dedup_digest(self):
+        database = os.path.join(self.dir.name, "dedup-digest.db")
+        self._create({"database": database, "digest-format": "md5:{md5}"})
+        self.assertIn("md5", self.job.pathfmt.hashes)
+
+        md5 = "35C9C9C7C90AD764BAE9E2623F522C24"
+        path1 = self._download("digest1", b"Foo Bar\n", {
+            "md5"         : md5,
+            "_http_hashes": {"sha256": "0123456789abcdef",
+                             "md5"   : md5.lower()},
+            "_http_size"  : 8,
+        })
+
+        # known digest: link before downloading
+        kwdict = {"md5": md5, "filename": "digest2", "extension": "ext"}
+        self.pathfmt.set_filename(kwdict)
+        self.pathfmt.build_path()
+        self._trigger(("prepare-after",))
+        self.assertTrue(kwdict["_file_skip"])
+        self.assertTrue(os.path.samefile(path1, self.pathfmt.realpath))
+
+        # unknown digest
+        kwdict = {"md5": "0" * 32, "filename": "digest3", "extension": "ext"}
+        self.pathfmt.set_filename(kwdict)
+        self.pathfmt.build_path()
+        self._trigger(("prepare-after",))
+        self.assertNotIn("_file_skip", kwdict)
+        self.assertNotIn("_http_dedup", kwdict)
+        self.assertFalse(os.path.exists(self.pathfmt.realpath))
+
+    def test_dedup_probe(self):
+        database = os.path.join(self.dir.name, "dedup-probe.db")
+        self._create({"database": database, "probe": True})
+
+        path1 = self._download("probe1", b"Foo Bar\n")
+
+        kwdict = {"filename": "probe2", "extension": "ext"}
+        self.pathfmt.set_filename(kwdict)
+        self.pathfmt.build_path()
+        self._trigger(("prepare-after",))
+
+        check = kwdict["_http_dedup"]
+        self.assertFalse(check(self.pathfmt, 8, b"Foo Baz\n"))
+        self.assertFalse(check(self.pathfmt, 9, b"Foo Bar\n"))
+        self.assertFalse(os.path.exists(self.pathfmt.realpath))
+
+        self.assertTrue(check(self.pathfmt, 8, b"Foo Bar\n"))
+        self.assertTrue(os.path.samefile(path1, self.pathfmt.realpath))
+
+
 class ExecTest(BasePostprocessorTest):
 
     def test_command_string(self):
@@ -310,6 +436,180 @@ class ExecTest(BasePostprocessorTest):
         self.assertTrue(p.called)
         self.assertFalse(i.wait.called)
 
+    def test_async_limit(self):
+        self._create({
+            "async"  : 2,
+            "command": "echo {}",
+        })
+
+        with patch("gallery_dl.util.Popen") as p:
+            procs = []
+
+            def popen(*args, **kwargs):
+                proc = Mock()
+                proc.poll.return_value = None
+                proc.wait.return_value = 0
+                procs.append(proc)
+                return proc
+            p.side_effect = popen
+
+            self._trigger(("after",))
+            self._trigger(("after",))
+            self.assertEqual(len(procs), 2)
+            self.assertFalse(procs[0].wait.called)
+
+            # third command waits for the first one
+            self._trigger(("after",))
+            self.assertEqual(len(procs), 3)
+            procs[0].wait.assert_called_once_with()
+            self.assertFalse(procs[1].wait.called)
+
+            self._trigger(("finalize",))
+            procs[1].wait.assert_called_once_with()
+            procs[2].wait.assert_called_once_with()
+
+    def test_batch_string(self):
+        self._create({
+            "mode"      : "batch",
+            "batch-size": 2,
+            "command"   : "echo {_directory}:",
+        })
+        directory = self.pathfmt.realdirectory
+
+        with patch("gallery_dl.util.Popen") as p:
+            i = Mock()
+            i.wait.return_value = 0
+            p.return_value = i
+
+            for name in ("a", "b", "c"):
+                self.pathfmt.kwdict["filename"] = name
+                self.pathfmt.build_path()
+                self._trigger(("after",))
+            self.assertEqual(p.call_count, 1)
+            self._trigger(("finalize",))
+
+        self.assertEqual(p.call_args_list, [
+            call(f"echo {directory}: {directory}a.ext {directory}b.ext",
+                 shell=True, creationflags=0, start_new_session=False),
+            call(f"echo {directory}: {directory}c.ext",
+                 shell=True, creationflags=0, start_new_session=False),
+        ])
+
+    def test_batch_list(self):
+        self._create({
+            "mode"   : "batch",
+            "command": ["exiftool", "-Artist={category}", "{_path}", "-q"],
+        })
+        directory = self.pathfmt.realdirectory
+
+        with patch("gallery_dl.util.Popen") as p:
+            i = Mock()
+            i.wait.return_value = 0
+            p.return_value = i
+
+            for name in ("a", "b"):
+                self.pathfmt.kwdict["filename"] = name
+                self.pathfmt.build_path()
+                self._trigger(("after",))
+            self.assertFalse(p.called)
+            self._trigger(("finalize",))
+
+        p.assert_called_once_with(
+            ["exiftool", "-Artist=test",
+             f"{directory}a.ext", f"{directory}b.ext", "-q"],
+            shell=False,
+            creationflags=0,
+            start_new_session=False,
+        )
+
+    def test_stdin(self):
+        self._create({
+            "mode"        : "stdin",
+            "stdin-format": "json",
+            "command"     : ["tagger", "--stdin"],
+        }, {"id": 1})
+
+        with patch("gallery_dl.util.Popen") as p:
+            i = Mock()
+            i.wait.return_value = 0
+            p.return_value = i
+
+            self._trigger(("after",))
+            self.pathfmt.kwdict["id"] = 2
+            self._trigger(("after",))
+            self._trigger(("finalize",))
+
+        p.assert_called_once_with(
+            ["tagger", "--stdin"],
+            shell=False,
+            creationflags=0,
+            start_new_session=False,
+            stdin=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        path = json.dumps(self.pathfmt.realpath)
+        self.assertEqual(i.stdin.write.call_args_list, [
+            call('{"category": "test", "filename": "file", "extension": '
+                 f'"ext", "id": 1, "_path": {path}}}\n'),
+            call('{"category": "test", "filename": "file", "extension": '
+                 f'"ext", "id": 2, "_path": {path}}}\n'),
+        ])
+        i.stdin.close.assert_called_once_with()
+        i.wait.assert_called_once_with()
+
+    def test_archive_after_success(self):
+        pp = self._create({
+            "mode"   : "batch",
+            "command": "echo {}",
+            "archive": ":memory:",
+        })
+        archive = pp.archive
+
+        with patch("gallery_dl.util.Popen") as p:
+            i = Mock()
+            i.wait.return_value = 1
+            p.return_value = i
+            self._trigger(("after",))
+            with self.assertLogs("postprocessor.exec", "WARNING"):
+                self._trigger(("finalize",))
+            self.assertFalse(archive.check(self.pathfmt.kwdict))
+
+            i.wait.return_value = 0
+            self._trigger(("after",))
+            self._trigger(("finalize",))
+            self.assertTrue(archive.check(self.pathfmt.kwdict))
+
+    def test_archive_shared_kwdict(self):
+        for options in (
+            {"mode": "batch"},
+            {"mode": "stdin"},
+            {"async": 2},
+        ):
+            options["command"] = ["true"]
+            options["archive"] = ":memory:"
+            options["archive-format"] = "{filename}"
+            pp = self._create(options)
+            archive = pp.archive
+            kwdict = self.pathfmt.kwdict
+
+            with patch("gallery_dl.util.Popen") as p:
+                i = Mock()
+                i.wait.return_value = 0
+                i.poll.return_value = None
+                p.return_value = i
+
+                for name in ("a", "b", "c"):
+                    kwdict["filename"] = name
+                    self.pathfmt.build_path()
+                    self._trigger(("after",))
+                self._trigger(("finalize",))
+
+            for name in ("a", "b", "c"):
+                kwdict["filename"] = name
+                self.assertTrue(archive.check(kwdict), (options, name))
+            self.job.hooks.clear()
+
     @unittest.skipIf(util.WINDOWS, "not POSIX")
     def test_session_posix(self):
         self._create({
@@ -404,6 +704,56 @@ class HashTest(BasePostprocessorTest):
             "3e1095b50736c4fd1e2deea152e3c8ecd5993462a747208e4d842659935a1c62",
             kwdict["b"], "sha512")
 
+    def test_precomputed(self):
+        self._create({"hashes": "sha256:a"})
+        self.assertIn("sha256", self.job.pathfmt.hashes)
+
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        kwdict = self.pathfmt.kwdict
+        kwdict["_http_hashes"] = {"sha256": "0123456789abcdef"}
+        kwdict["_http_size"] = 8
+        self._trigger()
+        self.assertEqual(kwdict["a"], "0123456789abcdef")
+
+        # file size changed
+        kwdict["_http_size"] = 9
+        self._trigger()
+        self.assertEqual(
+            "4775b55be17206445d7015a5fc7656f38a74b880670523c3b175455f885f2395",
+            kwdict["a"], "sha256")
+
+
+class CompareTest(BasePostprocessorTest):
+
+    def test_compare_digest(self):
+        self._create({})
+        self.assertIn("sha256", self.job.pathfmt.hashes)
+
+        os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+        with open(self.pathfmt.realpath, "wb") as fp:
+            fp.write(b"Foo Bar\n")
+        self.pathfmt.temppath = self.pathfmt.realpath + ".part"
+        with open(self.pathfmt.temppath, "wb") as fp:
+            fp.write(b"Foo Baz\n")
+
+        kwdict = self.pathfmt.kwdict
+        kwdict["_http_size"] = 8
+        kwdict["_http_hashes"] = {"sha256": (
+            "4775b55be17206445d7015a5fc7656f38a74b880670523c3b175455f885f2395")}
+
+        with patch("gallery_dl.postprocessor.compare.ComparePP"
+                   "._compare_content") as cc:
+            self._trigger()
+        self.assertFalse(cc.called)
+        self.assertTrue(self.pathfmt.delete)
+
+        self.pathfmt.delete = False
+        del kwdict["_http_hashes"]
+        self._trigger()
+        self.assertFalse(self.pathfmt.delete)
+
 
 class MetadataTest(BasePostprocessorTest):
 
@@ -800,6 +1150,117 @@ class MetadataTest(BasePostprocessorTest):
 }
 """)
 
+    def test_metadata_sink_jsonl(self):
+        pp = self._create({"sink": "jsonl", "sink-buffer": 2})
+        path = f"{self.pathfmt.realdirectory}metadata.jsonl"
+        util.remove_file(path)
+
+        for name in ("a", "b", "c"):
+            self.pathfmt.kwdict["filename"] = name
+            self.pathfmt.build_path()
+            self._trigger()
+
+        # 'c' is still buffered
+        directory = json.dumps(self.pathfmt.realdirectory)[1:-1]
+        with open(path, encoding="utf-8") as fp:
+            self.assertEqual(fp.read(), (
+                f'{{"_path": "{directory}a.ext", "category": "test", '
+                '"filename": "a", "extension": "ext"}\n'
+                f'{{"_path": "{directory}b.ext", "category": "test", '
+                '"filename": "b", "extension": "ext"}\n'
+            ))
+
+        self._trigger(("finalize",))
+        self.assertIsNone(pp.sink)
+        with open(path, encoding="utf-8") as fp:
+            self.assertEqual(len(fp.readlines()), 3)
+
+    def test_metadata_sink_jsonl_skip(self):
+        path = os.path.join(self.dir.name, "sink", "metadata.jsonl")
+        self._create({
+            "sink"     : "jsonl",
+            "sink-path": path,
+            "skip"     : True,
+            "include"  : ["id"],
+        }, {"id": 1})
+
+        self._trigger()
+        self._trigger(("finalize",))
+
+        # records written by previous runs get recognized
+        self.pathfmt.kwdict["id"] = 2
+        self._trigger()  # skipped
+        self._trigger(("finalize",))
+
+        self.pathfmt.kwdict["filename"] = "file2"
+        self.pathfmt.build_path()
+        self._trigger()
+        self._trigger(("finalize",))
+
+        with open(path, encoding="utf-8") as fp:
+            records = [json.loads(line) for line in fp]
+        self.assertEqual(records, [
+            {"_path": f"{self.pathfmt.realdirectory}file.ext" , "id": 1},
+            {"_path": f"{self.pathfmt.realdirectory}file2.ext", "id": 2},
+        ])
+
+    def test_metadata_sink_sqlite(self):
+        path = os.path.join(self.dir.name, "sink", "metadata.db")
+        self._create({
+            "sink"     : "sqlite",
+            "sink-path": path,
+            "skip"     : True,
+            "include"  : ["id"],
+        }, {"id": 1})
+
+        self._trigger()
+        self.pathfmt.kwdict["id"] = 2
+        self._trigger()  # skipped
+        self.pathfmt.kwdict["filename"] = "file2"
+        self.pathfmt.build_path()
+        self._trigger()
+        self._trigger(("finalize",))
+
+        import sqlite3
+        con = sqlite3.connect(path)
+        self.assertEqual(con.execute(
+            "SELECT path, data FROM metadata ORDER BY path").fetchall(), [
+            (f"{self.pathfmt.realdirectory}file.ext" , '{"id": 1}'),
+            (f"{self.pathfmt.realdirectory}file2.ext", '{"id": 2}'),
+        ])
+        con.close()
+
+    def test_metadata_sink_archive(self):
+        pp = self._create({
+            "sink"   : "jsonl",
+            "archive": ":memory:",
+        })
+        archive = pp.archive
+
+        self._trigger()
+        self.assertFalse(archive.check(self.pathfmt.kwdict))
+        self._trigger(("finalize",))
+        self.assertTrue(archive.check(self.pathfmt.kwdict))
+
+    def test_metadata_sink_archive_shared_kwdict(self):
+        pp = self._create({
+            "sink"          : "jsonl",
+            "archive"       : ":memory:",
+            "archive-format": "{filename}",
+        })
+        archive = pp.archive
+        kwdict = self.pathfmt.kwdict
+
+        for name in ("a", "b", "c"):
+            kwdict["filename"] = name
+            self.pathfmt.build_path()
+            self._trigger()
+        self._trigger(("finalize",))
+
+        for name in ("a", "b", "c"):
+            kwdict["filename"] = name
+            self.assertTrue(archive.check(kwdict), name)
+
     def _output(self, mock):
         return "".join(
             call[1][0]
@@ -929,6 +1390,159 @@ class RenameTest(BasePostprocessorTest):
         self.assertEqual(sorted(os.listdir(path)), ["12345.ext", "file.ext"])
 
 
+class UgoiraTest(BasePostprocessorTest):
+
+    FRAMES = [
+        {"file": "000000.jpg", "delay": 40},
+        {"file": "000001.jpg", "delay": 40},
+        {"file": "000002.jpg", "delay": 80},
+    ]
+
+    def _create_ugoira(self, options, frames=FRAMES):
+        pp = self._create(options, {
+            "extension": "zip",
+            "_ugoira_frame_data": [frame.copy() for frame in frames],
+        })
+        self._trigger(("prepare",))
+
+        os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+        with zipfile.ZipFile(self.pathfmt.temppath, "w") as zfile:
+            for num, frame in enumerate(frames):
+                zfile.writestr(frame["file"], str(num).encode())
+        return pp
+
+    def _run_ugoira(self, events=("file",)):
+        with patch("gallery_dl.util.Popen") as p:
+            p.return_value.wait.return_value = 0
+            self._trigger(events)
+
+        stdin = p.return_value.stdin.__enter__.return_value
+        data = b"".join(c.args[0] for c in stdin.write.call_args_list)
+        return p, data
+
+    def test_ugoira_pipe(self):
+        self._create_ugoira({"mode": "image2pipe"})
+        p, data = self._run_ugoira()
+
+        self.assertEqual(p.call_args_list, [call([
+            "ffmpeg", "-f", "image2pipe", "-framerate", "1000/40",
+            "-c:v", "mjpeg", "-i", "-", "-r", "1000/40", "-hide_banner", "-loglevel", "error",
+            self.pathfmt.realpath,
+        ], stdin=subprocess.PIPE, stdout=None, stderr=None)])
+        self.assertTrue(self.pathfmt.realpath.endswith("/file.webm"))
+        self.assertEqual(data, b"0122")
+        self.assertTrue(self.pathfmt.delete)
+
+    def test_ugoira_pipe_uniform(self):
+        frames = [{"file": "000000.png", "delay": 50},
+                  {"file": "000001.png", "delay": 50}]
+        self._create_ugoira({"mode": "image2pipe", "ffmpeg-output": False},
+                            frames)
+        p, data = self._run_ugoira()
+
+        self.assertEqual(p.call_args.args[0], [
+            "ffmpeg", "-f", "image2pipe", "-framerate", "1000/50",
+            "-c:v", "png", "-i", "-", self.pathfmt.realpath,
+        ])
+        self.assertEqual(data, b"01")
+
+    def test_ugoira_pipe_fallback(self):
+        frames = [{"file": "000000.jpg", "delay": 33},
+                  {"file": "000001.jpg", "delay": 50}]
+        self._create_ugoira({"mode": "image2pipe"}, frames)
+
+        with patch("gallery_dl.util.Popen") as p:
+            p.return_value.wait.return_value = 0
+            self._trigger(("file",))
+
+        args = p.call_args.args[0]
+        self.assertEqual(args[:3], ["ffmpeg", "-f", "concat"])
+        self.assertNotIn("stdin", p.call_args.kwargs)
+
+    def test_ugoira_pipe_processes(self):
+        pp = self._create_ugoira({"mode": "image2pipe", "processes": 2})
+        self.assertIsNotNone(pp.executor)
+        self.assertEqual(self.job.hooks["finalize"], [pp.finalize])
+
+        p, data = self._run_ugoira(("file", "finalize"))
+
+        self.assertEqual(p.call_count, 1)
+        self.assertEqual(data, b"0122")
+        self.assertTrue(self.pathfmt.delete)
+
+    def test_ugoira_processes_mode(self):
+        with self.assertLogs("postprocessor.ugoira", "WARNING") as log:
+            pp = self._create_ugoira({"mode": "concat", "processes": 2})
+        self.assertIsNone(pp.executor)
+        self.assertEqual(self.job.hooks["finalize"], [])
+        self.assertIn("'processes' requires 'mode'", log.output[0])
+
+    def test_ugoira_pipe_processes_error(self):
+        self._create_ugoira({"mode": "image2pipe", "processes": 2})
+        # download into a '.part' file like DownloadJob
+        zpath = self.pathfmt.temppath + ".part"
+        os.replace(self.pathfmt.temppath, zpath)
+        self.pathfmt.temppath = zpath
+        with open(zpath, "rb") as fp:
+            content = fp.read()
+
+        with patch("gallery_dl.util.Popen") as p, \
+                self.assertLogs("postprocessor.ugoira", "ERROR"):
+            p.return_value.wait.return_value = 1
+            self._trigger(("file",))
+            self.assertTrue(self.pathfmt.delete)
+            self.pathfmt.finalize()
+            self._trigger(("finalize",))
+
+        self.assertFalse(os.path.exists(zpath))
+        path = os.path.join(self.pathfmt.realdirectory, "file.zip")
+        with open(path, "rb") as fp:
+            self.assertEqual(fp.read(), content)
+        os.unlink(path)
+
+    def test_ugoira_pipe_processes_frames(self):
+        frames = self.FRAMES
+        pp = self._create({"mode": "image2pipe", "processes": 2})
+        paths = []
+
+        for index, frame in enumerate(frames):
+            self.pathfmt.set_filename({
+                "category": "test",
+                "filename": f"file_{index}",
+                "extension": "jpg",
+                "_ugoira_frame_data": frames,
+                "_ugoira_frame_index": index,
+            })
+            self._trigger(("prepare",))
+            os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+            with open(self.pathfmt.realpath, "wb") as fp:
+                fp.write(str(index).encode())
+            paths.append(self.pathfmt.realpath)
+
+        with patch("gallery_dl.util.Popen") as p:
+            p.return_value.wait.return_value = 1
+            with patch.object(pp.executor, "submit") as submit:
+                with self.assertLogs("postprocessor.ugoira", "INFO"):
+                    self._trigger(("after",))
+
+            # frames remain until their conversion is done
+            self.assertEqual(submit.call_count, 1)
+            for fpath in paths:
+                self.assertTrue(os.path.exists(fpath))
+
+            # and are kept when it fails
+            with self.assertLogs("postprocessor.ugoira", "ERROR"):
+                pp._convert_pipe_async(*submit.call_args.args[1:])
+            for fpath in paths:
+                self.assertTrue(os.path.exists(fpath))
+
+            p.return_value.wait.return_value = 0
+            pp.slots.acquire()
+            pp._convert_pipe_async(*submit.call_args.args[1:])
+            for fpath in paths:
+                self.assertFalse(os.path.exists(fpath))
+
+
 class ZipTest(BasePostprocessorTest):
 
     def test_zip_default(self):
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import ratelimit  # noqa E402
+
+
+class MockResponse():
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class TestBucket(unittest.TestCase):
+
+    def test_interval(self):
+        bucket = ratelimit.Bucket()
+
+        with patch("time.time", return_value=1000.0):
+            self.assertEqual(bucket.acquire(2.0), 0.0)
+            bucket.release()
+
+        with patch("time.time", return_value=1000.5):
+            self.assertEqual(bucket.acquire(2.0), 1.5)
+            # slot reserved by the previous call
+            self.assertEqual(bucket.acquire(2.0), 3.5)
+
+    def test_burst(self):
+        bucket = ratelimit.Bucket(3)
+
+        with patch("time.time", return_value=1000.0):
+            self.assertEqual(bucket.acquire(1.0), 0.0)
+            self.assertEqual(bucket.acquire(1.0), 0.0)
+            self.assertEqual(bucket.acquire(1.0), 0.0)
+            self.assertEqual(bucket.acquire(1.0), 1.0)
+
+        with patch("time.time", return_value=1010.0):
+            self.assertEqual(bucket.acquire(1.0), 0.0)
+            self.assertEqual(bucket.acquire(1.0), 0.0)
+
+    def test_block(self):
+        bucket = ratelimit.Bucket()
+
+        with patch("time.time", return_value=1000.0):
+            bucket.block(1030.0)
+            bucket.block(1010.0)
+            self.assertEqual(bucket.acquire(), 30.0)
+            self.assertEqual(bucket.acquire(1.0), 30.0)
+
+    def test_no_interval(self):
+        bucket = ratelimit.Bucket()
+
+        with patch("time.time", return_value=1000.0):
+            self.assertEqual(bucket.acquire(2.0), 0.0)
+            # requests without interval do not refill tokens
+            self.assertEqual(bucket.acquire(), 0.0)
+            self.assertEqual(bucket.acquire(2.0), 2.0)
+
+    def test_bucket(self):
+        bucket = ratelimit.bucket("test:bucket")
+        self.assertIs(ratelimit.bucket("test:bucket"), bucket)
+        self.assertEqual(bucket.burst, 1)
+
+        ratelimit.bucket("test:bucket", 5)
+        self.assertEqual(bucket.burst, 5)
+
+        self.assertIs(
+            ratelimit.bucket_url("https://example.org/foo/bar.jpg"),
+            ratelimit.bucket("https://example.org"),
+        )
+
+    def test_bucket_url_category(self):
+        bucket = ratelimit.bucket("test:category")
+        self.assertIs(
+            ratelimit.bucket_url("https://cdn.example.net/1.jpg",
+                                 "test:category"),
+            bucket,
+        )
+        # later requests to the same host use this category's bucket
+        self.assertIs(
+            ratelimit.bucket_url("https://cdn.example.net/2.jpg"), bucket)
+
+
+class TestReset(unittest.TestCase):
+
+    def _reset(self, headers, now=1000.0):
+        return ratelimit.reset(MockResponse(headers), now)
+
+    def test_none(self):
+        self.assertIsNone(self._reset({}))
+        self.assertIsNone(self._reset({"Retry-After": "invalid"}))
+
+    def test_seconds(self):
+        self.assertEqual(self._reset({"Retry-After": "30"}), 1030.0)
+        self.assertEqual(self._reset({"X-RateLimit-Reset": "2.5"}), 1002.5)
+
+    def test_timestamp(self):
+        self.assertEqual(
+            self._reset({"X-RateLimit-Reset": "1700000000"}), 1700000000.0)
+        self.assertEqual(
+            self._reset({"X-RateLimit-Reset": "1700000000123"}),
+            1700000000.123)
+
+    def test_date(self):
+        self.assertEqual(
+            self._reset({"Retry-After": "Tue, 14 Nov 2023 22:13:20 GMT"}),
+            1700000000.0)
+        self.assertEqual(
+            self._reset({"X-RateLimit-Reset": "2023-11-14T22:13:20.000Z"}),
+            1700000000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
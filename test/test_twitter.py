@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import config, extractor, exception  # noqa E402
+
+dbpath = tempfile.mkstemp()[1]
+config.set(("cache",), "file", dbpath)
+from gallery_dl import cache  # noqa E402
+cache._init()
+
+from gallery_dl.extractor import twitter  # noqa E402
+
+
+class ClientTransaction():
+
+    def __init__(self, name):
+        self.name = name
+
+    def generate_transaction_id(self, method, path):
+        return f"{self.name}:{method}:{path}"
+
+
+class TestClientTransaction(unittest.TestCase):
+
+    def setUp(self):
+        self.attrs = {
+            name: getattr(twitter.TwitterAPI, name)
+            for name in ("client_transaction",
+                         "client_transaction_refresh",
+                         "client_transaction_expires")
+        }
+        self.calls = []
+
+        def client_transaction(api, headers=None):
+            # keys get fetched outside of any database transaction
+            self.calls.append(cache.DatabaseCacheDecorator.db.connection
+                              .in_transaction)
+            if self.error:
+                raise self.error
+            if headers is None:
+                headers = api.headers
+            headers["x-csrf-token"] = f"csrf{len(self.calls)}"
+            return ClientTransaction(len(self.calls))
+
+        self.error = None
+        self.ct = cache.DatabaseCacheDecorator(client_transaction, None, 10800)
+        self.ct.db.delete(self.ct.key + "-")
+
+        extr = extractor.find("https://x.com/USER/media")
+        extr.initialize()
+        self.api = twitter.TwitterAPI(extr)
+
+    def tearDown(self):
+        for name, value in self.attrs.items():
+            setattr(twitter.TwitterAPI, name, value)
+        config.clear()
+
+    def _transaction_id(self):
+        with patch.object(twitter, "_client_transaction", self.ct):
+            self.api._transaction_id("https://x.com/i/api/graphql/ID/Name")
+            # wait for a background refresh to finish
+            with twitter.TwitterAPI.client_transaction_lock:
+                pass
+        return self.api.headers["x-client-transaction-id"]
+
+    def test_initialize(self):
+        twitter.TwitterAPI.client_transaction_expires = 0
+
+        now = int(time.time())
+        self.assertEqual(self._transaction_id(), "1:GET:/i/api/graphql/ID/Name")
+        self.assertEqual(self.calls, [True])
+
+        api = twitter.TwitterAPI
+        self.assertGreaterEqual(api.client_transaction_expires, now + 10800)
+        self.assertEqual(api.client_transaction_refresh,
+                         api.client_transaction_expires - 1800)
+
+        # reuse current keys
+        self.assertEqual(self._transaction_id(), "1:GET:/i/api/graphql/ID/Name")
+        self.assertEqual(len(self.calls), 1)
+
+    def test_refresh(self):
+        api = twitter.TwitterAPI
+        api.client_transaction = ClientTransaction("old")
+        api.client_transaction_expires = time.time() + 1000
+        api.client_transaction_refresh = 0
+
+        # current keys remain in use while new ones get fetched
+        self.assertEqual(self._transaction_id(), "old:GET:/i/api/graphql/ID/Name")
+        self.assertEqual(self.calls, [False])
+        self.assertEqual(api.client_transaction.name, 1)
+        self.assertEqual(api.client_transaction_refresh,
+                         api.client_transaction_expires - 1800)
+        self.assertFalse(api.client_transaction_lock.locked())
+
+        # new keys were stored in the cache database
+        self.assertEqual(self.ct.db.get(self.ct.key + "-")[0].name, 1)
+        self.assertFalse(self.ct.db.connection.in_transaction)
+
+        # 'x-csrf-token' gets updated by the thread making API calls
+        self.assertNotEqual(self.api.headers["x-csrf-token"], "csrf1")
+        self.assertEqual(self._transaction_id(), "1:GET:/i/api/graphql/ID/Name")
+        self.assertEqual(self.api.headers["x-csrf-token"], "csrf1")
+
+    def test_refresh_stored(self):
+        api = twitter.TwitterAPI
+        api.client_transaction = ClientTransaction("old")
+        api.client_transaction_expires = time.time() + 1000
+        api.client_transaction_refresh = 0
+
+        # use keys stored by another process
+        expires = int(time.time()) + 5000
+        self.ct.db.set(self.ct.key + "-", ClientTransaction("db"), expires)
+
+        self._transaction_id()
+        self.assertEqual(self.calls, [])
+        self.assertEqual(api.client_transaction.name, "db")
+        self.assertEqual(api.client_transaction_expires, expires)
+        self.assertEqual(api.client_transaction_refresh, expires - 1800)
+        self.assertFalse(api.client_transaction_lock.locked())
+
+    def test_refresh_error(self):
+        api = twitter.TwitterAPI
+        api.client_transaction = ct = ClientTransaction("old")
+        api.client_transaction_expires = expires = time.time() + 1000
+        api.client_transaction_refresh = 0
+        self.error = ValueError("test")
+
+        with self.assertLogs("twitter", "WARNING") as log:
+            self._transaction_id()
+        self.assertEqual(
+            log.output[0],
+            "WARNING:twitter:Failed to refresh client transaction keys "
+            "(ValueError: test)")
+
+        # retry after 5 minutes
+        self.assertIs(api.client_transaction, ct)
+        self.assertEqual(api.client_transaction_expires, expires)
+        self.assertGreater(api.client_transaction_refresh, time.time() + 290)
+        self.assertFalse(api.client_transaction_lock.locked())
+        self.assertIsNone(self.ct.db.get(self.ct.key + "-"))
+
+
+class FakeAPI():
+    """Return pages of Tweets from a list and update the extractor cursor"""
+
+    def __init__(self, extr, pages, error=None):
+        self.extr = extr
+        self.pages = pages
+        self.error = error
+        self.requests = []
+
+    def _user_id_by_screen_name(self, screen_name):
+        return "12345"
+
+    def user_likes(self, screen_name):
+        extr = self.extr
+        page = int(extr._init_cursor() or 0)
+
+        while page < len(self.pages):
+            self.requests.append(page)
+            for tweet in self.pages[page]:
+                if tweet == self.error:
+                    raise exception.HttpError("test")
+                if isinstance(tweet, dict):
+                    yield tweet
+                else:
+                    yield {"rest_id": str(tweet), "sortIndex": str(tweet),
+                           "legacy": {}}
+            page += 1
+            if page < len(self.pages):
+                extr._update_cursor(str(page))
+        extr._update_cursor(None)
+
+
+class TestIncremental(unittest.TestCase):
+
+    def setUp(self):
+        config.set(("extractor", "twitter"), "incremental", True)
+        twitter._sync_state.invalidate(("12345", "likes"))
+
+    def tearDown(self):
+        twitter._sync_state.invalidate(("12345", "likes"))
+        config.clear()
+
+    def _run(self, pages, error=None, stop=None):
+        extr = extractor.find("https://x.com/USER/likes")
+        extr.initialize()
+        extr.api = api = FakeAPI(extr, pages, error)
+
+        ids = []
+        tweets = extr._sync_tweets(extr.tweets())
+        try:
+            for tweet in tweets:
+                ids.append(int(tweet["rest_id"]))
+                if len(ids) == stop:
+                    tweets.close()
+                    break
+        except exception.HttpError:
+            ids.append("error")
+        return ids, api.requests, extr._cursor
+
+    def _state(self):
+        return twitter._sync_state(("12345", "likes"))
+
+    def test_complete(self):
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5]]),
+            ([9, 8, 7, 6, 5], [0, 1, 2], None))
+        self.assertEqual(
+            self._state(), {"newest": 9, "top": None, "cursor": None})
+
+        # stop at the newest Tweet of the previous run
+        self.assertEqual(
+            self._run([[12, 11], [10, 9], [8, 7]]),
+            ([12, 11, 10], [0, 1], None))
+        self.assertEqual(
+            self._state(), {"newest": 12, "top": None, "cursor": None})
+
+    def test_interrupted(self):
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5, 4]], error=5),
+            ([9, 8, 7, 6, "error"], [0, 1, 2], "2"))
+        self.assertEqual(
+            self._state(), {"newest": None, "top": 9, "cursor": "2"})
+
+        # resume from the saved cursor
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5, 4]]),
+            ([5, 4], [2], None))
+        self.assertEqual(
+            self._state(), {"newest": 9, "top": None, "cursor": None})
+
+        # Tweets newer than the interrupted run
+        self.assertEqual(
+            self._run([[11, 10], [9, 8], [7, 6], [5, 4]]),
+            ([11, 10], [0, 1], None))
+        self.assertEqual(
+            self._state(), {"newest": 11, "top": None, "cursor": None})
+
+    def test_closed(self):
+        # '--range', 'skip: abort', etc
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5, 4]], stop=3),
+            ([9, 8, 7], [0, 1], "1"))
+        self.assertEqual(
+            self._state(), {"newest": 9, "top": None, "cursor": None})
+
+        # start from the top again and stop at the newest Tweet
+        self.assertEqual(
+            self._run([[11, 10], [9, 8], [7, 6], [5, 4]]),
+            ([11, 10], [0, 1], None))
+        self.assertEqual(
+            self._state(), {"newest": 11, "top": None, "cursor": None})
+
+    def test_closed_resumed(self):
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5, 4]], error=5),
+            ([9, 8, 7, 6, "error"], [0, 1, 2], "2"))
+
+        # stopping a resumed run completes it
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5, 4]], stop=1),
+            ([5], [2], None))
+        self.assertEqual(
+            self._state(), {"newest": 9, "top": None, "cursor": None})
+
+    def test_cursor_option(self):
+        config.set(("extractor", "twitter"), "cursor", "2")
+        twitter._sync_state.update(
+            ("12345", "likes"), {"newest": 3, "top": 9, "cursor": "1"})
+
+        # explicit 'cursor' values take precedence over saved ones
+        self.assertEqual(
+            self._run([[9, 8], [7, 6], [5, 4], [3, 2]]),
+            ([5, 4], [2, 3], None))
+        self.assertEqual(
+            self._state(), {"newest": 9, "top": None, "cursor": None})
+
+    def test_pinned_quoted(self):
+        twitter._sync_state.update(
+            ("12345", "likes"), {"newest": 5, "top": None, "cursor": None})
+
+        pinned = {"rest_id": "2", "sortIndex": "2", "_pinned": True}
+        quoted = {"rest_id": "1", "legacy": {"quoted_by_id_str": "8"}}
+        retweet = {"rest_id": "4", "_retweet_id_str": "7", "legacy": {}}
+
+        # neither stop at nor start with pinned or quoted Tweets
+        self.assertEqual(
+            self._run([[pinned, 9, 8, quoted], [retweet, 5, 4]]),
+            ([2, 9, 8, 1, 4], [0, 1], None))
+        self.assertEqual(
+            self._state(), {"newest": 9, "top": None, "cursor": None})
+
+    def test_sort_index(self):
+        self.assertEqual(twitter._sort_index(
+            {"rest_id": "1", "sortIndex": "3", "_retweet_id_str": "2"}), 3)
+        self.assertEqual(twitter._sort_index(
+            {"rest_id": "1", "sortIndex": None, "_retweet_id_str": "2"}), 2)
+        self.assertEqual(twitter._sort_index(
+            {"rest_id": "1"}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()